@@ -52,6 +52,8 @@ class NetworkItems:
     consumer: list[ControllerConsumer]
     producer: list[ControllerProducer]
     storage: list[ControllerAtesStorage | ControllerIdealHeatStorage]
+    component: int = -1
+    """Connected component of the graph the network items belong to."""
 
     def add(
         self,
@@ -137,8 +139,10 @@ class EsdlControllerMapper(EsdlMapperAbstract):
                 )
             ]
             return NetworkController(networks=networks)
-        network_list = self.heat_transfer_assets_to_network(graph, heat_transfer_assets)
-        self.assets_to_networks(graph, network_list, consumers + producers + storages)
+        # Every hydraulic connected part of the system is a separate network.
+        components = graph.get_connected_components()
+        network_list = self.heat_transfer_assets_to_network(components, heat_transfer_assets)
+        self.assets_to_networks(components, network_list, consumers + producers + storages)
         # creating network controller classes
         networks = []
         for network in network_list:
@@ -185,18 +189,22 @@ class EsdlControllerMapper(EsdlMapperAbstract):
         graph = Graph()
         for i in range(len(networks)):
             graph.add_node(str(i))
-        for i in range(len(networks)):
-            for heat_transfer_asset in networks[i].heat_transfer_assets_prim:
-                for j in range(len(networks)):
-                    if i == j:
-                        continue
-                    if networks[j].exists(heat_transfer_asset.id):
-                        graph.connect(str(i), str(j))
+        # A heat transfer asset is connected with its secondary side to a single network.
+        secondary_network = {
+            heat_transfer_asset.id: j
+            for j, network in enumerate(networks)
+            for heat_transfer_asset in network.heat_transfer_assets_sec
+        }
+        for i, network in enumerate(networks):
+            for heat_transfer_asset in network.heat_transfer_assets_prim:
+                j = secondary_network.get(heat_transfer_asset.id, i)
+                if i != j:
+                    graph.connect(str(i), str(j))
         return graph
 
     def assets_to_networks(
         self,
-        graph: Graph,
+        components: dict[str, int],
         network_list: list[NetworkItems],
         assets: list[
             ControllerConsumer
@@ -207,62 +215,51 @@ class EsdlControllerMapper(EsdlMapperAbstract):
     ) -> None:
         """Method to move assets to networks.
 
-        :param graph: for checking connectivity.
+        Assets which are not in the same connected component as a heat transfer asset are not
+        added to any network.
+
+        :param components: connected component of every node in the graph.
         :param network_list: list of NetworkItems to add the assets to.
         :param assets: list of assets to be added to networks.
         """
+        network_by_component = {network.component: network for network in network_list}
         for asset in assets:
-            for network in network_list:
-                if belongs_to_network(asset.id, network, graph):
-                    network.add(asset)
-                    continue
+            component = components[asset.id]
+            if component in network_by_component:
+                network_by_component[component].add(asset)
 
     def heat_transfer_assets_to_network(
-        self, graph: Graph, heat_transfer_assets: list[ControllerHeatTransferAsset]
+        self, components: dict[str, int], heat_transfer_assets: list[ControllerHeatTransferAsset]
     ) -> list[NetworkItems]:
         """Method to move heat transfer assets to networks. or create new networks.
 
-        :param graph: for checking connectivity.
+        A network is created for every connected component the first time a primary or secondary
+        side of a heat transfer asset is found in it.
+
+        :param components: connected component of every node in the graph.
         :param heat_transfer_assets: list of heat transfer assets to be added to networks.
         :return: list of NetworkItems, which are the networks with the heat transfer assets.
         """
-        network_list: list[NetworkItems] = []
+        network_by_component: dict[int, NetworkItems] = {}
         for heat_transfer_asset in heat_transfer_assets:
-            # First check if the heat transfer asset is connected to a network that already
-            # is in the list
-            belongs = False
-            for network in network_list:
-                if belongs_to_network(heat_transfer_asset.id + "_primary", network, graph):
-                    network.heat_transfer_primary.append(heat_transfer_asset)
-                    belongs = True
-                    break
-            if not belongs:
-                network_list.append(
-                    NetworkItems(
-                        heat_transfer_primary=[heat_transfer_asset],
+            for side in ["_primary", "_secondary"]:
+                component = components[heat_transfer_asset.id + side]
+                if component not in network_by_component:
+                    network_by_component[component] = NetworkItems(
+                        heat_transfer_primary=[],
                         heat_transfer_secondary=[],
                         consumer=[],
                         producer=[],
                         storage=[],
+                        component=component,
                     )
-                )
-            belongs = False
-            for network in network_list:
-                if belongs_to_network(heat_transfer_asset.id + "_secondary", network, graph):
+                network = network_by_component[component]
+                if side == "_primary":
+                    network.heat_transfer_primary.append(heat_transfer_asset)
+                else:
                     network.heat_transfer_secondary.append(heat_transfer_asset)
-                    belongs = True
-                    break
-            if not belongs:
-                network_list.append(
-                    NetworkItems(
-                        heat_transfer_primary=[],
-                        heat_transfer_secondary=[heat_transfer_asset],
-                        consumer=[],
-                        producer=[],
-                        storage=[],
-                    )
-                )
-        return network_list
+        # Dicts keep the insertion order, so the networks are in the order they are found.
+        return list(network_by_component.values())
 
     def convert_heat_storages_and_ates(
         self, esdl_object: EsdlObject
@@ -284,20 +281,3 @@ class EsdlControllerMapper(EsdlMapperAbstract):
             for esdl_asset in esdl_ates
         ]
         return storages
-
-
-def belongs_to_network(id: str, network: NetworkItems, graph: Graph) -> bool:
-    """Check if the id is connected to a heat transfer asset in the network.
-
-    :param id: id to check if it belongs to the network.
-    :param network: NetworkItems to check if the id belongs to the network.
-    :param graph: for checking connectivity.
-    :return: bool, which is True if the id belongs to the network.
-    """
-    if network.heat_transfer_primary:
-        if graph.is_connected(network.heat_transfer_primary[0].id + "_primary", id):
-            return True
-    if network.heat_transfer_secondary:
-        if graph.is_connected(network.heat_transfer_secondary[0].id + "_secondary", id):
-            return True
-    return False
@@ -81,3 +81,29 @@ class EsdlAssetMapper:
         asset_type = type(model.esdl_asset)
         mapper = conversion_dict_mappers[asset_type]()
         return mapper.to_entity(model)  # type: ignore
+
+    @staticmethod
+    def to_entities(
+        models: list[EsdlAssetObject], mappers: dict[type, EsdlMapperAbstract] | None = None
+    ) -> list[AssetAbstract]:
+        """Method to map a list of esdl assets to asset entity classes.
+
+        A single mapper is used for all assets of the same type, so values cached by a mapper,
+        like the heat transfer coefficients of pipes, are reused for the other assets.
+
+        :param list[EsdlAssetObject] models: Objects to be converted to asset entities.
+        :param dict mappers: Mappers to use per esdl asset type, for example a pipe mapper with
+            a pipe catalog. Mappers of the other types are created.
+
+        :return: List of entity objects of type AssetAbstract in the same order as the models.
+        """
+        mappers = {} if mappers is None else dict(mappers)
+        entities = []
+        for model in models:
+            asset_type = type(model.esdl_asset)
+            if asset_type not in conversion_dict_mappers:
+                raise NotImplementedError(str(model.esdl_asset) + " not implemented in conversion")
+            if asset_type not in mappers:
+                mappers[asset_type] = conversion_dict_mappers[asset_type]()
+            entities.append(mappers[asset_type].to_entity(model))
+        return entities
@@ -14,11 +14,13 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Module containing the Esdl to Pipe asset mapper class."""
 import logging
+from pathlib import Path
 from typing import Any
 
 import numpy as np
 from esdl.edr.client import EDRClient
 
+from omotes_simulator_core.adapter.utility.edr_pipe_catalog import EdrPipeCatalog
 from omotes_simulator_core.entities.assets.asset_abstract import AssetAbstract
 from omotes_simulator_core.entities.assets.asset_defaults import PIPE_DEFAULTS, PipeSchedules
 from omotes_simulator_core.entities.assets.esdl_asset_object import EsdlAssetObject
@@ -32,9 +34,47 @@ from omotes_simulator_core.simulation.mappers.mappers import EsdlMapperAbstract
 logger = logging.getLogger(__name__)
 
 
+def _fetch_inner_diameter_from_edr(dn_diameter: int, schedule: PipeSchedules) -> float:
+    """Retrieve the inner diameter of a pipe from the EDR.
+
+    :param int dn_diameter: the nominal diameter of the pipe.
+    :param PipeSchedules schedule: the insulation schedule of the pipe.
+    :return: Inner diameter of the pipe [m].
+    """
+    esdl_object = EsdlAssetPipeMapper._get_esdl_object_from_edr(f"DN{dn_diameter}", schedule)
+    return float(esdl_object.innerDiameter)
+
+
+def create_pipe_catalog(cache_file: str | Path | None = None) -> EdrPipeCatalog:
+    """Create a catalog of pipe inner diameters retrieving missing diameters from the EDR.
+
+    :param str | Path cache_file: File to persist the catalog in, so the diameters are only
+        retrieved from the EDR once over multiple runs. When None the catalog is kept in memory.
+    :return: Catalog of inner diameters.
+    """
+    return EdrPipeCatalog(
+        fetch_inner_diameter=_fetch_inner_diameter_from_edr, cache_file=cache_file
+    )
+
+
 class EsdlAssetPipeMapper(EsdlMapperAbstract):
     """Class to map an ESDL asset to a pipe entity class."""
 
+    pipe_catalog: EdrPipeCatalog
+    """Catalog of the inner diameters of pipes that only have a nominal diameter."""
+
+    def __init__(self, pipe_catalog: EdrPipeCatalog | None = None) -> None:
+        """Constructor of the pipe mapper.
+
+        The heat transfer coefficients are cached per material and inner diameter for the
+        lifetime of the mapper, so mapping many pipes of the same type computes them only once.
+
+        :param EdrPipeCatalog pipe_catalog: Catalog of inner diameters, when None a catalog is
+            created that retrieves the diameters from the EDR and keeps them in memory.
+        """
+        self.pipe_catalog = create_pipe_catalog() if pipe_catalog is None else pipe_catalog
+        self._heat_transfer_coefficients: dict[tuple[Any, float], float] = {}
+
     def to_esdl(self, entity: Pipe) -> EsdlAssetObject:
         """Map a Pipe entity to an EsdlAsset."""
         raise NotImplementedError("EsdlAssetPipeMapper.to_esdl()")
@@ -52,7 +92,7 @@ class EsdlAssetPipeMapper(EsdlMapperAbstract):
             length=esdl_asset.get_property("length", PIPE_DEFAULTS.length),
             inner_diameter=self._get_diameter(esdl_asset=esdl_asset),
             roughness=esdl_asset.get_property("roughness", PIPE_DEFAULTS.roughness),
-            alpha_value=self._get_heat_transfer_coefficient(esdl_asset),
+            alpha_value=self._get_cached_heat_transfer_coefficient(esdl_asset),
             minor_loss_coefficient=esdl_asset.get_property(
                 "minor_loss_coefficient", PIPE_DEFAULTS.minor_loss_coefficient
             ),
@@ -64,6 +104,25 @@ class EsdlAssetPipeMapper(EsdlMapperAbstract):
 
         return pipe_entity
 
+    def _get_cached_heat_transfer_coefficient(self, esdl_asset: EsdlAssetObject) -> float:
+        """Get the heat transfer coefficient of the pipe from the cache of the mapper.
+
+        The cache is keyed on the material of the pipe and its inner diameter. For a material
+        reference the referenced material is used, so all pipes referring to the same material
+        share the cache entry.
+
+        :param EsdlAssetObject esdl_asset: The ESDL asset object associated with the
+                current pipe object.
+        :return: The heat transfer coefficient of the pipe [W/(m2 K)].
+        """
+        material = esdl_asset.esdl_asset.material
+        if material is None:
+            return PIPE_DEFAULTS.alpha_value
+        key = (getattr(material, "reference", material), esdl_asset.esdl_asset.innerDiameter)
+        if key not in self._heat_transfer_coefficients:
+            self._heat_transfer_coefficients[key] = self._get_heat_transfer_coefficient(esdl_asset)
+        return self._heat_transfer_coefficients[key]
+
     @staticmethod
     def _get_heat_transfer_coefficient(esdl_asset: EsdlAssetObject) -> float:
         """Calculate the heat transfer coefficient of the pipe.
@@ -90,8 +149,7 @@ class EsdlAssetPipeMapper(EsdlMapperAbstract):
         else:
             return PIPE_DEFAULTS.alpha_value
 
-    @staticmethod
-    def _get_diameter(esdl_asset: EsdlAssetObject) -> float:
+    def _get_diameter(self, esdl_asset: EsdlAssetObject) -> float:
         """Retrieve the diameter of the pipe and convert it if necessary.
 
         :param EsdlAssetObject esdl_asset: The ESDL asset object associated with the
@@ -110,14 +168,11 @@ class EsdlAssetPipeMapper(EsdlMapperAbstract):
 
         if inner_diameter == 0:
             if dn_diameter is not None:
-                esdl_object = EsdlAssetPipeMapper._get_esdl_object_from_edr(
-                    dn_diameter.name, schedule
-                )
                 logger.info(
                     f"Property innerDiameter is not set for: {esdl_asset.get_name()}, "
                     f"Schedule S1 is assumed for retrieval of pipe diameter from EDR list."
                 )
-                return float(esdl_object.innerDiameter)
+                return self.pipe_catalog.get_inner_diameter(dn_diameter.name, schedule)
             else:
                 return PIPE_DEFAULTS.diameter
         else:
@@ -17,9 +17,14 @@
 import logging
 
 from esdl.esdl import Joint as esdl_junction
+from esdl.esdl import Pipe as esdl_pipe
 
 from omotes_simulator_core.adapter.transforms.esdl_asset_mapper import EsdlAssetMapper
+from omotes_simulator_core.adapter.transforms.esdl_asset_mappers.pipe_mapper import (
+    EsdlAssetPipeMapper,
+)
 from omotes_simulator_core.adapter.transforms.string_to_esdl import OmotesAssetLabels
+from omotes_simulator_core.adapter.utility.edr_pipe_catalog import EdrPipeCatalog
 from omotes_simulator_core.entities.assets.asset_abstract import AssetAbstract
 from omotes_simulator_core.entities.assets.junction import Junction
 from omotes_simulator_core.entities.esdl_object import EsdlObject
@@ -78,12 +83,15 @@ def replace_joint_in_connected_assets(
 class EsdlEnergySystemMapper(EsdlMapperAbstract):
     """Creates a HeatNetwork entity object based on a PyESDL EnergySystem object."""
 
-    def __init__(self, esdl_object: EsdlObject):
+    def __init__(self, esdl_object: EsdlObject, pipe_catalog: EdrPipeCatalog | None = None):
         """Constructor for esdl to heat network mapper.
 
         :param esdl_object: Esdl object to be converted to a Heatnetwork
+        :param pipe_catalog: Catalog of the inner diameters of pipes, when None the pipe mapper
+            creates a catalog retrieving the diameters from the EDR.
         """
         self.esdl_object = esdl_object
+        self.pipe_catalog = pipe_catalog
 
     def to_esdl(self, entity: HeatNetwork) -> EsdlObject:
         """Method to convert a HeatNetwork object back to an esdlobject.
@@ -159,21 +167,25 @@ class EsdlEnergySystemMapper(EsdlMapperAbstract):
         :param Network network: network to add the components to.
         :return: List of pyassets.
         """
-        py_assets_list = []
+        enabled_esdl_assets = []
         for esdl_asset in self.esdl_object.get_all_assets_of_type(OmotesAssetLabels.ASSET):
             # Esdl Junctions need to be skipped in this method, they are added in another method.
             if isinstance(esdl_asset.esdl_asset, esdl_junction):
                 continue
             if esdl_asset.get_state() == "ENABLED":  # Only use asset if it is enabled.
-                py_assets_list.append(EsdlAssetMapper.to_entity(esdl_asset))
-                network.add_existing_asset(py_assets_list[-1].solver_asset)
+                enabled_esdl_assets.append(esdl_asset)
             else:
                 logger.warning(
                     f"The state of {esdl_asset.get_name()} is set to {esdl_asset.get_state()}. "
                     f"This asset will be ignored by the simulator.",
                     extra={"esdl_object_id": esdl_asset.get_id()},
                 )
-
+        # Map the assets in bulk, so mappers can reuse values computed for similar assets.
+        py_assets_list = EsdlAssetMapper.to_entities(
+            enabled_esdl_assets, {esdl_pipe: EsdlAssetPipeMapper(self.pipe_catalog)}
+        )
+        for py_asset in py_assets_list:
+            network.add_existing_asset(py_asset.solver_asset)
         return py_assets_list
 
     def _get_junction(self) -> dict[str, list[tuple[str, str]]]:
@@ -0,0 +1,151 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the catalog of pipe inner diameters from the EDR."""
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+from omotes_simulator_core.entities.assets.asset_defaults import PipeSchedules
+
+logger = logging.getLogger(__name__)
+
+
+class EdrPipeCatalog:
+    """Catalog of the inner diameter of Logstor steel pipes per nominal diameter and schedule.
+
+    Inner diameters are retrieved once per nominal diameter and schedule and kept in memory. The
+    catalog can be preloaded from a file and is written to the cache file when new diameters are
+    retrieved, so runs without access to the EDR can use a catalog prepared beforehand. When no
+    fetch function is given, the catalog only serves the diameters it already contains.
+    """
+
+    fetch_inner_diameter: Callable[[int, PipeSchedules], float] | None
+    """Function retrieving the inner diameter [m] for a nominal diameter and schedule."""
+
+    cache_file: Path | None
+    """File to which the catalog is written when new diameters are retrieved."""
+
+    def __init__(
+        self,
+        fetch_inner_diameter: Callable[[int, PipeSchedules], float] | None = None,
+        cache_file: str | Path | None = None,
+    ) -> None:
+        """Constructor of the EDR pipe catalog.
+
+        :param Callable fetch_inner_diameter: Function retrieving the inner diameter [m] for a
+            nominal diameter and schedule, when None the catalog works offline.
+        :param str | Path cache_file: File to persist the catalog in, it is loaded when it
+            exists.
+        """
+        self.fetch_inner_diameter = fetch_inner_diameter
+        self.cache_file = None if cache_file is None else Path(cache_file)
+        self._inner_diameters: dict[tuple[int, PipeSchedules], float] = {}
+        if self.cache_file is not None and self.cache_file.is_file():
+            self.load(self.cache_file)
+
+    def __len__(self) -> int:
+        """Method to get the number of entries in the catalog."""
+        return len(self._inner_diameters)
+
+    def get_inner_diameter(self, dn_diameter: str | int, schedule: PipeSchedules) -> float:
+        """Method to get the inner diameter of a pipe.
+
+        :param str | int dn_diameter: Nominal diameter of the pipe, e.g. "DN100" or 100.
+        :param PipeSchedules schedule: Insulation schedule of the pipe.
+        :return: Inner diameter of the pipe [m].
+        """
+        key = (self._to_nominal_diameter(dn_diameter), schedule)
+        if key not in self._inner_diameters:
+            if self.fetch_inner_diameter is None:
+                raise RuntimeError(
+                    f"Inner diameter for DN diameter '{dn_diameter}' and schedule "
+                    f"{schedule.name} is not in the pipe catalog."
+                )
+            self._inner_diameters[key] = float(self.fetch_inner_diameter(*key))
+            if self.cache_file is not None:
+                self.save(self.cache_file)
+        return self._inner_diameters[key]
+
+    def add_inner_diameter(
+        self, dn_diameter: str | int, schedule: PipeSchedules, inner_diameter: float
+    ) -> None:
+        """Method to add the inner diameter of a pipe to the catalog.
+
+        :param str | int dn_diameter: Nominal diameter of the pipe, e.g. "DN100" or 100.
+        :param PipeSchedules schedule: Insulation schedule of the pipe.
+        :param float inner_diameter: Inner diameter of the pipe [m].
+        """
+        self._inner_diameters[(self._to_nominal_diameter(dn_diameter), schedule)] = float(
+            inner_diameter
+        )
+
+    def load(self, file_path: str | Path) -> None:
+        """Method to load the inner diameters from a file into the catalog.
+
+        The file is a json file with the schedule names as keys, each holding the inner diameters
+        [m] by nominal diameter, e.g. {"S1": {"100": 0.1071}}. Entries already in the catalog are
+        overwritten by the entries in the file.
+
+        :param str | Path file_path: Path of the file to load.
+        """
+        with open(file_path) as file:
+            content = json.load(file)
+        for schedule_name, inner_diameters in content.items():
+            schedule = PipeSchedules[schedule_name]
+            for dn_diameter, inner_diameter in inner_diameters.items():
+                self.add_inner_diameter(int(dn_diameter), schedule, inner_diameter)
+
+    def save(self, file_path: str | Path) -> None:
+        """Method to write the catalog to a file in the format read by load.
+
+        The catalog is written to a temporary file first, so other processes never read a
+        partially written file.
+
+        :param str | Path file_path: Path of the file to write.
+        """
+        content: dict[str, dict[str, float]] = {}
+        for (dn_diameter, schedule), inner_diameter in sorted(
+            self._inner_diameters.items(), key=lambda item: (item[0][1].value, item[0][0])
+        ):
+            content.setdefault(schedule.name, {})[str(dn_diameter)] = inner_diameter
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_descriptor, temp_path = tempfile.mkstemp(dir=file_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as file:
+                json.dump(content, file, indent=2)
+            os.replace(temp_path, file_path)
+        except OSError as error:
+            logger.warning(f"Could not write pipe catalog file {file_path}: {error}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def _to_nominal_diameter(dn_diameter: str | int) -> int:
+        """Method to convert a nominal diameter like "DN100" to an integer.
+
+        :param str | int dn_diameter: Nominal diameter of the pipe.
+        :return: Nominal diameter as integer.
+        """
+        if isinstance(dn_diameter, int):
+            return dn_diameter
+        try:
+            return int(dn_diameter.replace("DN", ""))
+        except ValueError as error:
+            raise RuntimeError(f"Invalid DN diameter '{dn_diameter}': {error}") from error
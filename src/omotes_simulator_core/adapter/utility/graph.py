@@ -13,19 +13,30 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Module of simple graph class to help detect connectivity of the network."""
-import networkx as nx
+from typing import Any
+
+import numpy as np
+import scipy as sp
 
 
 class Graph:
-    """Main class for the graph."""
+    """Main class for the graph.
+
+    The nodes are stored by an integer index and the edges as pairs of indices. For the
+    connectivity queries the edges are converted to a sparse adjacency matrix in CSR format, which
+    is kept until the graph is changed.
+    """
 
     def __init__(self) -> None:
         """Constructor of the class.
 
-        The graph is stored as a dictionary of nodes and a list of edges.
-        Both are initialised empty.
+        The graph is stored as a dictionary from node name to index, a list of node names and a
+        set of edges. All are initialised empty.
         """
-        self.graph = nx.Graph()
+        self._node_index: dict[str, int] = {}
+        self._node_names: list[str] = []
+        self._edges: set[tuple[int, int]] = set()
+        self._adjacency: sp.sparse.csr_array | None = None
 
     def add_node(self, node: str) -> None:
         """Method to add a node to the graph.
@@ -35,7 +46,9 @@ class Graph:
         """
         if self.node_exists(node):
             raise ValueError(f"Node {node} already exists in the graph.")
-        self.graph.add_node(node)
+        self._node_index[node] = len(self._node_names)
+        self._node_names.append(node)
+        self._adjacency = None
 
     def connect(self, node1: str, node2: str) -> None:
         """Method to connect two nodes in the graph.
@@ -47,20 +60,25 @@ class Graph:
         :param str node1: Name of the first node.
         :param str node2: Name of the second node.
         """
-        if not self.node_exists(node1):
-            raise ValueError(f"Node {node1} does not exist in the graph.")
-        if not self.node_exists(node2):
-            raise ValueError(f"Node {node2} does not exist in the graph.")
         if self.is_directly_connected(node1, node2):
             return
-        self.graph.add_edge(node1, node2)
+        self._edges.add(self._edge(node1, node2))
+        self._adjacency = None
 
     def node_exists(self, node: str) -> bool:
         """Method to check if a node exists in the graph.
 
         :param str node: Name of the node to check.
         """
-        return bool(self.graph.has_node(node))
+        return node in self._node_index
+
+    def number_of_nodes(self) -> int:
+        """Method to get the number of nodes in the graph."""
+        return len(self._node_names)
+
+    def number_of_edges(self) -> int:
+        """Method to get the number of edges in the graph."""
+        return len(self._edges)
 
     def is_directly_connected(self, node1: str, node2: str) -> bool:
         """Method to check if two nodes are connected in the graph.
@@ -71,14 +89,7 @@ class Graph:
         :param str node1: Name of the first node.
         :param str node2: Name of the second node.
         """
-        if not self.node_exists(node1):
-            raise ValueError(f"Node {node1} does not exist in the graph.")
-        if not self.node_exists(node2):
-            raise ValueError(f"Node {node2} does not exist in the graph.")
-        for node in self.graph.neighbors(node1):
-            if node == node2:
-                return True
-        return False
+        return self._edge(node1, node2) in self._edges
 
     def is_connected(self, node1: str, node2: str) -> bool:
         """Method to check if two nodes are connected in the graph.
@@ -98,28 +109,107 @@ class Graph:
     def get_path(self, node1: str, node2: str) -> list[str]:
         """Method to get the path between two nodes in the graph.
 
-        First it is checked if the nodes are in the graph. Then the shortest path algorithms is
-        used. If no path is found an empty list is returned.
+        First it is checked if the nodes are in the graph. Then a breadth-first search is done
+        from the first node, which gives the shortest path since the edges have no weight. If no
+        path is found an empty list is returned.
         :param str node1: Name of the first node.
         :param str node2: Name of the second node.
         """
-        if not self.node_exists(node1):
-            raise ValueError(f"Node {node1} does not exist in the graph.")
-        if not self.node_exists(node2):
-            raise ValueError(f"Node {node2} does not exist in the graph.")
-        try:
-            # Method to look up the shortest path between two nodes, using
-            # Dijkstra's algorithm. The method only returns a single
-            # shortest path, so it is not guaranteed to return all paths.
-            return nx.shortest_path(self.graph, node1, node2)  # type: ignore
-        except nx.NetworkXNoPath:
+        self._check_node_exists(node1)
+        self._check_node_exists(node2)
+        start = self._node_index[node1]
+        end = self._node_index[node2]
+        _, predecessors = sp.sparse.csgraph.breadth_first_order(
+            self._get_adjacency(), start, directed=False, return_predecessors=True
+        )
+        if start != end and predecessors[end] < 0:
             return []
+        path = [end]
+        while path[-1] != start:
+            path.append(int(predecessors[path[-1]]))
+        return [self._node_names[index] for index in reversed(path)]
+
+    def get_connected_components(self) -> dict[str, int]:
+        """Method to get the connected component each node belongs to.
+
+        The components are numbered from 0 onwards. Two nodes are connected when they have the
+        same component number.
+
+        :return: Dict with the node name as key and the number of the component as value.
+        """
+        if not self._node_names:
+            return {}
+        _, labels = sp.sparse.csgraph.connected_components(self._get_adjacency(), directed=False)
+        return {name: int(label) for name, label in zip(self._node_names, labels)}
 
     def is_tree(self) -> bool:
         """Method to check if the graph is a tree.
 
-        This check is needed since we cannot handle cycles.
+        This check is needed since we cannot handle cycles. A graph is a tree when it is
+        connected and has one edge less than it has nodes.
 
         :return: True if the graph is tree, False otherwise.
         """
-        return bool(nx.is_tree(self.graph))
+        if not self._node_names:
+            raise ValueError("A graph without nodes is not a tree.")
+        if self.number_of_edges() != self.number_of_nodes() - 1:
+            return False
+        number_of_components, _ = sp.sparse.csgraph.connected_components(
+            self._get_adjacency(), directed=False
+        )
+        return bool(number_of_components == 1)
+
+    def to_networkx(self) -> Any:
+        """Method to convert the graph to a networkx graph.
+
+        networkx is an optional dependency, which is only needed for this method.
+
+        :return: networkx.Graph with the same nodes and edges.
+        """
+        try:
+            import networkx as nx
+        except ImportError as error:
+            raise ImportError(
+                "networkx is required to convert the graph, install omotes-simulator-core[networkx]"
+            ) from error
+        graph = nx.Graph()
+        graph.add_nodes_from(self._node_names)
+        graph.add_edges_from(
+            (self._node_names[index1], self._node_names[index2]) for index1, index2 in self._edges
+        )
+        return graph
+
+    def _check_node_exists(self, node: str) -> None:
+        """Method to raise an error when the node does not exist in the graph.
+
+        :param str node: Name of the node to check.
+        """
+        if not self.node_exists(node):
+            raise ValueError(f"Node {node} does not exist in the graph.")
+
+    def _edge(self, node1: str, node2: str) -> tuple[int, int]:
+        """Method to get the edge between two nodes as an ordered pair of node indices.
+
+        When the nodes are not in the graph, an error is raised.
+        :param str node1: Name of the first node.
+        :param str node2: Name of the second node.
+        """
+        self._check_node_exists(node1)
+        self._check_node_exists(node2)
+        index1 = self._node_index[node1]
+        index2 = self._node_index[node2]
+        return (index1, index2) if index1 <= index2 else (index2, index1)
+
+    def _get_adjacency(self) -> sp.sparse.csr_array:
+        """Method to get the symmetric adjacency matrix of the graph in CSR format."""
+        if self._adjacency is None:
+            number_of_nodes = self.number_of_nodes()
+            if self._edges:
+                rows, columns = np.array(sorted(self._edges), dtype=np.int32).T
+            else:
+                rows = columns = np.array([], dtype=np.int32)
+            self._adjacency = sp.sparse.csr_array(
+                (np.ones(len(rows), dtype=np.int8), (rows, columns)),
+                shape=(number_of_nodes, number_of_nodes),
+            )
+        return self._adjacency
@@ -0,0 +1,78 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Command line entry point running the benchmark cases on synthetic heat networks."""
+import argparse
+import logging
+
+from omotes_simulator_core.benchmark.benchmark_cases import (
+    BENCHMARK_CASES,
+    RUN_YEAR_CASE,
+    run_benchmarks,
+    write_results,
+)
+from omotes_simulator_core.benchmark.network_generator import (
+    RADIAL_TOPOLOGY,
+    RING_TOPOLOGY,
+    NetworkGeneratorSettings,
+)
+from omotes_simulator_core.benchmark.regression_gate import calibrate
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Run benchmark cases on synthetic heat networks of increasing size."
+    )
+    parser.add_argument(
+        "--topology", nargs="+", default=[RADIAL_TOPOLOGY], choices=[RADIAL_TOPOLOGY, RING_TOPOLOGY]
+    )
+    parser.add_argument("--consumers", nargs="+", type=int, default=[10, 100, 1000])
+    parser.add_argument("--producers", type=int, default=1)
+    parser.add_argument("--storages", type=int, default=0)
+    parser.add_argument("--heat-pump", action="store_true")
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        default=[case for case in BENCHMARK_CASES if case != RUN_YEAR_CASE],
+        choices=BENCHMARK_CASES,
+    )
+    parser.add_argument("--timestep", type=int, default=3600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--no-isolate", action="store_true", help="Run all cases in the current process."
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    logging.getLogger("omotes_simulator_core").setLevel(logging.ERROR)
+    logging.getLogger("omotes_simulator_core.benchmark").setLevel(logging.INFO)
+    results = run_benchmarks(
+        cases=args.cases,
+        settings=[
+            NetworkGeneratorSettings(
+                topology=topology,
+                number_of_consumers=number_of_consumers,
+                number_of_producers=args.producers,
+                number_of_storages=args.storages,
+                has_heat_pump=args.heat_pump,
+                seed=args.seed,
+            )
+            for topology in args.topology
+            for number_of_consumers in args.consumers
+        ],
+        timestep=args.timestep,
+        isolate=not args.no_isolate,
+    )
+    write_results(results, args.output, calibrate())
@@ -0,0 +1,296 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the benchmark cases run on synthetic heat networks."""
+import dataclasses
+import json
+import logging
+import multiprocessing
+import platform
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from omotes_simulator_core import __version__
+from omotes_simulator_core.adapter.transforms.controller_mapper import EsdlControllerMapper
+from omotes_simulator_core.adapter.transforms.mappers import EsdlEnergySystemMapper
+from omotes_simulator_core.benchmark.network_generator import (
+    NetworkGenerator,
+    NetworkGeneratorSettings,
+)
+from omotes_simulator_core.entities.esdl_object import EsdlObject
+from omotes_simulator_core.entities.heat_network import HeatNetwork
+from omotes_simulator_core.entities.network_controller import NetworkController
+from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+from omotes_simulator_core.infrastructure.profiling import get_peak_rss
+from omotes_simulator_core.simulation.networksimulation import NetworkSimulation
+
+logger = logging.getLogger(__name__)
+
+NETWORK_BUILD_CASE = "network_build"
+"""Case converting the esdl to a heat network and network controller."""
+SOLVE_CASE = "solve"
+"""Case solving the first time step of the network once."""
+RUN_DAY_CASE = "run_day"
+"""Case running the simulation over a day."""
+RUN_WEEK_CASE = "run_week"
+"""Case running the simulation over a week."""
+RUN_YEAR_CASE = "run_year"
+"""Case running the simulation over a year."""
+GATHER_OUTPUT_CASE = "gather_output"
+"""Case gathering the output of a simulation over a week."""
+
+CASE_DURATIONS = {
+    NETWORK_BUILD_CASE: timedelta(days=1),
+    SOLVE_CASE: timedelta(days=1),
+    RUN_DAY_CASE: timedelta(days=1),
+    RUN_WEEK_CASE: timedelta(weeks=1),
+    RUN_YEAR_CASE: timedelta(days=365),
+    GATHER_OUTPUT_CASE: timedelta(weeks=1),
+}
+"""Duration of the simulation per benchmark case, the profiles of the network cover it."""
+BENCHMARK_CASES = tuple(CASE_DURATIONS)
+"""Names of all benchmark cases."""
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of a benchmark case."""
+
+    case: str
+    """Name of the benchmark case."""
+    settings: dict[str, Any]
+    """Settings of the generated network."""
+    number_of_assets: int
+    """Number of assets of the heat network."""
+    number_of_unknowns: int
+    """Number of unknowns of the matrix of the solver."""
+    number_of_time_steps: int
+    """Number of time steps simulated in the case, 0 when no time step is simulated."""
+    time: float
+    """Wall clock time [s] of the benchmarked part of the case."""
+    solver_iterations: int
+    """Total number of iterations of the solver."""
+    controller_iterations: int
+    """Total number of iterations between the network and the controller."""
+    peak_rss: int | None
+    """Peak resident set size [bytes] of the process, None when it is not available."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Method to convert the result to a dict which can be written to json.
+
+        :return: Dict with the fields of the result.
+        """
+        return dataclasses.asdict(self)
+
+    @classmethod
+    def from_dict(cls, content: dict[str, Any]) -> "BenchmarkResult":
+        """Method to create a result from a dict as written by to_dict.
+
+        :param dict content: Dict with the fields of the result.
+        :return: The benchmark result.
+        """
+        return cls(**{field.name: content[field.name] for field in dataclasses.fields(cls)})
+
+    def get_settings(self) -> NetworkGeneratorSettings:
+        """Method to get the settings of the generated network of the result.
+
+        :return: Settings of the generated network.
+        """
+        settings = dict(self.settings)
+        settings["start"] = datetime.fromisoformat(settings["start"])
+        return NetworkGeneratorSettings(**settings)
+
+
+def _build(esdl_object: EsdlObject, timestep: int) -> tuple[HeatNetwork, NetworkController]:
+    """Function to convert the esdl to a heat network and network controller.
+
+    :param EsdlObject esdl_object: Esdl of the network.
+    :param int timestep: Timestep [s] of the simulation.
+    :return: Tuple with the heat network and network controller.
+    """
+    network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+    controller = EsdlControllerMapper().to_entity(esdl_object, timestep=timestep)
+    return network, controller
+
+
+def run_benchmark_case(
+    case: str, settings: NetworkGeneratorSettings, timestep: int = 3600
+) -> BenchmarkResult:
+    """Function to run a benchmark case on a generated network.
+
+    The profiles of the generated network are extended to cover the duration of the case. Only
+    the part of the case named by it is timed, the network is generated and built beforehand.
+
+    :param str case: Name of the benchmark case.
+    :param NetworkGeneratorSettings settings: Settings of the generated network.
+    :param int timestep: Timestep [s] of the simulation.
+    :return: Result of the benchmark case.
+    """
+    if case not in CASE_DURATIONS:
+        raise ValueError(f"Unknown benchmark case: {case}")
+    duration = CASE_DURATIONS[case]
+    settings = dataclasses.replace(
+        settings,
+        number_of_profile_values=int(duration.total_seconds()) // settings.profile_timestep + 2,
+    )
+    start = settings.start.astimezone(timezone.utc).replace(tzinfo=None)
+    config = SimulationConfiguration(
+        simulation_id=uuid.uuid4(),
+        name=f"Benchmark {case}",
+        timestep=timestep,
+        start=start,
+        stop=start + duration,
+    )
+    esdl_object = NetworkGenerator(settings).to_esdl_object()
+
+    number_of_time_steps = 0
+    solver_iterations = 0
+    controller_iterations = 0
+    start_time = time.perf_counter()
+    network, controller = _build(esdl_object, timestep)
+    if case == NETWORK_BUILD_CASE:
+        elapsed_time = time.perf_counter() - start_time
+    elif case == SOLVE_CASE:
+        controller.update_network_state(heat_network=network)
+        time_step = config.start.replace(tzinfo=timezone.utc)
+        controller_input = controller.update_setpoints(time_step)
+        network.solver.reset_statistics()
+        start_time = time.perf_counter()
+        network.run_time_step(time_step, timestep, controller_input)
+        elapsed_time = time.perf_counter() - start_time
+        solver_iterations = network.solver.number_of_iterations
+        controller_iterations = 1
+    else:
+        simulation = NetworkSimulation(network, controller)
+        start_time = time.perf_counter()
+        simulation.run(config, lambda progress, message: None)
+        elapsed_time = time.perf_counter() - start_time
+        number_of_time_steps = len(simulation.timing_report)
+        timing = simulation.timing_report.to_dataframe()
+        solver_iterations = int(timing["solver_iterations"].sum())
+        controller_iterations = int(timing["controller_iterations"].sum())
+        if case == GATHER_OUTPUT_CASE:
+            start_time = time.perf_counter()
+            simulation.gather_output()
+            elapsed_time = time.perf_counter() - start_time
+
+    settings_dict = dataclasses.asdict(settings)
+    settings_dict["start"] = settings.start.isoformat()
+    return BenchmarkResult(
+        case=case,
+        settings=settings_dict,
+        number_of_assets=len(network.assets),
+        number_of_unknowns=network.solver.matrix.num_unknowns,
+        number_of_time_steps=number_of_time_steps,
+        time=elapsed_time,
+        solver_iterations=solver_iterations,
+        controller_iterations=controller_iterations,
+        peak_rss=get_peak_rss(),
+    )
+
+
+def _set_log_level(level: int) -> None:
+    """Function to set the log level of the package in a process running benchmark cases.
+
+    :param int level: Log level of the package in the parent process.
+    """
+    logging.getLogger("omotes_simulator_core").setLevel(level)
+
+
+def run_benchmarks(
+    cases: list[str],
+    settings: list[NetworkGeneratorSettings],
+    timestep: int = 3600,
+    isolate: bool = True,
+) -> list[BenchmarkResult]:
+    """Function to run benchmark cases on generated networks.
+
+    The peak resident set size only covers a single case when the case runs in its own process,
+    otherwise it is the peak of all cases run so far. The log level of the package is passed on
+    to the processes running the cases.
+
+    :param list[str] cases: Names of the benchmark cases to run.
+    :param list settings: Settings of the generated networks, every case is run on every network.
+    :param int timestep: Timestep [s] of the simulation.
+    :param bool isolate: Run every case in a new process.
+    :return: List with the results of the benchmark cases.
+    """
+    results = []
+    for network_settings in settings:
+        for case in cases:
+            logger.info(
+                f"Running benchmark case {case} with {network_settings.number_of_consumers} "
+                f"consumers in a {network_settings.topology} network"
+            )
+            if isolate:
+                with ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_set_log_level,
+                    initargs=(logging.getLogger("omotes_simulator_core").getEffectiveLevel(),),
+                ) as executor:
+                    result = executor.submit(
+                        run_benchmark_case, case, network_settings, timestep
+                    ).result()
+            else:
+                result = run_benchmark_case(case, network_settings, timestep)
+            logger.info(f"Benchmark case {case} took {result.time:.3f} s")
+            results.append(result)
+    return results
+
+
+def write_results(
+    results: list[BenchmarkResult], path: str | Path, calibration_time: float | None = None
+) -> None:
+    """Function to write the benchmark results to a json file.
+
+    Next to the results the file holds the version of the package and the platform it ran on.
+
+    :param list[BenchmarkResult] results: Results of the benchmark cases.
+    :param str | Path path: Path of the json file.
+    :param float calibration_time: Time [s] of the calibration benchmark on the machine the
+        results are from, used to compare results of different machines.
+    """
+    content = {
+        "metadata": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "calibration_time": calibration_time,
+        },
+        "results": [result.to_dict() for result in results],
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as file:
+        json.dump(content, file, indent=2)
+
+
+def read_results(path: str | Path) -> tuple[list[BenchmarkResult], dict[str, Any]]:
+    """Function to read the benchmark results from a json file written by write_results.
+
+    :param str | Path path: Path of the json file.
+    :return: Tuple with the results of the benchmark cases and the metadata of the file.
+    """
+    with open(path) as file:
+        content = json.load(file)
+    return [BenchmarkResult.from_dict(result) for result in content["results"]], content["metadata"]
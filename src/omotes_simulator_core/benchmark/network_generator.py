@@ -0,0 +1,444 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the generator of synthetic heat networks for benchmarking."""
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import esdl
+import numpy as np
+from esdl.esdl_handler import EnergySystemHandler
+
+from omotes_simulator_core.entities.esdl_object import EsdlObject
+
+RADIAL_TOPOLOGY = "radial"
+"""Topology of a tree, every node is connected to a single parent node."""
+RING_TOPOLOGY = "ring"
+"""Topology of a ring of nodes, with cross connections forming a mesh."""
+
+SPECIFIC_HEAT_CAPACITY = 4180.0
+"""Specific heat capacity [J/kg/K] used to size the pipes."""
+DENSITY = 1000.0
+"""Density [kg/m3] used to size the pipes."""
+MINIMUM_INNER_DIAMETER = 0.05
+"""Smallest inner diameter [m] of the generated pipes."""
+
+
+@dataclass
+class NetworkGeneratorSettings:
+    """Settings of a synthetic heat network."""
+
+    topology: str = RADIAL_TOPOLOGY
+    """Topology of the network, radial or ring."""
+    number_of_consumers: int = 10
+    """Number of heating demands in the network."""
+    number_of_producers: int = 1
+    """Number of producers in the network."""
+    number_of_storages: int = 0
+    """Number of heat storages in the network."""
+    has_heat_pump: bool = False
+    """Add a water to water heat pump, with a producer in a separate source circuit.
+
+    The network controller supports a single heat transfer asset per network, so the network has
+    at most one heat pump.
+    """
+    consumers_per_node: int = 2
+    """Number of consumers connected to a node of the network."""
+    branching_factor: int = 3
+    """Number of child nodes of a node in the radial topology."""
+    cross_connection_interval: int = 0
+    """Number of nodes between the cross connections of the ring topology, 0 for a plain ring."""
+    pipe_length: float = 100.0
+    """Length [m] of the pipes between the nodes."""
+    design_velocity: float = 1.0
+    """Velocity [m/s] at peak demand used to size the pipes."""
+    supply_temperature: float = 80.0
+    """Supply temperature [C] of the network."""
+    return_temperature: float = 40.0
+    """Return temperature [C] of the network."""
+    peak_demand: float = 100000.0
+    """Peak demand [W] of a consumer."""
+    start: datetime = datetime(2019, 1, 1, tzinfo=timezone.utc)
+    """Start of the demand profiles."""
+    profile_timestep: int = 3600
+    """Timestep [s] of the demand profiles."""
+    number_of_profile_values: int = 25
+    """Number of values of each demand profile."""
+    seed: int = 0
+    """Seed of the random generator, the same settings always give the same network."""
+
+    def __post_init__(self) -> None:
+        """Method to validate the settings."""
+        if self.topology not in (RADIAL_TOPOLOGY, RING_TOPOLOGY):
+            raise ValueError(f"Unknown topology of the network: {self.topology}")
+        if self.number_of_consumers < 1:
+            raise ValueError("A network needs at least one consumer.")
+        if self.number_of_producers < 1:
+            raise ValueError("A network needs at least one producer.")
+        if self.number_of_storages < 0:
+            raise ValueError("The number of storages cannot be negative.")
+        if self.consumers_per_node < 1 or self.branching_factor < 1:
+            raise ValueError("The consumers per node and the branching factor should be positive.")
+        if self.number_of_profile_values < 2:
+            raise ValueError("A demand profile needs at least two values.")
+
+    @property
+    def number_of_nodes(self) -> int:
+        """Number of nodes of the network, every node has at least one consumer."""
+        return max(math.ceil(self.number_of_consumers / self.consumers_per_node), 1)
+
+
+class NetworkGenerator:
+    """Generator of synthetic heat networks as esdl energy systems.
+
+    The network consists of nodes, each a supply and a return joint, which are connected by a
+    supply and a return pipe. Every node has the same number of consumers, the producers and
+    storages are spread evenly over the nodes and the heat pump is at the middle node. The pipes
+    are sized for the peak demand of the consumers downstream of the first node. The demand
+    profiles are stored as time series profiles in the esdl, so no connection to a profile
+    database is needed.
+    """
+
+    settings: NetworkGeneratorSettings
+    """Settings of the generated network."""
+
+    def __init__(self, settings: NetworkGeneratorSettings) -> None:
+        """Constructor of the network generator.
+
+        :param NetworkGeneratorSettings settings: Settings of the generated network.
+        """
+        self.settings = settings
+
+    def to_esdl_object(self) -> EsdlObject:
+        """Method to generate the network as esdl object.
+
+        :return: EsdlObject with the generated network.
+        """
+        return EsdlObject(self.generate())
+
+    def generate(self) -> EnergySystemHandler:
+        """Method to generate the network.
+
+        :return: EnergySystemHandler with the generated energy system.
+        """
+        settings = self.settings
+        self._rng = np.random.default_rng(settings.seed)
+        self._esh = EnergySystemHandler()
+        energy_system = self._esh.create_empty_energy_system(
+            name=f"Synthetic {settings.topology} network",
+            es_description=f"Synthetic network with {settings.number_of_consumers} consumers",
+        )
+        self._area = energy_system.instance[0].area
+        information = esdl.EnergySystemInformation(id="information")
+        information.carriers = esdl.Carriers(id="carriers")
+        information.quantityAndUnits = esdl.QuantityAndUnits(id="quantity_and_units")
+        energy_system.energySystemInformation = information
+        self._carrier = self._add_carrier(
+            "heat", settings.supply_temperature, settings.return_temperature
+        )
+        self._power_unit = esdl.QuantityAndUnitType(
+            id="power_in_w",
+            description="Power in W",
+            physicalQuantity=esdl.PhysicalQuantityEnum.POWER,
+            unit=esdl.UnitEnum.WATT,
+        )
+        information.quantityAndUnits.quantityAndUnit.append(self._power_unit)
+
+        number_of_nodes = settings.number_of_nodes
+        edges = self._get_edges(number_of_nodes)
+        nodes = [self._add_node(index) for index in range(number_of_nodes)]
+        node_loads = self._add_assets(nodes)
+        diameters = self._get_inner_diameters(number_of_nodes, edges, node_loads)
+        for index, (node1, node2) in enumerate(edges):
+            self._add_pipe_pair(index, nodes[node1], nodes[node2], diameters[index])
+        return self._esh
+
+    def _add_carrier(
+        self, name: str, supply_temperature: float, return_temperature: float
+    ) -> esdl.HeatCommodity:
+        """Method to add a heat carrier to the energy system.
+
+        :param str name: Name of the carrier.
+        :param float supply_temperature: Supply temperature [C] of the carrier.
+        :param float return_temperature: Return temperature [C] of the carrier.
+        :return: The added carrier.
+        """
+        carrier = esdl.HeatCommodity(
+            id=f"carrier_{name}",
+            name=name,
+            supplyTemperature=supply_temperature,
+            returnTemperature=return_temperature,
+        )
+        self._esh.energy_system.energySystemInformation.carriers.carrier.append(carrier)
+        return carrier
+
+    def _add_asset(self, asset: esdl.Asset, carrier: esdl.HeatCommodity | None = None) -> None:
+        """Method to add an asset with an in and an out port to the area.
+
+        :param esdl.Asset asset: Asset to add.
+        :param esdl.HeatCommodity carrier: Carrier of the ports, the network carrier when None.
+        """
+        carrier = self._carrier if carrier is None else carrier
+        asset.port.append(esdl.InPort(id=f"{asset.id}_in", name="In", carrier=carrier))
+        asset.port.append(esdl.OutPort(id=f"{asset.id}_out", name="Out", carrier=carrier))
+        self._area.asset.append(asset)
+
+    def _add_node(self, index: int) -> tuple[esdl.Joint, esdl.Joint]:
+        """Method to add a node, consisting of a supply and a return joint.
+
+        :param int index: Index of the node.
+        :return: Tuple with the supply and the return joint.
+        """
+        supply_joint = esdl.Joint(id=f"Joint_supply_{index}", name=f"Joint_supply_{index}")
+        return_joint = esdl.Joint(id=f"Joint_return_{index}", name=f"Joint_return_{index}")
+        self._add_asset(supply_joint)
+        self._add_asset(return_joint)
+        return supply_joint, return_joint
+
+    def _get_edges(self, number_of_nodes: int) -> list[tuple[int, int]]:
+        """Method to get the connections between the nodes.
+
+        :param int number_of_nodes: Number of nodes of the network.
+        :return: List with the indices of the upstream and downstream node of the connections.
+        """
+        settings = self.settings
+        if settings.topology == RADIAL_TOPOLOGY:
+            return [
+                ((node - 1) // settings.branching_factor, node)
+                for node in range(1, number_of_nodes)
+            ]
+        edges = [(node, node + 1) for node in range(number_of_nodes - 1)]
+        if number_of_nodes > 2:
+            edges.append((number_of_nodes - 1, 0))
+        if settings.cross_connection_interval > 0:
+            half = number_of_nodes // 2
+            for node in range(
+                settings.cross_connection_interval, half, settings.cross_connection_interval
+            ):
+                edges.append((node, number_of_nodes - node))
+        return edges
+
+    def _get_node_indices(
+        self, number_of_assets: int, number_of_nodes: int, offset: float = 0.0
+    ) -> list[int]:
+        """Method to spread a number of assets evenly over the nodes.
+
+        :param int number_of_assets: Number of assets to spread.
+        :param int number_of_nodes: Number of nodes of the network.
+        :param float offset: Fraction of the distance between the assets before the first asset,
+            with 0 the first asset is at the first node.
+        :return: List with the index of the node per asset.
+        """
+        return [
+            int((index + offset) * number_of_nodes / number_of_assets)
+            for index in range(number_of_assets)
+        ]
+
+    def _add_assets(self, nodes: list[tuple[esdl.Joint, esdl.Joint]]) -> np.ndarray:
+        """Method to add the consumers, producers, storages and heat pumps to the nodes.
+
+        :param list nodes: Supply and return joint per node.
+        :return: Array with the peak demand [W] of the consumers per node.
+        """
+        settings = self.settings
+        number_of_nodes = len(nodes)
+        total_peak_demand = settings.number_of_consumers * settings.peak_demand
+        number_of_sources = settings.number_of_producers + int(settings.has_heat_pump)
+        source_power = 1.25 * total_peak_demand / number_of_sources
+
+        for index, node in enumerate(
+            self._get_node_indices(settings.number_of_producers, number_of_nodes)
+        ):
+            producer = esdl.GenericProducer(
+                id=f"Producer_{index}", name=f"Producer_{index}", power=source_power
+            )
+            self._add_asset(producer)
+            self._connect_source(producer.port, nodes[node])
+        for index, node in enumerate(
+            self._get_node_indices(settings.number_of_storages, number_of_nodes, 0.5)
+        ):
+            storage = esdl.HeatStorage(
+                id=f"Storage_{index}",
+                name=f"Storage_{index}",
+                volume=100.0,
+                fillLevel=0.5,
+                maxChargeRate=0.1 * total_peak_demand,
+                maxDischargeRate=0.1 * total_peak_demand,
+            )
+            self._add_asset(storage)
+            storage.port[0].connectedTo.append(nodes[node][0].port[1])
+            storage.port[1].connectedTo.append(nodes[node][1].port[0])
+        if settings.has_heat_pump:
+            self._add_heat_pump(nodes[number_of_nodes // 2], source_power)
+
+        node_loads = np.zeros(number_of_nodes)
+        scales = self._rng.uniform(0.5, 1.0, settings.number_of_consumers)
+        for index in range(settings.number_of_consumers):
+            node = index // settings.consumers_per_node
+            consumer = esdl.HeatingDemand(id=f"Consumer_{index}", name=f"Consumer_{index}")
+            self._add_asset(consumer)
+            consumer.port[0].profile.append(self._get_profile(index, scales[index]))
+            consumer.port[0].connectedTo.append(nodes[node][0].port[1])
+            consumer.port[1].connectedTo.append(nodes[node][1].port[0])
+            node_loads[node] += settings.peak_demand
+        return node_loads
+
+    def _connect_source(self, ports: list[esdl.Port], node: tuple[esdl.Joint, esdl.Joint]) -> None:
+        """Method to connect the in and out port of a source of heat to a node.
+
+        :param list ports: In and out port of the source.
+        :param tuple node: Supply and return joint of the node.
+        """
+        ports[0].connectedTo.append(node[1].port[1])
+        ports[1].connectedTo.append(node[0].port[0])
+
+    def _add_heat_pump(self, node: tuple[esdl.Joint, esdl.Joint], source_power: float) -> None:
+        """Method to add a water to water heat pump with a producer on its primary side.
+
+        :param tuple node: Supply and return joint of the node the secondary side is connected to.
+        :param float source_power: Thermal power [W] of the heat pump.
+        """
+        source_carrier = self._add_carrier("heat_pump_source", 40.0, 20.0)
+        coefficient_of_performance = 4.0
+        heat_pump = esdl.HeatPump(
+            id="HeatPump",
+            name="HeatPump",
+            COP=coefficient_of_performance,
+            power=source_power / coefficient_of_performance,
+        )
+        heat_pump.port.extend(
+            [
+                esdl.InPort(id="HeatPump_prim_in", name="PrimIn", carrier=source_carrier),
+                esdl.OutPort(id="HeatPump_prim_out", name="PrimOut", carrier=source_carrier),
+                esdl.InPort(id="HeatPump_sec_in", name="SecIn", carrier=self._carrier),
+                esdl.OutPort(id="HeatPump_sec_out", name="SecOut", carrier=self._carrier),
+            ]
+        )
+        self._area.asset.append(heat_pump)
+        self._connect_source(heat_pump.port[2:], node)
+
+        source = esdl.GenericProducer(
+            id="HeatPumpSource", name="HeatPumpSource", power=source_power
+        )
+        self._add_asset(source, source_carrier)
+        source.port[0].connectedTo.append(heat_pump.port[1])
+        source.port[1].connectedTo.append(heat_pump.port[0])
+
+    def _add_pipe_pair(
+        self,
+        index: int,
+        upstream_node: tuple[esdl.Joint, esdl.Joint],
+        downstream_node: tuple[esdl.Joint, esdl.Joint],
+        inner_diameter: float,
+    ) -> None:
+        """Method to connect two nodes with a supply and a return pipe.
+
+        :param int index: Index of the connection.
+        :param tuple upstream_node: Supply and return joint of the upstream node.
+        :param tuple downstream_node: Supply and return joint of the downstream node.
+        :param float inner_diameter: Inner diameter [m] of the pipes.
+        """
+        for name, start, end in (
+            ("supply", upstream_node[0], downstream_node[0]),
+            ("return", downstream_node[1], upstream_node[1]),
+        ):
+            pipe = esdl.Pipe(
+                id=f"Pipe_{name}_{index}",
+                name=f"Pipe_{name}_{index}",
+                length=self.settings.pipe_length,
+                innerDiameter=inner_diameter,
+            )
+            self._add_asset(pipe)
+            pipe.port[0].connectedTo.append(start.port[1])
+            pipe.port[1].connectedTo.append(end.port[0])
+
+    def _get_inner_diameters(
+        self, number_of_nodes: int, edges: list[tuple[int, int]], node_loads: np.ndarray
+    ) -> list[float]:
+        """Method to size the pipes for the peak demand of the consumers downstream.
+
+        The pipes of a tree spanning the network from the first node carry the peak demand of the
+        consumers in the subtree behind them. The other pipes get the diameter of the largest pipe
+        connected to their nodes.
+
+        :param int number_of_nodes: Number of nodes of the network.
+        :param list edges: Indices of the upstream and downstream node of the connections.
+        :param np.ndarray node_loads: Peak demand [W] of the consumers per node.
+        :return: List with the inner diameter [m] per connection.
+        """
+        neighbours: list[list[tuple[int, int]]] = [[] for _ in range(number_of_nodes)]
+        for index, (node1, node2) in enumerate(edges):
+            neighbours[node1].append((node2, index))
+            neighbours[node2].append((node1, index))
+        # Breadth first search from the first node, giving the edge to the parent of every node.
+        parent_edge = np.full(number_of_nodes, -1)
+        is_visited = np.zeros(number_of_nodes, dtype=bool)
+        is_visited[0] = True
+        order = [0]
+        for node in order:
+            for neighbour, index in neighbours[node]:
+                if not is_visited[neighbour]:
+                    is_visited[neighbour] = True
+                    parent_edge[neighbour] = index
+                    order.append(neighbour)
+
+        edge_loads = np.zeros(len(edges))
+        subtree_loads = node_loads.copy()
+        for node in reversed(order[1:]):
+            index = parent_edge[node]
+            edge_loads[index] = subtree_loads[node]
+            node1, node2 = edges[index]
+            subtree_loads[node1 if node2 == node else node2] += subtree_loads[node]
+
+        temperature_difference = self.settings.supply_temperature - self.settings.return_temperature
+        volume_flows = edge_loads / (SPECIFIC_HEAT_CAPACITY * temperature_difference * DENSITY)
+        diameters = np.maximum(
+            np.sqrt(4.0 * volume_flows / (math.pi * self.settings.design_velocity)),
+            MINIMUM_INNER_DIAMETER,
+        )
+        tree_edges = set(parent_edge[1:].tolist())
+        for index, (node1, node2) in enumerate(edges):
+            if index not in tree_edges:
+                diameters[index] = max(
+                    [diameters[parent_edge[node]] for node in (node1, node2) if node > 0]
+                    + [MINIMUM_INNER_DIAMETER]
+                )
+        return [round(float(diameter), 4) for diameter in diameters]
+
+    def _get_profile(self, index: int, scale: float) -> esdl.TimeSeriesProfile:
+        """Method to get the demand profile of a consumer.
+
+        The demand follows a daily pattern with a peak in the morning and a seasonal pattern with
+        the peak in winter, each consumer has its own scale and phase shift.
+
+        :param int index: Index of the consumer.
+        :param float scale: Fraction of the peak demand of the consumer.
+        :return: Time series profile with the heat demand [W].
+        """
+        settings = self.settings
+        hours = np.arange(
+            settings.number_of_profile_values
+        ) * settings.profile_timestep / 3600.0 + self._rng.uniform(0.0, 2.0)
+        daily = 0.7 + 0.3 * np.cos(2.0 * math.pi * (hours - 7.0) / 24.0)
+        seasonal = 0.6 + 0.4 * np.cos(2.0 * math.pi * hours / 8760.0)
+        values = settings.peak_demand * scale * daily * seasonal
+        return esdl.TimeSeriesProfile(
+            id=f"Consumer_{index}_profile",
+            startDateTime=settings.start,
+            timestep=settings.profile_timestep,
+            values=[float(value) for value in values],
+            profileQuantityAndUnit=esdl.QuantityAndUnitReference(reference=self._power_unit),
+        )
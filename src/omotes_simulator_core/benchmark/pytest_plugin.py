@@ -0,0 +1,146 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Pytest plugin adding a test per benchmark case of a baseline, failing on a regression.
+
+The plugin is enabled with ``-p omotes_simulator_core.benchmark.pytest_plugin`` and only adds
+tests when a baseline is given with ``--benchmark-baseline``. The tests are named after the
+benchmark cases, so ``-k benchmark`` selects only them.
+"""
+from typing import Any
+
+import pytest
+
+from omotes_simulator_core.benchmark.benchmark_cases import BenchmarkResult, read_results
+from omotes_simulator_core.benchmark.regression_gate import (
+    Tolerances,
+    calibrate,
+    compare_result,
+    get_case_name,
+    rerun_case,
+)
+
+
+class BenchmarkRegressionError(Exception):
+    """Error raised when a benchmark case regressed compared to the baseline."""
+
+
+class BenchmarkItem(pytest.Item):
+    """Test running a benchmark case and comparing it with the baseline."""
+
+    def __init__(
+        self,
+        *,
+        baseline: BenchmarkResult,
+        baseline_calibration_time: float | None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructor of the benchmark test.
+
+        :param BenchmarkResult baseline: Result of the benchmark case in the baseline.
+        :param float baseline_calibration_time: Calibration time [s] of the baseline machine.
+        """
+        super().__init__(**kwargs)
+        self.baseline = baseline
+        self.baseline_calibration_time = baseline_calibration_time
+
+    def runtest(self) -> None:
+        """Method to run the benchmark case and raise an error on a regression."""
+        config = self.config
+        current = rerun_case(
+            self.baseline,
+            isolate=not config.getoption("benchmark_no_isolate"),
+            repeats=config.getoption("benchmark_repeats"),
+        )
+        comparison = compare_result(
+            current,
+            self.baseline,
+            _get_calibration_time(config),
+            self.baseline_calibration_time,
+            Tolerances(
+                time=config.getoption("benchmark_time_tolerance"),
+                iterations=config.getoption("benchmark_iteration_tolerance"),
+                peak_rss=config.getoption("benchmark_peak_rss_tolerance"),
+            ),
+        )
+        self.user_properties.append(("benchmark", comparison.get_report()))
+        if comparison.is_regression:
+            raise BenchmarkRegressionError(comparison.get_report())
+
+    def repr_failure(self, excinfo: Any, style: Any = None) -> Any:
+        """Method to report a regression with the comparison instead of a traceback."""
+        if isinstance(excinfo.value, BenchmarkRegressionError):
+            return str(excinfo.value)
+        return super().repr_failure(excinfo, style)
+
+    def reportinfo(self) -> tuple[Any, int | None, str]:
+        """Method to get the location and name of the test in the report."""
+        return self.path, None, self.name
+
+
+_calibration_time_key = pytest.StashKey[float]()
+
+
+def _get_calibration_time(config: pytest.Config) -> float:
+    """Function to get the calibration time of the machine, which is timed once per session.
+
+    :param pytest.Config config: Configuration of the pytest session.
+    :return: Calibration time [s].
+    """
+    if _calibration_time_key not in config.stash:
+        config.stash[_calibration_time_key] = calibrate()
+    return config.stash[_calibration_time_key]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Hook adding the options of the benchmark regression tests."""
+    group = parser.getgroup("benchmark", "benchmark regression tests")
+    group.addoption(
+        "--benchmark-baseline",
+        default=None,
+        help="Json file with the baseline results, adds a test per benchmark case.",
+    )
+    group.addoption("--benchmark-time-tolerance", type=float, default=Tolerances.time)
+    group.addoption("--benchmark-iteration-tolerance", type=float, default=Tolerances.iterations)
+    group.addoption("--benchmark-peak-rss-tolerance", type=float, default=Tolerances.peak_rss)
+    group.addoption("--benchmark-repeats", type=int, default=3, help="Runs per benchmark case.")
+    group.addoption(
+        "--benchmark-no-isolate",
+        action="store_true",
+        help="Run the benchmark cases in the pytest process.",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(
+    session: pytest.Session, config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Hook adding a test per benchmark case of the baseline.
+
+    The hook runs before the tests are selected, so the tests can be selected with -k.
+    """
+    baseline_path = config.getoption("benchmark_baseline")
+    if baseline_path is None:
+        return
+    baseline_results, metadata = read_results(baseline_path)
+    for baseline in baseline_results:
+        items.append(
+            BenchmarkItem.from_parent(
+                session,
+                name=f"benchmark_{get_case_name(baseline)}",
+                baseline=baseline,
+                baseline_calibration_time=metadata.get("calibration_time"),
+            )
+        )
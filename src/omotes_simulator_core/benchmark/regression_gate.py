@@ -0,0 +1,300 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module comparing benchmark results against a stored baseline to detect regressions."""
+import argparse
+import logging
+import math
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import scipy as sp
+
+from omotes_simulator_core.benchmark.benchmark_cases import (
+    BenchmarkResult,
+    read_results,
+    run_benchmarks,
+    write_results,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Tolerances:
+    """Relative increase of the metrics of a benchmark case accepted before it is a regression."""
+
+    time: float = 0.5
+    """Accepted relative increase of the normalised time."""
+    iterations: float = 0.1
+    """Accepted relative increase of the solver and controller iterations."""
+    peak_rss: float = 0.25
+    """Accepted relative increase of the peak resident set size."""
+    minimum_time: float = 0.05
+    """Time [s] below which the time of a case is too noisy to compare."""
+
+
+@dataclass
+class MetricComparison:
+    """Comparison of a metric of a benchmark case with the baseline."""
+
+    metric: str
+    """Name of the metric."""
+    baseline: float
+    """Value of the metric in the baseline."""
+    current: float
+    """Current value of the metric."""
+    tolerance: float
+    """Accepted relative increase of the metric."""
+
+    @property
+    def ratio(self) -> float:
+        """Ratio of the current value to the value in the baseline."""
+        if self.baseline == 0:
+            return 1.0 if self.current == 0 else math.inf
+        return self.current / self.baseline
+
+    @property
+    def is_regression(self) -> bool:
+        """True when the metric increased more than the tolerance."""
+        return self.ratio > 1.0 + self.tolerance
+
+    @property
+    def is_improvement(self) -> bool:
+        """True when the metric decreased more than the tolerance."""
+        return self.ratio < 1.0 - self.tolerance
+
+
+@dataclass
+class CaseComparison:
+    """Comparison of a benchmark case with the baseline."""
+
+    name: str
+    """Name of the benchmark case and the network it ran on."""
+    metrics: list[MetricComparison] = field(default_factory=list)
+    """Comparison per metric of the case."""
+
+    @property
+    def is_regression(self) -> bool:
+        """True when any of the metrics is a regression."""
+        return any(metric.is_regression for metric in self.metrics)
+
+    def get_report(self) -> str:
+        """Method to get a report of the comparison with a line per metric.
+
+        :return: String with the report.
+        """
+        lines = []
+        for metric in self.metrics:
+            if metric.is_regression:
+                status = "REGRESSION"
+            elif metric.is_improvement:
+                status = "improved"
+            else:
+                status = "ok"
+            lines.append(
+                f"{status:<10} {self.name} {metric.metric}: {metric.baseline:.6g} -> "
+                f"{metric.current:.6g} (x{metric.ratio:.2f}, tolerance {metric.tolerance:.0%})"
+            )
+        return "\n".join(lines)
+
+
+def get_case_name(result: BenchmarkResult) -> str:
+    """Function to get a name identifying the benchmark case and the network it ran on.
+
+    :param BenchmarkResult result: Result of the benchmark case.
+    :return: Name of the case, e.g. "run_day[radial-10-1-0]" for a radial network with 10
+        consumers, 1 producer and no storages.
+    """
+    settings = result.settings
+    name = (
+        f"{result.case}[{settings['topology']}-{settings['number_of_consumers']}-"
+        f"{settings['number_of_producers']}-{settings['number_of_storages']}"
+    )
+    if settings["has_heat_pump"]:
+        name += "-heat_pump"
+    return name + "]"
+
+
+def calibrate(repeats: int = 5) -> float:
+    """Function to time a calibration benchmark, used to normalise for the speed of the machine.
+
+    The calibration mixes interpreted Python work on dicts, like the assembly of the equations,
+    with the factorization of a sparse matrix, like the solver. The fastest of the repeats is
+    taken, since slower repeats are disturbed by other processes.
+
+    :param int repeats: Number of times the calibration benchmark is run.
+    :return: Time [s] of the calibration benchmark.
+    """
+    size = 20000
+    matrix = sp.sparse.diags(
+        [np.full(size - 1, -1.0), np.full(size, 4.0), np.full(size - 1, -1.0)],
+        [-1, 0, 1],
+        format="csc",
+    )
+    right_hand_side = np.ones(size)
+    fastest = math.inf
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        values = {index: float(index) for index in range(100000)}
+        total = 0.0
+        for key, value in values.items():
+            total += value * 0.5 - key
+        for _ in range(5):
+            sp.sparse.linalg.spsolve(matrix, right_hand_side)
+        fastest = min(fastest, time.perf_counter() - start_time)
+    return fastest
+
+
+def compare_result(
+    current: BenchmarkResult,
+    baseline: BenchmarkResult,
+    current_calibration_time: float | None = None,
+    baseline_calibration_time: float | None = None,
+    tolerances: Tolerances | None = None,
+) -> CaseComparison:
+    """Function to compare the result of a benchmark case with the baseline.
+
+    The times are divided by the calibration time of the machine they ran on, when both are
+    known. Times below the minimum time are not compared, the iterations always are.
+
+    :param BenchmarkResult current: Current result of the benchmark case.
+    :param BenchmarkResult baseline: Result of the benchmark case in the baseline.
+    :param float current_calibration_time: Calibration time [s] of the current machine.
+    :param float baseline_calibration_time: Calibration time [s] of the baseline machine.
+    :param Tolerances tolerances: Accepted increase of the metrics, defaults when None.
+    :return: Comparison of the benchmark case.
+    """
+    tolerances = Tolerances() if tolerances is None else tolerances
+    comparison = CaseComparison(name=get_case_name(current))
+    if max(current.time, baseline.time) >= tolerances.minimum_time:
+        if current_calibration_time and baseline_calibration_time:
+            comparison.metrics.append(
+                MetricComparison(
+                    "normalised_time",
+                    baseline.time / baseline_calibration_time,
+                    current.time / current_calibration_time,
+                    tolerances.time,
+                )
+            )
+        else:
+            comparison.metrics.append(
+                MetricComparison("time", baseline.time, current.time, tolerances.time)
+            )
+    for metric in ("solver_iterations", "controller_iterations"):
+        comparison.metrics.append(
+            MetricComparison(
+                metric, getattr(baseline, metric), getattr(current, metric), tolerances.iterations
+            )
+        )
+    if current.peak_rss is not None and baseline.peak_rss is not None:
+        comparison.metrics.append(
+            MetricComparison("peak_rss", baseline.peak_rss, current.peak_rss, tolerances.peak_rss)
+        )
+    return comparison
+
+
+def rerun_case(
+    baseline: BenchmarkResult, isolate: bool = True, repeats: int = 3
+) -> BenchmarkResult:
+    """Function to run the benchmark case of a baseline result again.
+
+    The case is run several times and the fastest run is returned, since slower runs are
+    disturbed by other processes. The iterations do not differ between the runs.
+
+    :param BenchmarkResult baseline: Result of the benchmark case in the baseline.
+    :param bool isolate: Run every case in a new process.
+    :param int repeats: Number of times the case is run.
+    :return: Result of the fastest run.
+    """
+    return min(
+        (
+            run_benchmarks([baseline.case], [baseline.get_settings()], isolate=isolate)[0]
+            for _ in range(max(repeats, 1))
+        ),
+        key=lambda result: result.time,
+    )
+
+
+def run_regression_gate(
+    baseline_path: str | Path,
+    tolerances: Tolerances | None = None,
+    isolate: bool = True,
+    output_path: str | Path | None = None,
+    repeats: int = 3,
+) -> list[CaseComparison]:
+    """Function to run the benchmark cases of the baseline and compare them with it.
+
+    :param str | Path baseline_path: Path of the json file with the baseline results.
+    :param Tolerances tolerances: Accepted increase of the metrics, defaults when None.
+    :param bool isolate: Run every case in a new process.
+    :param str | Path output_path: Path of the json file the current results are written to,
+        when None they are not written. Pass the baseline path to update the baseline.
+    :param int repeats: Number of times every case is run.
+    :return: List with the comparison per benchmark case.
+    """
+    baseline_results, metadata = read_results(baseline_path)
+    calibration_time = calibrate()
+    logger.info(f"Calibration benchmark took {calibration_time:.4f} s")
+    current_results = []
+    comparisons = []
+    for baseline in baseline_results:
+        current = rerun_case(baseline, isolate, repeats)
+        current_results.append(current)
+        comparisons.append(
+            compare_result(
+                current, baseline, calibration_time, metadata.get("calibration_time"), tolerances
+            )
+        )
+    if output_path is not None:
+        write_results(current_results, output_path, calibration_time)
+    return comparisons
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compare the benchmark cases with a baseline, exits with 1 on a regression."
+    )
+    parser.add_argument("baseline")
+    parser.add_argument("--time-tolerance", type=float, default=Tolerances.time)
+    parser.add_argument("--iteration-tolerance", type=float, default=Tolerances.iterations)
+    parser.add_argument("--peak-rss-tolerance", type=float, default=Tolerances.peak_rss)
+    parser.add_argument("--output", help="Write the current results to this json file.")
+    parser.add_argument("--update", action="store_true", help="Overwrite the baseline.")
+    parser.add_argument("--repeats", type=int, default=3, help="Runs per case.")
+    parser.add_argument("--no-isolate", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    logging.getLogger("omotes_simulator_core").setLevel(logging.ERROR)
+    logging.getLogger("omotes_simulator_core.benchmark").setLevel(logging.INFO)
+    gate_comparisons = run_regression_gate(
+        args.baseline,
+        Tolerances(
+            time=args.time_tolerance,
+            iterations=args.iteration_tolerance,
+            peak_rss=args.peak_rss_tolerance,
+        ),
+        isolate=not args.no_isolate,
+        output_path=args.baseline if args.update else args.output,
+        repeats=args.repeats,
+    )
+    print("\n".join(comparison.get_report() for comparison in gate_comparisons))
+    regressions = [comparison.name for comparison in gate_comparisons if comparison.is_regression]
+    print(f"{len(regressions)} of {len(gate_comparisons)} benchmark cases regressed.")
+    sys.exit(1 if regressions else 0)
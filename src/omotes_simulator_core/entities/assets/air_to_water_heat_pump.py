@@ -77,14 +77,16 @@ class AirToWaterHeatPump(ProductionCluster):
         return abs(self.get_actual_heat_supplied()) / self.coefficient_of_performance
 
     def write_to_output(self) -> None:
-        """Method to write time step results to the output dict.
+        """Method to write time step results to the output store.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of the asset for a specific timestep.
+        The values are written to the last time step of the output store of the
+        asset.
         """
-        output_dict_temp = {
-            PROPERTY_HEAT_SUPPLY_SET_POINT: self.heat_demand_set_point,
-            PROPERTY_HEAT_SUPPLIED: self.get_actual_heat_supplied(),
-            PROPERTY_ELECTRICITY_CONSUMPTION: (self.get_electric_power_consumption()),
-        }
-        self.outputs[1][-1].update(output_dict_temp)  # Outputs appended to the out port.
+        # Outputs appended to the out port.
+        self.outputs.write(1, PROPERTY_HEAT_SUPPLY_SET_POINT, self.heat_demand_set_point)
+        if self.outputs.is_recorded(PROPERTY_HEAT_SUPPLIED):
+            self.outputs.write(1, PROPERTY_HEAT_SUPPLIED, self.get_actual_heat_supplied())
+        if self.outputs.is_recorded(PROPERTY_ELECTRICITY_CONSUMPTION):
+            self.outputs.write(
+                1, PROPERTY_ELECTRICITY_CONSUMPTION, self.get_electric_power_consumption()
+            )
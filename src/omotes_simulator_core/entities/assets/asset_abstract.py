@@ -17,8 +17,11 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
+from typing import Callable
 
-from pandas import DataFrame, concat
+import numpy as np
+import numpy.typing as npt
+from pandas import DataFrame, Index
 
 from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_MASSFLOW,
@@ -26,6 +29,8 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_TEMPERATURE,
     PROPERTY_VOLUMEFLOW,
 )
+from omotes_simulator_core.entities.assets.output_store import OutputStore
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 from omotes_simulator_core.entities.assets.utils import sign_output
 from omotes_simulator_core.solver.network.assets.base_asset import BaseAsset
 from omotes_simulator_core.solver.utils.fluid_properties import fluid_props
@@ -40,8 +45,8 @@ class AssetAbstract(ABC):
     asset_id: str
     """The unique identifier of the asset."""
 
-    outputs: list[list[dict[str, float]]]
-    """The output of the asset as a list with a dictionary per timestep."""
+    outputs: OutputStore
+    """The output of the asset with an array per port and property."""
 
     connected_ports: list[str]
     """List of ids of the connected ports."""
@@ -64,7 +69,7 @@ class AssetAbstract(ABC):
         self.name = asset_name
         self.asset_id = asset_id
         self.connected_ports = connected_ports
-        self.outputs = [[] for _ in range(len(self.connected_ports))]
+        self.outputs = OutputStore(number_of_ports=len(self.connected_ports))
         self.time_step: float = 3600  # s
         self.time = datetime.now()
 
@@ -80,6 +85,17 @@ class AssetAbstract(ABC):
             The keys of the dictionary are the names of the setpoints and the values are the values
         """
 
+    def set_setpoints_array(self, setpoints: SetpointArray, ordinal: int) -> None:
+        """Method to set the setpoints of the asset from a setpoint array.
+
+        By default the setpoints are converted to a dict and set with set_setpoints, assets that
+        are set every time step read the typed fields directly.
+
+        :param SetpointArray setpoints: The setpoints of the assets of the network.
+        :param int ordinal: Index of the record of this asset in the setpoint array.
+        """
+        self.set_setpoints(setpoints.get_setpoints(ordinal))
+
     def get_setpoints(self) -> dict[str, float]:
         """Placeholder to get the setpoint attributes of an asset.
 
@@ -96,22 +112,42 @@ class AssetAbstract(ABC):
         """
         return {}
 
+    def allocate_output(self, number_of_time_steps: int, dtype: npt.DTypeLike = None) -> None:
+        """Clear the output and allocate it for the given number of time steps.
+
+        :param int number_of_time_steps: The number of time steps of the simulation.
+        :param DTypeLike dtype: Data type of the output, when None the current data type is kept.
+        """
+        self.outputs.allocate(number_of_time_steps, dtype)
+
     def write_standard_output(self) -> None:
-        """Write the standard time step results of the asset to the output list.
+        """Write the standard time step results of the asset to the output store.
 
-        The output list is a list of list with dictionaries, where each dictionary
-        represents the output of its asset for a specific timestep of a specific port.
-        The basic properties mass flow rate, pressure and temperature are stored.
-        All assets can add their own properties to the dictionary via the write_output method.
+        A new time step is added to the output store, to which the basic properties mass flow
+        rate, pressure, temperature and volume flow rate are written for each port. Only the
+        properties recorded by the output store are computed.
+        All assets can add their own properties to the time step via the write_output method.
         """
+        self.outputs.add_time_step()
+        standard_output: dict[str, Callable[[int], float]] = {
+            PROPERTY_MASSFLOW: lambda i: sign_output(i) * self.solver_asset.get_mass_flow_rate(i),
+            PROPERTY_PRESSURE: self.solver_asset.get_pressure,
+            PROPERTY_TEMPERATURE: self.solver_asset.get_temperature,
+            PROPERTY_VOLUMEFLOW: lambda i: sign_output(i) * self.get_volume_flow_rate(i),
+        }
+        recorded_output = {
+            property_name: get_value
+            for property_name, get_value in standard_output.items()
+            if self.outputs.is_recorded(property_name)
+        }
         for i in range(len(self.connected_ports)):
-            output_dict_temp = {
-                PROPERTY_MASSFLOW: sign_output(i) * self.solver_asset.get_mass_flow_rate(i),
-                PROPERTY_PRESSURE: self.solver_asset.get_pressure(i),
-                PROPERTY_TEMPERATURE: self.solver_asset.get_temperature(i),
-                PROPERTY_VOLUMEFLOW: sign_output(i) * self.get_volume_flow_rate(i),
-            }
-            self.outputs[i].append(output_dict_temp)
+            self.outputs.write_values(
+                i,
+                {
+                    property_name: get_value(i)
+                    for property_name, get_value in recorded_output.items()
+                },
+            )
 
     def get_volume_flow_rate(self, i: int) -> float:
         """Calculates and returns the volume flow rate for the given port.
@@ -127,27 +163,36 @@ class AssetAbstract(ABC):
 
     @abstractmethod
     def write_to_output(self) -> None:
-        """Placeholder to write time step results to the output dict.
+        """Placeholder to write time step results to the output store.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of the asset for a specific timestep.
+        The values are written to the last time step of the output store, which is added by the
+        write_standard_output method.
         """
 
+    def get_output_columns(self) -> dict[tuple[str, str], np.ndarray]:
+        """Get the output of the asset as arrays per port and property.
+
+        The arrays are views on the output store, so no data is copied.
+
+        :return: Dict with a tuple of the port id and the property name as key and the array
+            with a value per time step as value.
+        """
+        columns = {}
+        for i, port_id in enumerate(self.connected_ports):
+            for property_name, values in self.outputs.get_port_arrays(i).items():
+                columns[(port_id, property_name)] = values
+        return columns
+
     def get_timeseries(self) -> DataFrame:
         """Get timeseries as a dataframe from an asset.
 
         The header is a tuple of the port id and the property name.
         """
-        # Create dataframe
-
-        temp_data = DataFrame()
-        for i in range(len(self.connected_ports)):
-            temp_frame = DataFrame(self.outputs[i])
-            temp_frame.columns = [
-                (self.connected_ports[i], column_name) for column_name in temp_frame.columns
-            ]
-            temp_data = concat([temp_data, temp_frame], axis=1)
-        return temp_data
+        columns = self.get_output_columns()
+        return DataFrame(
+            dict(enumerate(columns.values())),
+            index=range(self.outputs.number_of_time_steps),
+        ).set_axis(Index(list(columns), tupleize_cols=False), axis=1)
 
     def set_time_step(self, time_step: float) -> None:
         """Placeholder to set the time step for the asset.
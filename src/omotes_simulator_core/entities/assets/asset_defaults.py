@@ -120,6 +120,7 @@ class HeatBufferDefaults:
 
 
 # Default names
+OUTPUT_COLUMN_LEVELS = ("asset", "port", "property")
 PROPERTY_HEAT_DEMAND = "heat_demand"
 PROPERTY_HEAT_DEMAND_SET_POINT = "heat_demand_set_point"
 PROPERTY_TEMPERATURE_IN = "temperature_in"
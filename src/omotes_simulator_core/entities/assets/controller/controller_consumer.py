@@ -17,11 +17,13 @@
 import datetime
 import logging
 
+import numpy as np
 import pandas as pd
 
 from omotes_simulator_core.entities.assets.controller.asset_controller_abstract import (
     AssetControllerAbstract,
 )
+from omotes_simulator_core.entities.assets.controller.profile_array import ProfileArray
 from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
 
 logger = logging.getLogger(__name__)
@@ -49,7 +51,21 @@ class ControllerConsumer(AssetControllerAbstract):
         super().__init__(name, identifier)
         self.temperatures = temperatures
         self.max_power: float = max_power
-        self.profile: pd.DataFrame = profile.set_index("date") if not profile.empty else profile
+        self.profile = profile.set_index("date") if not profile.empty else profile
+
+    @property
+    def profile(self) -> pd.DataFrame:
+        """Resampled profile with the date as index."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: pd.DataFrame) -> None:
+        """Set the profile and convert it to an array for the lookups in time.
+
+        :param pd.DataFrame profile: Profile with the date as index and a values column.
+        """
+        self._profile = profile
+        self._profile_array = ProfileArray.from_profile(profile)
 
     def get_heat_demand(self, time: datetime.datetime) -> float:
         """Method to get the heat demand of the consumer.
@@ -57,13 +73,7 @@ class ControllerConsumer(AssetControllerAbstract):
         :param datetime.datetime time: Time for which to get the heat demand.
         :return: float with the heat demand.
         """
-        if self.profile.empty:
-            return 0.0
-
-        try:
-            demand = float(self.profile.loc[time, "values"])
-        except KeyError:
-            return 0.0
+        demand = self._profile_array.get_value(time, default=0.0)
 
         if demand > self.max_power:
             logging.warning(
@@ -72,3 +82,18 @@ class ControllerConsumer(AssetControllerAbstract):
             return self.max_power
         else:
             return demand
+
+    def get_heat_demand_array(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int
+    ) -> np.ndarray:
+        """Method to get the heat demand of the consumer for all time steps of a simulation.
+
+        The demand is capped at the maximum power of the consumer, like in get_heat_demand.
+
+        :param datetime.datetime start: Time of the first time step.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps.
+        :return: Array with the heat demand per time step.
+        """
+        demand = self._profile_array.sample(start, timestep, number_of_time_steps, default=0.0)
+        return np.minimum(demand, self.max_power)
@@ -16,6 +16,8 @@
 
 from enum import Enum
 
+import numpy as np
+
 from omotes_simulator_core.entities.assets.asset_defaults import (
     PRIMARY,
     PROPERTY_BYPASS,
@@ -28,7 +30,23 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
 from omotes_simulator_core.entities.assets.controller.asset_controller_abstract import (
     AssetControllerAbstract,
 )
-from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
+from omotes_simulator_core.entities.assets.controller.temperature_data import (
+    Temperatures,
+    celcius_to_kelvin,
+)
+
+SECONDARY_SET_PRIMARY_TEMPERATURES = Temperatures(
+    in_flow=celcius_to_kelvin(50), out_flow=celcius_to_kelvin(30)
+)
+"""Temperatures of the primary side when the asset is set by its secondary side."""
+SECONDARY_SET_SECONDARY_TEMPERATURES = Temperatures(
+    in_flow=celcius_to_kelvin(40), out_flow=celcius_to_kelvin(80)
+)
+"""Temperatures of the secondary side when the asset is set by its secondary side."""
+SECONDARY_SET_BYPASS_TEMPERATURES = Temperatures(
+    in_flow=celcius_to_kelvin(50), out_flow=celcius_to_kelvin(80)
+)
+"""Temperatures of both sides when the asset is set by its secondary side and bypassed."""
 
 
 class HeatTransferAssetType(Enum):
@@ -83,34 +101,21 @@ class ControllerHeatTransferAsset(AssetControllerAbstract):
         :param bypass: When true the heat exchange is bypassed, so the heat demand is not
         reduced by the factor. Default is False.
         """
-        if bypass:
-            return {
-                self.id: {
-                    PRIMARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
-                    PRIMARY + PROPERTY_TEMPERATURE_OUT: self.primary_temperatures.out_flow,
-                    PRIMARY + PROPERTY_TEMPERATURE_IN: self.primary_temperatures.in_flow,
-                    SECONDARY + PROPERTY_HEAT_DEMAND: heat_demand,
-                    SECONDARY + PROPERTY_TEMPERATURE_OUT: self.secondary_temperatures.out_flow,
-                    SECONDARY + PROPERTY_TEMPERATURE_IN: self.secondary_temperatures.in_flow,
-                    SECONDARY + PROPERTY_SET_PRESSURE: False,
-                    PRIMARY + PROPERTY_SET_PRESSURE: False,
-                    PROPERTY_BYPASS: True,
-                }
-            }
-        else:
-            return {
-                self.id: {
-                    PRIMARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
-                    PRIMARY + PROPERTY_TEMPERATURE_OUT: self.primary_temperatures.out_flow,
-                    PRIMARY + PROPERTY_TEMPERATURE_IN: self.primary_temperatures.in_flow,
-                    SECONDARY + PROPERTY_HEAT_DEMAND: heat_demand * self.factor,
-                    SECONDARY + PROPERTY_TEMPERATURE_OUT: self.secondary_temperatures.out_flow,
-                    SECONDARY + PROPERTY_TEMPERATURE_IN: self.secondary_temperatures.in_flow,
-                    SECONDARY + PROPERTY_SET_PRESSURE: False,
-                    PRIMARY + PROPERTY_SET_PRESSURE: False,
-                    PROPERTY_BYPASS: False,
-                }
+        # The heat demand is not reduced by the factor when the heat exchange is bypassed
+        secondary_heat_demand = heat_demand if bypass else heat_demand * self.factor
+        return {
+            self.id: {
+                PRIMARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
+                PRIMARY + PROPERTY_TEMPERATURE_OUT: self.primary_temperatures.out_flow,
+                PRIMARY + PROPERTY_TEMPERATURE_IN: self.primary_temperatures.in_flow,
+                SECONDARY + PROPERTY_HEAT_DEMAND: secondary_heat_demand,
+                SECONDARY + PROPERTY_TEMPERATURE_OUT: self.secondary_temperatures.out_flow,
+                SECONDARY + PROPERTY_TEMPERATURE_IN: self.secondary_temperatures.in_flow,
+                SECONDARY + PROPERTY_SET_PRESSURE: False,
+                PRIMARY + PROPERTY_SET_PRESSURE: False,
+                PROPERTY_BYPASS: bypass,
             }
+        }
 
     def set_asset_sec(
         self, heat_demand: float, bypass: bool = False
@@ -123,30 +128,88 @@ class ControllerHeatTransferAsset(AssetControllerAbstract):
         reduced by the factor. Default is False.
         """
         if bypass:
-            return {
-                self.id: {
-                    PRIMARY + PROPERTY_HEAT_DEMAND: heat_demand,
-                    PRIMARY + PROPERTY_TEMPERATURE_OUT: 273.15 + 80,
-                    PRIMARY + PROPERTY_TEMPERATURE_IN: 273.15 + 50,
-                    SECONDARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
-                    SECONDARY + PROPERTY_TEMPERATURE_OUT: 273.15 + 80,
-                    SECONDARY + PROPERTY_TEMPERATURE_IN: 273.15 + 50,
-                    SECONDARY + PROPERTY_SET_PRESSURE: False,
-                    PRIMARY + PROPERTY_SET_PRESSURE: False,
-                    PROPERTY_BYPASS: True,
-                }
-            }
+            primary_heat_demand = heat_demand
+            primary_temperatures = SECONDARY_SET_BYPASS_TEMPERATURES
+            secondary_temperatures = SECONDARY_SET_BYPASS_TEMPERATURES
         else:
-            return {
-                self.id: {
-                    PRIMARY + PROPERTY_HEAT_DEMAND: heat_demand / self.factor,
-                    PRIMARY + PROPERTY_TEMPERATURE_OUT: 273.15 + 30,
-                    PRIMARY + PROPERTY_TEMPERATURE_IN: 273.15 + 50,
-                    SECONDARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
-                    SECONDARY + PROPERTY_TEMPERATURE_OUT: 273.15 + 80,
-                    SECONDARY + PROPERTY_TEMPERATURE_IN: 273.15 + 40,
-                    SECONDARY + PROPERTY_SET_PRESSURE: False,
-                    PRIMARY + PROPERTY_SET_PRESSURE: False,
-                    PROPERTY_BYPASS: False,
-                }
+            primary_heat_demand = heat_demand / self.factor
+            primary_temperatures = SECONDARY_SET_PRIMARY_TEMPERATURES
+            secondary_temperatures = SECONDARY_SET_SECONDARY_TEMPERATURES
+        return {
+            self.id: {
+                PRIMARY + PROPERTY_HEAT_DEMAND: primary_heat_demand,
+                PRIMARY + PROPERTY_TEMPERATURE_OUT: primary_temperatures.out_flow,
+                PRIMARY + PROPERTY_TEMPERATURE_IN: primary_temperatures.in_flow,
+                SECONDARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
+                SECONDARY + PROPERTY_TEMPERATURE_OUT: secondary_temperatures.out_flow,
+                SECONDARY + PROPERTY_TEMPERATURE_IN: secondary_temperatures.in_flow,
+                SECONDARY + PROPERTY_SET_PRESSURE: False,
+                PRIMARY + PROPERTY_SET_PRESSURE: False,
+                PROPERTY_BYPASS: bypass,
+            }
+        }
+
+    def set_asset_prim_array(
+        self, heat_demand: np.ndarray, bypass: np.ndarray
+    ) -> dict[str, dict[str, np.ndarray | float | bool]]:
+        """Method to get the setpoints of set_asset_prim for multiple time steps at once.
+
+        :param np.ndarray heat_demand: Heat demand to set per time step.
+        :param np.ndarray bypass: Whether the heat exchange is bypassed per time step.
+        :return: dict with the asset id as key and a dict with the setpoints as value, of which
+            the values are an array per time step or a value that is the same for all time steps.
+        """
+        # The heat demand is not reduced by the factor when the heat exchange is bypassed
+        secondary_heat_demand = np.where(bypass, heat_demand, heat_demand * self.factor)
+        return {
+            self.id: {
+                PRIMARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
+                PRIMARY + PROPERTY_TEMPERATURE_OUT: self.primary_temperatures.out_flow,
+                PRIMARY + PROPERTY_TEMPERATURE_IN: self.primary_temperatures.in_flow,
+                SECONDARY + PROPERTY_HEAT_DEMAND: secondary_heat_demand,
+                SECONDARY + PROPERTY_TEMPERATURE_OUT: self.secondary_temperatures.out_flow,
+                SECONDARY + PROPERTY_TEMPERATURE_IN: self.secondary_temperatures.in_flow,
+                SECONDARY + PROPERTY_SET_PRESSURE: False,
+                PRIMARY + PROPERTY_SET_PRESSURE: False,
+                PROPERTY_BYPASS: bypass,
+            }
+        }
+
+    def set_asset_sec_array(
+        self, heat_demand: np.ndarray, bypass: np.ndarray
+    ) -> dict[str, dict[str, np.ndarray | float | bool]]:
+        """Method to get the setpoints of set_asset_sec for multiple time steps at once.
+
+        :param np.ndarray heat_demand: Heat demand to set per time step.
+        :param np.ndarray bypass: Whether the heat exchange is bypassed per time step.
+        :return: dict with the asset id as key and a dict with the setpoints as value, of which
+            the values are an array per time step or a value that is the same for all time steps.
+        """
+        # The heat demand is not increased by the factor when the heat exchange is bypassed
+        primary_heat_demand = np.where(bypass, heat_demand, heat_demand / self.factor)
+        bypass_temperatures = SECONDARY_SET_BYPASS_TEMPERATURES
+        primary_out_flow = np.where(
+            bypass, bypass_temperatures.out_flow, SECONDARY_SET_PRIMARY_TEMPERATURES.out_flow
+        )
+        primary_in_flow = np.where(
+            bypass, bypass_temperatures.in_flow, SECONDARY_SET_PRIMARY_TEMPERATURES.in_flow
+        )
+        secondary_out_flow = np.where(
+            bypass, bypass_temperatures.out_flow, SECONDARY_SET_SECONDARY_TEMPERATURES.out_flow
+        )
+        secondary_in_flow = np.where(
+            bypass, bypass_temperatures.in_flow, SECONDARY_SET_SECONDARY_TEMPERATURES.in_flow
+        )
+        return {
+            self.id: {
+                PRIMARY + PROPERTY_HEAT_DEMAND: primary_heat_demand,
+                PRIMARY + PROPERTY_TEMPERATURE_OUT: primary_out_flow,
+                PRIMARY + PROPERTY_TEMPERATURE_IN: primary_in_flow,
+                SECONDARY + PROPERTY_HEAT_DEMAND: -1 * heat_demand,
+                SECONDARY + PROPERTY_TEMPERATURE_OUT: secondary_out_flow,
+                SECONDARY + PROPERTY_TEMPERATURE_IN: secondary_in_flow,
+                SECONDARY + PROPERTY_SET_PRESSURE: False,
+                PRIMARY + PROPERTY_SET_PRESSURE: False,
+                PROPERTY_BYPASS: bypass,
             }
+        }
@@ -34,6 +34,7 @@ from omotes_simulator_core.entities.assets.controller.controller_storage import
     ControllerAtesStorage,
     ControllerIdealHeatStorage,
 )
+from omotes_simulator_core.entities.assets.controller.profile_array import ProfileArray
 
 
 class ControllerNetwork:
@@ -52,10 +53,16 @@ class ControllerNetwork:
     """List of all producers in the network."""
     storages: list[ControllerAtesStorage | ControllerIdealHeatStorage]
     """List of all storages in the network."""
-    factor_to_first_network: list[float]
-    """Factor to calculate power in the first network in the list of networks."""
+    conversion_factor: float
+    """Product of the factors to first network, converting power to the first network."""
     path: list[str]
     """Path from this network to the first network in the total system."""
+    asset_ids: set[str]
+    """Ids of all assets given to the network at construction, used to check for existence."""
+    total_heat_demand_array: ProfileArray | None = None
+    """Total heat demand of the consumers per time step of the simulation, when precomputed."""
+    total_supply_array: ProfileArray | None = None
+    """Total maximum power of the producers per time step of the simulation, when precomputed."""
 
     def __init__(
         self,
@@ -74,6 +81,29 @@ class ControllerNetwork:
         self.storages = storages_in
         self.factor_to_first_network = [factor_to_first_network]
         self.path: list[str] = []
+        self.asset_ids = {
+            asset.id
+            for asset in self.heat_transfer_assets_prim
+            + self.heat_transfer_assets_sec
+            + self.consumers
+            + self.producers
+            + self.storages
+        }
+
+    @property
+    def factor_to_first_network(self) -> list[float]:
+        """Factors to calculate power in the first network in the list of networks."""
+        return self._factor_to_first_network
+
+    @factor_to_first_network.setter
+    def factor_to_first_network(self, factors: list[float]) -> None:
+        """Set the factors to the first network and the conversion factor.
+
+        :param list[float] factors: Factors of the heat transfer assets on the path to the first
+            network.
+        """
+        self._factor_to_first_network = factors
+        self.conversion_factor = float(np.prod(np.array(factors, dtype=float)))
 
     def exists(self, identifier: str) -> bool:
         """Method to check an asset is in the network.
@@ -81,23 +111,56 @@ class ControllerNetwork:
         :param str identifier: Identifier of the asset to check.
         :return bool: True when the asset is in the network, False otherwise.
         """
-        return any(
-            [
-                asset.id == identifier
-                for asset in self.heat_transfer_assets_prim
-                + self.heat_transfer_assets_sec
-                + self.consumers
-                + self.producers
-                + self.storages
-            ]
-        )
+        return identifier in self.asset_ids
+
+    def set_time_grid(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int
+    ) -> None:
+        """Method to precompute the total demand and supply for the time steps of a simulation.
+
+        After this the totals at the time steps are looked up in an array, instead of being
+        summed over the profiles of all consumers and producers. Times that are not on the grid
+        are still summed over the profiles. The maximum power of the consumers and producers is
+        read once, so the grid needs to be set again when it is changed.
+
+        :param datetime.datetime start: Time of the first time step.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps.
+        """
+        total_heat_demand = np.zeros(number_of_time_steps)
+        for consumer in self.consumers:
+            total_heat_demand += consumer.get_heat_demand_array(
+                start, timestep, number_of_time_steps
+            )
+        total_supply = np.zeros(number_of_time_steps)
+        for producer in self.producers:
+            total_supply += producer.get_max_power_array(start, timestep, number_of_time_steps)
+        self.total_heat_demand_array = ProfileArray.from_grid(start, timestep, total_heat_demand)
+        self.total_supply_array = ProfileArray.from_grid(start, timestep, total_supply)
+
+    @staticmethod
+    def _get_precomputed(
+        profile_array: ProfileArray | None, time: datetime.datetime
+    ) -> float | None:
+        """Method to look up a precomputed total at the given time.
+
+        :param ProfileArray | None profile_array: Precomputed totals, None when not computed.
+        :param datetime.datetime time: Time to look up.
+        :return: Total at the given time, None when it is not precomputed for this time.
+        """
+        if profile_array is None:
+            return None
+        index = profile_array.get_index(time)
+        if index < 0:
+            return None
+        return float(profile_array.values[index])
 
     def get_total_heat_demand(self, time: datetime.datetime) -> float:
         """Method which the total heat demand at the given time corrected to the first network."""
-        return float(
-            sum([consumer.get_heat_demand(time) for consumer in self.consumers])
-            * float(np.prod(np.array(self.factor_to_first_network, dtype=float)))
-        )
+        total_heat_demand = self._get_precomputed(self.total_heat_demand_array, time)
+        if total_heat_demand is None:
+            total_heat_demand = sum([consumer.get_heat_demand(time) for consumer in self.consumers])
+        return float(total_heat_demand * self.conversion_factor)
 
     def get_total_discharge_storage(self) -> float:
         """Method to get the total storage discharge of the network corrected to the first network.
@@ -106,7 +169,7 @@ class ControllerNetwork:
         """
         return float(
             sum([storage.effective_max_discharge_power for storage in self.storages])
-            * float(np.prod(np.array(self.factor_to_first_network, dtype=float)))
+            * self.conversion_factor
         )
 
     def get_total_charge_storage(self) -> float:
@@ -116,7 +179,7 @@ class ControllerNetwork:
         """
         return float(
             sum([storage.effective_max_charge_power for storage in self.storages])
-            * float(np.prod(np.array(self.factor_to_first_network, dtype=float)))
+            * self.conversion_factor
         )
 
     def get_total_supply(self, time: datetime.datetime) -> float:
@@ -124,10 +187,10 @@ class ControllerNetwork:
 
         :return float: Total heat supply of all producers.
         """
-        return float(
-            sum([producer.get_max_power(time) for producer in self.producers])
-            * float(np.prod(np.array(self.factor_to_first_network, dtype=float)))
-        )
+        total_supply = self._get_precomputed(self.total_supply_array, time)
+        if total_supply is None:
+            total_supply = sum([producer.get_max_power(time) for producer in self.producers])
+        return float(total_supply * self.conversion_factor)
 
     def set_supply_to_max(self, time: datetime.datetime, priority: int = 0) -> dict:
         """Method to set the producers to the max power.
@@ -16,11 +16,13 @@
 
 import datetime
 
+import numpy as np
 import pandas as pd
 
 from omotes_simulator_core.entities.assets.controller.asset_controller_abstract import (
     AssetControllerAbstract,
 )
+from omotes_simulator_core.entities.assets.controller.profile_array import ProfileArray
 from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
 
 
@@ -51,7 +53,21 @@ class ControllerProducer(AssetControllerAbstract):
         self.power: float = power
         self.marginal_costs: float = marginal_costs
         self.priority: None | int = priority
-        self.profile: pd.DataFrame = profile.set_index("date") if not profile.empty else profile
+        self.profile = profile.set_index("date") if not profile.empty else profile
+
+    @property
+    def profile(self) -> pd.DataFrame:
+        """Resampled profile of the maximum power with the date as index."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, profile: pd.DataFrame) -> None:
+        """Set the profile and convert it to an array for the lookups in time.
+
+        :param pd.DataFrame profile: Profile with the date as index and a values column.
+        """
+        self._profile = profile
+        self._profile_array = ProfileArray.from_profile(profile)
 
     def get_max_power(self, time: datetime.datetime) -> float:
         """Gets the maximum producer power at the given timestep.
@@ -59,12 +75,16 @@ class ControllerProducer(AssetControllerAbstract):
         If there is a profile, it will look it up, otherwise it returns the
         maximum power defined in the esdl parameter.
         """
-        if self.profile.empty:
-            max_power = self.power
-        else:
-            try:
-                max_power = float(self.profile.loc[time, "values"])
-            except KeyError:
-                max_power = self.power
+        return self._profile_array.get_value(time, default=self.power)
+
+    def get_max_power_array(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int
+    ) -> np.ndarray:
+        """Method to get the maximum producer power for all time steps of a simulation.
 
-        return max_power
+        :param datetime.datetime start: Time of the first time step.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps.
+        :return: Array with the maximum power per time step.
+        """
+        return self._profile_array.sample(start, timestep, number_of_time_steps, self.power)
@@ -0,0 +1,90 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the allocation of the required supply to producers on priority."""
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.controller.controller_producer import ControllerProducer
+
+
+class MeritOrder:
+    """Merit order of the producers based on their priority.
+
+    The producers are grouped per priority once, sorted from priority 1 upwards, with the
+    cumulative capacity of the priorities. The required supply is allocated by setting the
+    priorities to their maximum power in order until the required supply is met, the last
+    priority is set to a part of its maximum power and the remaining priorities are not used.
+    Producers without a priority, or with a priority below 1, are never used.
+    The priorities and power of the producers are read once, so the merit order needs to be
+    created again when they are changed.
+    """
+
+    producers: list[ControllerProducer]
+    """Producers in the order of the columns of the factors."""
+    priorities: np.ndarray
+    """Priorities with producers in increasing order."""
+    capacities: np.ndarray
+    """Total power of the producers per priority."""
+    cumulative_capacities: np.ndarray
+    """Total power of the producers up to and including each priority."""
+    producer_levels: np.ndarray
+    """Index of the priority of each producer in priorities, -1 when the producer is not used."""
+
+    def __init__(self, producers: list[ControllerProducer]) -> None:
+        """Constructor of the merit order.
+
+        :param list[ControllerProducer] producers: Producers to allocate the supply to.
+        """
+        self.producers = list(producers)
+        producer_priorities = np.array(
+            [producer.priority if producer.priority is not None else 0 for producer in producers],
+            dtype=np.int64,
+        )
+        powers = np.array([producer.power for producer in producers], dtype=np.float64)
+        used = producer_priorities >= 1
+        self.priorities, levels = np.unique(producer_priorities[used], return_inverse=True)
+        self.capacities = np.zeros(len(self.priorities))
+        np.add.at(self.capacities, levels, powers[used])
+        self.cumulative_capacities = np.cumsum(self.capacities)
+        self.producer_levels = np.full(len(producers), -1, dtype=np.int64)
+        self.producer_levels[used] = levels
+
+    def get_factors(self, required_supply: float | np.ndarray) -> np.ndarray:
+        """Method to get the factor of the maximum power of each producer.
+
+        :param float | np.ndarray required_supply: Required supply, or an array with the
+            required supply per time step.
+        :return: Array with a row per required supply and a column per producer, with 1 for the
+            producers at maximum power and 0 for the producers that are not used.
+        """
+        required_supply = np.atleast_1d(np.asarray(required_supply, dtype=np.float64))
+        number_of_levels = len(self.priorities)
+        # The priority that meets the required supply is the first one with a cumulative
+        # capacity of at least the required supply.
+        last_level = np.searchsorted(self.cumulative_capacities, required_supply, side="left")
+        last_level[required_supply <= 0] = -1
+        level_factors = (np.arange(number_of_levels) < last_level[:, None]).astype(np.float64)
+        partial = (last_level >= 0) & (last_level < number_of_levels)
+        partial_level = last_level[partial]
+        level_factors[partial, partial_level] = (
+            1
+            + (required_supply[partial] - self.cumulative_capacities[partial_level])
+            / self.capacities[partial_level]
+        )
+        factors = np.zeros((len(required_supply), len(self.producers)))
+        used = self.producer_levels >= 0
+        factors[:, used] = level_factors[:, self.producer_levels[used]]
+        return factors
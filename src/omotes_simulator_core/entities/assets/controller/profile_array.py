@@ -0,0 +1,170 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the array representation of a profile used for fast lookups in time."""
+
+import calendar
+import datetime
+
+import numpy as np
+import pandas as pd
+
+MICROSECONDS_PER_SECOND = 1_000_000
+"""Number of microseconds in a second, the resolution of the times of a profile array."""
+
+
+def to_microseconds(time: datetime.datetime) -> int:
+    """Convert a time to the number of microseconds since the epoch.
+
+    Times without a timezone are taken as UTC, which is the timezone of the profiles.
+
+    :param datetime.datetime time: Time to convert.
+    :return: Number of microseconds since 1970-01-01 UTC.
+    """
+    return calendar.timegm(time.utctimetuple()) * MICROSECONDS_PER_SECOND + time.microsecond
+
+
+class ProfileArray:
+    """Values of a profile stored in a float64 array on an equidistant time grid.
+
+    Looking up the value at a time is integer arithmetic on the offset to the start of the grid,
+    which avoids the index lookup of a DataFrame in every time step. Profiles that are not
+    equidistant are looked up with a binary search on their times.
+    """
+
+    values: np.ndarray
+    """Values of the profile, one per time of the grid."""
+    start: int
+    """Time of the first value in microseconds since the epoch."""
+    step: int
+    """Time between two values in microseconds, 0 for a single value or a non equidistant one."""
+
+    def __init__(self, start: int, step: int, values: np.ndarray) -> None:
+        """Constructor of the profile array.
+
+        :param int start: Time of the first value in microseconds since the epoch.
+        :param int step: Time between two values in microseconds.
+        :param np.ndarray values: Values of the profile.
+        """
+        self.values = np.ascontiguousarray(values, dtype=np.float64)
+        self.start = start
+        self.step = step
+        self._times: np.ndarray | None = None
+
+    @classmethod
+    def from_profile(cls, profile: pd.DataFrame) -> "ProfileArray":
+        """Create a profile array from a profile with the date as index and a values column.
+
+        :param pd.DataFrame profile: Profile to convert, may be empty.
+        :return: Profile array with the values of the profile.
+        """
+        if profile.empty:
+            return cls(0, 0, np.empty(0))
+        index = pd.DatetimeIndex(profile.index)
+        if index.tz is not None:
+            index = index.tz_convert(datetime.timezone.utc).tz_localize(None)
+        times = index.values.astype("datetime64[us]").astype(np.int64)
+        values = profile["values"].to_numpy(dtype=np.float64)
+        steps = np.diff(times)
+        if len(steps) == 0:
+            return cls(int(times[0]), 0, values)
+        if steps[0] > 0 and np.all(steps == steps[0]):
+            return cls(int(times[0]), int(steps[0]), values)
+        profile_array = cls(int(times[0]), 0, values)
+        order = np.argsort(times, kind="stable")
+        profile_array._times = times[order]
+        profile_array.values = profile_array.values[order]
+        return profile_array
+
+    @classmethod
+    def from_grid(
+        cls, start: datetime.datetime, timestep: float, values: np.ndarray
+    ) -> "ProfileArray":
+        """Create a profile array from values on a time grid.
+
+        :param datetime.datetime start: Time of the first value.
+        :param float timestep: Time between two values in seconds.
+        :param np.ndarray values: Values on the time grid.
+        :return: Profile array with the given values.
+        """
+        return cls(to_microseconds(start), round(timestep * MICROSECONDS_PER_SECOND), values)
+
+    def __len__(self) -> int:
+        """Method to get the number of values in the profile array."""
+        return len(self.values)
+
+    def get_index(self, time: datetime.datetime) -> int:
+        """Method to get the index of the value at the given time.
+
+        :param datetime.datetime time: Time to look up.
+        :return: Index of the value, -1 when the time is not in the profile.
+        """
+        offset = to_microseconds(time) - self.start
+        if self._times is not None:
+            index = int(np.searchsorted(self._times, offset + self.start))
+            if index < len(self._times) and self._times[index] == offset + self.start:
+                return index
+            return -1
+        if self.step == 0:
+            return 0 if offset == 0 and len(self.values) > 0 else -1
+        index, remainder = divmod(offset, self.step)
+        if remainder != 0 or not 0 <= index < len(self.values):
+            return -1
+        return int(index)
+
+    def get_value(self, time: datetime.datetime, default: float) -> float:
+        """Method to get the value at the given time.
+
+        :param datetime.datetime time: Time to look up.
+        :param float default: Value returned when the time is not in the profile.
+        :return: Value of the profile at the given time.
+        """
+        index = self.get_index(time)
+        if index < 0:
+            return default
+        return float(self.values[index])
+
+    def sample(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int, default: float
+    ) -> np.ndarray:
+        """Method to get the values of the profile on a time grid.
+
+        :param datetime.datetime start: Time of the first time step of the grid.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps of the grid.
+        :param float default: Value for the time steps that are not in the profile.
+        :return: Array with a value per time step of the grid.
+        """
+        grid_start = to_microseconds(start)
+        grid_step = round(timestep * MICROSECONDS_PER_SECOND)
+        times = grid_start + grid_step * np.arange(number_of_time_steps, dtype=np.int64)
+        result = np.full(number_of_time_steps, default, dtype=np.float64)
+        if len(self.values) == 0:
+            return result
+        if self._times is not None:
+            indices = np.searchsorted(self._times, times)
+            clipped = np.minimum(indices, len(self._times) - 1)
+            found = (indices < len(self._times)) & (self._times[clipped] == times)
+            result[found] = self.values[clipped[found]]
+            return result
+        offsets = times - self.start
+        if self.step == 0:
+            found = offsets == 0
+            result[found] = self.values[0]
+            return result
+        indices, remainders = np.divmod(offsets, self.step)
+        found = (remainders == 0) & (indices >= 0) & (indices < len(self.values))
+        result[found] = self.values[indices[found]]
+        return result
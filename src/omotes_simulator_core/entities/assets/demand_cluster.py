@@ -28,11 +28,17 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_TEMPERATURE_IN,
     PROPERTY_TEMPERATURE_OUT,
 )
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray, get_field_mask
 from omotes_simulator_core.entities.assets.utils import heat_demand_and_temperature_to_mass_flow
 from omotes_simulator_core.solver.network.assets.production_asset import HeatBoundary
 
 logger = logging.getLogger(__name__)
 
+NECESSARY_SETPOINTS_MASK = get_field_mask(
+    (PROPERTY_TEMPERATURE_IN, PROPERTY_TEMPERATURE_OUT, PROPERTY_HEAT_DEMAND)
+)
+"""Mask of the setpoints that are required to set a demand cluster."""
+
 
 class DemandCluster(AssetAbstract):
     """A DemandCluster represents an asset that consumes heat."""
@@ -81,13 +87,45 @@ class DemandCluster(AssetAbstract):
             raise ValueError(
                 f"The setpoints {necessary_setpoints.difference(setpoints_set)} are missing."
             )
-        self.thermal_power_allocation = setpoints[PROPERTY_HEAT_DEMAND]
+        self._set_heat_demand_and_temperatures(
+            setpoints[PROPERTY_HEAT_DEMAND],
+            setpoints[PROPERTY_TEMPERATURE_IN],
+            setpoints[PROPERTY_TEMPERATURE_OUT],
+        )
 
-        self.temperature_out = setpoints[PROPERTY_TEMPERATURE_OUT]
+    def set_setpoints_array(self, setpoints: SetpointArray, ordinal: int) -> None:
+        """Method to set the setpoints of the asset from a setpoint array.
+
+        :param SetpointArray setpoints: The setpoints of the assets of the network.
+        :param int ordinal: Index of the record of this asset in the setpoint array.
+        """
+        if not setpoints.has_setpoints(ordinal, NECESSARY_SETPOINTS_MASK):
+            # The dict method reports the missing setpoints
+            self.set_setpoints(setpoints.get_setpoints(ordinal))
+            return
+        record = setpoints.records[ordinal]
+        self._set_heat_demand_and_temperatures(
+            float(record[PROPERTY_HEAT_DEMAND]),
+            float(record[PROPERTY_TEMPERATURE_IN]),
+            float(record[PROPERTY_TEMPERATURE_OUT]),
+        )
+
+    def _set_heat_demand_and_temperatures(
+        self, heat_demand: float, temperature_in: float, temperature_out: float
+    ) -> None:
+        """Method to set the heat demand and temperatures of the asset and its solver asset.
+
+        :param float heat_demand: The heat demand of the asset [W].
+        :param float temperature_in: The inlet temperature of the asset [K].
+        :param float temperature_out: The outlet temperature of the asset [K].
+        """
+        self.thermal_power_allocation = heat_demand
+
+        self.temperature_out = temperature_out
 
         if self.first_time_step or self.solver_asset.prev_sol[0] == 0.0:
 
-            self.temperature_in = setpoints[PROPERTY_TEMPERATURE_IN]
+            self.temperature_in = temperature_in
             self.first_time_step = False
         else:
             # After the first time step: use solver temperature
@@ -102,16 +140,14 @@ class DemandCluster(AssetAbstract):
         self.solver_asset.mass_flow_rate_set_point = adjusted_mass_flowrate  # type: ignore
 
     def write_to_output(self) -> None:
-        """Method to write time step results to the output dict.
+        """Method to write time step results to the output store.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of the asset for a specific timestep.
+        The values are written to the last time step of the output store of the
+        asset.
         """
-        output_dict_temp = {
-            PROPERTY_HEAT_DEMAND_SET_POINT: -self.thermal_power_allocation,
-            PROPERTY_HEAT_DEMAND: self.get_heat_supplied(),
-        }
-        self.outputs[1][-1].update(output_dict_temp)
+        self.outputs.write(1, PROPERTY_HEAT_DEMAND_SET_POINT, -self.thermal_power_allocation)
+        if self.outputs.is_recorded(PROPERTY_HEAT_DEMAND):
+            self.outputs.write(1, PROPERTY_HEAT_DEMAND, self.get_heat_supplied())
 
     def postprocess(self) -> None:
         """Postprocess after a simulation time step to update internal states.
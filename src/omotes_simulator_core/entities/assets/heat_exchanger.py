@@ -200,30 +200,31 @@ class HeatExchanger(AssetAbstract):
     def write_to_output(self) -> None:
         """Get output power and electricity consumption of the asset.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of its asset for a specific timestep.
+        The values are written to the last time step of the output store of the
+        asset.
         """
         # Primary side output
-        self.outputs[1][-1].update(
-            {
-                PROPERTY_HEAT_POWER_PRIMARY: (
-                    self.solver_asset.get_heat_power_primary()  # type: ignore
-                ),
-                PROPERTY_HEAT_LOSS: (
-                    self.solver_asset.get_heat_power_primary()  # type: ignore
-                    - self.solver_asset.get_heat_power_secondary()  # type: ignore
-                ),
-            }
-        )
+        if self.outputs.is_recorded(PROPERTY_HEAT_POWER_PRIMARY):
+            self.outputs.write(
+                1,
+                PROPERTY_HEAT_POWER_PRIMARY,
+                self.solver_asset.get_heat_power_primary(),  # type: ignore
+            )
+        if self.outputs.is_recorded(PROPERTY_HEAT_LOSS):
+            self.outputs.write(
+                1,
+                PROPERTY_HEAT_LOSS,
+                self.solver_asset.get_heat_power_primary()  # type: ignore
+                - self.solver_asset.get_heat_power_secondary(),  # type: ignore
+            )
 
         # Secondary side output
-        self.outputs[0][-1].update(
-            {
-                PROPERTY_HEAT_POWER_SECONDARY: (
-                    self.solver_asset.get_heat_power_secondary()  # type: ignore
-                )
-            }
-        )
+        if self.outputs.is_recorded(PROPERTY_HEAT_POWER_SECONDARY):
+            self.outputs.write(
+                0,
+                PROPERTY_HEAT_POWER_SECONDARY,
+                self.solver_asset.get_heat_power_secondary(),  # type: ignore
+            )
 
     def postprocess(self) -> None:
         """Postprocess after a simulation time step to update internal states.
@@ -267,10 +267,11 @@ class IdealHeatStorage(AssetAbstract):
 
     def write_to_output(self) -> None:
         """Write additional output properties of the asset."""
-        self.outputs[1][-1].update(
+        self.outputs.write_values(
+            1,
             {
                 PROPERTY_FILL_LEVEL: self.fill_level,
-            }
+            },
         )
 
     def postprocess(self) -> None:
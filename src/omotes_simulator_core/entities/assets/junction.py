@@ -60,7 +60,7 @@ class Junction:
     def write_to_output(self) -> None:
         """Placeholder to write the asset to the output.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of its asset for a specific timestep.
+        The values are written to the last time step of the output store of the
+        asset.
         """
         return
@@ -0,0 +1,194 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the columnar store for the output of an asset."""
+import numpy as np
+import numpy.typing as npt
+
+DEFAULT_OUTPUT_CAPACITY = 16
+"""Number of time steps allocated when the number of time steps is not known beforehand."""
+
+
+class OutputStore:
+    """Columnar store for the output of an asset.
+
+    Every property of every port is stored in its own contiguous array with a value per time step.
+    The arrays are preallocated for the number of time steps of the simulation and grow when more
+    time steps are written. Properties that are not written in a time step are NaN.
+    """
+
+    dtype: np.dtype
+    """Data type of the stored values."""
+
+    recorded_properties: set[str] | None
+    """Names of the properties that are stored, all properties are stored when None."""
+
+    def __init__(
+        self,
+        number_of_ports: int,
+        number_of_time_steps: int = 0,
+        dtype: npt.DTypeLike = np.float64,
+    ) -> None:
+        """Constructor of the output store.
+
+        :param int number_of_ports: Number of ports of the asset.
+        :param int number_of_time_steps: Number of time steps to allocate the arrays for.
+        :param DTypeLike dtype: Data type of the stored values, float64 or float32.
+        """
+        self._columns: list[dict[str, np.ndarray]] = [{} for _ in range(number_of_ports)]
+        self.recorded_properties = None
+        self.allocate(number_of_time_steps, dtype)
+
+    def __len__(self) -> int:
+        """Method to get the number of ports in the store."""
+        return len(self._columns)
+
+    @property
+    def number_of_time_steps(self) -> int:
+        """Number of time steps written to the store."""
+        return self._number_of_time_steps
+
+    def allocate(self, number_of_time_steps: int, dtype: npt.DTypeLike | None = None) -> None:
+        """Method to clear the store and allocate it for the given number of time steps.
+
+        :param int number_of_time_steps: Number of time steps to allocate the arrays for.
+        :param DTypeLike dtype: Data type of the stored values, when None the current data type
+            is kept.
+        """
+        if dtype is not None:
+            self.dtype = np.dtype(dtype)
+        self._capacity = max(number_of_time_steps, 0)
+        self._number_of_time_steps = 0
+        for port_columns in self._columns:
+            port_columns.clear()
+
+    def is_recorded(self, property_name: str) -> bool:
+        """Method to check if a property is stored.
+
+        :param str property_name: Name of the property.
+        :return: True when the property is stored, False otherwise.
+        """
+        return self.recorded_properties is None or property_name in self.recorded_properties
+
+    def add_time_step(self) -> None:
+        """Method to add a time step to the store, to which the values are written.
+
+        The values of the new time step are NaN until they are written.
+        """
+        if self._number_of_time_steps == self._capacity:
+            self._grow(max(2 * self._capacity, DEFAULT_OUTPUT_CAPACITY))
+        self._number_of_time_steps += 1
+
+    def write(self, port_index: int, property_name: str, value: float) -> None:
+        """Method to write a value of the last time step.
+
+        Values of properties that are not recorded are ignored.
+
+        :param int port_index: Index of the port the value belongs to.
+        :param str property_name: Name of the property.
+        :param float value: Value of the property.
+        """
+        if self._number_of_time_steps == 0:
+            raise IndexError("No time step added to the output store.")
+        if not self.is_recorded(property_name):
+            return
+        port_columns = self._columns[port_index]
+        if property_name not in port_columns:
+            port_columns[property_name] = np.full(self._capacity, np.nan, dtype=self.dtype)
+        port_columns[property_name][self._number_of_time_steps - 1] = value
+
+    def write_values(self, port_index: int, values: dict[str, float]) -> None:
+        """Method to write multiple values of the last time step.
+
+        :param int port_index: Index of the port the values belong to.
+        :param dict values: Dict with the property name as key and the value as value.
+        """
+        for property_name, value in values.items():
+            self.write(port_index, property_name, value)
+
+    def aggregate_last(self, number_of_time_steps: int) -> None:
+        """Method to replace the last time steps by a single time step with their mean values.
+
+        :param int number_of_time_steps: Number of time steps at the end of the store to
+            aggregate.
+        """
+        if not 0 < number_of_time_steps <= self._number_of_time_steps:
+            raise IndexError(
+                f"Cannot aggregate {number_of_time_steps} time steps, the output store has "
+                f"{self._number_of_time_steps} time steps."
+            )
+        start = self._number_of_time_steps - number_of_time_steps
+        for port_columns in self._columns:
+            for column in port_columns.values():
+                column[start] = column[start : self._number_of_time_steps].mean()
+                column[start + 1 : self._number_of_time_steps] = np.nan
+        self._number_of_time_steps = start + 1
+
+    def get_values(self, port_index: int, time_step_index: int = -1) -> dict[str, float]:
+        """Method to get the values of a port for a time step.
+
+        :param int port_index: Index of the port.
+        :param int time_step_index: Index of the time step, negative values count from the end.
+        :return: Dict with the property name as key and the value as value.
+        """
+        if not -self._number_of_time_steps <= time_step_index < self._number_of_time_steps:
+            raise IndexError(f"Time step {time_step_index} is not in the output store.")
+        time_step_index %= self._number_of_time_steps
+        return {
+            property_name: float(column[time_step_index])
+            for property_name, column in self._columns[port_index].items()
+        }
+
+    def get_properties(self, port_index: int) -> list[str]:
+        """Method to get the names of the properties stored for a port.
+
+        :param int port_index: Index of the port.
+        :return: List of property names in the order they were first written.
+        """
+        return list(self._columns[port_index])
+
+    def get_array(self, port_index: int, property_name: str) -> np.ndarray:
+        """Method to get the values of a property for all written time steps.
+
+        The returned array is a view on the store, so it is not copied.
+
+        :param int port_index: Index of the port.
+        :param str property_name: Name of the property.
+        :return: Array with a value per time step.
+        """
+        return self._columns[port_index][property_name][: self._number_of_time_steps]
+
+    def get_port_arrays(self, port_index: int) -> dict[str, np.ndarray]:
+        """Method to get the values of all properties of a port for all written time steps.
+
+        :param int port_index: Index of the port.
+        :return: Dict with the property name as key and a view on the values as value.
+        """
+        return {
+            property_name: column[: self._number_of_time_steps]
+            for property_name, column in self._columns[port_index].items()
+        }
+
+    def _grow(self, capacity: int) -> None:
+        """Method to increase the number of time steps the arrays can hold.
+
+        :param int capacity: New number of time steps the arrays can hold.
+        """
+        for port_columns in self._columns:
+            for property_name, column in port_columns.items():
+                new_column = np.full(capacity, np.nan, dtype=self.dtype)
+                new_column[: self._capacity] = column
+                port_columns[property_name] = new_column
+        self._capacity = capacity
@@ -106,24 +106,30 @@ class Pipe(AssetAbstract):
         """
 
     def write_to_output(self) -> None:
-        """Method to write time step results to the output dict.
+        """Method to write time step results to the output store.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of the asset for a specific timestep.
+        The values are written to the last time step of the output store of the
+        asset.
         """
-        for i in range(len(self.connected_ports)):
-            output_dict_temp = {PROPERTY_VELOCITY: sign_output(i) * self.get_velocity(i)}
-            self.outputs[i][-1].update(output_dict_temp)
+        if self.outputs.is_recorded(PROPERTY_VELOCITY):
+            for i in range(len(self.connected_ports)):
+                output_dict_temp = {PROPERTY_VELOCITY: sign_output(i) * self.get_velocity(i)}
+                self.outputs.write_values(i, output_dict_temp)
 
         # only for the second connection point these properties are added
-        pressure_loss = self.solver_asset.get_pressure(1) - self.solver_asset.get_pressure(0)
-        self.outputs[1][-1].update(
-            {
-                PROPERTY_PRESSURE_LOSS: pressure_loss,
-                PROPERTY_PRESSURE_LOSS_PER_LENGTH: pressure_loss / self.length,
-                PROPERTY_HEAT_LOSS: self.get_heat_loss(),
-            }
-        )
+        if self.outputs.is_recorded(PROPERTY_PRESSURE_LOSS) or self.outputs.is_recorded(
+            PROPERTY_PRESSURE_LOSS_PER_LENGTH
+        ):
+            pressure_loss = self.solver_asset.get_pressure(1) - self.solver_asset.get_pressure(0)
+            self.outputs.write_values(
+                1,
+                {
+                    PROPERTY_PRESSURE_LOSS: pressure_loss,
+                    PROPERTY_PRESSURE_LOSS_PER_LENGTH: pressure_loss / self.length,
+                },
+            )
+        if self.outputs.is_recorded(PROPERTY_HEAT_LOSS):
+            self.outputs.write(1, PROPERTY_HEAT_LOSS, self.get_heat_loss())
 
     def get_velocity(self, port: int) -> float:
         """Get the velocity of the fluid in the pipe at the given connection point.
@@ -29,11 +29,17 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_TEMPERATURE_IN,
     PROPERTY_TEMPERATURE_OUT,
 )
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray, get_field_mask
 from omotes_simulator_core.entities.assets.utils import heat_demand_and_temperature_to_mass_flow
 from omotes_simulator_core.solver.network.assets.production_asset import HeatBoundary
 
 logger = logging.getLogger(__name__)
 
+NECESSARY_SETPOINTS_MASK = get_field_mask(
+    (PROPERTY_TEMPERATURE_IN, PROPERTY_TEMPERATURE_OUT, PROPERTY_HEAT_DEMAND, PROPERTY_SET_PRESSURE)
+)
+"""Mask of the setpoints that are required to set a production cluster."""
+
 
 class ProductionCluster(AssetAbstract):
     """A ProductionCluster represents an asset that produces heat."""
@@ -207,6 +213,22 @@ class ProductionCluster(AssetAbstract):
                 f"The setpoints {necessary_setpoints.difference(setpoints_set)} are missing."
             )
 
+    def set_setpoints_array(self, setpoints: SetpointArray, ordinal: int) -> None:
+        """Set the setpoints of the asset from a setpoint array.
+
+        :param SetpointArray setpoints: The setpoints of the assets of the network.
+        :param int ordinal: Index of the record of this asset in the setpoint array.
+        """
+        if not setpoints.has_setpoints(ordinal, NECESSARY_SETPOINTS_MASK):
+            # The dict method reports the missing setpoints
+            self.set_setpoints(setpoints.get_setpoints(ordinal))
+            return
+        record = setpoints.records[ordinal]
+        self._set_pressure_or_mass_flow_control(bool(record[PROPERTY_SET_PRESSURE]))
+        self._set_out_temperature(float(record[PROPERTY_TEMPERATURE_OUT]))
+        self._set_in_temperature(float(record[PROPERTY_TEMPERATURE_IN]))
+        self._set_heat_demand(float(record[PROPERTY_HEAT_DEMAND]))
+
     def update(self) -> None:
         """Update the asset properties to the results from the previous (timestep) simulation.
 
@@ -225,16 +247,14 @@ class ProductionCluster(AssetAbstract):
         ) * self.solver_asset.get_mass_flow_rate(1)
 
     def write_to_output(self) -> None:
-        """Method to write time step results to the output dict.
+        """Method to write time step results to the output store.
 
-        The output list is a list of dictionaries, where each dictionary
-        represents the output of the asset for a specific timestep.
+        The values are written to the last time step of the output store of the
+        asset.
         """
-        output_dict_temp = {
-            PROPERTY_HEAT_SUPPLY_SET_POINT: self.heat_demand_set_point,
-            PROPERTY_HEAT_SUPPLIED: self.get_actual_heat_supplied(),
-        }
-        self.outputs[1][-1].update(output_dict_temp)
+        self.outputs.write(1, PROPERTY_HEAT_SUPPLY_SET_POINT, self.heat_demand_set_point)
+        if self.outputs.is_recorded(PROPERTY_HEAT_SUPPLIED):
+            self.outputs.write(1, PROPERTY_HEAT_SUPPLIED, self.get_actual_heat_supplied())
 
     def is_converged(self) -> bool:
         """Check if the asset has converged with accepted error of 0.1%.
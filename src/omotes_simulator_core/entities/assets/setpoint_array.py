@@ -0,0 +1,223 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the typed array representation of the setpoints of the assets."""
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PRIMARY,
+    PROPERTY_BYPASS,
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_SET_PRESSURE,
+    PROPERTY_TEMPERATURE_IN,
+    PROPERTY_TEMPERATURE_OUT,
+    SECONDARY,
+)
+
+SETPOINT_FIELDS = (
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_TEMPERATURE_IN,
+    PROPERTY_TEMPERATURE_OUT,
+    PROPERTY_SET_PRESSURE,
+    PRIMARY + PROPERTY_HEAT_DEMAND,
+    PRIMARY + PROPERTY_TEMPERATURE_IN,
+    PRIMARY + PROPERTY_TEMPERATURE_OUT,
+    PRIMARY + PROPERTY_SET_PRESSURE,
+    SECONDARY + PROPERTY_HEAT_DEMAND,
+    SECONDARY + PROPERTY_TEMPERATURE_IN,
+    SECONDARY + PROPERTY_TEMPERATURE_OUT,
+    SECONDARY + PROPERTY_SET_PRESSURE,
+    PROPERTY_BYPASS,
+)
+"""Names of the setpoints that can be stored, the keys of the setpoint dicts of the controller."""
+BOOLEAN_SETPOINT_FIELDS = frozenset(
+    {
+        PROPERTY_SET_PRESSURE,
+        PRIMARY + PROPERTY_SET_PRESSURE,
+        SECONDARY + PROPERTY_SET_PRESSURE,
+        PROPERTY_BYPASS,
+    }
+)
+"""Names of the setpoints that are a flag instead of a value."""
+MASK_FIELD = "mask"
+"""Name of the field with a bit per setpoint, which is set when the setpoint is given."""
+SETPOINT_DTYPE = np.dtype(
+    [(MASK_FIELD, np.uint16)]
+    + [
+        (name, np.bool_ if name in BOOLEAN_SETPOINT_FIELDS else np.float64)
+        for name in SETPOINT_FIELDS
+    ]
+)
+"""Data type of a record with the setpoints of an asset."""
+
+
+def get_field_mask(names: list[str] | tuple[str, ...] | set[str]) -> int:
+    """Get the bits of the mask field for the given setpoints.
+
+    :param names: Names of the setpoints.
+    :return: Mask with the bits of the given setpoints set.
+    """
+    mask = 0
+    for name in names:
+        if name not in SETPOINT_FIELDS:
+            raise ValueError(f"Unknown setpoint: {name}")
+        mask |= 1 << SETPOINT_FIELDS.index(name)
+    return mask
+
+
+class SetpointArray:
+    """Setpoints of the assets of a network in a numpy structured array.
+
+    The array has a record per asset, indexed by the ordinal of the asset in the list of asset
+    ids. Every setpoint is a typed field of the record, the mask field tells which setpoints are
+    given. An array with an extra leading dimension stores the setpoints of multiple time steps,
+    for example of a whole simulation.
+    """
+
+    asset_ids: list[str]
+    """Ids of the assets in the order of the records."""
+    records: np.ndarray
+    """Structured array with the SETPOINT_DTYPE and a record per asset as last dimension."""
+
+    def __init__(
+        self,
+        asset_ids: list[str],
+        number_of_time_steps: int | None = None,
+        records: np.ndarray | None = None,
+    ) -> None:
+        """Constructor of the setpoint array without setpoints.
+
+        :param list[str] asset_ids: Ids of the assets in the order of the records.
+        :param int number_of_time_steps: Number of time steps to store, when None the setpoints
+            of a single time step are stored.
+        :param np.ndarray records: Existing records to wrap instead of allocating new ones.
+        """
+        self.asset_ids = asset_ids
+        if records is None:
+            shape = (
+                (len(asset_ids),)
+                if number_of_time_steps is None
+                else (number_of_time_steps, len(asset_ids))
+            )
+            records = np.zeros(shape, dtype=SETPOINT_DTYPE)
+        self.records = records
+        self._ordinals = {asset_id: ordinal for ordinal, asset_id in enumerate(asset_ids)}
+        if len(self._ordinals) != len(asset_ids) or self.records.shape[-1] != len(asset_ids):
+            raise ValueError("The asset ids of a setpoint array should match its records.")
+
+    @classmethod
+    def from_dict(
+        cls, setpoints: dict[str, dict[str, float | bool]], asset_ids: list[str]
+    ) -> "SetpointArray":
+        """Create a setpoint array of a single time step from the setpoint dicts.
+
+        :param dict setpoints: dict with the key the asset id and the value a dict with the
+            setpoints of the asset.
+        :param list[str] asset_ids: Ids of the assets in the order of the records.
+        :return: Setpoint array with the given setpoints.
+        """
+        setpoint_array = cls(asset_ids)
+        for asset_id, asset_setpoints in setpoints.items():
+            setpoint_array.set_setpoints(asset_id, asset_setpoints)
+        return setpoint_array
+
+    def __len__(self) -> int:
+        """Method to get the number of time steps, or assets for a single time step."""
+        return len(self.records)
+
+    def get_ordinal(self, asset_id: str) -> int:
+        """Method to get the index of the record of an asset.
+
+        :param str asset_id: Id of the asset.
+        :return: Index of the record of the asset.
+        """
+        if asset_id not in self._ordinals:
+            raise KeyError(f"Asset {asset_id} is not in the setpoint array.")
+        return self._ordinals[asset_id]
+
+    def set_setpoints(
+        self,
+        asset_id: str,
+        setpoints: dict[str, float | bool],
+        time_step_index: int | None = None,
+    ) -> None:
+        """Method to set the setpoints of an asset.
+
+        :param str asset_id: Id of the asset.
+        :param dict setpoints: dict with the name of the setpoint as key and the value as value.
+        :param int time_step_index: Index of the time step when multiple time steps are stored.
+        """
+        ordinal = self.get_ordinal(asset_id)
+        record = (
+            self.records[ordinal]
+            if time_step_index is None
+            else self.records[time_step_index, ordinal]
+        )
+        for name, value in setpoints.items():
+            if name not in SETPOINT_FIELDS:
+                raise ValueError(f"Unknown setpoint {name} for asset {asset_id}.")
+            record[name] = value
+        record[MASK_FIELD] |= get_field_mask(tuple(setpoints))
+
+    def get_time_step(self, time_step_index: int) -> "SetpointArray":
+        """Method to get the setpoints of a single time step, without copying them.
+
+        :param int time_step_index: Index of the time step.
+        :return: Setpoint array with the setpoints of the time step.
+        """
+        if self.records.ndim != 2:
+            raise ValueError("The setpoint array only stores a single time step.")
+        return SetpointArray(self.asset_ids, records=self.records[time_step_index])
+
+    def get_set_ordinals(self) -> np.ndarray:
+        """Method to get the indices of the assets for which setpoints are given.
+
+        :return: Array with the indices of the records with at least one setpoint.
+        """
+        return np.flatnonzero(self.records[MASK_FIELD])
+
+    def has_setpoints(self, ordinal: int, mask: int) -> bool:
+        """Method to check if all setpoints of the mask are given for an asset.
+
+        :param int ordinal: Index of the record of the asset.
+        :param int mask: Bits of the setpoints, see get_field_mask.
+        :return: True when all setpoints are given, False otherwise.
+        """
+        return (int(self.records[ordinal][MASK_FIELD]) & mask) == mask
+
+    def get_setpoints(self, ordinal: int) -> dict[str, float | bool]:
+        """Method to get the given setpoints of an asset as a dict.
+
+        :param int ordinal: Index of the record of the asset.
+        :return: dict with the name of the setpoint as key and the value as value.
+        """
+        record = self.records[ordinal]
+        mask = int(record[MASK_FIELD])
+        return {
+            name: (bool(record[name]) if name in BOOLEAN_SETPOINT_FIELDS else float(record[name]))
+            for bit, name in enumerate(SETPOINT_FIELDS)
+            if mask & (1 << bit)
+        }
+
+    def to_dict(self) -> dict[str, dict[str, float | bool]]:
+        """Method to convert the setpoints of a single time step to the setpoint dicts.
+
+        :return: dict with the key the asset id and the value a dict with the setpoints.
+        """
+        return {
+            self.asset_ids[ordinal]: self.get_setpoints(ordinal)
+            for ordinal in self.get_set_ordinals()
+        }
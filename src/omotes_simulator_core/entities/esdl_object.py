@@ -17,6 +17,7 @@
 
 import logging
 
+from esdl import esdl
 from esdl.esdl_handler import EnergySystemHandler
 
 from omotes_simulator_core.adapter.transforms.string_to_esdl import (
@@ -29,9 +30,21 @@ logger = logging.getLogger(__name__)
 
 
 class EsdlObject:
-    """EsdlObject class is a wrapper around PyEsdl."""
+    """EsdlObject class is a wrapper around PyEsdl.
+
+    On construction the energy system is indexed once, so all query methods are dictionary
+    lookups. This assumes the energy system is not modified after the EsdlObject is created.
+    """
 
     energy_system_handler: EnergySystemHandler
+    _assets_by_id: dict[str, EsdlAssetObject]
+    """Wrapped assets by their esdl id, in the order in which they appear in the esdl."""
+    _assets_by_label: dict[OmotesAssetLabels, list[EsdlAssetObject]]
+    """Wrapped assets per OmotesAssetLabels."""
+    _ports: dict[str, tuple[EsdlAssetObject, esdl.Port]]
+    """Map from port id to the wrapped asset and the esdl port."""
+    _connections: dict[str, list[tuple[str, str]]]
+    """Map from port id to the (asset id, port id) of connected ports of enabled assets."""
 
     def __init__(self, esdl_energysystem_handler: EnergySystemHandler) -> None:
         """
@@ -40,11 +53,42 @@ class EsdlObject:
         :param esdl_energysystem: PyEsdl EnergySystem object
         """
         self.energy_system_handler = esdl_energysystem_handler
+        self._build_index()
 
     def __repr__(self) -> str:
         """Returns a string describing the esdl file object."""
         return str(self.energy_system_handler)
 
+    def _build_index(self) -> None:
+        """Method to index all assets, ports and connections of the energy system.
+
+        Every esdl asset is wrapped exactly once, the wrapped assets are shared by all queries.
+        """
+        esdl_assets = self.energy_system_handler.get_all_instances_of_type(esdl.Asset)
+        self._assets_by_id = {asset.id: EsdlAssetObject(asset) for asset in esdl_assets}
+
+        string_esdl_asset_mapper = StringEsdlAssetMapper()
+        self._assets_by_label = {}
+        for label, asset_types in string_esdl_asset_mapper.label_to_type_map.items():
+            # Assets are grouped per esdl type, in the order of the types in the label map.
+            self._assets_by_label[label] = [
+                asset
+                for asset_type in asset_types
+                for asset in self._assets_by_id.values()
+                if isinstance(asset.esdl_asset, asset_type)
+            ]
+
+        self._ports = {}
+        self._connections = {}
+        for asset in self._assets_by_id.values():
+            for esdl_port in asset.esdl_asset.port:
+                self._ports[esdl_port.id] = (asset, esdl_port)
+                self._connections[esdl_port.id] = [
+                    (port.energyasset.id, port.id)
+                    for port in esdl_port.connectedTo
+                    if str(port.energyasset.state) == "ENABLED"
+                ]
+
     def get_all_assets_of_type(self, esdl_asset_type: OmotesAssetLabels) -> list[EsdlAssetObject]:
         """
         Returns a list of all the esdl assets of the specified type in the esdl file.
@@ -53,43 +97,32 @@ class EsdlObject:
         :param OmotesAssetLabels esdl_asset_type: Type of asset to return
         :return: List of EsdlAssetObject of the specified type
         """
-        output_list = []
-        for asset_type in StringEsdlAssetMapper().to_esdl(esdl_asset_type):
-            esdl_assets = self.energy_system_handler.get_all_instances_of_type(asset_type)
-            output_list += [EsdlAssetObject(asset) for asset in esdl_assets]
-        return output_list
+        if esdl_asset_type not in self._assets_by_label:
+            raise NotImplementedError(
+                esdl_asset_type + " not implemented in StringESDLAssetMapper class"
+            )
+        return list(self._assets_by_label[esdl_asset_type])
 
     def get_connected_assets(self, asset_id: str, port_id: str) -> list[tuple[str, str]]:
         """Method to get the id's of connected assets from the esdl.
 
         This returns a list of a tuple with the id of the connected asset and the id of the port
-        to which the original asset is connected.
+        to which the original asset is connected. Only assets which are enabled are returned.
 
         :param str asset_id: id of the asset for which to return the connected assets.
         :param str port_id: id of the port for which to return the connected assets.
         :return: List of tuple with the id of the connected assets and the connected port ids.
         """
-        esdl_asset = self.energy_system_handler.get_by_id(asset_id)
-
-        connected_ports = []
+        if asset_id not in self._assets_by_id:
+            raise KeyError(f"Can't find object for id={asset_id} in the ESDL model")
         connected_assets = []
-        for esdl_port in esdl_asset.port:
-            if esdl_port.id == port_id:
-                connected_ports = (
-                    esdl_port.connectedTo
-                )  # TODO: try to maybe only use assets that are enabled here.
-                break
-
-        connected_assets = [
-            (port.energyasset.id, port.id)
-            for port in connected_ports
-            if str(port.energyasset.state) == "ENABLED"
-        ]
-
-        if not connected_ports or not connected_assets:
+        if port_id in self._ports and self._ports[port_id][0].get_id() == asset_id:
+            connected_assets = self._connections[port_id]
+
+        if not connected_assets:
             raise ValueError(f"No connected assets found for asset: {asset_id} and port: {port_id}")
 
-        return connected_assets
+        return list(connected_assets)
 
     def get_asset_by_id(self, asset_id: str) -> EsdlAssetObject:
         """Method to get an asset by its id.
@@ -97,4 +130,16 @@ class EsdlObject:
         :param str asset_id: id of the asset to get.
         :return: EsdlAssetObject with the asset.
         """
-        return EsdlAssetObject(self.energy_system_handler.get_by_id(asset_id))
+        if asset_id not in self._assets_by_id:
+            raise KeyError(f"Can't find object for id={asset_id} in the ESDL model")
+        return self._assets_by_id[asset_id]
+
+    def get_port_by_id(self, port_id: str) -> tuple[EsdlAssetObject, esdl.Port]:
+        """Method to get a port and the asset it belongs to by the id of the port.
+
+        :param str port_id: id of the port to get.
+        :return: Tuple with the EsdlAssetObject the port belongs to and the esdl port.
+        """
+        if port_id not in self._ports:
+            raise KeyError(f"Can't find port for id={port_id} in the ESDL model")
+        return self._ports[port_id]
@@ -17,10 +17,20 @@
 import datetime
 from typing import Callable
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 
 from omotes_simulator_core.entities.assets.asset_abstract import AssetAbstract
+from omotes_simulator_core.entities.assets.asset_defaults import OUTPUT_COLUMN_LEVELS
 from omotes_simulator_core.entities.assets.junction import Junction
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
+from omotes_simulator_core.entities.simulation_configuration import (
+    OutputSpecification,
+    SimulationConfiguration,
+)
+from omotes_simulator_core.infrastructure.output_writer_abstract import OutputWriterAbstract
+from omotes_simulator_core.infrastructure.tracing import is_tracing_enabled, start_span
 from omotes_simulator_core.solver.network.network import Network
 from omotes_simulator_core.solver.solver import Solver
 
@@ -29,24 +39,54 @@ class HeatNetwork:
     """Class to store information on the heat network."""
 
     def __init__(
-        self, conversion_factory: Callable[[Network], tuple[list[AssetAbstract], list[Junction]]]
+        self,
+        conversion_factory: Callable[[Network], tuple[list[AssetAbstract], list[Junction]]],
+        output_writer: OutputWriterAbstract | None = None,
     ) -> None:
         """Constructor of heat network class.
 
         :param conversion_factory: method to convert the esdl network to lists of assets&junctions
         and returns list of both
+        :param output_writer: Optional writer consuming the output in chunks of time steps during
+        the simulation, when None the output is kept in memory.
         """
         self.network = Network()
         self.assets, self.junctions = conversion_factory(self.network)
         self.solver = Solver(self.network)
 
+        # Optional writer consuming the output in chunks of time steps during the simulation
+        self.output_writer = output_writer
+
+        # Specification of the recorded output, by default all output is recorded
+        self.output_specification = OutputSpecification()
+        self._recorded_assets = list(self.assets)
+        self._number_of_simulated_time_steps = 0
+        self._interval_start_time: datetime.datetime | None = None
+
         # Mapping from asset id to asset object for easy access
         self._asset_id_to_asset: dict[str, AssetAbstract] = {
             asset.asset_id: asset for asset in self.assets
         }
+        # Ids of the assets in the order of the assets, shared with the setpoint arrays
+        self._asset_ids = [asset.asset_id for asset in self.assets]
+
+    def __getstate__(self) -> dict:
+        """Method to get the state of the network to pickle, without the output writer.
+
+        The output writer holds the files of a single simulation, so it is not stored with the
+        network in the build cache.
+
+        :return: Dict with the attributes of the network.
+        """
+        state = self.__dict__.copy()
+        state["output_writer"] = None
+        return state
 
     def run_time_step(
-        self, time: datetime.datetime, time_step: float, controller_input: dict
+        self,
+        time: datetime.datetime,
+        time_step: float,
+        controller_input: dict | SetpointArray,
     ) -> None:
         """Method to simulate a time step.
 
@@ -54,16 +94,42 @@ class HeatNetwork:
 
         :param Datetime time: Time for which to simulate the model
         :param float time_step: The time step to simulate
-        :param dict controller_input: Dict specifying the heat demand for the different assets.
+        :param dict | SetpointArray controller_input: Dict specifying the heat demand for the
+            different assets, or a setpoint array with the asset ids in the order of get_asset_ids.
+            A setpoint array created with the list of get_asset_ids is matched by identity, other
+            lists of asset ids are compared to the asset ids of the network.
         :return: None
         """
-        for py_asset in self.assets:
-            if py_asset.asset_id in controller_input:
+        if isinstance(controller_input, SetpointArray):
+            asset_ids = controller_input.asset_ids
+            if asset_ids is not self._asset_ids and asset_ids != self._asset_ids:
+                raise ValueError("The setpoint array does not match the assets of the network.")
+            for ordinal in controller_input.get_set_ordinals():
+                py_asset = self.assets[ordinal]
                 py_asset.set_time_step(time_step)
                 py_asset.set_time(time)
-                py_asset.set_setpoints(controller_input[py_asset.asset_id])
+                py_asset.set_setpoints_array(controller_input, int(ordinal))
+        else:
+            for py_asset in self.assets:
+                if py_asset.asset_id in controller_input:
+                    py_asset.set_time_step(time_step)
+                    py_asset.set_time(time)
+                    py_asset.set_setpoints(controller_input[py_asset.asset_id])
 
-        self.solver.solve()
+        tracing_enabled = is_tracing_enabled()
+        attributes = (
+            {"time": time.isoformat(), "number_of_unknowns": self.solver.matrix.num_unknowns}
+            if tracing_enabled
+            else {}
+        )
+        with start_span("solver", **attributes) as span:
+            iterations_before = self.solver.number_of_iterations
+            self.solver.solve()
+            if tracing_enabled:
+                span.set_attribute(
+                    "iterations", self.solver.number_of_iterations - iterations_before
+                )
+                span.set_attribute("converged", self.solver.converged)
 
     def plot_network(self) -> None:
         """Method to plot the network.
@@ -72,17 +138,110 @@ class HeatNetwork:
         :return:
         """
 
-    def store_output(self) -> None:
+    def set_output_specification(self, output_specification: OutputSpecification) -> None:
+        """Method to set which output of the assets is recorded.
+
+        The output of assets that are not recorded is not computed and their output store stays
+        empty. The output stores of the recorded assets only store the requested properties.
+
+        :param OutputSpecification output_specification: Specification of the recorded output.
+        :return: None
+        """
+        self.output_specification = output_specification
+        recorded_properties = (
+            None
+            if output_specification.properties is None
+            else set(output_specification.properties)
+        )
+        self._recorded_assets = []
+        for py_asset in self.assets:
+            py_asset.outputs.recorded_properties = recorded_properties
+            if output_specification.is_asset_recorded(type(py_asset).__name__, py_asset.asset_id):
+                self._recorded_assets.append(py_asset)
+
+    def allocate_output(self, number_of_time_steps: int, dtype: npt.DTypeLike = None) -> None:
+        """Method to clear the output of all assets and allocate it for the simulation.
+
+        When an output writer is set, the output stores only hold the time steps of a chunk.
+
+        :param int number_of_time_steps: The number of time steps of the simulation.
+        :param DTypeLike dtype: Data type of the output, when None the current data type is kept.
+        :return: None
+        """
+        specification = self.output_specification
+        number_of_output_time_steps = specification.get_number_of_output_time_steps(
+            number_of_time_steps
+        )
+        if self.output_writer is not None:
+            number_of_output_time_steps = self.output_writer.allocate(number_of_output_time_steps)
+        if specification.aggregation == "mean":
+            # The time steps of an interval are stored until they are aggregated
+            number_of_output_time_steps += specification.time_step_interval - 1
+        for py_asset in self.assets:
+            py_asset.allocate_output(number_of_output_time_steps, dtype)
+        self._number_of_simulated_time_steps = 0
+        self._interval_start_time = None
+
+    def store_output(self, time: datetime.datetime | None = None) -> None:
         """Method to store the output data.
 
         This method takes the data from the assets and stores it into our own
         dataframe. This is needed since we have the possibility to redo a timestep when results are
-        not converged for the input of the controller.
+        not converged for the input of the controller. When an output writer is set, the output is
+        passed on to the writer, which writes it to file per chunk of time steps.
+
+        Only the assets in the output specification are stored. When the specification reduces
+        an interval of time steps by sampling, only the first time step of each interval is
+        stored. When it reduces an interval by the mean, each time step is stored and the interval
+        is aggregated after its last time step.
+        :param Datetime time: Time of the time step, required when an output writer is set.
         :return: None
         """
-        for py_asset in self.assets:
+        if self.output_writer is not None and time is None:
+            raise ValueError("The time of the time step is required for the output writer.")
+        interval = self.output_specification.time_step_interval
+        position_in_interval = self._number_of_simulated_time_steps % interval
+        self._number_of_simulated_time_steps += 1
+        if position_in_interval == 0:
+            self._interval_start_time = time
+        elif self.output_specification.aggregation == "sample":
+            return
+        for py_asset in self._recorded_assets:
             py_asset.write_standard_output()
             py_asset.write_to_output()
+        if (
+            self.output_specification.aggregation == "sample"
+            or position_in_interval == interval - 1
+        ):
+            self._complete_output_time_step(position_in_interval + 1)
+
+    def close_output(self) -> None:
+        """Method to complete the last output time step and close the output writer.
+
+        A last interval of time steps that is not complete is aggregated over the time steps it
+        has. The remaining output is written to the output writer, when it is set.
+        :return: None
+        """
+        if self.output_specification.aggregation == "mean":
+            remaining_time_steps = (
+                self._number_of_simulated_time_steps % self.output_specification.time_step_interval
+            )
+            if remaining_time_steps > 0:
+                self._complete_output_time_step(remaining_time_steps)
+        if self.output_writer is not None:
+            self.output_writer.close(self._recorded_assets)
+
+    def _complete_output_time_step(self, number_of_time_steps: int) -> None:
+        """Method to complete an output time step from the stored time steps of an interval.
+
+        :param int number_of_time_steps: Number of stored time steps of the interval.
+        :return: None
+        """
+        if number_of_time_steps > 1:
+            for py_asset in self._recorded_assets:
+                py_asset.outputs.aggregate_last(number_of_time_steps)
+        if self.output_writer is not None and self._interval_start_time is not None:
+            self.output_writer.store_time_step(self._interval_start_time, self._recorded_assets)
 
     def post_process_assets(self) -> None:
         """Method to post-process all assets in the network.
@@ -92,16 +251,43 @@ class HeatNetwork:
         for py_asset in self.assets:
             py_asset.postprocess()
 
-    def gather_output(self) -> pd.DataFrame:
-        """Method to gather output of all assets and return it as a dict.
+    def gather_output(self, config: SimulationConfiguration | None = None) -> pd.DataFrame:
+        """Method to gather output of all assets and return it as a DataFrame.
 
-        :return: Dict with for all asset a dict with all outputs.
+        The output arrays of all assets are collected first and the DataFrame is created once.
+
+        :param SimulationConfiguration config: Configuration of the simulation, used to create
+            the time index in UTC, a start without time zone is taken as UTC. When None, the time
+            steps are numbered instead.
+        :return: DataFrame with a row per output time step and a column per recorded asset, port
+            and property.
         """
         # Todo what do we do with the junction output do we need it?
-        result = pd.DataFrame()
-        for py_asset in self.assets:
-            result = pd.concat([result, py_asset.get_timeseries()], axis=1)
-        return result
+        keys = []
+        arrays = []
+        for py_asset in self._recorded_assets:
+            for (port_id, property_name), values in py_asset.get_output_columns().items():
+                keys.append((py_asset.asset_id, port_id, property_name))
+                arrays.append(values)
+        number_of_time_steps = len(arrays[0]) if arrays else 0
+        if config is None:
+            index = pd.RangeIndex(number_of_time_steps)
+        else:
+            start = pd.Timestamp(config.start)
+            start = start.tz_localize("UTC") if start.tzinfo is None else start.tz_convert("UTC")
+            index = pd.date_range(
+                start=start,
+                periods=number_of_time_steps,
+                freq=pd.Timedelta(
+                    seconds=config.timestep * self.output_specification.time_step_interval
+                ),
+                name="time",
+            )
+        return pd.DataFrame(
+            np.column_stack(arrays) if arrays else np.empty((number_of_time_steps, 0)),
+            index=index,
+            columns=pd.MultiIndex.from_tuples(keys, names=OUTPUT_COLUMN_LEVELS),
+        )
 
     def check_convergence(self) -> bool:
         """Method to check if the network has converged.
@@ -120,3 +306,12 @@ class HeatNetwork:
         :return: The asset with the given ID.
         """
         return self._asset_id_to_asset[asset_id]
+
+    def get_asset_ids(self) -> list[str]:
+        """Method to get the IDs of the assets in the order of the assets.
+
+        The list is created once and shared, so it should not be modified.
+
+        :return: List with the IDs of the assets.
+        """
+        return self._asset_ids
@@ -17,6 +17,8 @@
 import datetime
 import logging
 
+import numpy as np
+
 from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_HEAT_DEMAND,
     PROPERTY_SET_PRESSURE,
@@ -24,11 +26,15 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_TEMPERATURE_OUT,
 )
 from omotes_simulator_core.entities.assets.controller.controller_heat_transfer import (
+    ControllerHeatTransferAsset,
     HeatTransferAssetType,
 )
 from omotes_simulator_core.entities.assets.controller.controller_network import ControllerNetwork
+from omotes_simulator_core.entities.assets.controller.merit_order import MeritOrder
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 from omotes_simulator_core.entities.heat_network import HeatNetwork
 from omotes_simulator_core.entities.network_controller_abstract import NetworkControllerAbstract
+from omotes_simulator_core.entities.setpoint_horizon import SetpointHorizon
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +44,38 @@ AssetSetpointsDict = dict[str, dict[str, float | bool]]
 class NetworkController(NetworkControllerAbstract):
     """class for the new network controller."""
 
+    setpoint_horizon: SetpointHorizon | None = None
+    """Setpoints precomputed for the time steps of a simulation, None when not precomputed."""
+    merit_order: MeritOrder | None = None
+    """Merit order of the producers of all networks, created when the time grid is set."""
+
     def __init__(
         self,
         networks: list[ControllerNetwork],
     ) -> None:
         """Constructor of the class, which sets all attributes."""
         self.networks = networks
+        self._factor_paths: list[list[tuple[ControllerHeatTransferAsset, bool]]] | None = None
+        self._heat_transfer_assets: list[ControllerHeatTransferAsset] = []
+        self._heat_transfer_factors: list[float] | None = None
+
+    def set_time_grid(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int
+    ) -> None:
+        """Method to precompute the demand and supply of all networks for a simulation.
+
+        The merit order of the producers is created and the paths between the networks are
+        determined again, setpoints precomputed for a previous simulation are discarded.
+
+        :param datetime.datetime start: Time of the first time step.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps.
+        """
+        self.setpoint_horizon = None
+        self.merit_order = self._create_merit_order()
+        self._factor_paths = None
+        for network in self.networks:
+            network.set_time_grid(start, timestep, number_of_time_steps)
 
     def update_network_state(self, heat_network: HeatNetwork) -> None:
         """Method to update the network state."""
@@ -53,22 +85,65 @@ class NetworkController(NetworkControllerAbstract):
                 controller.set_state(heat_network.get_asset_by_id(controller.id).get_state())
 
     def update_networks_factor(self) -> None:
-        """Method to update the factor of the networks taken into account the changing COP."""
-        for network in self.networks:
-            current_network = network
-            network.factor_to_first_network = [1]
-            for step in network.path:
-                if current_network == self.networks[int(step)]:
-                    continue
-                for asset in current_network.heat_transfer_assets_prim:
-                    if self.networks[int(step)].exists(asset.id):
-                        network.factor_to_first_network.append(asset.factor)
-                        break
-                for asset in current_network.heat_transfer_assets_sec:
-                    if self.networks[int(step)].exists(asset.id):
-                        network.factor_to_first_network.append(1 / asset.factor)
-                        break
-                current_network = self.networks[int(step)]
+        """Method to update the factor of the networks taken into account the changing COP.
+
+        The heat transfer assets on the path from every network to the first network are
+        determined once. The factors of a network are only updated when the factor of a heat
+        transfer asset on its path changed since the previous update.
+        """
+        if self._factor_paths is None:
+            self._factor_paths = [self._get_factor_path(network) for network in self.networks]
+            unique_assets = {
+                id(asset): asset for factor_path in self._factor_paths for asset, _ in factor_path
+            }
+            self._heat_transfer_assets = list(unique_assets.values())
+            self._heat_transfer_factors = None
+        factors = [asset.factor for asset in self._heat_transfer_assets]
+        if factors == self._heat_transfer_factors:
+            return
+        changed_assets = None
+        if self._heat_transfer_factors is not None:
+            changed_assets = {
+                id(asset)
+                for asset, factor, previous_factor in zip(
+                    self._heat_transfer_assets, factors, self._heat_transfer_factors
+                )
+                if factor != previous_factor
+            }
+        for network, factor_path in zip(self.networks, self._factor_paths):
+            if changed_assets is not None and not any(
+                id(asset) in changed_assets for asset, _ in factor_path
+            ):
+                continue
+            network.factor_to_first_network = [1] + [
+                1 / asset.factor if inverse else asset.factor for asset, inverse in factor_path
+            ]
+        self._heat_transfer_factors = factors
+
+    def _get_factor_path(
+        self, network: ControllerNetwork
+    ) -> list[tuple[ControllerHeatTransferAsset, bool]]:
+        """Method to get the heat transfer assets on the path from a network to the first network.
+
+        :param ControllerNetwork network: Network to get the path for.
+        :return: List of the heat transfer assets in the order of the path, with True when the
+            inverse of the factor of the asset converts the power to the next network.
+        """
+        factor_path = []
+        current_network = network
+        for step in network.path:
+            if current_network == self.networks[int(step)]:
+                continue
+            for asset in current_network.heat_transfer_assets_prim:
+                if self.networks[int(step)].exists(asset.id):
+                    factor_path.append((asset, False))
+                    break
+            for asset in current_network.heat_transfer_assets_sec:
+                if self.networks[int(step)].exists(asset.id):
+                    factor_path.append((asset, True))
+                    break
+            current_network = self.networks[int(step)]
+        return factor_path
 
     def update_setpoints(self, time: datetime.datetime) -> dict:
         """Method to get the controller inputs for the network.
@@ -84,6 +159,10 @@ class NetworkController(NetworkControllerAbstract):
         :param float time: Time step for which to run the controller.
         :return: dict with the key the asset id and the heat demand for that asset.
         """
+        if self.setpoint_horizon is not None:
+            index = self._get_precomputed_index(self.setpoint_horizon, time)
+            if index >= 0:
+                return self.setpoint_horizon.get_setpoints(index)
         self.update_networks_factor()
         total_demand = sum([network.get_total_heat_demand(time) for network in self.networks])
         total_supply = sum([network.get_total_supply(time) for network in self.networks])
@@ -211,6 +290,165 @@ class NetworkController(NetworkControllerAbstract):
 
         return asset_setpoints
 
+    def update_setpoint_array(
+        self, time: datetime.datetime, setpoint_array: SetpointArray
+    ) -> SetpointArray | dict:
+        """Method to get the controller inputs for the network from the precomputed setpoints.
+
+        For precomputed time steps the records of the time step in the setpoint array of the
+        horizon are returned without creating the setpoint dicts, otherwise the setpoint dicts of
+        update_setpoints are returned.
+
+        :param datetime.datetime time: Time step for which to run the controller.
+        :param SetpointArray setpoint_array: Setpoints of all time steps of the horizon, see
+            SetpointHorizon.get_setpoint_array.
+        :return: Setpoint array with the setpoints of the time step, or the setpoint dicts when
+            the time step is not precomputed.
+        """
+        if self.setpoint_horizon is not None:
+            index = self._get_precomputed_index(self.setpoint_horizon, time)
+            if index >= 0:
+                return setpoint_array.get_time_step(index)
+        return self.update_setpoints(time)
+
+    @staticmethod
+    def _get_precomputed_index(horizon: SetpointHorizon, time: datetime.datetime) -> int:
+        """Method to get the index of a time step in the precomputed setpoints.
+
+        A warning is logged when the consumers are capped in the time step.
+
+        :param SetpointHorizon horizon: Precomputed setpoints.
+        :param datetime.datetime time: Time of the time step.
+        :return: Index of the time step, -1 when the setpoints of the time are not precomputed.
+        """
+        index = horizon.get_index(time)
+        if index >= 0 and horizon.capped[index]:
+            logger.warning(
+                f"Total supply + storage is lower than total demand at time: {time}"
+                f"Consumers are capped to the available power."
+            )
+        return index
+
+    def precompute_setpoints(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int
+    ) -> SetpointHorizon | None:
+        """Method to compute the setpoints of all time steps of a simulation at once.
+
+        Without storages the setpoints only depend on the time, so they are computed for the
+        whole horizon with array operations, following the same steps as update_setpoints.
+        update_setpoints then looks up the setpoints of a time step. Time steps at which
+        update_setpoints would fail, because there is no demand and no supply, are not
+        precomputed. The time grid of the networks is set as well.
+
+        :param datetime.datetime start: Time of the first time step.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps.
+        :return: The precomputed setpoints, None when a network has storages.
+        """
+        self.set_time_grid(start, timestep, number_of_time_steps)
+        if any(network.storages for network in self.networks):
+            return None
+        self.update_networks_factor()
+        horizon = SetpointHorizon(start, timestep, number_of_time_steps)
+
+        total_demand = np.zeros(number_of_time_steps)
+        total_supply = np.zeros(number_of_time_steps)
+        for network in self.networks:
+            if network.total_heat_demand_array is not None:
+                total_demand += network.total_heat_demand_array.values * network.conversion_factor
+            if network.total_supply_array is not None:
+                total_supply += network.total_supply_array.values * network.conversion_factor
+
+        # Without storages the supply is either allocated on priority to cover the demand, or
+        # all producers are at max and the consumers are capped to the supply.
+        surplus = total_supply > total_demand
+        horizon.capped = ~surplus
+        horizon.valid = surplus | (total_demand != 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            consumer_factor = np.where(surplus, 1.0, total_supply / total_demand)
+        merit_order = self._get_merit_order()
+        producer_factors = dict(
+            zip(
+                [producer.id for producer in merit_order.producers],
+                merit_order.get_factors(np.where(surplus, total_demand, 0.0)).T,
+            )
+        )
+
+        for network in self.networks:
+            for producer in network.producers:
+                max_power = producer.get_max_power_array(start, timestep, number_of_time_steps)
+                producer_factor = np.where(surplus, producer_factors[producer.id], 1.0)
+                heat_demand = np.zeros(number_of_time_steps)
+                is_set = producer_factor != 0
+                # Discharging (e.g., heat from component/system to the network) is negative.
+                heat_demand[is_set] = -1 * max_power[is_set] * producer_factor[is_set]
+                horizon.heat_demand[producer.id] = heat_demand
+                horizon.properties[producer.id] = {
+                    PROPERTY_TEMPERATURE_OUT: producer.temperatures.out_flow,
+                    PROPERTY_TEMPERATURE_IN: producer.temperatures.in_flow,
+                    PROPERTY_SET_PRESSURE: False,
+                }
+            for consumer in network.consumers:
+                demand = consumer.get_heat_demand_array(start, timestep, number_of_time_steps)
+                # Charging (e.g., heat from network to compontent) is positive.
+                horizon.heat_demand[consumer.id] = +1 * demand * consumer_factor
+                horizon.properties[consumer.id] = {
+                    PROPERTY_TEMPERATURE_OUT: consumer.temperatures.out_flow,
+                    PROPERTY_TEMPERATURE_IN: consumer.temperatures.in_flow,
+                }
+
+        for network in self.networks:
+            if len(network.heat_transfer_assets_prim) + len(network.heat_transfer_assets_sec) != 1:
+                continue
+            total_heat_demand = self._get_network_heat_demand(network, horizon)
+            for asset in network.heat_transfer_assets_sec:
+                if (
+                    asset.heat_transfer_type == HeatTransferAssetType.HEAT_PUMP
+                    and asset.max_electrical_power is not None
+                ):
+                    max_secondary = asset.max_electrical_power * asset.factor
+                    requested_secondary = np.abs(total_heat_demand)
+                    exceeded = requested_secondary > max_secondary
+                    if np.any(exceeded):
+                        # Scale down consumers in this network proportionally
+                        scale_factor = max_secondary / requested_secondary[exceeded]
+                        for consumer in network.consumers:
+                            horizon.heat_demand[consumer.id][exceeded] *= scale_factor
+                        total_heat_demand = self._get_network_heat_demand(network, horizon)
+            for asset in network.heat_transfer_assets_prim:
+                horizon.heat_transfer.append((asset, True, total_heat_demand))
+            for asset in network.heat_transfer_assets_sec:
+                horizon.heat_transfer.append((asset, False, total_heat_demand))
+
+        horizon.pressure = [network.set_pressure() for network in self.networks]
+        self.setpoint_horizon = horizon
+        return horizon
+
+    @staticmethod
+    def _get_network_heat_demand(
+        network: ControllerNetwork, horizon: SetpointHorizon
+    ) -> np.ndarray:
+        """Method to get the total heat demand setpoint of a network for all time steps.
+
+        :param ControllerNetwork network: Network to sum the setpoints of.
+        :param SetpointHorizon horizon: Precomputed setpoints of the assets.
+        :return: Array with the sum of the heat demand of all producers and consumers.
+        """
+        total_heat_demand = np.zeros(len(horizon))
+        for asset in network.producers + network.consumers:
+            total_heat_demand = total_heat_demand + horizon.heat_demand[asset.id]
+        return total_heat_demand
+
+    def _create_merit_order(self) -> MeritOrder:
+        """Method to create the merit order of the producers of all networks."""
+        return MeritOrder([producer for network in self.networks for producer in network.producers])
+
+    def _get_merit_order(self) -> MeritOrder:
+        """Method to get the merit order, which is created when the time grid is not set."""
+        if self.merit_order is None:
+            return self._create_merit_order()
+        return self.merit_order
+
     def _set_producers_to_max(self, time: datetime.datetime) -> dict:
         result = {}
         for network in self.networks:
@@ -262,33 +500,22 @@ class NetworkController(NetworkControllerAbstract):
     def _set_producers_based_on_priority(
         self, time: datetime.datetime, required_supply: float
     ) -> dict:
-        """Method to set the producers based on the priority of the source."""
+        """Method to set the producers based on the priority of the source.
+
+        The required supply is allocated with the merit order of the producers, the producers
+        that are not needed are set to zero.
+        """
+        merit_order = self._get_merit_order()
+        factors = merit_order.get_factors(required_supply)[0].tolist()
         producers = {}
-        priority = 0
-        while required_supply > 0:
-            priority += 1
-            max_supply_priority = self._get_total_supply_priority(priority)
-            required_supply -= max_supply_priority
-            if required_supply > 0:
-                # set the producers with the priority to the max
-                for network in self.networks:
-                    producers.update(network.set_supply_to_max(time, priority))
-            else:
-                # set the producers with the priority with a factor.
-                factor = 1 + required_supply / max_supply_priority
-                for network in self.networks:
-                    producers.update(network.set_supply(time, factor=factor, priority=priority))
-        if len(producers) < sum([len(network.producers) for network in self.networks]):
-            # not al producers are set need to set the remaining to zero.
-            for network in self.networks:
-                for producer in network.producers:
-                    if producer.id not in producers:
-                        producers[producer.id] = {
-                            PROPERTY_HEAT_DEMAND: 0,
-                            PROPERTY_TEMPERATURE_IN: producer.temperatures.in_flow,
-                            PROPERTY_TEMPERATURE_OUT: producer.temperatures.out_flow,
-                            PROPERTY_SET_PRESSURE: False,
-                        }
+        for producer, factor in zip(merit_order.producers, factors):
+            # Discharging (e.g., heat from component/system to the network) is negative.
+            producers[producer.id] = {
+                PROPERTY_HEAT_DEMAND: -1 * producer.get_max_power(time) * factor if factor else 0,
+                PROPERTY_TEMPERATURE_OUT: producer.temperatures.out_flow,
+                PROPERTY_TEMPERATURE_IN: producer.temperatures.in_flow,
+                PROPERTY_SET_PRESSURE: False,
+            }
         return producers
 
     def _get_total_supply_priority(self, priority: int) -> float:
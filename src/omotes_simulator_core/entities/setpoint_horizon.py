@@ -0,0 +1,166 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the setpoints of the network controller for all time steps of a simulation."""
+
+import datetime
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.entities.assets.asset_defaults import PROPERTY_HEAT_DEMAND
+from omotes_simulator_core.entities.assets.controller.controller_heat_transfer import (
+    ControllerHeatTransferAsset,
+)
+from omotes_simulator_core.entities.assets.controller.profile_array import (
+    MICROSECONDS_PER_SECOND,
+    to_microseconds,
+)
+from omotes_simulator_core.entities.assets.setpoint_array import (
+    MASK_FIELD,
+    SetpointArray,
+    get_field_mask,
+)
+
+
+class SetpointHorizon:
+    """Setpoints of the network controller precomputed for all time steps of a simulation.
+
+    The heat demand of the producers and consumers is stored in an array per asset with a value
+    per time step, the properties that do not change in time are stored once per asset. The
+    setpoints of a time step are assembled from a row of these arrays.
+    """
+
+    start: int
+    """Time of the first time step in microseconds since the epoch."""
+    step: int
+    """Time between two time steps in microseconds."""
+    heat_demand: dict[str, np.ndarray]
+    """Heat demand setpoint per time step of the producers and consumers, by asset id."""
+    properties: dict[str, dict[str, float | bool]]
+    """Setpoints that are the same for all time steps, by asset id."""
+    heat_transfer: list[tuple[ControllerHeatTransferAsset, bool, np.ndarray]]
+    """Heat transfer assets with whether they are set on the primary side and their heat demand
+    per time step."""
+    pressure: list[tuple[str, str]]
+    """Asset id and setpoint key of the assets that set the pressure of each network."""
+    capped: np.ndarray
+    """Whether the consumers are capped to the available power, per time step."""
+    valid: np.ndarray
+    """Whether the setpoints of a time step are precomputed, per time step."""
+
+    def __init__(
+        self, start: datetime.datetime, timestep: float, number_of_time_steps: int
+    ) -> None:
+        """Constructor of the setpoint horizon, without setpoints.
+
+        :param datetime.datetime start: Time of the first time step.
+        :param float timestep: Time between two time steps in seconds.
+        :param int number_of_time_steps: Number of time steps.
+        """
+        self.start = to_microseconds(start)
+        self.step = round(timestep * MICROSECONDS_PER_SECOND)
+        self.heat_demand = {}
+        self.properties = {}
+        self.heat_transfer = []
+        self.pressure = []
+        self.capped = np.zeros(number_of_time_steps, dtype=bool)
+        self.valid = np.ones(number_of_time_steps, dtype=bool)
+        self._setpoint_array: SetpointArray | None = None
+
+    def __len__(self) -> int:
+        """Method to get the number of time steps of the horizon."""
+        return len(self.valid)
+
+    def get_index(self, time: datetime.datetime) -> int:
+        """Method to get the index of the time step with precomputed setpoints at the given time.
+
+        :param datetime.datetime time: Time of the time step.
+        :return: Index of the time step, -1 when the setpoints of the time are not precomputed.
+        """
+        index, remainder = divmod(to_microseconds(time) - self.start, self.step)
+        if remainder != 0 or not 0 <= index < len(self.valid) or not self.valid[index]:
+            return -1
+        return int(index)
+
+    def get_setpoints(self, index: int) -> dict[str, dict[str, float | bool]]:
+        """Method to get the setpoints of all assets for a time step.
+
+        :param int index: Index of the time step.
+        :return: dict with the key the asset id and the value a dict with the setpoints.
+        """
+        setpoints: dict[str, dict[str, float | bool]] = {}
+        for asset_id, heat_demand in self.heat_demand.items():
+            setpoints[asset_id] = {
+                PROPERTY_HEAT_DEMAND: float(heat_demand[index]),
+                **self.properties[asset_id],
+            }
+        for asset, primary, heat_transfer_demand in self.heat_transfer:
+            total_heat_demand = float(heat_transfer_demand[index])
+            if primary:
+                setpoints.update(asset.set_asset_prim(total_heat_demand, total_heat_demand >= 0))
+            else:
+                setpoints.update(asset.set_asset_sec(total_heat_demand, total_heat_demand < 0))
+        for asset_id, key in self.pressure:
+            setpoints[asset_id][key] = True
+        return setpoints
+
+    def get_setpoint_array(self, asset_ids: list[str]) -> SetpointArray:
+        """Method to get the setpoints of all time steps as a setpoint array.
+
+        The setpoint array is created on the first call and kept for the next calls with the same
+        asset ids. The setpoints of the time steps that are not valid are not filled. The
+        setpoints are filled per asset for all time steps at once with array operations.
+
+        :param list[str] asset_ids: Ids of the assets in the order of the records.
+        :return: Setpoint array with the setpoints of all time steps.
+        """
+        if self._setpoint_array is not None and self._setpoint_array.asset_ids == asset_ids:
+            return self._setpoint_array
+        setpoint_array = SetpointArray(asset_ids, len(self.valid))
+        records = setpoint_array.records
+        for asset_id, heat_demand in self.heat_demand.items():
+            column = records[:, setpoint_array.get_ordinal(asset_id)]
+            column[PROPERTY_HEAT_DEMAND] = heat_demand
+            for name, value in self.properties[asset_id].items():
+                column[name] = value
+            column[MASK_FIELD] |= get_field_mask((PROPERTY_HEAT_DEMAND, *self.properties[asset_id]))
+        for asset, primary, heat_transfer_demand in self.heat_transfer:
+            total_heat_demand = heat_transfer_demand[self.valid]
+            if primary:
+                setpoints = asset.set_asset_prim_array(total_heat_demand, total_heat_demand >= 0)
+            else:
+                setpoints = asset.set_asset_sec_array(total_heat_demand, total_heat_demand < 0)
+            for asset_id, asset_setpoints in setpoints.items():
+                ordinal = setpoint_array.get_ordinal(asset_id)
+                for name, values in asset_setpoints.items():
+                    records[name][self.valid, ordinal] = values
+                records[MASK_FIELD][self.valid, ordinal] |= get_field_mask(tuple(asset_setpoints))
+        for asset_id, key in self.pressure:
+            column = records[:, setpoint_array.get_ordinal(asset_id)]
+            column[key] = True
+            column[MASK_FIELD] |= get_field_mask((key,))
+        self._setpoint_array = setpoint_array
+        return setpoint_array
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Method to get the heat demand setpoints of all time steps.
+
+        :return: DataFrame with the time as index and a column per producer and consumer.
+        """
+        index = pd.to_datetime(
+            self.start + self.step * np.arange(len(self.valid), dtype=np.int64), unit="us", utc=True
+        )
+        return pd.DataFrame(self.heat_demand, index=index)
@@ -15,10 +15,74 @@
 
 """Configuration parameters for the simulation that are not included in the ESDL."""
 
+import math
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
+OUTPUT_AGGREGATIONS = ("sample", "mean")
+"""Methods to reduce the time steps in an interval to a single output value."""
+OUTPUT_MODES = ("memory", "stream", "aggregate", "memmap")
+"""Ways to keep the output of a simulation, in memory, streamed to a file during the run,
+aggregated to statistics per output or in memory mapped files."""
+
+
+@dataclass
+class OutputSpecification:
+    """Class to specify which output of the simulation is recorded.
+
+    An asset is recorded when no asset types and ids are given, or when its type or id is in the
+    given lists. Of the recorded assets only the given properties are recorded, or all properties
+    when no properties are given. Output that is not recorded is not computed.
+    """
+
+    asset_types: list[str] | None = None
+    """Class names of the assets to record, e.g. Pipe or ProductionCluster."""
+
+    asset_ids: list[str] | None = None
+    """Ids of the assets to record."""
+
+    properties: list[str] | None = None
+    """Names of the properties to record."""
+
+    time_step_interval: int = 1
+    """Number of time steps that are reduced to a single output time step."""
+
+    aggregation: str = "sample"
+    """Reduction of the time steps in an interval, either sample (first time step) or mean."""
+
+    def __post_init__(self) -> None:
+        """Method to check the specification after it is created."""
+        if self.time_step_interval < 1:
+            raise ValueError(
+                f"Time step interval should be at least 1, got {self.time_step_interval}."
+            )
+        if self.aggregation not in OUTPUT_AGGREGATIONS:
+            raise ValueError(
+                f"Aggregation should be one of {OUTPUT_AGGREGATIONS}, got '{self.aggregation}'."
+            )
+
+    def is_asset_recorded(self, asset_type: str, asset_id: str) -> bool:
+        """Method to check if the output of an asset is recorded.
+
+        :param str asset_type: Class name of the asset.
+        :param str asset_id: Id of the asset.
+        :return: True when the output of the asset is recorded, False otherwise.
+        """
+        if self.asset_types is None and self.asset_ids is None:
+            return True
+        return (self.asset_types is not None and asset_type in self.asset_types) or (
+            self.asset_ids is not None and asset_id in self.asset_ids
+        )
+
+    def get_number_of_output_time_steps(self, number_of_time_steps: int) -> int:
+        """Method to get the number of output time steps of a simulation.
+
+        :param int number_of_time_steps: Number of time steps of the simulation.
+        :return: Number of output time steps, including a last partial interval.
+        """
+        return math.ceil(number_of_time_steps / self.time_step_interval)
+
 
 @dataclass
 class SimulationConfiguration:
@@ -29,3 +93,50 @@ class SimulationConfiguration:
     timestep: int
     start: datetime
     stop: datetime
+    output_dtype: str = "float64"
+    """Numpy data type of the output arrays of the assets, e.g. float32 to halve their memory."""
+    output_specification: OutputSpecification = field(default_factory=OutputSpecification)
+    """Specification of the assets, properties and time steps of which output is recorded."""
+    output_mode: str = "memory"
+    """Way to keep the output, memory returns it as a DataFrame, stream writes it to a file in the
+    output directory in chunks of time steps, aggregate returns statistics per output and memmap
+    writes it to memory mapped files in a directory in the output directory."""
+    output_directory: str | None = None
+    """Directory the output files are written to, required when the output is not kept in
+    memory."""
+    output_format: str = "parquet"
+    """Format of the file the output is streamed to, parquet or arrow."""
+    output_layout: str = "wide"
+    """Layout of the file the output is streamed to, wide with a column per output or long with a
+    row per time step and output."""
+    output_aggregation_period: str | None = None
+    """Pandas frequency of the periods the aggregated statistics are computed for, e.g. M for
+    months, the whole simulation when None."""
+    solver_diagnostics: bool = False
+    """Whether the diagnostics of every iteration of the solver are recorded."""
+    solver_condition_estimate: bool = False
+    """Whether the diagnostics of the solver include an estimate of the condition number of the
+    matrix, which factorizes the matrix a second time in every iteration."""
+    precompute_setpoints: bool = False
+    """Whether the setpoints of the controller are computed for all time steps before the
+    simulation starts, which is only done when the networks have no storages."""
+    failure_bundle_directory: str | None = None
+    """Directory in which the state of a failed solve is written, the temporary directory of the
+    system when None."""
+    build_cache_directory: str | None = None
+    """Directory of the on-disk cache of built networks and controllers, which is not used when
+    None."""
+    pipe_catalog_file: str | None = None
+    """File in which the inner diameters of pipes retrieved from the EDR are kept between runs,
+    the diameters are only kept in memory when None."""
+
+    def __post_init__(self) -> None:
+        """Method to check the configuration after it is created."""
+        if self.output_mode not in OUTPUT_MODES:
+            raise ValueError(
+                f"Output mode should be one of {OUTPUT_MODES}, got '{self.output_mode}'."
+            )
+        if self.output_mode not in ("memory", "aggregate") and self.output_directory is None:
+            raise ValueError(
+                f"An output directory is required for output mode '{self.output_mode}'."
+            )
@@ -15,7 +15,7 @@
 
 """Module to read the esdl profiles from an energy system."""
 import logging
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import cast
 
 import esdl
@@ -24,6 +24,8 @@ from esdl.esdl_handler import EnergySystemHandler
 from esdl.profiles.influxdbprofilemanager import ConnectionSettings, InfluxDBProfileManager
 from esdl.units.conversion import ENERGY_IN_J, POWER_IN_W, convert_to_unit
 
+from omotes_simulator_core.infrastructure.tracing import start_span
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,13 +66,44 @@ def parse_esdl_profiles(esh: EnergySystemHandler) -> dict[str, pd.DataFrame]:
     return data_set
 
 
-def get_data_from_profile(esdl_profile: esdl.InfluxDBProfile) -> pd.DataFrame:
+def get_profile_references(esh: EnergySystemHandler) -> list[tuple[str, ...]]:
+    """Method to get the references to the data of the InfluxDB profiles of an energy system.
+
+    A reference holds the attributes that select the data of a profile in the database, so it can
+    be used to identify the data without loading it.
+    :param esh: EnergySystemHandler with the energy system
+    :return: list with the id, host, port, database, measurement, field, filters, start date, end
+        date and multiplier of every profile, sorted by id
+    """
+    return sorted(
+        (
+            str(profile.id),
+            str(profile.host),
+            str(profile.port),
+            str(profile.database),
+            str(profile.measurement),
+            str(profile.field),
+            str(profile.filters),
+            str(profile.startDate),
+            str(profile.endDate),
+            str(profile.multiplier),
+        )
+        for profile in esh.get_all_instances_of_type(esdl.InfluxDBProfile)
+    )
+
+
+def get_data_from_profile(
+    esdl_profile: esdl.InfluxDBProfile | esdl.TimeSeriesProfile,
+) -> pd.DataFrame:
     """Method to get the data from the esdl influxdb profile.
 
-    This method tries to get the data from the esdl profile.
+    This method tries to get the data from the esdl profile. Time series profiles hold their
+    values in the esdl itself, so they are read without a connection to the database.
     :param esdl_profile: esdl.Profile with the profile
     :return: pandas.DataFrame with the data
     """
+    if isinstance(esdl_profile, esdl.TimeSeriesProfile):
+        return get_data_from_time_series_profile(esdl_profile)
     influx_cred_map: dict[str, tuple[str, str]] = {}
     profile_host = str(esdl_profile.host)
     profile_port = int(esdl_profile.port)
@@ -103,15 +136,21 @@ def get_data_from_profile(esdl_profile: esdl.InfluxDBProfile) -> pd.DataFrame:
         verify_ssl=ssl_setting,
     )
     time_series_data = InfluxDBProfileManager(conn_settings)
-    time_series_data.load_influxdb(
+    with start_span(
+        "profile_loading",
+        host=influx_host,
         measurement=profile_measurement,
-        fields=[profile_field],
-        from_datetime=cast(datetime, esdl_profile.startDate),
-        to_datetime=cast(datetime, esdl_profile.endDate),
-        filters=_normalize_influx_filters(
-            str(esdl_profile.filters) if esdl_profile.filters else None
-        ),
-    )
+        field=profile_field,
+    ):
+        time_series_data.load_influxdb(
+            measurement=profile_measurement,
+            fields=[profile_field],
+            from_datetime=cast(datetime, esdl_profile.startDate),
+            to_datetime=cast(datetime, esdl_profile.endDate),
+            filters=_normalize_influx_filters(
+                str(esdl_profile.filters) if esdl_profile.filters else None
+            ),
+        )
     # Error check start and end dates of profiles
 
     # I do not think this is required since you set it in mapeditor.
@@ -175,6 +214,33 @@ def get_data_from_profile(esdl_profile: esdl.InfluxDBProfile) -> pd.DataFrame:
     return pd.DataFrame(data_points)
 
 
+def get_data_from_time_series_profile(esdl_profile: esdl.TimeSeriesProfile) -> pd.DataFrame:
+    """Method to get the data from an esdl time series profile.
+
+    The values are converted to the SI unit of the profile, values of a profile without quantity
+    and unit are used as they are. A start date time without time zone is taken as UTC.
+    :param esdl_profile: esdl.TimeSeriesProfile with the profile
+    :return: pandas.DataFrame with the data
+    """
+    start = cast(datetime, esdl_profile.startDateTime)
+    if start is None or not esdl_profile.timestep:
+        raise ValueError(
+            f"Time series profile {esdl_profile.id} has no start date time or timestep."
+        )
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+    dates = pd.date_range(
+        start=start, periods=len(esdl_profile.values), freq=pd.Timedelta(esdl_profile.timestep, "s")
+    ).tz_convert(timezone.utc)
+    conversion_factor = 1.0
+    if esdl_profile.profileQuantityAndUnit is not None:
+        conversion_factor = convert_to_unit(
+            1.0, esdl_profile.profileQuantityAndUnit, get_unit(esdl_profile)
+        )
+    values = [float(value) * conversion_factor for value in esdl_profile.values]
+    return pd.DataFrame({"date": list(dates.to_pydatetime()), "values": values})
+
+
 def get_unit(profile: esdl.InfluxDBProfile) -> esdl.PhysicalQuantityEnum:
     """Method to get the SI unit of the profile.
 
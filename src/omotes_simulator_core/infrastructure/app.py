@@ -16,6 +16,7 @@
 """Entry point for running simulator-core library from cmdline."""
 
 import logging
+import os
 import sys
 import traceback
 import uuid
@@ -25,30 +26,57 @@ import pandas as pd
 
 from omotes_simulator_core.entities.esdl_object import EsdlObject
 from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+from omotes_simulator_core.infrastructure.network_build_cache import NetworkBuildCache
 from omotes_simulator_core.infrastructure.simulation_manager import SimulationManager
 from omotes_simulator_core.infrastructure.utils import pyesdl_from_file
 
 logger = logging.getLogger(__name__)
 
+BUILD_CACHE_DIRECTORY_VARIABLE = "OMOTES_BUILD_CACHE_DIRECTORY"
+"""Environment variable with the directory of the build cache of command line runs."""
+PIPE_CATALOG_FILE_VARIABLE = "OMOTES_PIPE_CATALOG_FILE"
+"""Environment variable with the file of the pipe catalog of command line runs."""
+
 
 def progressLogger(progress: float, message: str) -> None:
     """Function to report progress to logging/stdout."""
     logger.info(f"{message} ({progress * 100:.2f}%)")
 
 
-def run(file_path: str | None = None) -> pd.DataFrame:
-    """Main run function for the heatnetwork simulator."""
-    config = SimulationConfiguration(
+def get_default_config() -> SimulationConfiguration:
+    """Function to get the configuration of a run from the command line.
+
+    The build cache is used when the directory is set in the environment variable
+    OMOTES_BUILD_CACHE_DIRECTORY. The inner diameters of pipes retrieved from the EDR are kept
+    in the file set in the environment variable OMOTES_PIPE_CATALOG_FILE.
+
+    :return: Configuration simulating the first week of 2019 with hourly time steps.
+    """
+    return SimulationConfiguration(
         simulation_id=uuid.uuid1(),
         name="test run",
         timestep=3600,
         start=datetime.strptime("2019-01-01T00:00:00", "%Y-%m-%dT%H:%M:%S"),
         stop=datetime.strptime("2019-01-08T01:00:00", "%Y-%m-%dT%H:%M:%S"),
+        build_cache_directory=os.environ.get(BUILD_CACHE_DIRECTORY_VARIABLE),
+        pipe_catalog_file=os.environ.get(PIPE_CATALOG_FILE_VARIABLE),
     )
 
+
+def run(file_path: str | None = None) -> pd.DataFrame:
+    """Main run function for the heatnetwork simulator."""
+    config = get_default_config()
+
     esdl_file_path = sys.argv[1] if file_path is None else file_path
     try:
-        app = SimulationManager(EsdlObject(pyesdl_from_file(esdl_file_path)), config)
+        build_cache = (
+            None
+            if config.build_cache_directory is None
+            else NetworkBuildCache(config.build_cache_directory)
+        )
+        app = SimulationManager(
+            EsdlObject(pyesdl_from_file(esdl_file_path)), config, build_cache=build_cache
+        )
         result = app.execute(progressLogger)
         return result
     except Exception as error:
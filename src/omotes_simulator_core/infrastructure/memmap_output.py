@@ -0,0 +1,313 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the writer and reader of simulation results in memory mapped files."""
+import json
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from omotes_simulator_core.entities.assets.asset_defaults import OUTPUT_COLUMN_LEVELS
+from omotes_simulator_core.infrastructure.output_writer_abstract import OutputWriterAbstract
+
+METADATA_FILE = "metadata.json"
+"""Name of the file describing the blocks and the time axis of the results."""
+TIME_FILE = "time.npy"
+"""Name of the file holding the time axis of the results."""
+TIME_COLUMN = "time"
+"""Name of the index holding the time of the time steps."""
+
+
+class MemmapOutputWriter(OutputWriterAbstract):
+    """Writer storing the results of a simulation in preallocated memory mapped files.
+
+    The outputs are stored in a block per property, which is a .npy file with a row per time step
+    and a column per asset and port. The time axis is stored in its own file and a metadata file
+    maps the columns of the blocks to the outputs. The files are created with the outputs of the
+    first chunk of time steps, the metadata is updated after every chunk, so the results written
+    can be read by other processes while the simulation runs. The files are sized for the number
+    of output time steps of the simulation when the network allocates its output.
+    """
+
+    directory: Path
+    """Directory the files are written to."""
+    number_of_time_steps: int
+    """Number of time steps the files are allocated for, set when the output is allocated."""
+    dtype: np.dtype
+    """Data type of the stored values."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        dtype: npt.DTypeLike = np.float64,
+        chunk_size: int = 168,
+    ) -> None:
+        """Constructor of the memory mapped output writer.
+
+        :param str | Path directory: Directory the files are written to, it is created when it
+            does not exist.
+        :param DTypeLike dtype: Data type of the stored values, float64 or float32.
+        :param int chunk_size: Number of time steps written at once.
+        """
+        super().__init__(chunk_size)
+        self.directory = Path(directory)
+        self.number_of_time_steps = 0
+        self.dtype = np.dtype(dtype)
+        self._time: np.memmap | None = None
+        self._blocks: dict[str, np.memmap] = {}
+        self._block_columns: dict[str, list[tuple[str, str]]] = {}
+        self._column_index: dict[tuple[str, ...], tuple[str, int]] = {}
+        self._timezone: str | None = None
+
+    def allocate(self, number_of_time_steps: int) -> int:
+        """Method to size the files for the output time steps of a simulation.
+
+        :param int number_of_time_steps: Number of output time steps of the simulation.
+        :return: Number of output time steps the output stores of the assets need to hold.
+        """
+        if self._time is not None:
+            raise ValueError("The memory mapped output is allocated after its files are created.")
+        self.number_of_time_steps = number_of_time_steps
+        return super().allocate(number_of_time_steps)
+
+    def _write_chunk(
+        self, times: list[datetime], columns: dict[tuple[str, ...], np.ndarray]
+    ) -> None:
+        """Method to write a chunk of time steps to the memory mapped files.
+
+        :param list[datetime] times: Times of the time steps in the chunk.
+        :param dict columns: Dict with the key of the output as key and the values as value.
+        """
+        start = self.number_of_time_steps_written
+        end = start + len(times)
+        if end > self.number_of_time_steps:
+            raise ValueError(
+                f"Cannot write {end} time steps, the files are allocated for "
+                f"{self.number_of_time_steps} time steps."
+            )
+        time_index = pd.DatetimeIndex(times)
+        time_block = self._time
+        if time_block is None:
+            time_block = self._create_files(list(columns), time_index)
+        elif not set(columns).issubset(self._column_index):
+            raise ValueError("Outputs are added after the first chunk of memory mapped output.")
+        if time_index.tz is not None:
+            time_index = time_index.tz_convert("UTC").tz_localize(None)
+        time_block[start:end] = time_index.values
+        for key, values in columns.items():
+            property_name, column = self._column_index[key]
+            self._blocks[property_name][start:end, column] = values
+        time_block.flush()
+        for block in self._blocks.values():
+            block.flush()
+        self._write_metadata(end)
+
+    def _close(self) -> None:
+        """Method to release the memory mapped files."""
+        self._time = None
+        self._blocks = {}
+
+    def _create_files(self, keys: list[tuple[str, ...]], time_index: pd.DatetimeIndex) -> np.memmap:
+        """Method to create the files for the outputs of the first chunk, filled with NaN.
+
+        :param list keys: Keys of the outputs.
+        :param DatetimeIndex time_index: Times of the time steps of the first chunk.
+        :return: Memory map of the time axis.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._timezone = None if time_index.tz is None else "UTC"
+        for asset_id, port_id, property_name in keys:
+            block_columns = self._block_columns.setdefault(property_name, [])
+            self._column_index[(asset_id, port_id, property_name)] = (
+                property_name,
+                len(block_columns),
+            )
+            block_columns.append((asset_id, port_id))
+        time_block: np.memmap = np.lib.format.open_memmap(
+            self.directory / TIME_FILE,
+            mode="w+",
+            dtype="datetime64[ns]",
+            shape=(self.number_of_time_steps,),
+        )
+        time_block[:] = np.datetime64("NaT")
+        self._time = time_block
+        for index, (property_name, block_columns) in enumerate(self._block_columns.items()):
+            block = np.lib.format.open_memmap(
+                self.directory / self._get_block_file(index),
+                mode="w+",
+                dtype=self.dtype,
+                shape=(self.number_of_time_steps, len(block_columns)),
+            )
+            block[:] = np.nan
+            self._blocks[property_name] = block
+        return time_block
+
+    def _write_metadata(self, number_of_time_steps_written: int) -> None:
+        """Method to write the metadata file, replacing the previous one at once.
+
+        :param int number_of_time_steps_written: Number of time steps written to the blocks.
+        """
+        metadata = {
+            "levels": list(OUTPUT_COLUMN_LEVELS),
+            "number_of_time_steps": self.number_of_time_steps,
+            "number_of_time_steps_written": number_of_time_steps_written,
+            "time_file": TIME_FILE,
+            "timezone": self._timezone,
+            "blocks": {
+                property_name: {
+                    "file": self._get_block_file(index),
+                    "columns": [list(column) for column in block_columns],
+                }
+                for index, (property_name, block_columns) in enumerate(self._block_columns.items())
+            },
+        }
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "w") as file:
+                json.dump(metadata, file, indent=2)
+            os.replace(temp_path, self.directory / METADATA_FILE)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    @staticmethod
+    def _get_block_file(index: int) -> str:
+        """Method to get the name of the file of a block.
+
+        :param int index: Index of the block.
+        :return: Name of the file.
+        """
+        return f"block_{index}.npy"
+
+
+class MemmapOutputReader:
+    """Reader of the results written by the MemmapOutputWriter.
+
+    The blocks are opened as read only memory maps, so only the values that are accessed are
+    loaded in memory. The metadata is read again for every request, so results of a simulation
+    that is still running can be read up to the last chunk written.
+    """
+
+    directory: Path
+    """Directory the results are read from."""
+
+    def __init__(self, directory: str | Path) -> None:
+        """Constructor of the memory mapped output reader.
+
+        :param str | Path directory: Directory the results are read from.
+        """
+        self.directory = Path(directory)
+        self._metadata: dict[str, Any] = {}
+        self.refresh()
+
+    @property
+    def number_of_time_steps(self) -> int:
+        """Number of time steps written when the metadata was read."""
+        return int(self._metadata["number_of_time_steps_written"])
+
+    @property
+    def properties(self) -> list[str]:
+        """Names of the properties, each stored in its own block."""
+        return list(self._metadata["blocks"])
+
+    @property
+    def columns(self) -> list[tuple[str, ...]]:
+        """Keys of the outputs in the files."""
+        return [
+            (asset_id, port_id, property_name)
+            for property_name, block in self._metadata["blocks"].items()
+            for asset_id, port_id in block["columns"]
+        ]
+
+    def refresh(self) -> None:
+        """Method to read the metadata, to include the time steps written since the last read."""
+        with open(self.directory / METADATA_FILE) as file:
+            self._metadata = json.load(file)
+
+    def get_time_index(self) -> pd.DatetimeIndex:
+        """Method to get the times of the time steps written.
+
+        :return: DatetimeIndex with the time of each time step.
+        """
+        times = np.load(self.directory / self._metadata["time_file"], mmap_mode="r")
+        time_index = pd.DatetimeIndex(times[: self.number_of_time_steps], name=TIME_COLUMN)
+        if self._metadata["timezone"] is not None:
+            time_index = time_index.tz_localize(self._metadata["timezone"])
+        return time_index
+
+    def get_block(self, property_name: str) -> pd.DataFrame:
+        """Method to get the values of a property as a DataFrame on the memory mapped block.
+
+        The values are not copied, so they are only loaded when accessed. The DataFrame is read
+        only.
+
+        :param str property_name: Name of the property.
+        :return: DataFrame with the time as index and a column per asset and port.
+        """
+        self.refresh()
+        return self._get_block(property_name)
+
+    def read(self, properties: list[str] | None = None) -> pd.DataFrame:
+        """Method to read the values of the given properties in the result format.
+
+        The values of the blocks are copied into a single DataFrame.
+
+        :param list[str] properties: Names of the properties to read, when None all properties
+            are read.
+        :return: DataFrame with the time as index and a column per output with a MultiIndex.
+        """
+        self.refresh()
+        if properties is None:
+            properties = self.properties
+        keys: list[tuple[str, ...]] = []
+        arrays = []
+        for property_name in properties:
+            block = self._get_block(property_name)
+            keys.extend((asset_id, port_id, property_name) for asset_id, port_id in block.columns)
+            arrays.append(block.to_numpy())
+        levels = self._metadata["levels"]
+        if keys:
+            columns = pd.MultiIndex.from_tuples(keys, names=levels)
+        else:
+            columns = pd.MultiIndex.from_arrays([[]] * len(levels), names=levels)
+        return pd.DataFrame(
+            np.hstack(arrays) if arrays else np.empty((self.number_of_time_steps, 0)),
+            index=self.get_time_index(),
+            columns=columns,
+        )
+
+    def _get_block(self, property_name: str) -> pd.DataFrame:
+        """Method to get the values of a property as a DataFrame without reading the metadata.
+
+        :param str property_name: Name of the property.
+        :return: DataFrame with the time as index and a column per asset and port.
+        """
+        block = self._metadata["blocks"][property_name]
+        values = np.load(self.directory / block["file"], mmap_mode="r")
+        return pd.DataFrame(
+            values[: self.number_of_time_steps],
+            index=self.get_time_index(),
+            columns=pd.MultiIndex.from_tuples(
+                [tuple(column) for column in block["columns"]],
+                names=self._metadata["levels"][:2],
+            ),
+            copy=False,
+        )
@@ -0,0 +1,141 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the on-disk cache for networks and controllers built from an esdl."""
+import gzip
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from omotes_simulator_core import __version__
+from omotes_simulator_core.entities.heat_network import HeatNetwork
+from omotes_simulator_core.entities.network_controller import NetworkController
+from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 6
+"""Version of the layout of the cache files, increase when the layout changes."""
+
+
+class NetworkBuildCache:
+    """Cache storing the heat network and network controller built from an esdl on disk.
+
+    The cached objects contain the network topology, the matrix index layout of the solver and
+    the resampled profiles of the controller. They are stored as a compressed pickle, which means
+    the cache directory should only be shared between trusted processes.
+    """
+
+    cache_dir: Path
+    """Directory in which the cache files are stored."""
+
+    def __init__(self, cache_dir: str | Path) -> None:
+        """Constructor of the network build cache.
+
+        :param str | Path cache_dir: Directory in which the cache files are stored, it is created
+            when it does not exist.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(
+        esdl_string: str,
+        config: SimulationConfiguration,
+        profile_references: list[tuple[str, ...]] | None = None,
+    ) -> str:
+        """Method to get the cache key for an esdl and simulation configuration.
+
+        Only the configuration fields that are used to build the network and controller are part
+        of the key. The start and stop of the simulation are not, so a cached build can be reused
+        for another simulation window. The data of profiles that are not stored in the esdl, like
+        InfluxDB profiles, is identified by their references, so it is not loaded for the key. The
+        content of the pipe catalog file is part of the key, since it sets the pipe diameters.
+
+        :param str esdl_string: Content of the esdl file.
+        :param SimulationConfiguration config: Configuration of the simulation.
+        :param list profile_references: References to the data of the profiles that are not
+            stored in the esdl, as returned by get_profile_references.
+        :return: Hex digest identifying the build.
+        """
+        sha = hashlib.sha256()
+        sha.update(f"{CACHE_FORMAT_VERSION};{__version__};{config.timestep};".encode())
+        sha.update(esdl_string.encode())
+        if config.pipe_catalog_file is not None and os.path.isfile(config.pipe_catalog_file):
+            sha.update(b";")
+            sha.update(Path(config.pipe_catalog_file).read_bytes())
+        for reference in sorted(profile_references or []):
+            sha.update(f";{'|'.join(reference)}".encode())
+        return sha.hexdigest()
+
+    def get_path(self, key: str) -> Path:
+        """Method to get the path of the cache file for the given key.
+
+        :param str key: Cache key as returned by get_key.
+        :return: Path of the cache file.
+        """
+        return self.cache_dir / f"{key}.pkl.gz"
+
+    def load(self, key: str) -> tuple[HeatNetwork, NetworkController] | None:
+        """Method to load the network and controller for the given key.
+
+        :param str key: Cache key as returned by get_key.
+        :return: Tuple with the network and controller, or None when they are not in the cache or
+            the cache file cannot be read.
+        """
+        path = self.get_path(key)
+        if not path.is_file():
+            return None
+        try:
+            with gzip.open(path, "rb") as file:
+                content = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as error:
+            logger.warning(f"Could not read network build cache file {path}: {error}")
+            return None
+        if content.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        logger.info(f"Network and controller loaded from build cache: {path}")
+        return content["network"], content["controller"]
+
+    def store(self, key: str, network: HeatNetwork, controller: NetworkController) -> None:
+        """Method to store the network and controller under the given key.
+
+        The objects need to be stored before the simulation is run, since the simulation changes
+        their state. The file is written to a temporary file first, so concurrent runs never read
+        a partially written file. When the objects cannot be pickled, for example because an asset
+        holds a reference to an external process, nothing is stored.
+
+        :param str key: Cache key as returned by get_key.
+        :param HeatNetwork network: Heat network to store.
+        :param NetworkController controller: Network controller to store.
+        """
+        content = {"version": CACHE_FORMAT_VERSION, "network": network, "controller": controller}
+        try:
+            data = pickle.dumps(content, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            logger.warning(f"Network cannot be stored in the build cache: {error}")
+            return
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(gzip.compress(data))
+            os.replace(temp_path, self.get_path(key))
+        except OSError as error:
+            logger.warning(f"Could not write network build cache file: {error}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
@@ -0,0 +1,307 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the aggregator reducing simulation results to key performance indicators."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    OUTPUT_COLUMN_LEVELS,
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_HEAT_DEMAND_SET_POINT,
+)
+from omotes_simulator_core.infrastructure.output_writer_abstract import OutputWriterAbstract
+
+PERIOD_LEVEL = "period"
+"""Name of the index level holding the aggregation period in the summary."""
+TOTAL_PERIOD = "total"
+"""Label of the period when the whole simulation is aggregated at once."""
+SECONDS_PER_HOUR = 3600.0
+"""Number of seconds in an hour."""
+
+
+class _PeriodAccumulator:
+    """Running statistics of all outputs for a single aggregation period."""
+
+    def __init__(self, number_of_columns: int, histogram_sizes: dict[str, tuple[int, int]]) -> None:
+        """Constructor of the period accumulator.
+
+        :param int number_of_columns: Number of aggregated outputs.
+        :param dict histogram_sizes: Dict with the property name as key and a tuple with the number
+            of outputs of the property and the number of bins as value.
+        """
+        self.count = np.zeros(number_of_columns, dtype=np.int64)
+        self.sum = np.zeros(number_of_columns)
+        self.min = np.full(number_of_columns, np.nan)
+        self.max = np.full(number_of_columns, np.nan)
+        self.above_threshold = np.zeros(number_of_columns, dtype=np.int64)
+        self.unmet_demand = np.zeros(number_of_columns, dtype=np.int64)
+        self.histograms = {
+            property_name: np.zeros(size, dtype=np.int64)
+            for property_name, size in histogram_sizes.items()
+        }
+
+
+class OutputAggregator(OutputWriterAbstract):
+    """Aggregator reducing the results of a simulation to statistics per output.
+
+    For every asset, port and property the number of values, sum, minimum, maximum, time above a
+    threshold and optionally a histogram are accumulated, in total or per calendar period. For the
+    heat demand of consumers the hours are counted in which the heat delivered is below the heat
+    demand set point. The
+    output stores are cleared after every chunk of time steps, so the memory used only depends on
+    the number of outputs and not on the simulation duration.
+    """
+
+    time_step: float
+    """Duration of an output time step [s]."""
+    period: str | None
+    """Pandas frequency of the aggregation periods, e.g. M or Y, None aggregates in total."""
+    thresholds: dict[str, float]
+    """Thresholds per property name, for which the time above the threshold is accumulated."""
+    histogram_bins: dict[str, np.ndarray]
+    """Bin edges per property name, for which a histogram is accumulated."""
+    unmet_demand_tolerance: float
+    """Relative shortfall of the heat delivered below the heat demand set point that is met."""
+
+    def __init__(
+        self,
+        time_step: float,
+        period: str | None = None,
+        thresholds: dict[str, float] | None = None,
+        histogram_bins: dict[str, list[float]] | None = None,
+        unmet_demand_tolerance: float = 0.001,
+        chunk_size: int = 168,
+    ) -> None:
+        """Constructor of the output aggregator.
+
+        :param float time_step: Duration of an output time step [s].
+        :param str period: Pandas frequency of the aggregation periods, e.g. M for months or Y for
+            years. When None, the whole simulation is aggregated at once.
+        :param dict thresholds: Thresholds per property name, for which the time above the
+            threshold is accumulated.
+        :param dict histogram_bins: Increasing bin edges per property name, for which a histogram
+            is accumulated. The last bin includes its right edge.
+        :param float unmet_demand_tolerance: Relative shortfall of the heat delivered below the
+            heat demand set point that is still counted as met.
+        :param int chunk_size: Number of time steps aggregated at once.
+        """
+        super().__init__(chunk_size)
+        self.time_step = time_step
+        self.period = period
+        self.thresholds = {} if thresholds is None else dict(thresholds)
+        self.histogram_bins = {}
+        for property_name, bin_edges in ({} if histogram_bins is None else histogram_bins).items():
+            edges = np.asarray(bin_edges, dtype=np.float64)
+            if edges.size < 2 or np.any(np.diff(edges) <= 0):
+                raise ValueError(
+                    f"Histogram bins of {property_name} should be at least two increasing edges."
+                )
+            self.histogram_bins[property_name] = edges
+        self.unmet_demand_tolerance = unmet_demand_tolerance
+        self._keys: list[tuple[str, ...]] = []
+        self._threshold_values = np.empty(0)
+        self._histogram_columns: dict[str, np.ndarray] = {}
+        self._demand_columns = np.empty(0, dtype=np.intp)
+        self._demand_set_point_columns = np.empty(0, dtype=np.intp)
+        self._accumulators: dict[str, _PeriodAccumulator] = {}
+
+    def get_summary(self) -> pd.DataFrame:
+        """Method to get the aggregated statistics of all outputs.
+
+        The summary contains the time steps written, which are all time steps once the writer is
+        closed at the end of the simulation.
+
+        :return: DataFrame with a row per output, and per period when a period is set, with the
+            count, sum, mean, min, max, integral over time [value * s], time above the threshold
+            [s] and unmet demand hours [h] as columns. The time above the threshold is NaN for
+            properties without a threshold, the unmet demand hours are NaN for all outputs but the
+            heat demand of consumers.
+        """
+        has_threshold = ~np.isnan(self._threshold_values)
+        has_demand = np.zeros(len(self._keys), dtype=bool)
+        has_demand[self._demand_columns] = True
+        frames = []
+        for accumulator in self._accumulators.values():
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = accumulator.sum / accumulator.count
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "count": accumulator.count,
+                        "sum": accumulator.sum,
+                        "mean": mean,
+                        "min": accumulator.min,
+                        "max": accumulator.max,
+                        "integral": accumulator.sum * self.time_step,
+                        "time_above_threshold": np.where(
+                            has_threshold, accumulator.above_threshold * self.time_step, np.nan
+                        ),
+                        "unmet_demand_hours": np.where(
+                            has_demand,
+                            accumulator.unmet_demand * self.time_step / SECONDS_PER_HOUR,
+                            np.nan,
+                        ),
+                    }
+                )
+            )
+        return self._concat(frames)
+
+    def get_histograms(self) -> dict[str, pd.DataFrame]:
+        """Method to get the accumulated histograms.
+
+        :return: Dict with the property name as key and a DataFrame with a row per output, and per
+            period when a period is set, and the number of time steps per bin as value. The
+            columns are the intervals of the bins.
+        """
+        histograms = {}
+        for property_name, edges in self.histogram_bins.items():
+            columns = self._histogram_columns.get(property_name, np.empty(0, dtype=np.intp))
+            frames = [
+                pd.DataFrame(
+                    accumulator.histograms[property_name],
+                    columns=pd.IntervalIndex.from_breaks(edges, closed="left"),
+                )
+                for accumulator in self._accumulators.values()
+            ]
+            histograms[property_name] = self._concat(frames, columns)
+        return histograms
+
+    def _write_chunk(
+        self, times: list[datetime], columns: dict[tuple[str, ...], np.ndarray]
+    ) -> None:
+        """Method to add a chunk of time steps to the running statistics.
+
+        :param list[datetime] times: Times of the time steps in the chunk.
+        :param dict columns: Dict with the key of the output as key and the values as value.
+        """
+        if not self._accumulators:
+            self._set_outputs(list(columns))
+        elif not set(columns).issubset(self._keys):
+            raise ValueError("Outputs are added after the first chunk of aggregated output.")
+        values = np.full((len(times), len(self._keys)), np.nan)
+        for index, key in enumerate(self._keys):
+            if key in columns:
+                values[:, index] = columns[key]
+        if self.period is None:
+            self._accumulate(TOTAL_PERIOD, values)
+            return
+        periods = pd.DatetimeIndex(times).tz_localize(None).to_period(self.period).astype(str)
+        for period in periods.unique():
+            self._accumulate(period, values[np.asarray(periods == period)])
+
+    def _close(self) -> None:
+        """Method to finish the aggregation, the statistics are kept in memory."""
+
+    def _set_outputs(self, keys: list[tuple[str, ...]]) -> None:
+        """Method to fix the aggregated outputs by the first chunk of time steps.
+
+        :param list keys: Keys of the outputs.
+        """
+        self._keys = keys
+        self._threshold_values = np.array([self.thresholds.get(key[-1], np.nan) for key in keys])
+        self._histogram_columns = {
+            property_name: np.array(
+                [index for index, key in enumerate(keys) if key[-1] == property_name],
+                dtype=np.intp,
+            )
+            for property_name in self.histogram_bins
+        }
+        key_index = {key: index for index, key in enumerate(keys)}
+        demand_columns = []
+        demand_set_point_columns = []
+        for index, (asset_id, port_id, property_name) in enumerate(keys):
+            set_point_key = (asset_id, port_id, PROPERTY_HEAT_DEMAND_SET_POINT)
+            if property_name == PROPERTY_HEAT_DEMAND and set_point_key in key_index:
+                demand_columns.append(index)
+                demand_set_point_columns.append(key_index[set_point_key])
+        self._demand_columns = np.array(demand_columns, dtype=np.intp)
+        self._demand_set_point_columns = np.array(demand_set_point_columns, dtype=np.intp)
+
+    def _accumulate(self, period: str, values: np.ndarray) -> None:
+        """Method to add the values of time steps within a period to its running statistics.
+
+        :param str period: Label of the period.
+        :param np.ndarray values: Array with a row per time step and a column per output.
+        """
+        if period not in self._accumulators:
+            self._accumulators[period] = _PeriodAccumulator(
+                len(self._keys),
+                {
+                    property_name: (len(columns), len(self.histogram_bins[property_name]) - 1)
+                    for property_name, columns in self._histogram_columns.items()
+                },
+            )
+        accumulator = self._accumulators[period]
+        accumulator.count += np.count_nonzero(~np.isnan(values), axis=0)
+        accumulator.sum += np.nansum(values, axis=0)
+        # fmin and fmax ignore NaN, so outputs without values stay NaN without a warning
+        accumulator.min = np.fmin(accumulator.min, np.fmin.reduce(values, axis=0))
+        accumulator.max = np.fmax(accumulator.max, np.fmax.reduce(values, axis=0))
+        accumulator.above_threshold += np.count_nonzero(values > self._threshold_values, axis=0)
+        # The heat delivered and its set point have opposite signs, so their magnitudes are compared
+        heat_delivered = np.abs(values[:, self._demand_columns])
+        heat_demand = np.abs(values[:, self._demand_set_point_columns])
+        is_unmet = heat_delivered < heat_demand * (1.0 - self.unmet_demand_tolerance)
+        accumulator.unmet_demand[self._demand_columns] += np.count_nonzero(is_unmet, axis=0)
+        for property_name, columns in self._histogram_columns.items():
+            accumulator.histograms[property_name] += self._histogram(
+                values[:, columns], self.histogram_bins[property_name]
+            )
+
+    @staticmethod
+    def _histogram(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        """Method to count the values per bin for each column at once.
+
+        :param np.ndarray values: Array with a row per time step and a column per output.
+        :param np.ndarray edges: Increasing bin edges, the last bin includes its right edge.
+        :return: Array with a row per output and a column per bin.
+        """
+        number_of_bins = len(edges) - 1
+        number_of_columns = values.shape[1]
+        bin_index = np.searchsorted(edges, values, side="right") - 1
+        bin_index[values == edges[-1]] = number_of_bins - 1
+        is_counted = (bin_index >= 0) & (bin_index < number_of_bins) & ~np.isnan(values)
+        flat_index = bin_index + np.arange(number_of_columns) * number_of_bins
+        counts = np.bincount(flat_index[is_counted], minlength=number_of_columns * number_of_bins)
+        return counts.reshape(number_of_columns, number_of_bins)
+
+    def _concat(
+        self, frames: list[pd.DataFrame], columns: np.ndarray | None = None
+    ) -> pd.DataFrame:
+        """Method to combine the statistics of the periods with the output keys as index.
+
+        :param list frames: DataFrame per period with a row per output.
+        :param np.ndarray columns: Indices of the outputs in the frames, when None all outputs.
+        :return: DataFrame indexed by the output keys, and the period when a period is set.
+        """
+        keys = self._keys if columns is None else [self._keys[index] for index in columns]
+        if keys:
+            index = pd.MultiIndex.from_tuples(keys, names=OUTPUT_COLUMN_LEVELS)
+        else:
+            index = pd.MultiIndex.from_arrays(
+                [[]] * len(OUTPUT_COLUMN_LEVELS), names=OUTPUT_COLUMN_LEVELS
+            )
+        if not frames:
+            return pd.DataFrame(index=index)
+        if self.period is None:
+            return frames[0].set_axis(index, axis=0)
+        return pd.concat(
+            [frame.set_axis(index, axis=0) for frame in frames],
+            keys=list(self._accumulators),
+            names=[PERIOD_LEVEL],
+        )
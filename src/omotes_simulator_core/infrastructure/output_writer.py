@@ -0,0 +1,325 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the streaming writer and reader of simulation results in Arrow files."""
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.entities.assets.asset_defaults import OUTPUT_COLUMN_LEVELS
+from omotes_simulator_core.infrastructure.output_writer_abstract import OutputWriterAbstract
+
+PARQUET_FORMAT = "parquet"
+"""File format writing the results to a Parquet file."""
+ARROW_FORMAT = "arrow"
+"""File format writing the results to an Arrow IPC file."""
+WIDE_LAYOUT = "wide"
+"""Layout with a row per time step and a column per output."""
+LONG_LAYOUT = "long"
+"""Layout with a row per time step and output, with the value in a single column."""
+
+TIME_COLUMN = "time"
+"""Name of the column holding the time of the time step."""
+VALUE_COLUMN = "value"
+"""Name of the column holding the value in the long layout."""
+COLUMN_SEPARATOR = "/"
+"""Separator between the levels of the output key in the column names of the wide layout."""
+METADATA_KEY = b"omotes_output"
+"""Key of the schema metadata describing the layout and the outputs in the file."""
+
+
+def _import_pyarrow() -> Any:
+    """Import pyarrow, which is an optional dependency only needed for streaming output.
+
+    :return: The pyarrow module.
+    """
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as error:
+        raise ImportError(
+            "pyarrow is required for streaming output, install omotes-simulator-core[arrow]"
+        ) from error
+    return pyarrow
+
+
+class StreamingOutputWriter(OutputWriterAbstract):
+    """Writer storing the results of a simulation in chunks of time steps.
+
+    Every chunk of time steps is written to the file as an Arrow record batch.
+    """
+
+    path: Path
+    """Path of the file the results are written to."""
+    file_format: str
+    """Format of the file, parquet or arrow."""
+    layout: str
+    """Layout of the results in the file, wide or long."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        file_format: str = PARQUET_FORMAT,
+        layout: str = WIDE_LAYOUT,
+        chunk_size: int = 168,
+    ) -> None:
+        """Constructor of the streaming output writer.
+
+        :param str | Path path: Path of the file the results are written to.
+        :param str file_format: Format of the file, parquet or arrow.
+        :param str layout: Layout of the results in the file, wide or long.
+        :param int chunk_size: Number of time steps written per record batch.
+        """
+        if file_format not in (PARQUET_FORMAT, ARROW_FORMAT):
+            raise ValueError(f"Unknown file format for streaming output: {file_format}")
+        if layout not in (WIDE_LAYOUT, LONG_LAYOUT):
+            raise ValueError(f"Unknown layout for streaming output: {layout}")
+        super().__init__(chunk_size)
+        self._pa = _import_pyarrow()
+        self.path = Path(path)
+        self.file_format = file_format
+        self.layout = layout
+        self._columns: list[tuple[str, ...]] = []
+        self._writer: Any = None
+        self._schema: Any = None
+
+    def _write_chunk(
+        self, times: list[datetime], columns: dict[tuple[str, ...], np.ndarray]
+    ) -> None:
+        """Method to write a chunk of time steps to the file as a record batch.
+
+        The outputs are fixed by the first chunk and recorded in the metadata of the file, so the
+        reader gets them without reading the record batches.
+
+        :param list[datetime] times: Times of the time steps in the chunk.
+        :param dict columns: Dict with the key of the output as key and the values as value.
+        """
+        if self._writer is None:
+            self._columns = list(columns)
+        elif not set(columns).issubset(self._columns):
+            raise ValueError("Outputs are added after the first chunk of streaming output.")
+        if self.layout == WIDE_LAYOUT:
+            batch = self._to_wide_batch(times, columns)
+        else:
+            batch = self._to_long_batch(times, columns)
+        if self._writer is None:
+            self._writer = self._open(batch.schema)
+        else:
+            batch = batch.cast(self._schema)
+        self._writer.write_batch(batch)
+
+    def _close(self) -> None:
+        """Method to close the file."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _open(self, schema: Any) -> Any:
+        """Method to open the file with the schema of the first record batch.
+
+        :param pyarrow.Schema schema: Schema of the record batches.
+        :return: Writer of the record batches to the file.
+        """
+        schema = schema.with_metadata(
+            {
+                METADATA_KEY: json.dumps(
+                    {
+                        "layout": self.layout,
+                        "levels": list(OUTPUT_COLUMN_LEVELS),
+                        "columns": [list(key) for key in self._columns],
+                    }
+                )
+            }
+        )
+        self._schema = schema
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.file_format == PARQUET_FORMAT:
+            return self._pa.parquet.ParquetWriter(self.path, schema)
+        return self._pa.ipc.new_file(self.path, schema)
+
+    def _to_wide_batch(
+        self, times: list[datetime], columns: dict[tuple[str, ...], np.ndarray]
+    ) -> Any:
+        """Method to convert the buffered output to a record batch in the wide layout.
+
+        The outputs are fixed by the first record batch. Outputs that are missing in a later
+        record batch are written as NaN.
+
+        :param list[datetime] times: Times of the time steps in the chunk.
+        :param dict columns: Dict with the key of the output as key and the values as value.
+        :return: pyarrow.RecordBatch with a row per time step.
+        """
+        number_of_time_steps = len(times)
+        arrays = [self._pa.array(pd.DatetimeIndex(times))]
+        for key in self._columns:
+            values = columns.get(key)
+            if values is None:
+                values = np.full(number_of_time_steps, np.nan)
+            arrays.append(self._pa.array(values))
+        names = [TIME_COLUMN] + [COLUMN_SEPARATOR.join(key) for key in self._columns]
+        return self._pa.RecordBatch.from_arrays(arrays, names=names)
+
+    def _to_long_batch(
+        self, times: list[datetime], columns: dict[tuple[str, ...], np.ndarray]
+    ) -> Any:
+        """Method to convert the buffered output to a record batch in the long layout.
+
+        :param list[datetime] times: Times of the time steps in the chunk.
+        :param dict columns: Dict with the key of the output as key and the values as value.
+        :return: pyarrow.RecordBatch with a row per time step and output.
+        """
+        number_of_time_steps = len(times)
+        keys = list(columns)
+        time_index = pd.DatetimeIndex(times)
+        arrays = [
+            self._pa.array(time_index.take(np.tile(np.arange(number_of_time_steps), len(keys))))
+        ]
+        for level in range(len(OUTPUT_COLUMN_LEVELS)):
+            level_values = np.repeat([key[level] for key in keys], number_of_time_steps)
+            arrays.append(self._pa.array(level_values))
+        arrays.append(self._pa.array(np.concatenate(list(columns.values()))))
+        names = [TIME_COLUMN, *OUTPUT_COLUMN_LEVELS, VALUE_COLUMN]
+        return self._pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+class StreamingOutputReader:
+    """Reader of the results written by the StreamingOutputWriter.
+
+    Parquet files are read per column, Arrow IPC files are memory mapped, so only the requested
+    outputs are loaded in memory.
+    """
+
+    path: Path
+    """Path of the file the results are read from."""
+    layout: str
+    """Layout of the results in the file, wide or long."""
+    level_names: tuple[str, ...]
+    """Names of the levels of the key of the outputs."""
+    columns: list[tuple[str, ...]]
+    """Keys of the outputs in the file."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Constructor of the streaming output reader.
+
+        :param str | Path path: Path of the file the results are read from.
+        """
+        self._pa = _import_pyarrow()
+        self.path = Path(path)
+        with open(self.path, "rb") as file:
+            self._is_parquet = file.read(4) == b"PAR1"
+        if self._is_parquet:
+            self._file = self._pa.parquet.ParquetFile(self.path)
+            schema = self._file.schema_arrow
+        else:
+            self._file = self._pa.ipc.open_file(self._pa.memory_map(str(self.path)))
+            schema = self._file.schema
+        metadata = json.loads(schema.metadata[METADATA_KEY])
+        self.layout = metadata["layout"]
+        self.level_names = tuple(metadata["levels"])
+        self.columns = [tuple(key) for key in metadata["columns"]]
+
+    def read(self, columns: list[tuple[str, ...]] | None = None) -> pd.DataFrame:
+        """Method to read the results.
+
+        :param list columns: Keys of the outputs to read, when None all outputs are read.
+        :return: DataFrame with the time as index and a column per output with a MultiIndex.
+        """
+        if columns is None:
+            columns = self.columns
+        chunks = list(self.iter_chunks(columns))
+        if not chunks:
+            return pd.DataFrame(
+                index=pd.DatetimeIndex([], name=TIME_COLUMN),
+                columns=pd.MultiIndex.from_tuples(columns, names=self.level_names),
+            )
+        return pd.concat(chunks)
+
+    def iter_chunks(self, columns: list[tuple[str, ...]] | None = None) -> Iterator[pd.DataFrame]:
+        """Method to read the results per chunk of time steps written.
+
+        :param list columns: Keys of the outputs to read, when None all outputs are read.
+        :return: Iterator over DataFrames with the time as index and a column per output.
+        """
+        if columns is None:
+            columns = self.columns
+        if self.layout == WIDE_LAYOUT:
+            names = [TIME_COLUMN] + [COLUMN_SEPARATOR.join(key) for key in columns]
+            for batch in self._iter_batches(names):
+                yield self._to_frame(batch.to_pandas(), columns)
+        else:
+            names = [TIME_COLUMN, *self.level_names, VALUE_COLUMN]
+            selected_keys = None
+            if set(columns) != set(self.columns):
+                selected_keys = self._pa.array([COLUMN_SEPARATOR.join(key) for key in columns])
+            for batch in self._iter_batches(names):
+                if selected_keys is not None:
+                    batch = batch.filter(self._get_long_mask(batch, selected_keys))
+                yield self._long_to_frame(batch.to_pandas(), columns)
+
+    def _iter_batches(self, names: list[str]) -> Iterator[Any]:
+        """Method to iterate over the record batches in the file, only reading the given columns.
+
+        :param list[str] names: Names of the columns to read.
+        :return: Iterator over pyarrow.RecordBatch.
+        """
+        if self._is_parquet:
+            for row_group in range(self._file.num_row_groups):
+                yield from self._file.read_row_group(row_group, columns=names).to_batches()
+        else:
+            for index in range(self._file.num_record_batches):
+                yield self._file.get_batch(index).select(names)
+
+    def _get_long_mask(self, batch: Any, selected_keys: Any) -> Any:
+        """Method to get the rows of a record batch in the long layout of the selected outputs.
+
+        The rows are selected before the record batch is converted to a DataFrame, so only the
+        values of the selected outputs are loaded.
+
+        :param pyarrow.RecordBatch batch: Record batch with a row per time step and output.
+        :param pyarrow.Array selected_keys: Keys of the selected outputs, with the levels joined
+            by the column separator.
+        :return: pyarrow.BooleanArray which is True for the rows of the selected outputs.
+        """
+        keys = self._pa.compute.binary_join_element_wise(
+            *[batch.column(name) for name in self.level_names], COLUMN_SEPARATOR
+        )
+        return self._pa.compute.is_in(keys, value_set=selected_keys)
+
+    def _to_frame(self, frame: pd.DataFrame, columns: list[tuple[str, ...]]) -> pd.DataFrame:
+        """Method to convert a wide DataFrame read from the file to the result format.
+
+        :param DataFrame frame: DataFrame with the time column and a column per output.
+        :param list columns: Keys of the outputs in the DataFrame.
+        :return: DataFrame with the time as index and a column per output with a MultiIndex.
+        """
+        result = frame.set_index(TIME_COLUMN)
+        result.columns = pd.MultiIndex.from_tuples(columns, names=self.level_names)
+        return result
+
+    def _long_to_frame(self, frame: pd.DataFrame, columns: list[tuple[str, ...]]) -> pd.DataFrame:
+        """Method to convert a long DataFrame read from the file to the result format.
+
+        :param DataFrame frame: DataFrame with the time, a column per level and the value.
+        :param list columns: Keys of the outputs to select.
+        :return: DataFrame with the time as index and a column per output with a MultiIndex.
+        """
+        result = frame.pivot(index=TIME_COLUMN, columns=list(self.level_names), values=VALUE_COLUMN)
+        return result.reindex(columns=pd.MultiIndex.from_tuples(columns, names=self.level_names))
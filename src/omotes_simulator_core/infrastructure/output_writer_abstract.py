@@ -0,0 +1,118 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the abstract class for writers consuming the output in chunks of time steps."""
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.asset_abstract import AssetAbstract
+
+
+class OutputWriterAbstract(ABC):
+    """Abstract class for writers consuming the output of the assets in chunks of time steps.
+
+    The outputs of the assets are buffered in their output stores. Every chunk_size time steps
+    they are passed to the writer, after which the output stores are cleared. The memory used for
+    the results is therefore independent of the simulation duration.
+    """
+
+    chunk_size: int
+    """Number of time steps written per chunk."""
+    number_of_time_steps_written: int
+    """Number of time steps written by the writer."""
+
+    def __init__(self, chunk_size: int = 168) -> None:
+        """Constructor of the output writer.
+
+        :param int chunk_size: Number of time steps written per chunk.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size of the output writer should be at least 1.")
+        self.chunk_size = chunk_size
+        self.number_of_time_steps_written = 0
+        self._times: list[datetime] = []
+
+    def allocate(self, number_of_time_steps: int) -> int:
+        """Method to prepare the writer for the output time steps of a simulation.
+
+        :param int number_of_time_steps: Number of output time steps of the simulation.
+        :return: Number of output time steps the output stores of the assets need to hold, which
+            is at most a chunk.
+        """
+        return min(number_of_time_steps, self.chunk_size)
+
+    def store_time_step(self, time: datetime, assets: Sequence[AssetAbstract]) -> None:
+        """Method to register that the output of the assets for a time step is written.
+
+        When chunk_size time steps are buffered, they are written.
+
+        :param datetime time: Time of the time step.
+        :param Sequence[AssetAbstract] assets: Assets of which the output is written.
+        """
+        self._times.append(time)
+        if len(self._times) >= self.chunk_size:
+            self.flush(assets)
+
+    def flush(self, assets: Sequence[AssetAbstract]) -> None:
+        """Method to write the buffered time steps and clear the output stores.
+
+        :param Sequence[AssetAbstract] assets: Assets of which the output is written.
+        """
+        if not self._times:
+            return
+        columns: dict[tuple[str, ...], np.ndarray] = {}
+        for asset in assets:
+            if asset.outputs.number_of_time_steps != len(self._times):
+                raise ValueError(
+                    f"Output of {asset.name} has {asset.outputs.number_of_time_steps} time steps,"
+                    f" while {len(self._times)} time steps are buffered."
+                )
+            for (port_id, property_name), values in asset.get_output_columns().items():
+                columns[(asset.asset_id, port_id, property_name)] = values
+        self._write_chunk(self._times, columns)
+        self.number_of_time_steps_written += len(self._times)
+        self._times = []
+        for asset in assets:
+            asset.allocate_output(self.chunk_size)
+
+    def close(self, assets: Sequence[AssetAbstract] | None = None) -> None:
+        """Method to write the remaining time steps and close the writer.
+
+        :param Sequence[AssetAbstract] assets: Assets of which the remaining output is written, when
+            None the buffered time steps are discarded.
+        """
+        if assets is not None:
+            self.flush(assets)
+        self._close()
+
+    @abstractmethod
+    def _write_chunk(
+        self, times: list[datetime], columns: dict[tuple[str, ...], np.ndarray]
+    ) -> None:
+        """Placeholder to write a chunk of time steps.
+
+        The arrays are views on the output stores, which are cleared after the chunk is written.
+
+        :param list[datetime] times: Times of the time steps in the chunk.
+        :param dict columns: Dict with the asset id, port id and property name as key and the
+            values of the time steps as value.
+        """
+
+    @abstractmethod
+    def _close(self) -> None:
+        """Placeholder to release the resources of the writer after the last chunk."""
@@ -74,26 +74,17 @@ class Plotting:
                 for point in asset.geometry.point:
                     coor_pipe.append([point.lon, point.lat])
 
-                last_data_index = len(result) - 1
+                port_ids = asset_object.get_port_ids()
+                last_result = result[asset.id].iloc[-1]
                 data = {
                     "asset_id": asset.id,
                     "asset_name": asset.name,
                     "geometry": LineString(coor_pipe),
-                    "mass_flow": result[(asset_object.get_port_ids()[0], PROPERTY_MASSFLOW)][
-                        last_data_index
-                    ],
-                    "pressure_in": result[(asset_object.get_port_ids()[0], PROPERTY_PRESSURE)][
-                        last_data_index
-                    ],
-                    "pressure_out": result[(asset_object.get_port_ids()[1], PROPERTY_PRESSURE)][
-                        last_data_index
-                    ],
-                    "temperature_in": result[
-                        (asset_object.get_port_ids()[0], PROPERTY_TEMPERATURE)
-                    ][last_data_index],
-                    "temperature_out": result[
-                        (asset_object.get_port_ids()[1], PROPERTY_TEMPERATURE)
-                    ][last_data_index],
+                    "mass_flow": last_result[(port_ids[0], PROPERTY_MASSFLOW)],
+                    "pressure_in": last_result[(port_ids[0], PROPERTY_PRESSURE)],
+                    "pressure_out": last_result[(port_ids[1], PROPERTY_PRESSURE)],
+                    "temperature_in": last_result[(port_ids[0], PROPERTY_TEMPERATURE)],
+                    "temperature_out": last_result[(port_ids[1], PROPERTY_TEMPERATURE)],
                 }
 
                 geo_df.loc[len(geo_df)] = data
@@ -1,5 +1,3 @@
-"""Module for profiling of the simulator core."""
-
 #  Copyright (c) 2023. Deltares & TNO
 #
 #  This program is free software: you can redistribute it and/or modify
@@ -15,14 +13,340 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+"""Module for profiling of the simulator core.
+
+The cpu mode profiles the run with cProfile. The memory mode traces the allocations with
+tracemalloc and takes a snapshot at the end of every phase of the simulation, the snapshots are
+summarised in a report with the allocated memory per module of the package.
+"""
 import argparse
 import cProfile
+import os
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
 
+from omotes_simulator_core.entities.esdl_object import EsdlObject
 from omotes_simulator_core.infrastructure.app import run  # noqa: F401
+from omotes_simulator_core.infrastructure.app import get_default_config, progressLogger
+from omotes_simulator_core.infrastructure.simulation_manager import SimulationManager
+from omotes_simulator_core.infrastructure.tracing import (
+    Span,
+    SpanExporterAbstract,
+    set_span_exporter,
+)
+from omotes_simulator_core.infrastructure.utils import pyesdl_from_file
+
+CPU_MODE = "cpu"
+"""Mode profiling the cpu time of the functions with cProfile."""
+MEMORY_MODE = "memory"
+"""Mode profiling the allocated memory per module with tracemalloc."""
+
+PACKAGE_NAME = "omotes_simulator_core"
+"""Name of the package, allocations are accounted to the module of the package doing them."""
+PHASE_SPANS = ("esdl_mapping", "controller_construction", "gather_output")
+"""Names of the spans after which a snapshot is taken."""
+TIME_STEP_SPAN = "time_step"
+"""Name of the span of a time step, a snapshot is taken every snapshot interval time steps."""
+UNKNOWN_MODULE = "<unknown>"
+"""Module of allocations done outside the package or in code that is not in a module."""
+
+
+def get_peak_rss() -> int | None:
+    """Function to get the peak resident set size of the current process.
+
+    :return: Peak resident set size [bytes], None on platforms without the resource module.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports the peak resident set size in kilobytes, macOS in bytes.
+    return int(peak_rss if sys.platform == "darwin" else peak_rss * 1024)
+
+
+def get_rss() -> int | None:
+    """Function to get the resident set size of the current process.
+
+    :return: Resident set size [bytes], None on platforms without /proc.
+    """
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_module_name(filename: str) -> str:
+    """Function to get the name of the module of a source file.
+
+    :param str filename: Path of the source file.
+    :return: Dotted name of the module relative to the python path, e.g. "pandas.core.frame".
+    """
+    for entry in sorted(sys.path, key=len, reverse=True):
+        prefix = os.path.join(os.path.abspath(entry) if entry else os.getcwd(), "")
+        if filename.startswith(prefix):
+            parts = Path(filename[len(prefix) :]).with_suffix("").parts
+            if parts and parts[-1] == "__init__":
+                parts = parts[:-1]
+            return ".".join(parts) if parts else UNKNOWN_MODULE
+    return UNKNOWN_MODULE
+
+
+@dataclass
+class MemorySnapshot:
+    """Memory use of the process at the end of a phase of the simulation."""
+
+    phase: str
+    """Name of the phase after which the snapshot is taken."""
+    traced_memory: int
+    """Memory [bytes] allocated by Python at the time of the snapshot."""
+    traced_peak: int
+    """Peak of the memory [bytes] allocated by Python since the previous snapshot."""
+    rss: int | None
+    """Resident set size [bytes] of the process, None when it is not available."""
+    peak_rss: int | None
+    """Peak resident set size [bytes] of the process, None when it is not available."""
+    allocations: dict[tuple[str, str], tuple[int, int]] = field(default_factory=dict)
+    """Size [bytes] and number of the allocations per module of the package and the top level
+    package in which they are done."""
+
+    def get_module_sizes(self) -> dict[str, int]:
+        """Method to get the allocated memory per module of the package.
+
+        :return: Dict with the module as key and the allocated memory [bytes] as value.
+        """
+        sizes: dict[str, int] = {}
+        for (module, _), (size, _) in self.allocations.items():
+            sizes[module] = sizes.get(module, 0) + size
+        return sizes
+
+
+class MemoryProfiler(SpanExporterAbstract):
+    """Span exporter taking a tracemalloc snapshot when a phase of the simulation ends.
+
+    An allocation is accounted to the innermost module of the package in its traceback, so the
+    arrays numpy allocates for the output are accounted to the output store, and to the top level
+    package doing the allocation, e.g. numpy, pandas or pyecore.
+    """
+
+    snapshot_interval: int
+    """Number of time steps between the snapshots taken during the time loop."""
+    number_of_frames: int
+    """Number of frames stored in the traceback of an allocation."""
+    snapshots: list[MemorySnapshot]
+    """Snapshots taken in the order of the phases."""
+
+    def __init__(self, snapshot_interval: int = 24, number_of_frames: int = 10) -> None:
+        """Constructor of the memory profiler.
+
+        :param int snapshot_interval: Number of time steps between the snapshots.
+        :param int number_of_frames: Number of frames stored in the traceback of an allocation,
+            more frames account more allocations to the package but make the run slower.
+        """
+        if snapshot_interval < 1:
+            raise ValueError("Snapshot interval should be at least 1 time step.")
+        self.snapshot_interval = snapshot_interval
+        self.number_of_frames = number_of_frames
+        self.snapshots = []
+        self._number_of_time_steps = 0
+        self._module_names: dict[str, str] = {}
+        self._allocation_keys: dict[tracemalloc.Traceback, tuple[str, str] | None] = {}
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Method to start tracing the allocations and take the first snapshot.
+
+        When the allocations are already traced, tracing is not restarted and the number of
+        frames already used is kept.
+        """
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(self.number_of_frames)
+        self.take_snapshot("start")
+
+    def stop(self) -> None:
+        """Method to stop tracing the allocations when they were not traced before the start."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+
+    def take_snapshot(self, phase: str) -> MemorySnapshot:
+        """Method to take a snapshot of the memory use at the end of a phase.
+
+        :param str phase: Name of the phase.
+        :return: The snapshot, which is also added to the snapshots of the profiler.
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory profiler is not started.")
+        traced_memory, traced_peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        memory_snapshot = MemorySnapshot(
+            phase=phase,
+            traced_memory=traced_memory,
+            traced_peak=traced_peak,
+            rss=get_rss(),
+            peak_rss=get_peak_rss(),
+            allocations=self._group_allocations(snapshot),
+        )
+        self.snapshots.append(memory_snapshot)
+        tracemalloc.reset_peak()
+        return memory_snapshot
+
+    def export(self, span: Span) -> None:
+        """Method to take a snapshot when a phase ends.
+
+        :param Span span: The span that ended.
+        """
+        if not tracemalloc.is_tracing():
+            return
+        if span.name in PHASE_SPANS:
+            self.take_snapshot(span.name)
+        elif span.name == TIME_STEP_SPAN:
+            self._number_of_time_steps += 1
+            if self._number_of_time_steps % self.snapshot_interval == 0:
+                self.take_snapshot(f"{TIME_STEP_SPAN} {self._number_of_time_steps}")
+
+    def shutdown(self) -> None:
+        """Method to stop tracing the allocations."""
+        self.stop()
+
+    def get_report(self, top: int = 20) -> str:
+        """Method to get a report of the memory use at every snapshot.
+
+        The report starts with the trajectory of the traced memory and resident set size, followed
+        by the modules with the most allocated memory per snapshot.
+
+        :param int top: Number of modules listed per snapshot.
+        :return: String with the report.
+        """
+        lines = [
+            f"{'phase':<30} {'traced [MB]':>12} {'traced peak [MB]':>17} {'rss [MB]':>10} "
+            f"{'peak rss [MB]':>14}"
+        ]
+        for snapshot in self.snapshots:
+            lines.append(
+                f"{snapshot.phase:<30} {_to_mb(snapshot.traced_memory):>12} "
+                f"{_to_mb(snapshot.traced_peak):>17} {_to_mb(snapshot.rss):>10} "
+                f"{_to_mb(snapshot.peak_rss):>14}"
+            )
+        previous_sizes: dict[str, int] = {}
+        for snapshot in self.snapshots:
+            lines += ["", f"Allocated memory per module after {snapshot.phase}:"]
+            sizes = snapshot.get_module_sizes()
+            packages: dict[str, list[str]] = {}
+            for module, package in sorted(
+                snapshot.allocations, key=lambda key: -snapshot.allocations[key][0]
+            ):
+                packages.setdefault(module, []).append(package)
+            for module, size in sorted(sizes.items(), key=lambda item: -item[1])[:top]:
+                change = size - previous_sizes.get(module, 0)
+                lines.append(
+                    f"{_to_mb(size):>10} MB {change / 2**20:+10.1f} MB  {module} "
+                    f"({', '.join(packages[module][:3])})"
+                )
+            previous_sizes = sizes
+        return "\n".join(lines)
+
+    def _group_allocations(
+        self, snapshot: tracemalloc.Snapshot
+    ) -> dict[tuple[str, str], tuple[int, int]]:
+        """Method to group the allocations of a snapshot per module and top level package.
+
+        :param tracemalloc.Snapshot snapshot: Snapshot of the traced allocations.
+        :return: Dict with the module of the package and the top level package as key and the
+            size [bytes] and number of the allocations as value.
+        """
+        allocations: dict[tuple[str, str], tuple[int, int]] = {}
+        for statistic in snapshot.statistics("traceback"):
+            key = self._get_allocation_key(statistic.traceback)
+            if key is None:
+                continue
+            size, count = allocations.get(key, (0, 0))
+            allocations[key] = (size + statistic.size, count + statistic.count)
+        return allocations
+
+    def _get_allocation_key(self, traceback: tracemalloc.Traceback) -> tuple[str, str] | None:
+        """Method to get the module of the package and the top level package of an allocation.
+
+        The key is cached per traceback, since most allocations are in every snapshot.
+
+        :param tracemalloc.Traceback traceback: Traceback of the allocation.
+        :return: Tuple with the module and the top level package, None for allocations of the
+            profiler itself.
+        """
+        if traceback not in self._allocation_keys:
+            key: tuple[str, str] | None = None
+            if traceback[-1].filename not in (tracemalloc.__file__, __file__):
+                package = self._get_module_name(traceback[-1].filename).split(".")[0]
+                module = UNKNOWN_MODULE
+                for frame in reversed(traceback):
+                    name = self._get_module_name(frame.filename)
+                    if name.split(".")[0] == PACKAGE_NAME:
+                        module = name
+                        break
+                key = (module, package)
+            self._allocation_keys[traceback] = key
+        return self._allocation_keys[traceback]
+
+    def _get_module_name(self, filename: str) -> str:
+        """Method to get the name of the module of a source file, cached per file.
+
+        :param str filename: Path of the source file.
+        :return: Dotted name of the module.
+        """
+        if filename not in self._module_names:
+            self._module_names[filename] = get_module_name(filename)
+        return self._module_names[filename]
+
+
+def _to_mb(size: int | None) -> str:
+    """Function to format a size in megabytes.
+
+    :param int size: Size [bytes], None when it is not available.
+    :return: Size [MB] with one decimal, "-" when it is not available.
+    """
+    return "-" if size is None else f"{size / 2**20:.1f}"
+
+
+def profile_memory(
+    esdl_file: str, snapshot_interval: int = 24, number_of_frames: int = 10
+) -> MemoryProfiler:
+    """Function to run the simulation of an esdl file while profiling the memory use.
+
+    Next to the snapshots taken at the end of the phases, a snapshot is taken after the esdl is
+    loaded.
+
+    :param str esdl_file: Path of the esdl file.
+    :param int snapshot_interval: Number of time steps between the snapshots.
+    :param int number_of_frames: Number of frames stored in the traceback of an allocation.
+    :return: The memory profiler holding the snapshots.
+    """
+    profiler = MemoryProfiler(snapshot_interval, number_of_frames)
+    profiler.start()
+    set_span_exporter(profiler)
+    try:
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file))
+        profiler.take_snapshot("esdl_load")
+        SimulationManager(esdl_object, get_default_config()).execute(progressLogger)
+    finally:
+        set_span_exporter(None)
+    return profiler
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="sample argument parser")
     parser.add_argument("esdl_file")
     parser.add_argument("profiling_output_file")
+    parser.add_argument("--mode", choices=[CPU_MODE, MEMORY_MODE], default=CPU_MODE)
+    parser.add_argument("--snapshot-interval", type=int, default=24)
+    parser.add_argument("--frames", type=int, default=10)
+    parser.add_argument("--top", type=int, default=20)
     args = parser.parse_args()
-    cProfile.run("run(args.esdl_file)", args.profiling_output_file)
+    if args.mode == MEMORY_MODE:
+        memory_profiler = profile_memory(args.esdl_file, args.snapshot_interval, args.frames)
+        Path(args.profiling_output_file).write_text(memory_profiler.get_report(args.top))
+    else:
+        cProfile.run("run(args.esdl_file)", args.profiling_output_file)
@@ -15,15 +15,27 @@
 
 """Simulation manager creates and controls the simulation objects."""
 import logging
+from pathlib import Path
 from typing import Callable
 
 import pandas as pd
 
 from omotes_simulator_core.adapter.transforms.controller_mapper import EsdlControllerMapper
+from omotes_simulator_core.adapter.transforms.esdl_asset_mappers.pipe_mapper import (
+    create_pipe_catalog,
+)
 from omotes_simulator_core.adapter.transforms.mappers import EsdlEnergySystemMapper
 from omotes_simulator_core.entities.esdl_object import EsdlObject
 from omotes_simulator_core.entities.heat_network import HeatNetwork
+from omotes_simulator_core.entities.network_controller import NetworkController
 from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+from omotes_simulator_core.entities.utility.influxdb_reader import get_profile_references
+from omotes_simulator_core.infrastructure.memmap_output import MemmapOutputWriter
+from omotes_simulator_core.infrastructure.network_build_cache import NetworkBuildCache
+from omotes_simulator_core.infrastructure.output_aggregator import OutputAggregator
+from omotes_simulator_core.infrastructure.output_writer import StreamingOutputWriter
+from omotes_simulator_core.infrastructure.output_writer_abstract import OutputWriterAbstract
+from omotes_simulator_core.infrastructure.tracing import start_span
 from omotes_simulator_core.simulation.networksimulation import NetworkSimulation
 
 logger = logging.getLogger(__name__)
@@ -32,35 +44,120 @@ logger = logging.getLogger(__name__)
 class SimulationManager:
     """Manager class for managing the simulation."""
 
-    def __init__(self, esdl: EsdlObject, config: SimulationConfiguration):
+    def __init__(
+        self,
+        esdl: EsdlObject,
+        config: SimulationConfiguration,
+        build_cache: NetworkBuildCache | None = None,
+    ):
         """Constructor for SimulationManager class.
 
         :param EsdlObject esdl: Esdlobject, which stores the network information
         :param SimulationConfiguration config: Config object to hold the simulation start, stop, end
+        :param NetworkBuildCache build_cache: Optional cache to load the network and controller
+            from, when not given the network and controller are always built from the esdl.
         """
         self.esdl = esdl
         self.config = config
+        self.build_cache = build_cache
 
     def execute(self, progress_calback: Callable[[float, str], None]) -> pd.DataFrame:
         """Method to simulate the network.
 
         First the network is converted to an internal object model and then the simulation is run.
+        When the output is written to files, the returned DataFrame has no time steps and the
+        results are read from the output directory. When the output is aggregated, the summary of
+        the statistics per output is returned.
 
         :return: DataFrame with the result of the simulations
         """
-        try:
-            # convert ESDL to Heat Network, NetworkController
-            network = HeatNetwork(EsdlEnergySystemMapper(self.esdl).to_entity)
+        with start_span(
+            "simulation",
+            simulation_id=str(self.config.simulation_id),
+            simulation_name=self.config.name,
+            timestep=self.config.timestep,
+            start=self.config.start.isoformat(),
+            stop=self.config.stop.isoformat(),
+        ):
+            try:
+                # convert ESDL to Heat Network, NetworkController
+                network, controller = self._get_network_and_controller()
+
+                worker = NetworkSimulation(network, controller)
+                worker.run(self.config, progress_calback)
+            except Exception as error:
+                logger.error(
+                    f"Error occured: {error}"
+                )  # Asset ID is not set,  error is reported for the entire ESDL/run
+                raise error
+
+            # Run output presenter that iterates over het network (/controller?) and
+            # gathers the output into a single data object
+            with start_span("gather_output"):
+                if isinstance(network.output_writer, OutputAggregator):
+                    return network.output_writer.get_summary()
+                return worker.gather_output()
+
+    def _get_network_and_controller(self) -> tuple[HeatNetwork, NetworkController]:
+        """Method to get the network and controller, from the build cache when possible.
+
+        :return: Tuple with the heat network and network controller.
+        """
+        if self.build_cache is None:
+            return self._build_network_and_controller()
+        esh = self.esdl.energy_system_handler
+        key = self.build_cache.get_key(esh.to_string(), self.config, get_profile_references(esh))
+        cached_build = self.build_cache.load(key)
+        if cached_build is not None:
+            network, controller = cached_build
+            # The output writer is not stored in the build cache
+            network.output_writer = self._create_output_writer()
+            return network, controller
+        network, controller = self._build_network_and_controller()
+        self.build_cache.store(key, network, controller)
+        return network, controller
+
+    def _build_network_and_controller(self) -> tuple[HeatNetwork, NetworkController]:
+        """Method to convert the esdl to a heat network and network controller.
+
+        :return: Tuple with the heat network and network controller.
+        """
+        with start_span("esdl_mapping") as span:
+            pipe_catalog = create_pipe_catalog(self.config.pipe_catalog_file)
+            network = HeatNetwork(
+                EsdlEnergySystemMapper(self.esdl, pipe_catalog).to_entity,
+                output_writer=self._create_output_writer(),
+            )
+            span.set_attribute("number_of_assets", len(network.assets))
+            span.set_attribute("number_of_junctions", len(network.junctions))
+        with start_span("controller_construction"):
             controller = EsdlControllerMapper().to_entity(self.esdl, timestep=self.config.timestep)
+        return network, controller
+
+    def _create_output_writer(self) -> OutputWriterAbstract | None:
+        """Method to create the writer of the output mode of the configuration.
 
-            worker = NetworkSimulation(network, controller)
-            worker.run(self.config, progress_calback)
-        except Exception as error:
-            logger.error(
-                f"Error occured: {error}"
-            )  # Asset ID is not set,  error is reported for the entire ESDL/run
-            raise error
-
-        # Run output presenter that iterates over het network (/controller?) and
-        # gathers the output into a single data object
-        return worker.gather_output()
+        The output is streamed to a file, or written to a directory of memory mapped files, named
+        after the simulation id in the output directory. The statistics of aggregated output are
+        computed per output time step.
+
+        :return: Writer consuming the output during the simulation, or None when the output is
+            kept in memory.
+        """
+        config = self.config
+        if config.output_mode == "aggregate":
+            return OutputAggregator(
+                config.timestep * config.output_specification.time_step_interval,
+                period=config.output_aggregation_period,
+            )
+        if config.output_mode == "memory" or config.output_directory is None:
+            return None
+        if config.output_mode == "memmap":
+            return MemmapOutputWriter(
+                Path(config.output_directory) / str(config.simulation_id), dtype=config.output_dtype
+            )
+        return StreamingOutputWriter(
+            Path(config.output_directory) / f"{config.simulation_id}.{config.output_format}",
+            file_format=config.output_format,
+            layout=config.output_layout,
+        )
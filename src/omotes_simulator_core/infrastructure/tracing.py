@@ -0,0 +1,265 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the tracing of the phases of a simulation as nested spans.
+
+Spans are started with the start_span context manager and passed to the span exporter when they
+end. The default exporter is a no-op, for which start_span returns a shared span without
+recording anything, so tracing costs a single attribute check when it is disabled. Attributes
+that are passed to start_span are built before the check, in a loop they are only built when
+is_tracing_enabled returns True.
+"""
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+STATUS_OK = "ok"
+"""Status of a span that ended without an exception."""
+STATUS_ERROR = "error"
+"""Status of a span that ended with an exception."""
+
+
+@dataclass
+class Span:
+    """Timed phase of a simulation with attributes describing it."""
+
+    name: str
+    """Name of the phase."""
+    trace_id: str
+    """Id shared by all spans started within the same root span."""
+    span_id: str
+    """Unique id of the span."""
+    parent_id: str | None
+    """Id of the span in which this span is started, None for a root span."""
+    start_time: int = 0
+    """Start of the span since the epoch [ns]."""
+    end_time: int = 0
+    """End of the span since the epoch [ns]."""
+    attributes: dict[str, Any] = field(default_factory=dict)
+    """Attributes describing the phase, e.g. the time step or the number of iterations."""
+    status: str = STATUS_OK
+    """Status of the span, ok or error."""
+
+    @property
+    def duration(self) -> float:
+        """Duration of the span [s]."""
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Method to set an attribute of the span.
+
+        :param str key: Name of the attribute.
+        :param Any value: Value of the attribute, it should be serializable to json.
+        """
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        """Method to convert the span to a dict that can be serialized to json.
+
+        :return: Dict with the fields of the span and its duration [s].
+        """
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "duration": self.duration,
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class SpanExporterAbstract(ABC):
+    """Abstract class for exporters receiving the spans when they end."""
+
+    enabled: bool = True
+    """Whether spans are recorded for the exporter."""
+
+    @abstractmethod
+    def export(self, span: Span) -> None:
+        """Placeholder to export a span that ended.
+
+        :param Span span: The span that ended.
+        """
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Placeholder to release the resources of the exporter."""
+
+
+class NoOpSpanExporter(SpanExporterAbstract):
+    """Exporter that disables tracing, no spans are recorded."""
+
+    enabled = False
+
+    def export(self, span: Span) -> None:
+        """Method to ignore the span.
+
+        :param Span span: The span that ended.
+        """
+
+    def shutdown(self) -> None:
+        """Method to shut down the exporter, there is nothing to release."""
+
+
+class JsonLinesSpanExporter(SpanExporterAbstract):
+    """Exporter appending each span as a line of json to a file."""
+
+    path: Path
+    """Path of the file the spans are appended to."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Constructor of the json lines span exporter.
+
+        :param str | Path path: Path of the file the spans are appended to.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a")
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        """Method to append the span to the file.
+
+        :param Span span: The span that ended.
+        """
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def shutdown(self) -> None:
+        """Method to close the file."""
+        with self._lock:
+            self._file.close()
+
+
+class _NoOpSpan:
+    """Span returned when tracing is disabled, all methods do nothing."""
+
+    def __enter__(self) -> "_NoOpSpan":
+        """Method to enter the span."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Method to exit the span."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Method to ignore the attribute.
+
+        :param str key: Name of the attribute.
+        :param Any value: Value of the attribute.
+        """
+
+
+class _RecordingSpan:
+    """Context manager timing a span and passing it to the exporter when it ends."""
+
+    def __init__(self, exporter: SpanExporterAbstract, name: str, attributes: dict) -> None:
+        """Constructor of the recording span.
+
+        :param SpanExporterAbstract exporter: Exporter receiving the span when it ends.
+        :param str name: Name of the phase.
+        :param dict attributes: Attributes describing the phase.
+        """
+        self._exporter = exporter
+        parent = _current_span.get()
+        span_id = os.urandom(8).hex()
+        self.span = Span(
+            name=name,
+            trace_id=span_id if parent is None else parent.trace_id,
+            span_id=span_id,
+            parent_id=None if parent is None else parent.span_id,
+            attributes=attributes,
+        )
+        self._token: Any = None
+
+    def __enter__(self) -> Span:
+        """Method to start the span and make it the parent of spans started within it."""
+        self._token = _current_span.set(self.span)
+        self.span.start_time = time.time_ns()
+        return self.span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Method to end the span and export it."""
+        self.span.end_time = time.time_ns()
+        _current_span.reset(self._token)
+        if exc_value is not None:
+            self.span.status = STATUS_ERROR
+            self.span.set_attribute("error", repr(exc_value))
+        self._exporter.export(self.span)
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+_NO_OP_SPAN = _NoOpSpan()
+_span_exporter: SpanExporterAbstract = NoOpSpanExporter()
+
+
+def set_span_exporter(exporter: SpanExporterAbstract | None) -> None:
+    """Set the exporter receiving the spans, the previous exporter is shut down.
+
+    :param SpanExporterAbstract exporter: Exporter receiving the spans, None disables tracing.
+    """
+    global _span_exporter
+    _span_exporter.shutdown()
+    _span_exporter = NoOpSpanExporter() if exporter is None else exporter
+
+
+def get_span_exporter() -> SpanExporterAbstract:
+    """Get the exporter receiving the spans.
+
+    :return: The current span exporter.
+    """
+    return _span_exporter
+
+
+def is_tracing_enabled() -> bool:
+    """Check if spans are recorded, so attributes that are costly to build can be skipped.
+
+    :return: True when the span exporter records spans, False otherwise.
+    """
+    return _span_exporter.enabled
+
+
+def start_span(name: str, /, **attributes: Any) -> _RecordingSpan | _NoOpSpan:
+    """Start a span for a phase, to be used as a context manager.
+
+    :param str name: Name of the phase.
+    :param attributes: Attributes describing the phase, more can be set on the span returned
+        when entering the context.
+    :return: Context manager returning the span when entered.
+    """
+    if not _span_exporter.enabled:
+        return _NO_OP_SPAN
+    return _RecordingSpan(_span_exporter, name, attributes)
@@ -15,14 +15,22 @@
 
 """Simulates an heat network for the specified duration."""
 import logging
-from datetime import timedelta, timezone
+import os
+import tempfile
+import time as timer
+from datetime import datetime, timedelta, timezone
 from typing import Callable
 
 from pandas import DataFrame
 
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 from omotes_simulator_core.entities.heat_network import HeatNetwork
 from omotes_simulator_core.entities.network_controller import NetworkController
 from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+from omotes_simulator_core.infrastructure.tracing import is_tracing_enabled, start_span
+from omotes_simulator_core.simulation.timing_report import TimingReport
+from omotes_simulator_core.solver.failure_bundle import write_failure_bundle
+from omotes_simulator_core.solver.solver_diagnostics import SolverDiagnostics
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +44,13 @@ class NetworkSimulation:
         """Instantiate the NetworkSimulation object."""
         self.network = network
         self.controller = controller
+        self.config: SimulationConfiguration | None = None
+        self.timing_report = TimingReport(0)
+
+    @property
+    def solver_diagnostics(self) -> SolverDiagnostics | None:
+        """Diagnostics of the iterations of the solver, None when they are not recorded."""
+        return self.network.solver.diagnostics
 
     def run(
         self,
@@ -45,16 +60,44 @@ class NetworkSimulation:
     ) -> None:
         """Run the simulation.
 
+        The time spent per phase and the number of iterations of every time step are recorded in
+        the timing report, a summary of the time steps since the previous progress message is
+        logged at debug level. When enabled in the configuration, the diagnostics of
+        every iteration of the solver are recorded as well.
+
         :param SimulationConfiguration config: Configuration parameters for simulation.
         :param Callable[[float, str], None] progress_calback: Callback function to report progress.
         :param int max_number_messages: Maximum number of messages to report progress.
         """
+        self.config = config
+
         # time loop
         number_of_time_steps = int((config.stop - config.start).total_seconds() / config.timestep)
         logger.info("Number of time steps: " + str(number_of_time_steps))
+        self.timing_report = TimingReport(number_of_time_steps)
+        solver = self.network.solver
+        solver_phase_keys = {phase: f"solver_{phase}" for phase in solver.get_statistics()}
+        self.network.set_output_specification(config.output_specification)
+        self.network.allocate_output(number_of_time_steps, dtype=config.output_dtype)
+        if config.solver_diagnostics:
+            solver.enable_diagnostics(estimate_condition=config.solver_condition_estimate)
+        start = config.start.replace(tzinfo=timezone.utc)
+        # Setpoints of all time steps when the precomputed setpoints are passed as setpoint array
+        setpoint_array: SetpointArray | None = None
+        if config.precompute_setpoints:
+            horizon = self.controller.precompute_setpoints(
+                start, config.timestep, number_of_time_steps
+            )
+            if horizon is None:
+                logger.info("Setpoints are not precomputed, since the network has storages.")
+            else:
+                setpoint_array = horizon.get_setpoint_array(self.network.get_asset_ids())
+        else:
+            self.controller.set_time_grid(start, config.timestep, number_of_time_steps)
 
         # Set interval for progress messages
         progress_interval = max(round(number_of_time_steps / max_number_messages), 1)
+        last_reported_time_step = 0
 
         # Loop over time steps
         for time_step in range(number_of_time_steps):
@@ -63,44 +106,128 @@ class NetworkSimulation:
                 tzinfo=timezone.utc
             )
 
+            solver.reset_statistics()
+            if solver.diagnostics is not None:
+                solver.diagnostics.start_time_step(time)
+            durations = {}
+            start_time = timer.perf_counter()
+
             # Link controller to network
             self.controller.update_network_state(heat_network=self.network)
+            phase_end_time = timer.perf_counter()
+            durations["update_network_state"] = phase_end_time - start_time
+            start_time = phase_end_time
 
             # Update controller to current time
-            controller_input = self.controller.update_setpoints(time)
-            logger.debug("Simulating for timestep " + str(time))
+            controller_input: dict | SetpointArray
+            if setpoint_array is None:
+                controller_input = self.controller.update_setpoints(time)
+            else:
+                controller_input = self.controller.update_setpoint_array(time, setpoint_array)
+            phase_end_time = timer.perf_counter()
+            durations["update_setpoints"] = phase_end_time - start_time
+            start_time = phase_end_time
+            logger.debug("Simulating for timestep %s", time)
 
             # Iteration loop to ensure convergence
             max_iterations = 20
             iteration = 0
             is_converged = False
 
-            while not is_converged and iteration < max_iterations:
-                # Run time step
-                self.network.run_time_step(
-                    time=time, time_step=config.timestep, controller_input=controller_input
-                )
-
-                # Check convergence
-                is_converged = self.network.check_convergence()
-                iteration += 1
+            attributes = (
+                {"time": time.isoformat(), "number_of_assets": len(self.network.assets)}
+                if is_tracing_enabled()
+                else {}
+            )
+            with start_span("time_step", **attributes) as span:
+                while not is_converged and iteration < max_iterations:
+                    # Run time step
+                    try:
+                        self.network.run_time_step(
+                            time=time, time_step=config.timestep, controller_input=controller_input
+                        )
+                    except Exception as error:
+                        self._write_failure_bundle(time, controller_input, error)
+                        raise
+
+                    # Check convergence
+                    is_converged = self.network.check_convergence()
+                    iteration += 1
+                span.set_attribute("iterations", iteration)
+                span.set_attribute("converged", is_converged)
+            phase_end_time = timer.perf_counter()
+            durations["run_time_step"] = phase_end_time - start_time
+            start_time = phase_end_time
 
             # Log warning if not converged
             logger.debug("Convergence time step reached after %d iterations", iteration)
 
             # Post-process asset properties after time step
             self.network.post_process_assets()
+            phase_end_time = timer.perf_counter()
+            durations["post_process_assets"] = phase_end_time - start_time
+            start_time = phase_end_time
 
             # Store output of time step
-            self.network.store_output()
+            self.network.store_output(time)
+            durations["store_output"] = timer.perf_counter() - start_time
+
+            for phase, duration in solver.get_statistics().items():
+                durations[solver_phase_keys[phase]] = duration
+            self.timing_report.add_time_step(
+                time, durations, iteration, solver.number_of_iterations
+            )
 
             if (time_step % progress_interval) == 0:
                 progress_calback((float(time_step) / float(number_of_time_steps)), "calculating")
+                logger.debug(
+                    "Timing of time steps: %s",
+                    self.timing_report.get_progress_message(last_reported_time_step),
+                )
+                last_reported_time_step = time_step + 1
+
+        # Write the remaining output when the output is streamed to a file
+        self.network.close_output()
+
+    def _write_failure_bundle(
+        self, time: datetime, controller_input: dict | SetpointArray, error: Exception
+    ) -> None:
+        """Method to write the state of the failed solve of a time step to a failure bundle.
+
+        Errors while writing the bundle are logged, so they do not hide the error of the solve.
+
+        :param datetime time: Time of the time step that failed.
+        :param dict | SetpointArray controller_input: Setpoints of the controller for the time
+            step.
+        :param Exception error: Error raised by the solve.
+        """
+        if self.config is None:
+            return
+        if isinstance(controller_input, SetpointArray):
+            controller_input = controller_input.to_dict()
+        directory = self.config.failure_bundle_directory
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), "omotes_failure_bundles")
+        try:
+            path = write_failure_bundle(
+                directory,
+                self.network.solver,
+                time,
+                self.config.timestep,
+                controller_input,
+                error,
+                prefix=f"{self.config.simulation_id}_",
+            )
+        except Exception as bundle_error:
+            logger.warning(f"Failure bundle could not be written: {bundle_error}")
+            return
+        logger.error(f"Solve of time step {time} failed, failure bundle written to: {path}")
 
     def gather_output(self) -> DataFrame:
         """Gathers all output and return a dict with this output.
 
-        :return: DataFrame with all the results for the simulation
+        :return: DataFrame with all the results for the simulation, indexed by the time of the
+            time steps.
         """
-        result = self.network.gather_output()
+        result = self.network.gather_output(self.config)
         return result
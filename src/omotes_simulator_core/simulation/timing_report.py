@@ -0,0 +1,138 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the report of the time spent per phase of the simulated time steps."""
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.solver.solver import SOLVER_PHASES
+
+SIMULATION_PHASES = (
+    "update_network_state",
+    "update_setpoints",
+    "run_time_step",
+    "post_process_assets",
+    "store_output",
+)
+"""Phases of a time step of the simulation of which the time is recorded."""
+TIMING_PHASES = SIMULATION_PHASES + tuple(f"solver_{phase}" for phase in SOLVER_PHASES)
+"""All recorded phases, the solver phases are part of the run_time_step phase."""
+
+
+class TimingReport:
+    """Report of the time spent per phase and the number of iterations of each time step.
+
+    The values are stored in arrays preallocated for the number of time steps, so recording a
+    time step only costs a few assignments.
+    """
+
+    def __init__(self, number_of_time_steps: int) -> None:
+        """Constructor of the timing report.
+
+        :param int number_of_time_steps: Number of time steps of the simulation.
+        """
+        self._times: list[datetime] = []
+        self._durations = np.zeros((number_of_time_steps, len(TIMING_PHASES)))
+        self._controller_iterations = np.zeros(number_of_time_steps, dtype=np.int64)
+        self._solver_iterations = np.zeros(number_of_time_steps, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Method to get the number of time steps recorded."""
+        return len(self._times)
+
+    def add_time_step(
+        self,
+        time: datetime,
+        durations: dict[str, float],
+        controller_iterations: int,
+        solver_iterations: int,
+    ) -> None:
+        """Method to record a time step.
+
+        :param datetime time: Time of the time step.
+        :param dict durations: Dict with the phase as key and the time spent [s] as value,
+            phases that are not given are recorded as zero.
+        :param int controller_iterations: Number of times the network is solved for the
+            setpoints of the controller before the assets converged.
+        :param int solver_iterations: Total number of Picard iterations of the solver.
+        """
+        index = len(self._times)
+        if index == len(self._durations):
+            raise IndexError("All time steps of the timing report are recorded.")
+        self._times.append(time)
+        for column, phase in enumerate(TIMING_PHASES):
+            self._durations[index, column] = durations.get(phase, 0.0)
+        self._controller_iterations[index] = controller_iterations
+        self._solver_iterations[index] = solver_iterations
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Method to get the report with a row per time step.
+
+        :return: DataFrame indexed by the time of the time step, with the time [s] per phase, the
+            total time [s] and the number of controller and solver iterations as columns.
+        """
+        number_of_time_steps = len(self._times)
+        report = pd.DataFrame(
+            self._durations[:number_of_time_steps],
+            index=pd.DatetimeIndex(self._times, name="time"),
+            columns=list(TIMING_PHASES),
+        )
+        report["total"] = report[list(SIMULATION_PHASES)].sum(axis=1)
+        report["controller_iterations"] = self._controller_iterations[:number_of_time_steps]
+        report["solver_iterations"] = self._solver_iterations[:number_of_time_steps]
+        return report
+
+    def get_summary(self) -> pd.DataFrame:
+        """Method to get the total, mean and maximum time spent per phase.
+
+        :return: DataFrame with a row per phase and the total, mean and max time [s] as columns.
+        """
+        report = self.to_dataframe()
+        columns = list(TIMING_PHASES) + ["total"]
+        return pd.DataFrame(
+            {
+                "total": report[columns].sum(),
+                "mean": report[columns].mean(),
+                "max": report[columns].max(),
+            }
+        )
+
+    def get_slowest_time_steps(self, number_of_time_steps: int = 10) -> pd.DataFrame:
+        """Method to get the time steps that took longest.
+
+        :param int number_of_time_steps: Number of time steps to return.
+        :return: DataFrame with the rows of the slowest time steps, slowest first.
+        """
+        return self.to_dataframe().nlargest(number_of_time_steps, "total")
+
+    def get_progress_message(self, start_index: int = 0) -> str:
+        """Method to describe the time steps recorded from the given index onwards.
+
+        :param int start_index: Index of the first time step to describe.
+        :return: Message with the mean and maximum time and the iterations of the time steps.
+        """
+        durations = self._durations[start_index : len(self._times), : len(SIMULATION_PHASES)]
+        if len(durations) == 0:
+            return "no time steps recorded"
+        totals = durations.sum(axis=1)
+        slowest = int(np.argmax(totals))
+        solver_iterations = self._solver_iterations[start_index : len(self._times)]
+        return (
+            f"time step {totals.mean():.3f} s mean, {totals[slowest]:.3f} s max at "
+            f"{self._times[start_index + slowest]}, {solver_iterations.mean():.1f} solver "
+            f"iterations mean"
+        )
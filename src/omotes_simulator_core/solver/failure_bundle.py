@@ -0,0 +1,180 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the bundle of the state of a failed solve, to replay it offline."""
+import json
+import logging
+import pickle
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import scipy as sp
+
+from omotes_simulator_core import __version__
+from omotes_simulator_core.solver.matrix.matrix import load_matrix_dump
+from omotes_simulator_core.solver.network.assets.base_asset import BaseAsset
+from omotes_simulator_core.solver.network.assets.node import Node
+from omotes_simulator_core.solver.network.network import Network
+from omotes_simulator_core.solver.solver import Solver
+
+logger = logging.getLogger(__name__)
+
+METADATA_FILE = "metadata.json"
+"""File with the time step, setpoints and error of the failed solve."""
+MATRIX_FILE = "matrix.npz"
+"""File with the last assembled system of equations of the failed solve."""
+PREVIOUS_SOLUTIONS_FILE = "previous_solutions.npz"
+"""File with the solution of the previous iteration of every asset and node."""
+NETWORK_FILE = "network.pkl"
+"""File with the solver network at the moment of the failure, used to replay the solve."""
+DIAGNOSTICS_FILE = "diagnostics.npy"
+"""File with the diagnostics of the iterations of the solver, when they are recorded."""
+
+
+def write_failure_bundle(
+    directory: str | Path,
+    solver: Solver,
+    time: datetime,
+    timestep: float,
+    setpoints: dict[str, Any],
+    error: BaseException,
+    prefix: str = "failure_",
+) -> Path:
+    """Function to write the state of a failed solve to a new directory.
+
+    The bundle holds the last system of equations, the previous solution of every asset and
+    node, the solver network, the setpoints of the controller and the time step. A new directory
+    is created for every bundle, so concurrent runs never overwrite each other.
+
+    :param str | Path directory: Directory in which the directory of the bundle is created.
+    :param Solver solver: Solver of which the solve failed.
+    :param datetime time: Time of the time step that failed.
+    :param float timestep: Length of the time step [s].
+    :param dict setpoints: Setpoints of the controller per asset id for the time step.
+    :param BaseException error: Error raised by the solve.
+    :param str prefix: Prefix of the name of the directory of the bundle.
+    :return: Path of the directory of the bundle.
+    """
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    path = Path(tempfile.mkdtemp(prefix=prefix, dir=directory))
+    metadata = {
+        "version": __version__,
+        "time": time.isoformat(),
+        "timestep": timestep,
+        "setpoints": setpoints,
+        "error": repr(error),
+        "number_of_unknowns": solver.matrix.num_unknowns,
+    }
+    with open(path / METADATA_FILE, "w") as file:
+        json.dump(metadata, file, indent=2, default=str)
+    matrix = solver.matrix
+    if matrix.system_matrix is not None and matrix.system_rhs is not None:
+        matrix.dump_matrix(matrix.system_matrix, matrix.system_rhs, path / MATRIX_FILE)
+    items: list[BaseAsset | Node] = [
+        *solver.network.assets.values(),
+        *solver.network.nodes.values(),
+    ]
+    np.savez_compressed(
+        path / PREVIOUS_SOLUTIONS_FILE, **{item.name: item.prev_sol for item in items}
+    )
+    if solver.diagnostics is not None:
+        np.save(path / DIAGNOSTICS_FILE, solver.diagnostics.records)
+    try:
+        with open(path / NETWORK_FILE, "wb") as file:
+            pickle.dump(solver.network, file, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as pickle_error:
+        logger.warning(f"Network cannot be stored in the failure bundle: {pickle_error}")
+        (path / NETWORK_FILE).unlink(missing_ok=True)
+    return path
+
+
+class FailureBundle:
+    """State of a failed solve read from a failure bundle directory."""
+
+    path: Path
+    """Directory of the bundle."""
+    metadata: dict[str, Any]
+    """Time step, setpoints and error of the failed solve."""
+    matrix: sp.sparse.csc_matrix | None
+    """Last assembled matrix of the failed solve, None when no system was assembled."""
+    rhs: npt.NDArray | None
+    """Right hand side of the last assembled system."""
+    previous_solutions: dict[str, npt.NDArray]
+    """Solution of the previous iteration per asset and node name."""
+    network: Network | None
+    """Solver network at the moment of the failure, None when it could not be stored."""
+    diagnostics: npt.NDArray | None
+    """Diagnostics of the iterations of the solver, None when they were not recorded."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Constructor of the failure bundle, reading the bundle from its directory.
+
+        The network is unpickled, so only read bundles from a trusted source.
+
+        :param str | Path path: Directory of the bundle.
+        """
+        self.path = Path(path)
+        with open(self.path / METADATA_FILE) as file:
+            self.metadata = json.load(file)
+        self.matrix = self.rhs = None
+        if (self.path / MATRIX_FILE).is_file():
+            self.matrix, self.rhs, _ = load_matrix_dump(self.path / MATRIX_FILE)
+        with np.load(self.path / PREVIOUS_SOLUTIONS_FILE) as content:
+            self.previous_solutions = {name: content[name] for name in content.files}
+        self.network = None
+        if (self.path / NETWORK_FILE).is_file():
+            with open(self.path / NETWORK_FILE, "rb") as file:
+                self.network = pickle.load(file)
+        self.diagnostics = None
+        if (self.path / DIAGNOSTICS_FILE).is_file():
+            self.diagnostics = np.load(self.path / DIAGNOSTICS_FILE)
+
+    @property
+    def time(self) -> datetime:
+        """Time of the time step that failed."""
+        return datetime.fromisoformat(self.metadata["time"])
+
+    def solve_matrix(self) -> npt.NDArray:
+        """Method to solve the last assembled system of equations again.
+
+        :return: Solution of the system, which contains NaN when the matrix is singular.
+        """
+        if self.matrix is None or self.rhs is None:
+            raise ValueError(f"Failure bundle {self.path} holds no system of equations.")
+        return np.asarray(sp.sparse.linalg.spsolve(self.matrix, self.rhs))
+
+    def replay(self) -> Solver:
+        """Method to run the failed solve again on the stored network.
+
+        :return: Solver of the replayed solve, when the solve does not fail.
+        """
+        if self.network is None:
+            raise ValueError(f"Failure bundle {self.path} holds no network to replay.")
+        solver = Solver(self.network)
+        solver.solve()
+        return solver
+
+
+def replay_failure_bundle(path: str | Path) -> Solver:
+    """Function to replay the failed solve of a failure bundle.
+
+    :param str | Path path: Directory of the bundle.
+    :return: Solver of the replayed solve, when the solve does not fail.
+    """
+    return FailureBundle(path).replay()
@@ -13,14 +13,19 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Module containing a matrix class to store the matrix and solve it using numpy."""
-import csv
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
 
 import numpy as np
 import numpy.typing as npt
 import scipy as sp
 
 from omotes_simulator_core.solver.matrix.equation_object import EquationObject
-from omotes_simulator_core.solver.matrix.index_core_quantity import index_core_quantity
+
+logger = logging.getLogger(__name__)
 
 
 class Matrix:
@@ -31,6 +36,14 @@ class Matrix:
     sol_old: npt.NDArray = np.array([], dtype=float)
     relative_convergence: float = 1e-6
     absolute_convergence: float = 1e-6
+    assembly_time: float = 0.0
+    """Time spent on assembling the sparse matrix since the last reset [s]."""
+    factorization_time: float = 0.0
+    """Time spent on factorizing and solving the sparse matrix since the last reset [s]."""
+    system_matrix: sp.sparse.csc_matrix | None = None
+    """Sparse matrix of the last solved system of equations."""
+    system_rhs: sp.sparse.csc_matrix | None = None
+    """Right hand side of the last solved system of equations."""
 
     def __init__(self) -> None:
         """Constructor of matrix class."""
@@ -57,11 +70,12 @@ class Matrix:
         A sparse matrix solver is used, for this the coefficients, indices in the matrix are
         converted to numpy arrays. These arrays are then used to create a csc_matrix which can
         be solved by the sparse matrix solver of scipy.
-        :param dump: if true it will dump the matrix to a csv file
+        :param dump: if true it will dump the matrix to a file in the temporary directory
         :param equations: list with the equations to solve.
         :return: list containing the solution of the system of equations.
         """
         self.verify_equations(equations)
+        start_time = time.perf_counter()
         self.sol_old = self.sol_new
         coefficient_array = np.concatenate([equation.coefficients for equation in equations])
         column_index_array = np.concatenate([equation.indices for equation in equations])
@@ -73,12 +87,19 @@ class Matrix:
             shape=(self.num_unknowns, self.num_unknowns),
         )
         rhs = sp.sparse.csc_matrix([[equation.rhs] for equation in equations])
+        self.system_matrix = matrix
+        self.system_rhs = rhs
         if dump:
-            self.dump_matrix(matrix=matrix, rhs_array=rhs)
+            file_descriptor, file_name = tempfile.mkstemp(prefix="matrix_dump_", suffix=".npz")
+            os.close(file_descriptor)
+            self.dump_matrix(matrix=matrix, rhs_array=rhs, file_name=file_name)
+            logger.info(f"Matrix dumped to {file_name}")
+        assembled_time = time.perf_counter()
         self.sol_new = sp.sparse.linalg.spsolve(matrix, rhs)
+        self.assembly_time += assembled_time - start_time
+        self.factorization_time += time.perf_counter() - assembled_time
         if np.isnan(self.sol_new).any():
-            self.dump_matrix(matrix=matrix, rhs_array=rhs)
-            raise RuntimeError("Matrix is singular, matrix is dumped to file.")
+            raise RuntimeError("Matrix is singular.")
         result: list[float] = self.sol_new.tolist()
         return result
 
@@ -143,25 +164,46 @@ class Matrix:
         self,
         matrix: sp.sparse.csc_matrix,
         rhs_array: sp.sparse.csc_matrix,
-        file_name: str = "dump.csv",
+        file_name: str | Path,
     ) -> None:
-        """Method to dump the matrix to a csv file.
+        """Method to dump the system of equations to a compressed numpy file.
+
+        The matrix is stored in its sparse format, together with the right hand side and the
+        solution of the previous iteration, so the size of the file scales with the number of
+        non-zeros. The file is read with load_matrix_dump.
 
-        :param matrix: Matrix to be printed to the file
-        :param rhs_array: Right hand side to be printed to the file
-        :param file_name: File name to dump the matrix in default=dump.csv
-        :return:
+        :param matrix: Matrix to be written to the file
+        :param rhs_array: Right hand side to be written to the file
+        :param file_name: Name of the npz file to write
         """
-        with open(file_name, "w", newline="") as f:
-            write = csv.writer(f)
-            write.writerow(
-                ["m", "P", "u"]
-                * int(self.num_unknowns / index_core_quantity.number_core_quantities)
-                + ["rhs"]
-            )
-            for row, rhs in zip(matrix.todense(), rhs_array.todense()):
-                write.writerow(row.tolist()[0] + rhs.tolist()[0])
+        matrix = sp.sparse.csc_matrix(matrix)
+        np.savez_compressed(
+            file_name,
+            data=matrix.data,
+            indices=matrix.indices,
+            indptr=matrix.indptr,
+            shape=np.array(matrix.shape),
+            rhs=np.asarray(rhs_array.todense()).ravel(),
+            solution=self.sol_old,
+        )
 
     def reset_solution(self) -> None:
         """Method to reset the solution to 1, so the new iteration can start."""
         self.sol_new = np.ones(self.num_unknowns)
+
+
+def load_matrix_dump(
+    file_name: str | Path,
+) -> tuple[sp.sparse.csc_matrix, npt.NDArray, npt.NDArray]:
+    """Function to read a system of equations written by Matrix.dump_matrix.
+
+    :param file_name: Name of the npz file to read.
+    :return: Tuple with the matrix, the right hand side and the solution of the previous
+        iteration.
+    """
+    with np.load(file_name) as content:
+        matrix = sp.sparse.csc_matrix(
+            (content["data"], content["indices"], content["indptr"]),
+            shape=tuple(content["shape"]),
+        )
+        return matrix, content["rhs"], content["solution"]
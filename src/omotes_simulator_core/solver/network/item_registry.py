@@ -0,0 +1,102 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Module containing the integer indexed registry of the items in a network."""
+from typing import Generic, Iterator, MutableMapping, TypeVar
+
+ItemType = TypeVar("ItemType")
+
+
+class ItemRegistry(MutableMapping[str, ItemType], Generic[ItemType]):
+    """Registry of the items in a network, stored in a list indexed by an integer id.
+
+    The integer id of an item is the order in which it is registered. The network refers to the
+    items by their integer id, the names are only used to look up the id at the API edge. The
+    registry behaves as a dict from name to item, so items can still be retrieved by name.
+    """
+
+    def __init__(self) -> None:
+        """Constructor of the registry without items."""
+        self._items: list[ItemType | None] = []
+        self._ids: dict[str, int] = {}
+        self._values: list[ItemType] | None = []
+
+    def add(self, name: str, item: ItemType) -> int:
+        """Method to add an item to the registry.
+
+        :param str name: Unique name of the item.
+        :param ItemType item: Item to add.
+        :return: Integer id of the item.
+        """
+        if name in self._ids:
+            raise ValueError(f"{name} already exists in network.")
+        self._ids[name] = len(self._items)
+        self._items.append(item)
+        self._values = None
+        return self._ids[name]
+
+    def get_id(self, name: str) -> int:
+        """Method to get the integer id of an item.
+
+        :param str name: Name of the item.
+        :return: Integer id of the item.
+        """
+        return self._ids[name]
+
+    def get_by_id(self, item_id: int) -> ItemType:
+        """Method to get an item by its integer id.
+
+        :param int item_id: Integer id of the item.
+        :return: The item with the given id.
+        """
+        item = self._items[item_id]
+        if item is None:
+            raise KeyError(f"Item with id {item_id} is removed from the network.")
+        return item
+
+    def values(self) -> list[ItemType]:  # type: ignore[override]
+        """Method to get the items in the order in which they are registered.
+
+        The list is kept until the registry changes, so it should not be modified.
+
+        :return: List of the items.
+        """
+        if self._values is None:
+            self._values = [item for item in self._items if item is not None]
+        return self._values
+
+    def __getitem__(self, name: str) -> ItemType:
+        """Method to get an item by its name."""
+        return self.get_by_id(self._ids[name])
+
+    def __setitem__(self, name: str, item: ItemType) -> None:
+        """Method to add an item by its name, or replace the item with the same name."""
+        if name in self._ids:
+            self._items[self._ids[name]] = item
+            self._values = None
+        else:
+            self.add(name, item)
+
+    def __delitem__(self, name: str) -> None:
+        """Method to remove an item by its name, the ids of the other items do not change."""
+        self._items[self._ids.pop(name)] = None
+        self._values = None
+
+    def __iter__(self) -> Iterator[str]:
+        """Method to iterate over the names of the items in the order they are registered."""
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        """Method to get the number of items in the registry."""
+        return len(self._ids)
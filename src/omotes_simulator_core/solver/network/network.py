@@ -13,8 +13,6 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Module containing the network class."""
-import uuid
-
 import numpy.typing as npt
 
 from omotes_simulator_core.solver.network.assets.base_asset import BaseAsset
@@ -24,10 +22,15 @@ from omotes_simulator_core.solver.network.assets.heat_transfer_asset import Heat
 from omotes_simulator_core.solver.network.assets.node import Node
 from omotes_simulator_core.solver.network.assets.production_asset import HeatBoundary
 from omotes_simulator_core.solver.network.assets.solver_pipe import SolverPipe
+from omotes_simulator_core.solver.network.item_registry import ItemRegistry
 
 
 class Network:
-    """Class to store a network consisting of nodes and assets."""
+    """Class to store a network consisting of nodes and assets.
+
+    The assets and nodes are registered by an integer id and refer to each other by this id
+    internally. The names of the assets and nodes are only used in the public methods.
+    """
 
     str_to_class_dict = {
         "Boundary": BaseBoundary,
@@ -37,16 +40,35 @@ class Network:
         "Pipe": SolverPipe,
         "HeatTransferAsset": HeatTransferAsset,
     }
-    assets: dict[str, BaseAsset]
-    nodes: dict[str, Node]
+    assets: ItemRegistry[BaseAsset]
+    """Assets in the network by integer id, in the order in which they are added."""
+    nodes: ItemRegistry[Node]
+    """Nodes in the network by integer id, in the order in which they are created."""
+    number_of_items: int
+    """Number of items registered in the network, used to create deterministic names."""
 
     def __init__(self) -> None:
         """Constructor of the network class.
 
         Initializes the class properties and loads the fluid properties.
         """
-        self.assets = {}
-        self.nodes = {}
+        self.assets = ItemRegistry()
+        self.nodes = ItemRegistry()
+        self.number_of_items = 0
+
+    def _create_item_name(self, prefix: str) -> str:
+        """Method to create a unique name for a new item in the network.
+
+        The name is based on the number of items registered in the network. Building the same
+        network twice thus results in the same names, and since the assets and nodes are stored in
+        the order in which they are added, also in the same layout of the matrix.
+
+        :param str prefix: Prefix of the name, e.g. node or asset.
+        :return: Unique name of the item.
+        """
+        name = f"{prefix}_{self.number_of_items}"
+        self.number_of_items += 1
+        return name
 
     def add_asset(
         self, asset_type: str, name: str | None = None, identifier: str | None = None
@@ -56,19 +78,21 @@ class Network:
         This method creates and asset of the given type.
         If the type does not exist a ValueError is raised.
         The unique id which is created for this asset is returned.
-        :param name: Unique name of the asset, if not given a random uuid is created.
+        :param name: Unique name of the asset, if not given a name is created based on the
+        number of items in the network.
         :param str asset_type: The type of asset to be added
-        :param str identifier: Unique identifier of the asset, if not given a random uuid is
-        created.
+        :param str identifier: Unique identifier of the asset, if not given the name is used.
         :return: Unique id of the asset.
         """
         if asset_type not in self.str_to_class_dict:
             raise ValueError(asset_type + " not recognized.")
         if name is None:
-            name = str(uuid.uuid4())
+            name = self._create_item_name("asset")
+        else:
+            self.number_of_items += 1
         if identifier is None:
-            identifier = str(uuid.uuid4())
-        self.assets[name] = self.str_to_class_dict[asset_type](name=name, _id=identifier)
+            identifier = name
+        self.assets.add(name, self.str_to_class_dict[asset_type](name=name, _id=identifier))
         return name
 
     def add_existing_asset(self, asset: BaseAsset) -> str:
@@ -79,120 +103,115 @@ class Network:
         :param BaseAsset asset: The asset to be added to the network.
         :return: Unique id of the asset.
         """
-        if asset.name in self.assets:
-            raise ValueError(f"{asset.name} already exists in network.")
-        self.assets[asset.name] = asset
+        self.assets.add(asset.name, asset)
+        self.number_of_items += 1
         return asset.name
 
     def _connect_single_asset_at_node(
         self,
-        asset_id_connected: str,
+        asset_id_connected: int,
         connection_point_connected: int,
-        asset_id_unconnected: str,
+        asset_id_unconnected: int,
         connection_point_unconnected: int,
-    ) -> str:
+    ) -> int:
         """Method to connect a single asset to a node.
 
         This method connects the unconnected asset to the node of the connected asset.
         The id of the node is returned.
 
-        :param asset_id_connected: id of the connected asset
-        :type asset_id_connected: str
+        :param asset_id_connected: integer id of the connected asset
+        :type asset_id_connected: int
         :param connection_point_connected: Connection point of the connected asset
         :type connection_point_connected: int
-        :param asset_id_unconnected: id of the unconnected asset
-        :type asset_id_unconnected: str
+        :param asset_id_unconnected: integer id of the unconnected asset
+        :type asset_id_unconnected: int
         :param connection_point_unconnected: Connection point of the unconnected asset
         :type connection_point_unconnected: int
-        :return: id of node connecting the two assets
+        :return: integer id of node connecting the two assets
         """
+        asset_unconnected = self.assets.get_by_id(asset_id_unconnected)
         # Get the node of the connected asset
-        node = self.assets[asset_id_connected].get_connected_node(
+        node = self.assets.get_by_id(asset_id_connected).get_connected_node(
             connection_point=connection_point_connected
         )
         # Connect the asset to the node
-        self.assets[asset_id_unconnected].connect_node(
-            connection_point=connection_point_unconnected, node=node
-        )
+        asset_unconnected.connect_node(connection_point=connection_point_unconnected, node=node)
         # Connect the node to the asset
-        node.connect_asset(
-            self.assets[asset_id_unconnected], connection_point=connection_point_unconnected
-        )
-        return node.name
+        node.connect_asset(asset_unconnected, connection_point=connection_point_unconnected)
+        return self.nodes.get_id(node.name)
 
     def _connect_both_assets_at_node(
         self,
-        asset1_id: str,
+        asset1_id: int,
         connection_point_1: int,
-        asset2_id: str,
+        asset2_id: int,
         connection_point_2: int,
-    ) -> str:
+    ) -> int:
         """Method to connect to assets at the given connection points.
 
         Connects the two assets to a new node and returns the id of the node.
 
-        :param asset1_id: id of first asset to be connected
-        :type asset1_id: str
+        :param asset1_id: integer id of first asset to be connected
+        :type asset1_id: int
         :param connection_point_1: Connection point of first asset to be connected
         :type connection_point_1: int
-        :param asset2_id: id of second asset to be connected
-        :type asset2_id: str
+        :param asset2_id: integer id of second asset to be connected
+        :type asset2_id: int
         :param connection_point_2: Connection point of second asset to be connected
         :type connection_point_2: int
-        :return: id of node connecting the two assets
+        :return: integer id of node connecting the two assets
         """
         # Create a new node
-        node_id = str(uuid.uuid4())
-        self.nodes[node_id] = Node(name=node_id, _id=node_id)
+        node_name = self._create_item_name("node")
+        node = Node(name=node_name, _id=node_name)
+        node_id = self.nodes.add(node_name, node)
         # Connect the assets to the node
         for asset_id, connection_point in [
             (asset1_id, connection_point_1),
             (asset2_id, connection_point_2),
         ]:
-            self.assets[asset_id].connect_node(
-                connection_point=connection_point, node=self.nodes[node_id]
-            )
-            self.nodes[node_id].connect_asset(
-                asset=self.assets[asset_id], connection_point=connection_point
-            )
+            asset = self.assets.get_by_id(asset_id)
+            asset.connect_node(connection_point=connection_point, node=node)
+            node.connect_asset(asset=asset, connection_point=connection_point)
         return node_id
 
     def _connect_both_assets_and_replace_node(
         self,
-        asset1_id: str,
+        asset1_id: int,
         connection_point_1: int,
-        asset2_id: str,
+        asset2_id: int,
         connection_point_2: int,
-    ) -> str:
+    ) -> int:
         """Method to connect to assets at the given connection points.
 
         Connects the two assets to a new node and returns the id of the node.
 
-        :param asset1_id: id of first asset to be connected
-        :type asset1_id: str
+        :param asset1_id: integer id of first asset to be connected
+        :type asset1_id: int
         :param connection_point_1: Connection point of first asset to be connected
         :type connection_point_1: int
-        :param asset2_id: id of second asset to be connected
-        :type asset2_id: str
+        :param asset2_id: integer id of second asset to be connected
+        :type asset2_id: int
         :param connection_point_2: Connection point of second asset to be connected
         :type connection_point_2: int
-        :return: id of node connecting the two assets
+        :return: integer id of node connecting the two assets
         """
+        asset2 = self.assets.get_by_id(asset2_id)
         # Retrieve the nodes of the assets
-        node1 = self.assets[asset1_id].get_connected_node(connection_point=connection_point_1)
-        node2 = self.assets[asset2_id].get_connected_node(connection_point=connection_point_2)
-        # Check if the nodes are the same, if so return the name of the node.
-        if node1 == node2:
-            return node1.name
-        else:
+        node1 = self.assets.get_by_id(asset1_id).get_connected_node(
+            connection_point=connection_point_1
+        )
+        node2 = asset2.get_connected_node(connection_point=connection_point_2)
+        # Check if the nodes are the same, if so return the id of the node.
+        if node1 != node2:
             # Both nodes are different, connect the two nodes and remove the second node.
             # First connect all assets connected to the second node to the first node.
             for connected_comp, connection_point in node2.get_connected_assets():
                 # Disconnect the connected component from the second node
                 connected_comp.disconnect_node(connection_point=connection_point)
                 # Connect the connected component to the first node
-                self.connect_assets(
-                    asset1_id=connected_comp.name,
+                self._connect_assets_by_id(
+                    asset1_id=self.assets.get_id(connected_comp.name),
                     connection_point_1=connection_point,
                     asset2_id=asset1_id,
                     connection_point_2=connection_point_1,
@@ -200,9 +219,9 @@ class Network:
             # Remove the second node from the network
             del self.nodes[node2.name]
             # Finally connect the first asset to the second asset
-            self.assets[asset2_id].disconnect_node(connection_point=connection_point_2)
-            self.assets[asset2_id].connect_node(connection_point=connection_point_2, node=node1)
-            return node1.name
+            asset2.disconnect_node(connection_point=connection_point_2)
+            asset2.connect_node(connection_point=connection_point_2, node=node1)
+        return self.nodes.get_id(node1.name)
 
     def connect_assets(
         self,
@@ -226,9 +245,36 @@ class Network:
         # Check if both assets exist; if not raise a ValueError
         for asset_id in [asset1_id, asset2_id]:
             self.exists_asset(asset_id=asset_id)
+        node_id = self._connect_assets_by_id(
+            asset1_id=self.assets.get_id(asset1_id),
+            connection_point_1=connection_point_1,
+            asset2_id=self.assets.get_id(asset2_id),
+            connection_point_2=connection_point_2,
+        )
+        return self.nodes.get_by_id(node_id).name
+
+    def _connect_assets_by_id(
+        self,
+        asset1_id: int,
+        connection_point_1: int,
+        asset2_id: int,
+        connection_point_2: int,
+    ) -> int:
+        """Method to connect to assets given by their integer id at the given connection points.
+
+        :param asset1_id: integer id of first asset to be connected
+        :param connection_point_1: Connection point of first asset to be connected
+        :param asset2_id: integer id of second asset to be connected
+        :param connection_point_2: Connection point of second asset to be connected
+        :return: integer id of node connecting the two assets
+        """
         # Create boolean list with for each asset wether the connection point is connected
-        connected_1 = self.assets[asset1_id].is_connected(connection_point=connection_point_1)
-        connected_2 = self.assets[asset2_id].is_connected(connection_point=connection_point_2)
+        connected_1 = self.assets.get_by_id(asset1_id).is_connected(
+            connection_point=connection_point_1
+        )
+        connected_2 = self.assets.get_by_id(asset2_id).is_connected(
+            connection_point=connection_point_2
+        )
         # Use the connect_assets_decision_tree to connect the assets
         return self.connect_assets_decision_tree(
             connected_1=connected_1,
@@ -243,11 +289,11 @@ class Network:
         self,
         connected_1: bool,
         connected_2: bool,
-        asset1_id: str,
+        asset1_id: int,
         connection_point_1: int,
-        asset2_id: str,
+        asset2_id: int,
         connection_point_2: int,
-    ) -> str:
+    ) -> int:
         """Method to connect to assets at the given connection points.
 
         The method uses a decision tree to connect the assets. The decision tree is as follows:
@@ -260,11 +306,11 @@ class Network:
 
         :param connected_1: Boolean indicating if asset 1 is connected
         :param connected_2: Boolean indicating if asset 2 is connected
-        :param asset1_id: id of first asset to be connected
+        :param asset1_id: integer id of first asset to be connected
         :param connection_point_1: Connection point of first asset to be connected
-        :param asset2_id: id of second asset to be connected
+        :param asset2_id: integer id of second asset to be connected
         :param connection_point_2: Connection point of second asset to be connected
-        :return: id of node connecting the two assets
+        :return: integer id of node connecting the two assets
         """
         if not any([connected_1, connected_2]):
             # both assets are not connected. Create a new node and connect everything.
@@ -389,10 +435,9 @@ class Network:
         :param list[float] solution:Solution to be transferred to the assets.
         :return: None
         """
-        for asset in self.assets:
-            index = self.get_asset(asset_id=asset).matrix_index
-            nou = self.get_asset(asset_id=asset).number_of_unknowns
-            self.get_asset(asset_id=asset).prev_sol = solution[index : index + nou].tolist()
+        for asset in self.assets.values():
+            index = asset.matrix_index
+            asset.prev_sol = solution[index : index + asset.number_of_unknowns].tolist()
 
     def set_result_node(self, solution: npt.NDArray) -> None:
         """Method to transfer the solution to the nodes in the network.
@@ -400,10 +445,9 @@ class Network:
         :param list[float] solution:Solution to be transferred to the nodes.
         :return: None
         """
-        for node in self.nodes:
-            index = self.get_node(node_id=node).matrix_index
-            nou = self.get_node(node_id=node).number_of_unknowns
-            self.get_node(node_id=node).prev_sol = solution[index : index + nou].tolist()
+        for node in self.nodes.values():
+            index = node.matrix_index
+            node.prev_sol = solution[index : index + node.number_of_unknowns].tolist()
 
     def print_result(self) -> None:
         """Method to print the result of the network."""
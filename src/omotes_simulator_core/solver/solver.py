@@ -14,13 +14,18 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Module for solving the network class."""
 import logging
+import time
 
 from omotes_simulator_core.solver.matrix.equation_object import EquationObject
 from omotes_simulator_core.solver.matrix.matrix import Matrix
 from omotes_simulator_core.solver.network.network import Network
+from omotes_simulator_core.solver.solver_diagnostics import SolverDiagnostics
 
 logger = logging.getLogger(__name__)
 
+SOLVER_PHASES = ("equation_assembly", "matrix_assembly", "factorization", "result_transfer")
+"""Phases of the solver of which the time is recorded."""
+
 
 class Solver:
     """Class to solve the network."""
@@ -28,6 +33,9 @@ class Solver:
     _iteration_limit: int = 100
     """The maximum number of iterations for the solver."""
 
+    diagnostics: SolverDiagnostics | None = None
+    """Diagnostics of the iterations of the solver, None when they are not recorded."""
+
     def __init__(self, network: Network):
         """Constructor of the solver class.
 
@@ -38,17 +46,21 @@ class Solver:
         self.matrix = Matrix()
         self.network = network
         self.set_unknowns_matrix()
+        self.number_of_iterations = 0
+        self.converged = True
+        self._equation_assembly_time = 0.0
+        self._result_transfer_time = 0.0
 
     def set_unknowns_matrix(self) -> None:
-        """Sets the unknowns of the matrix."""
-        for asset in self.network.assets:
-            self.network.get_asset(asset).set_matrix_index(
-                self.matrix.add_unknowns(self.network.get_asset(asset).number_of_unknowns)
-            )
-        for node in self.network.nodes:
-            self.network.get_node(node).set_matrix_index(
-                self.matrix.add_unknowns(self.network.get_node(node).number_of_unknowns)
-            )
+        """Sets the unknowns of the matrix.
+
+        The assets and nodes are added in the order in which they are added to the network, so
+        the layout of the matrix is the same for every run of the same network.
+        """
+        for asset in self.network.assets.values():
+            asset.set_matrix_index(self.matrix.add_unknowns(asset.number_of_unknowns))
+        for node in self.network.nodes.values():
+            node.set_matrix_index(self.matrix.add_unknowns(node.number_of_unknowns))
 
     def get_equations(self) -> list[EquationObject]:
         """Method to get the equations of the network.
@@ -56,30 +68,74 @@ class Solver:
         :return: list[EquationObject] equations: List of equations of the network.
         """
         equations: list[EquationObject] = []
-        for asset in self.network.assets:
-            equations = equations + self.network.assets[asset].get_equations()
-        for node in self.network.nodes:
-            equations = equations + self.network.nodes[node].get_equations()
+        for asset in self.network.assets.values():
+            equations.extend(asset.get_equations())
+        for node in self.network.nodes.values():
+            equations.extend(node.get_equations())
         return equations
 
     def solve(self) -> None:
         """Method to solve the network."""
         iteration = 0
+        self.converged = True
         self.matrix.reset_solution()
-        for asset in self.network.assets:
-            self.network.get_asset(asset).reset_prev_sol()
-        for node in self.network.nodes:
-            self.network.get_node(node).reset_prev_sol()
+        for asset in self.network.assets.values():
+            asset.reset_prev_sol()
+        for node in self.network.nodes.values():
+            node.reset_prev_sol()
+        if self.diagnostics is not None:
+            self.diagnostics.start_solve()
         while not self.matrix.is_converged():
             iteration += 1
+            start_time = time.perf_counter()
             equations = self.get_equations()
-            self.matrix.solve(equations, dump=False)
+            self._equation_assembly_time += time.perf_counter() - start_time
+            try:
+                self.matrix.solve(equations, dump=False)
+            finally:
+                if self.diagnostics is not None:
+                    self.diagnostics.record(iteration, self.matrix)
+            start_time = time.perf_counter()
             self.results_to_assets()
+            self._result_transfer_time += time.perf_counter() - start_time
             if iteration > self._iteration_limit:
                 logger.warning("No converged solution reached")
+                self.converged = False
                 break
+        self.number_of_iterations += iteration
         logger.debug("Solver finished after %d iterations", iteration)
 
+    def enable_diagnostics(self, estimate_condition: bool = False) -> SolverDiagnostics:
+        """Method to start recording the diagnostics of every iteration of the solver.
+
+        :param bool estimate_condition: Whether the condition number of the matrix is estimated,
+            which costs an extra factorization per iteration.
+        :return: The diagnostics the iterations are recorded in.
+        """
+        self.diagnostics = SolverDiagnostics(self.network, estimate_condition)
+        return self.diagnostics
+
+    def get_statistics(self) -> dict[str, float]:
+        """Method to get the time spent per solver phase since the last reset.
+
+        :return: Dict with the phase as key and the time [s] as value.
+        """
+        return {
+            "equation_assembly": self._equation_assembly_time,
+            "matrix_assembly": self.matrix.assembly_time,
+            "factorization": self.matrix.factorization_time,
+            "result_transfer": self._result_transfer_time,
+        }
+
+    def reset_statistics(self) -> None:
+        """Method to reset the number of iterations and the time spent per solver phase."""
+        self.number_of_iterations = 0
+        self.converged = True
+        self._equation_assembly_time = 0.0
+        self._result_transfer_time = 0.0
+        self.matrix.assembly_time = 0.0
+        self.matrix.factorization_time = 0.0
+
     def get_results(self) -> None:
         """Method to get the results of the network."""
 
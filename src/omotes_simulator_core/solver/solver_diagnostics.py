@@ -0,0 +1,217 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Module containing the diagnostics of the iterations of the solver."""
+import math
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import scipy as sp
+
+from omotes_simulator_core.solver.matrix.index_core_quantity import index_core_quantity
+from omotes_simulator_core.solver.matrix.matrix import Matrix
+from omotes_simulator_core.solver.network.assets.base_asset import BaseAsset
+from omotes_simulator_core.solver.network.assets.node import Node
+from omotes_simulator_core.solver.network.network import Network
+
+CORE_QUANTITIES = ("mass_flow_rate", "pressure", "internal_energy")
+"""Core quantities of the unknowns, in the order of their index in the matrix."""
+
+DIAGNOSTICS_DTYPE = np.dtype(
+    [
+        ("time_step", np.int64),
+        ("solve", np.int32),
+        ("iteration", np.int32),
+        ("size", np.int32),
+        ("nnz", np.int64),
+        ("condition_estimate", np.float64),
+        *((f"residual_{quantity}", np.float64) for quantity in CORE_QUANTITIES),
+        ("max_change_unknown", np.int64),
+    ]
+)
+"""Fields recorded per iteration of the solver."""
+
+DEFAULT_DIAGNOSTICS_CAPACITY = 1024
+"""Number of iterations allocated when the diagnostics are created."""
+
+
+def estimate_condition_number(matrix: sp.sparse.csc_matrix) -> float:
+    """Function to estimate the 1-norm condition number of a sparse matrix.
+
+    The 1-norm of the inverse is estimated with a few solves of the LU factorization, so the
+    inverse is never formed.
+
+    :param sp.sparse.csc_matrix matrix: Square matrix to estimate the condition number of.
+    :return: Estimate of the condition number, infinite when the matrix is singular.
+    """
+    try:
+        factorization = sp.sparse.linalg.splu(matrix)
+    except RuntimeError:
+        return math.inf
+    inverse = sp.sparse.linalg.LinearOperator(
+        matrix.shape,
+        matvec=factorization.solve,
+        rmatvec=lambda vector: factorization.solve(vector, trans="T"),
+        dtype=np.float64,
+    )
+    return float(sp.sparse.linalg.norm(matrix, 1) * sp.sparse.linalg.onenormest(inverse))
+
+
+class SolverDiagnostics:
+    """Diagnostics of every iteration of the solver.
+
+    Per iteration the size and number of non-zeros of the matrix, an estimate of its condition
+    number, the residual per core quantity and the unknown that changed most are recorded. The
+    residual is the largest change of an unknown relative to the convergence tolerance of the
+    matrix, so the iteration is converged when all residuals are at most one. The records are
+    stored in a preallocated structured array, which grows when it is full.
+    """
+
+    estimate_condition: bool
+    """Whether the condition number is estimated, which costs an extra factorization."""
+    unknown_owners: list[str]
+    """Name of the asset or node owning each unknown of the matrix."""
+    unknown_quantities: npt.NDArray[np.int64]
+    """Index of the core quantity of each unknown of the matrix."""
+    unknown_connection_points: npt.NDArray[np.int64]
+    """Connection point of the owner of each unknown of the matrix."""
+
+    def __init__(self, network: Network, estimate_condition: bool = False) -> None:
+        """Constructor of the solver diagnostics.
+
+        :param Network network: Network of the solver, of which the matrix index of the assets
+            and nodes is set.
+        :param bool estimate_condition: Whether the condition number is estimated, which is off
+            by default since it factorizes the matrix a second time in every iteration.
+        """
+        self.estimate_condition = estimate_condition
+        items: list[BaseAsset | Node] = [*network.assets.values(), *network.nodes.values()]
+        number_of_unknowns = sum(item.number_of_unknowns for item in items)
+        self.unknown_owners = [""] * number_of_unknowns
+        self.unknown_quantities = np.zeros(number_of_unknowns, dtype=np.int64)
+        self.unknown_connection_points = np.zeros(number_of_unknowns, dtype=np.int64)
+        for item in items:
+            offsets = np.arange(item.number_of_unknowns)
+            indices = item.matrix_index + offsets
+            for index in indices:
+                self.unknown_owners[index] = item.name
+            self.unknown_quantities[indices] = offsets % index_core_quantity.number_core_quantities
+            self.unknown_connection_points[indices] = (
+                offsets // index_core_quantity.number_core_quantities
+            )
+        self._records = np.zeros(DEFAULT_DIAGNOSTICS_CAPACITY, dtype=DIAGNOSTICS_DTYPE)
+        self._number_of_records = 0
+        self._times: list[datetime] = []
+        self._solve = 0
+
+    def __len__(self) -> int:
+        """Method to get the number of recorded iterations."""
+        return self._number_of_records
+
+    @property
+    def records(self) -> np.ndarray:
+        """Structured array with a record per iteration, a view on the diagnostics."""
+        return self._records[: self._number_of_records]
+
+    def start_time_step(self, time: datetime) -> None:
+        """Method to start recording the iterations of a new time step.
+
+        :param datetime time: Time of the time step.
+        """
+        self._times.append(time)
+        self._solve = 0
+
+    def start_solve(self) -> None:
+        """Method to start recording the iterations of a new solve of the network."""
+        self._solve += 1
+
+    def record(self, iteration: int, matrix: Matrix) -> None:
+        """Method to record an iteration of the solver.
+
+        :param int iteration: Number of the iteration within the solve, starting at 1.
+        :param Matrix matrix: Matrix of which the system is solved in the iteration.
+        """
+        if self._number_of_records == len(self._records):
+            self._records = np.resize(self._records, 2 * len(self._records))
+        record = self._records[self._number_of_records]
+        record["time_step"] = len(self._times) - 1
+        record["solve"] = self._solve
+        record["iteration"] = iteration
+        record["size"] = matrix.num_unknowns
+        system_matrix = matrix.system_matrix
+        record["nnz"] = 0 if system_matrix is None else system_matrix.nnz
+        record["condition_estimate"] = (
+            estimate_condition_number(system_matrix)
+            if self.estimate_condition and system_matrix is not None
+            else np.nan
+        )
+        change = np.abs(matrix.sol_new - matrix.sol_old) / (
+            matrix.absolute_convergence + matrix.relative_convergence * np.abs(matrix.sol_old)
+        )
+        for quantity_index, quantity in enumerate(CORE_QUANTITIES):
+            quantity_change = change[self.unknown_quantities == quantity_index]
+            record[f"residual_{quantity}"] = (
+                quantity_change.max() if len(quantity_change) else np.nan
+            )
+        record["max_change_unknown"] = np.nanargmax(change) if not np.isnan(change).all() else -1
+        self._number_of_records += 1
+
+    def get_unknown_description(self, index: int) -> str:
+        """Method to describe an unknown of the matrix.
+
+        :param int index: Index of the unknown in the matrix.
+        :return: Description with the owner, core quantity and connection point of the unknown.
+        """
+        if index < 0:
+            return ""
+        return (
+            f"{self.unknown_owners[index]} {CORE_QUANTITIES[self.unknown_quantities[index]]} "
+            f"at connection point {self.unknown_connection_points[index]}"
+        )
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Method to get the diagnostics with a row per iteration.
+
+        :return: DataFrame with the fields of the records as columns, the time of the time step
+            and the owner and quantity of the unknown that changed most.
+        """
+        report = pd.DataFrame(self.records)
+        report.insert(
+            0,
+            "time",
+            [self._times[index] if index >= 0 else None for index in report["time_step"]],
+        )
+        unknowns = report["max_change_unknown"].to_numpy()
+        report["max_change_owner"] = [
+            self.unknown_owners[index] if index >= 0 else "" for index in unknowns
+        ]
+        report["max_change_quantity"] = [
+            CORE_QUANTITIES[self.unknown_quantities[index]] if index >= 0 else ""
+            for index in unknowns
+        ]
+        return report
+
+    def get_hot_spots(self, number_of_owners: int = 10) -> pd.Series:
+        """Method to get the assets and nodes of which an unknown changed most most often.
+
+        These are the parts of the network that limit the convergence of the solver.
+
+        :param int number_of_owners: Number of assets and nodes to return.
+        :return: Series with the owner as index and the number of iterations as value.
+        """
+        owners = self.to_dataframe()["max_change_owner"]
+        return owners[owners != ""].value_counts().head(number_of_owners)
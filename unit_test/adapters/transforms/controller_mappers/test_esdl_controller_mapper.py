@@ -15,10 +15,12 @@
 
 import unittest
 from pathlib import Path
+from unittest.mock import Mock
 
 from omotes_simulator_core.adapter.transforms.controller_mapper import EsdlControllerMapper
 from omotes_simulator_core.entities.assets.controller import (
     ControllerAtesStorage,
+    ControllerConsumer,
     ControllerIdealHeatStorage,
 )
 from omotes_simulator_core.entities.esdl_object import EsdlObject
@@ -95,3 +97,35 @@ class TestEsdlControllerMapper(unittest.TestCase):
         self.assertEqual(len(storages), 2)
         self.assertIsInstance(storages[0], ControllerIdealHeatStorage)
         self.assertIsInstance(storages[1], ControllerAtesStorage)
+
+    def test_heat_transfer_assets_to_network(self):
+        # Arrange
+        components = {"hp1_primary": 0, "hp1_secondary": 1, "hp2_primary": 1, "hp2_secondary": 2}
+        heat_pump1 = Mock(id="hp1")
+        heat_pump2 = Mock(id="hp2")
+        mapper = EsdlControllerMapper()
+
+        # Act
+        networks = mapper.heat_transfer_assets_to_network(components, [heat_pump1, heat_pump2])
+
+        # Assert
+        self.assertEqual([network.component for network in networks], [0, 1, 2])
+        self.assertEqual(networks[0].heat_transfer_primary, [heat_pump1])
+        self.assertEqual(networks[1].heat_transfer_secondary, [heat_pump1])
+        self.assertEqual(networks[1].heat_transfer_primary, [heat_pump2])
+        self.assertEqual(networks[2].heat_transfer_secondary, [heat_pump2])
+
+    def test_assets_to_networks(self):
+        # Arrange
+        components = {"hp1_primary": 0, "hp1_secondary": 1, "consumer": 1, "unconnected": 2}
+        mapper = EsdlControllerMapper()
+        networks = mapper.heat_transfer_assets_to_network(components, [Mock(id="hp1")])
+        consumer = Mock(spec=ControllerConsumer, id="consumer")
+        unconnected = Mock(spec=ControllerConsumer, id="unconnected")
+
+        # Act
+        mapper.assets_to_networks(components, networks, [consumer, unconnected])
+
+        # Assert
+        self.assertEqual(networks[0].consumer, [])
+        self.assertEqual(networks[1].consumer, [consumer])
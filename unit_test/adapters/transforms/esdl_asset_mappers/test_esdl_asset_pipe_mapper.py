@@ -14,15 +14,20 @@
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
 """Test pipe mapper."""
+import tempfile
 import typing
 import unittest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import esdl
+
 from omotes_simulator_core.adapter.transforms.esdl_asset_mappers.pipe_mapper import (
     EsdlAssetPipeMapper,
+    create_pipe_catalog,
 )
 from omotes_simulator_core.adapter.transforms.string_to_esdl import OmotesAssetLabels
+from omotes_simulator_core.adapter.utility.edr_pipe_catalog import EdrPipeCatalog
 from omotes_simulator_core.entities.assets.asset_defaults import PIPE_DEFAULTS, PipeSchedules
 from omotes_simulator_core.entities.assets.pipe import Pipe
 from omotes_simulator_core.entities.esdl_object import EsdlObject
@@ -140,7 +145,7 @@ class TestEsdlAssetPipeMapper(unittest.TestCase):
         esdl_asset_mock.get_property = mock_get_property
 
         # Act
-        diameter = EsdlAssetPipeMapper._get_diameter(esdl_asset_mock)
+        diameter = self.mapper._get_diameter(esdl_asset_mock)
 
         # Assert
         self.assertEqual(diameter, 0.5)
@@ -167,7 +172,7 @@ class TestEsdlAssetPipeMapper(unittest.TestCase):
             EsdlAssetPipeMapper, "_get_esdl_object_from_edr", return_value=edr_object_mock
         ):
             # Act
-            diameter = EsdlAssetPipeMapper._get_diameter(esdl_asset_mock)
+            diameter = self.mapper._get_diameter(esdl_asset_mock)
 
             # Assert
             self.assertEqual(diameter, 0.42)
@@ -187,7 +192,7 @@ class TestEsdlAssetPipeMapper(unittest.TestCase):
         esdl_asset_mock.get_property = mock_get_property
 
         # Act
-        diameter = EsdlAssetPipeMapper._get_diameter(esdl_asset_mock)
+        diameter = self.mapper._get_diameter(esdl_asset_mock)
 
         # Assert
         self.assertEqual(diameter, PIPE_DEFAULTS.diameter)
@@ -231,7 +236,7 @@ class TestEsdlAssetPipeMapper(unittest.TestCase):
             EsdlAssetPipeMapper, "_get_esdl_object_from_edr", return_value=edr_object_mock
         ) as mock_edr:
             # Act
-            diameter = EsdlAssetPipeMapper._get_diameter(esdl_asset_mock)
+            diameter = self.mapper._get_diameter(esdl_asset_mock)
 
             # Assert
             self.assertEqual(diameter, 0.08)
@@ -255,3 +260,111 @@ class TestEsdlAssetPipeMapper(unittest.TestCase):
                 "/edr/Public/Assets/Logstor/Steel-S3-DN-100.edd"
             )
             self.assertEqual(result, expected_object)
+
+    def test_get_diameter_with_nominal_diameter_uses_catalog(self):
+        """Test that the EDR is only consulted once for pipes with the same DN diameter."""
+        # Arrange
+        esdl_asset_mock = Mock()
+        dn_mock = Mock()
+        dn_mock.name = "DN50"
+
+        def mock_get_property(key, default=None):
+            if key == "innerDiameter":
+                return 0
+            if key == "diameter":
+                return dn_mock
+            return default
+
+        esdl_asset_mock.get_property = mock_get_property
+        edr_object_mock = Mock()
+        edr_object_mock.innerDiameter = 0.08
+
+        with patch.object(
+            EsdlAssetPipeMapper, "_get_esdl_object_from_edr", return_value=edr_object_mock
+        ) as mock_edr:
+            # Act
+            diameters = [self.mapper._get_diameter(esdl_asset_mock) for _ in range(3)]
+
+            # Assert
+            self.assertEqual(diameters, [0.08, 0.08, 0.08])
+            mock_edr.assert_called_once_with("DN50", PipeSchedules.S1)
+
+    def test_get_diameter_uses_injected_catalog(self) -> None:
+        """Test that a catalog passed to the mapper is used instead of the EDR."""
+        # Arrange
+        fetch = Mock()
+        catalog = EdrPipeCatalog(fetch_inner_diameter=fetch)
+        catalog.add_inner_diameter("DN50", PipeSchedules.S1, 0.07)
+        mapper = EsdlAssetPipeMapper(pipe_catalog=catalog)
+        esdl_asset_mock = Mock()
+        dn_mock = Mock()
+        dn_mock.name = "DN50"
+        esdl_asset_mock.get_property = lambda key, default=None: {
+            "innerDiameter": 0,
+            "diameter": dn_mock,
+        }.get(key, default)
+
+        # Act
+        diameter = mapper._get_diameter(esdl_asset_mock)
+
+        # Assert
+        self.assertEqual(diameter, 0.07)
+        self.assertIs(mapper.pipe_catalog, catalog)
+        fetch.assert_not_called()
+
+    def test_mappers_have_separate_default_catalogs(self) -> None:
+        """Test that the default catalog is created per mapper and not shared."""
+        # Act
+        other_mapper = EsdlAssetPipeMapper()
+
+        # Assert
+        self.assertIsNot(self.mapper.pipe_catalog, other_mapper.pipe_catalog)
+
+    def test_create_pipe_catalog_with_cache_file(self) -> None:
+        """Test that the created catalog keeps its diameters in the given file."""
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            cache_file = Path(directory) / "catalog.json"
+
+            # Act
+            catalog = create_pipe_catalog(cache_file)
+
+            # Assert
+            self.assertEqual(catalog.cache_file, cache_file)
+
+    def test_get_cached_heat_transfer_coefficient_shared_material(self) -> None:
+        """Test that pipes referring to the same material share the heat transfer coefficient."""
+        # Arrange
+        material = esdl.CompoundMatter(compoundType=esdl.CompoundTypeEnum.LAYERED)
+        esdl_pipes = []
+        for inner_diameter in [0.1, 0.1, 0.2]:
+            esdl_pipe = Mock()
+            esdl_pipe.esdl_asset = esdl.Pipe(
+                innerDiameter=inner_diameter, material=esdl.MatterReference(reference=material)
+            )
+            esdl_pipes.append(esdl_pipe)
+
+        with patch.object(
+            EsdlAssetPipeMapper, "_get_heat_transfer_coefficient", return_value=0.5
+        ) as mock_heat_transfer_coefficient:
+            # Act
+            alpha_values = [
+                self.mapper._get_cached_heat_transfer_coefficient(esdl_pipe)
+                for esdl_pipe in esdl_pipes
+            ]
+
+            # Assert
+            self.assertEqual(alpha_values, [0.5, 0.5, 0.5])
+            self.assertEqual(mock_heat_transfer_coefficient.call_count, 2)
+
+    def test_get_cached_heat_transfer_coefficient_no_material(self) -> None:
+        """Test that the default alpha value is returned for a pipe without material."""
+        # Arrange
+        esdl_pipe = Mock()
+        esdl_pipe.esdl_asset = esdl.Pipe(innerDiameter=0.1)
+
+        # Act
+        alpha_value = self.mapper._get_cached_heat_transfer_coefficient(esdl_pipe)
+
+        # Assert
+        self.assertEqual(alpha_value, PIPE_DEFAULTS.alpha_value)
@@ -44,5 +44,5 @@ class TestEsdlGraphMapper(unittest.TestCase):
 
         # Assert
         self.assertIsInstance(graph, Graph)
-        self.assertEqual(len(graph.graph.nodes), 19)
-        self.assertEqual(len(graph.graph.edges), 20)
+        self.assertEqual(graph.number_of_nodes(), 19)
+        self.assertEqual(graph.number_of_edges(), 20)
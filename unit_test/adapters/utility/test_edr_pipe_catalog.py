@@ -0,0 +1,103 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test EDR pipe catalog."""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import Mock
+
+from omotes_simulator_core.adapter.utility.edr_pipe_catalog import EdrPipeCatalog
+from omotes_simulator_core.entities.assets.asset_defaults import PipeSchedules
+
+
+class EdrPipeCatalogTest(unittest.TestCase):
+    """Testcase for EdrPipeCatalog class."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory and a local stand-in for the EDR."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_file = Path(self.temp_dir.name) / "pipe_catalog.json"
+        self.fetch_inner_diameter = Mock(
+            side_effect=lambda dn_diameter, schedule: dn_diameter / 1e3
+        )
+
+    def test_get_inner_diameter_fetched_once(self) -> None:
+        """Test that the inner diameter is only fetched once per DN diameter and schedule."""
+        # Arrange
+        catalog = EdrPipeCatalog(fetch_inner_diameter=self.fetch_inner_diameter)
+
+        # Act
+        diameters = [
+            catalog.get_inner_diameter("DN100", PipeSchedules.S1),
+            catalog.get_inner_diameter(100, PipeSchedules.S1),
+            catalog.get_inner_diameter("DN100", PipeSchedules.S2),
+        ]
+
+        # Assert
+        self.assertEqual(diameters, [0.1, 0.1, 0.1])
+        self.assertEqual(self.fetch_inner_diameter.call_count, 2)
+        self.fetch_inner_diameter.assert_any_call(100, PipeSchedules.S1)
+        self.fetch_inner_diameter.assert_any_call(100, PipeSchedules.S2)
+
+    def test_get_inner_diameter_offline_missing(self) -> None:
+        """Test that an error is raised for a missing diameter without fetch function."""
+        # Arrange
+        catalog = EdrPipeCatalog()
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            catalog.get_inner_diameter("DN100", PipeSchedules.S1)
+
+    def test_get_inner_diameter_invalid_dn(self) -> None:
+        """Test that an error is raised for an invalid DN diameter."""
+        # Arrange
+        catalog = EdrPipeCatalog(fetch_inner_diameter=self.fetch_inner_diameter)
+
+        # Act
+        with self.assertRaises(RuntimeError):
+            catalog.get_inner_diameter("DNxyz", PipeSchedules.S1)
+
+    def test_cache_file_persisted_and_reused(self) -> None:
+        """Test that fetched diameters are written to the cache file and reused offline."""
+        # Arrange
+        catalog = EdrPipeCatalog(
+            fetch_inner_diameter=self.fetch_inner_diameter, cache_file=self.cache_file
+        )
+        catalog.get_inner_diameter("DN50", PipeSchedules.S3)
+
+        # Act
+        offline_catalog = EdrPipeCatalog(cache_file=self.cache_file)
+        diameter = offline_catalog.get_inner_diameter("DN50", PipeSchedules.S3)
+
+        # Assert
+        self.assertEqual(diameter, 0.05)
+        self.assertEqual(json.loads(self.cache_file.read_text()), {"S3": {"50": 0.05}})
+
+    def test_load_preloads_catalog(self) -> None:
+        """Test that a catalog file can be preloaded."""
+        # Arrange
+        self.cache_file.write_text(json.dumps({"S1": {"100": 0.1071, "150": 0.1603}}))
+        catalog = EdrPipeCatalog(fetch_inner_diameter=self.fetch_inner_diameter)
+
+        # Act
+        catalog.load(self.cache_file)
+
+        # Assert
+        self.assertEqual(len(catalog), 2)
+        self.assertEqual(catalog.get_inner_diameter("DN150", PipeSchedules.S1), 0.1603)
+        self.fetch_inner_diameter.assert_not_called()
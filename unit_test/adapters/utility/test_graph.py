@@ -15,6 +15,7 @@
 
 """Test ates mapper."""
 
+import importlib.util
 import unittest
 
 from omotes_simulator_core.adapter.utility.graph import Graph
@@ -260,3 +261,74 @@ class TestGraph(unittest.TestCase):
 
         # Assert
         self.assertTrue(res)
+
+    def test_get_connected_components(self):
+        """Test for graph."""
+        # Arrange
+        self.graph.add_node("A")
+        self.graph.add_node("B")
+        self.graph.add_node("C")
+        self.graph.add_node("D")
+        self.graph.connect("A", "B")
+        self.graph.connect("C", "D")
+
+        # Act
+        res = self.graph.get_connected_components()
+
+        # Assert
+        self.assertEqual(set(res), {"A", "B", "C", "D"})
+        self.assertEqual(res["A"], res["B"])
+        self.assertEqual(res["C"], res["D"])
+        self.assertNotEqual(res["A"], res["C"])
+
+    def test_get_path_after_connect(self):
+        """Test for graph."""
+        # Arrange
+        self.graph.add_node("A")
+        self.graph.add_node("B")
+        self.graph.add_node("C")
+        self.graph.connect("A", "B")
+        path_before = self.graph.get_path("A", "C")
+
+        # Act
+        self.graph.connect("B", "C")
+        path_after = self.graph.get_path("A", "C")
+
+        # Assert
+        self.assertEqual(path_before, [])
+        self.assertEqual(path_after, ["A", "B", "C"])
+
+    def test_number_of_nodes_and_edges(self):
+        """Test for graph."""
+        # Arrange
+        self.graph.add_node("A")
+        self.graph.add_node("B")
+        self.graph.add_node("C")
+        self.graph.connect("A", "B")
+        self.graph.connect("B", "A")
+
+        # Act
+        number_of_nodes = self.graph.number_of_nodes()
+        number_of_edges = self.graph.number_of_edges()
+
+        # Assert
+        self.assertEqual(number_of_nodes, 3)
+        self.assertEqual(number_of_edges, 1)
+
+    @unittest.skipIf(importlib.util.find_spec("networkx") is None, "networkx is not installed")
+    def test_to_networkx(self):
+        """Test for graph."""
+        # Arrange
+        import networkx as nx
+
+        self.graph.add_node("A")
+        self.graph.add_node("B")
+        self.graph.connect("A", "B")
+
+        # Act
+        res = self.graph.to_networkx()
+
+        # Assert
+        self.assertIsInstance(res, nx.Graph)
+        self.assertEqual(set(res.nodes), {"A", "B"})
+        self.assertTrue(res.has_edge("B", "A"))
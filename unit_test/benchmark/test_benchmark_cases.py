@@ -0,0 +1,99 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test benchmark cases."""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from omotes_simulator_core.benchmark.benchmark_cases import (
+    NETWORK_BUILD_CASE,
+    RUN_DAY_CASE,
+    SOLVE_CASE,
+    read_results,
+    run_benchmark_case,
+    run_benchmarks,
+    write_results,
+)
+from omotes_simulator_core.benchmark.network_generator import NetworkGeneratorSettings
+
+
+class BenchmarkCasesTest(unittest.TestCase):
+    """Testcase for the benchmark cases."""
+
+    def setUp(self) -> None:
+        """Set up the settings of a small network."""
+        self.settings = NetworkGeneratorSettings(number_of_consumers=3)
+
+    def test_run_benchmark_case_solve(self) -> None:
+        """Test that a single solve reports the iterations of the solver."""
+        # Act
+        result = run_benchmark_case(SOLVE_CASE, self.settings)
+
+        # Assert
+        self.assertEqual(result.case, SOLVE_CASE)
+        self.assertEqual(result.number_of_assets, 6)
+        self.assertEqual(result.number_of_time_steps, 0)
+        self.assertEqual(result.controller_iterations, 1)
+        self.assertGreater(result.solver_iterations, 0)
+        self.assertGreater(result.time, 0.0)
+
+    def test_run_benchmarks(self) -> None:
+        """Test that every case is run on every network and the results are written."""
+        # Arrange
+        settings = [self.settings, NetworkGeneratorSettings(number_of_consumers=4)]
+
+        # Act
+        results = run_benchmarks([NETWORK_BUILD_CASE, RUN_DAY_CASE], settings, isolate=False)
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "results.json"
+            write_results(results, path)
+            with open(path) as file:
+                content = json.load(file)
+
+        # Assert
+        self.assertEqual(
+            [result.case for result in results], [NETWORK_BUILD_CASE, RUN_DAY_CASE] * 2
+        )
+        self.assertEqual(results[1].number_of_time_steps, 24)
+        self.assertEqual(results[1].controller_iterations, 24)
+        self.assertEqual(results[1].settings["number_of_profile_values"], 26)
+        self.assertEqual(len(content["results"]), 4)
+        self.assertIn("version", content["metadata"])
+        self.assertEqual(content["results"][3]["settings"]["number_of_consumers"], 4)
+
+    def test_read_results(self) -> None:
+        """Test that written results are read back with the settings of the network."""
+        # Arrange
+        results = [run_benchmark_case(SOLVE_CASE, self.settings)]
+
+        # Act
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "results.json"
+            write_results(results, path, calibration_time=0.1)
+            read, metadata = read_results(path)
+
+        # Assert
+        self.assertEqual(read, results)
+        self.assertEqual(metadata["calibration_time"], 0.1)
+        self.assertEqual(read[0].get_settings().start, self.settings.start)
+        self.assertEqual(read[0].get_settings().number_of_consumers, 3)
+
+    def test_run_benchmark_case_unknown(self) -> None:
+        """Test that an unknown case raises an error."""
+        # Act
+        with self.assertRaises(ValueError):
+            run_benchmark_case("unknown", self.settings)
@@ -0,0 +1,106 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test network generator."""
+import unittest
+
+import esdl
+
+from omotes_simulator_core.benchmark.network_generator import (
+    RING_TOPOLOGY,
+    NetworkGenerator,
+    NetworkGeneratorSettings,
+)
+
+
+class NetworkGeneratorTest(unittest.TestCase):
+    """Testcase for NetworkGenerator class."""
+
+    def test_generate_radial(self) -> None:
+        """Test that a radial network has a pipe pair per node except the first node."""
+        # Arrange
+        settings = NetworkGeneratorSettings(
+            number_of_consumers=7, number_of_producers=2, number_of_storages=1
+        )
+
+        # Act
+        esh = NetworkGenerator(settings).generate()
+
+        # Assert
+        self.assertEqual(settings.number_of_nodes, 4)
+        self.assertEqual(len(esh.get_all_instances_of_type(esdl.HeatingDemand)), 7)
+        self.assertEqual(len(esh.get_all_instances_of_type(esdl.GenericProducer)), 2)
+        self.assertEqual(len(esh.get_all_instances_of_type(esdl.HeatStorage)), 1)
+        self.assertEqual(len(esh.get_all_instances_of_type(esdl.Joint)), 8)
+        self.assertEqual(len(esh.get_all_instances_of_type(esdl.Pipe)), 6)
+
+    def test_generate_ring_with_heat_pump(self) -> None:
+        """Test that a ring network is closed and the heat pump has a separate source circuit."""
+        # Arrange
+        settings = NetworkGeneratorSettings(
+            topology=RING_TOPOLOGY,
+            number_of_consumers=12,
+            has_heat_pump=True,
+            cross_connection_interval=2,
+        )
+
+        # Act
+        esh = NetworkGenerator(settings).generate()
+
+        # Assert
+        # A ring of 6 nodes has 6 connections, with a cross connection between nodes 2 and 4.
+        self.assertEqual(len(esh.get_all_instances_of_type(esdl.Pipe)), 14)
+        heat_pump = esh.get_all_instances_of_type(esdl.HeatPump)[0]
+        self.assertEqual(len(heat_pump.port), 4)
+        self.assertEqual(heat_pump.port[0].connectedTo[0].eContainer().id, "HeatPumpSource")
+
+    def test_generate_is_reproducible(self) -> None:
+        """Test that the same settings give the same profiles."""
+        # Arrange
+        settings = NetworkGeneratorSettings(number_of_consumers=3, seed=5)
+
+        # Act
+        esh1 = NetworkGenerator(settings).generate()
+        esh2 = NetworkGenerator(settings).generate()
+
+        # Assert
+        profile1 = esh1.get_all_instances_of_type(esdl.TimeSeriesProfile)[2]
+        profile2 = esh2.get_all_instances_of_type(esdl.TimeSeriesProfile)[2]
+        self.assertEqual(list(profile1.values), list(profile2.values))
+        self.assertEqual(len(profile1.values), settings.number_of_profile_values)
+
+    def test_consumer_profile(self) -> None:
+        """Test that the demand profile is read without a profile database."""
+        # Arrange
+        esdl_object = NetworkGenerator(
+            NetworkGeneratorSettings(number_of_consumers=2)
+        ).to_esdl_object()
+        consumer = esdl_object.get_asset_by_id("Consumer_0")
+
+        # Act
+        profile = consumer.get_profile()
+
+        # Assert
+        self.assertEqual(len(profile), 25)
+        self.assertEqual(str(profile["date"][0]), "2019-01-01 00:00:00+00:00")
+        self.assertTrue(((profile["values"] > 0) & (profile["values"] <= 100000.0)).all())
+
+    def test_invalid_settings(self) -> None:
+        """Test that invalid settings raise an error."""
+        # Act
+        with self.assertRaises(ValueError):
+            NetworkGeneratorSettings(topology="star")
+        with self.assertRaises(ValueError):
+            NetworkGeneratorSettings(number_of_producers=0)
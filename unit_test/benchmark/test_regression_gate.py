@@ -0,0 +1,154 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test benchmark regression gate."""
+import math
+import tempfile
+import unittest
+from dataclasses import replace
+from pathlib import Path
+
+from omotes_simulator_core.benchmark.benchmark_cases import (
+    RUN_DAY_CASE,
+    SOLVE_CASE,
+    BenchmarkResult,
+    run_benchmark_case,
+    write_results,
+)
+from omotes_simulator_core.benchmark.network_generator import NetworkGeneratorSettings
+from omotes_simulator_core.benchmark.regression_gate import (
+    MetricComparison,
+    Tolerances,
+    calibrate,
+    compare_result,
+    get_case_name,
+    run_regression_gate,
+)
+
+
+class RegressionGateTest(unittest.TestCase):
+    """Testcase for the benchmark regression gate."""
+
+    def setUp(self) -> None:
+        """Set up a baseline result of a day run."""
+        self.baseline = BenchmarkResult(
+            case=RUN_DAY_CASE,
+            settings={
+                "topology": "radial",
+                "number_of_consumers": 10,
+                "number_of_producers": 1,
+                "number_of_storages": 0,
+                "has_heat_pump": True,
+            },
+            number_of_assets=22,
+            number_of_unknowns=300,
+            number_of_time_steps=24,
+            time=1.0,
+            solver_iterations=72,
+            controller_iterations=24,
+            peak_rss=1000,
+        )
+
+    def test_metric_comparison(self) -> None:
+        """Test that a metric regresses when it increases more than the tolerance."""
+        # Act
+        within = MetricComparison("time", 1.0, 1.2, 0.25)
+        regression = MetricComparison("time", 1.0, 1.3, 0.25)
+        improvement = MetricComparison("time", 1.0, 0.7, 0.25)
+        from_zero = MetricComparison("solver_iterations", 0, 1, 0.1)
+
+        # Assert
+        self.assertFalse(within.is_regression)
+        self.assertFalse(within.is_improvement)
+        self.assertTrue(regression.is_regression)
+        self.assertTrue(improvement.is_improvement)
+        self.assertEqual(from_zero.ratio, math.inf)
+        self.assertTrue(from_zero.is_regression)
+        self.assertEqual(MetricComparison("time", 0, 0, 0.1).ratio, 1.0)
+
+    def test_get_case_name(self) -> None:
+        """Test that the name holds the case and the network settings."""
+        # Act
+        name = get_case_name(self.baseline)
+
+        # Assert
+        self.assertEqual(name, "run_day[radial-10-1-0-heat_pump]")
+
+    def test_compare_result_doubled_iterations(self) -> None:
+        """Test that doubled solver iterations are a regression, even when the time is equal."""
+        # Arrange
+        current = replace(self.baseline, solver_iterations=144)
+
+        # Act
+        comparison = compare_result(current, self.baseline)
+
+        # Assert
+        self.assertTrue(comparison.is_regression)
+        regressions = [metric.metric for metric in comparison.metrics if metric.is_regression]
+        self.assertEqual(regressions, ["solver_iterations"])
+        self.assertIn("REGRESSION", comparison.get_report())
+
+    def test_compare_result_normalised_time(self) -> None:
+        """Test that the times are normalised with the calibration time of the machines."""
+        # Arrange
+        current = replace(self.baseline, time=2.0)
+
+        # Act
+        slower_machine = compare_result(current, self.baseline, 0.2, 0.1)
+        same_machine = compare_result(current, self.baseline, 0.1, 0.1)
+
+        # Assert
+        self.assertEqual(slower_machine.metrics[0].metric, "normalised_time")
+        self.assertAlmostEqual(slower_machine.metrics[0].ratio, 1.0)
+        self.assertFalse(slower_machine.is_regression)
+        self.assertTrue(same_machine.is_regression)
+
+    def test_compare_result_short_time(self) -> None:
+        """Test that times below the minimum time are not compared."""
+        # Arrange
+        baseline = replace(self.baseline, time=0.001)
+        current = replace(self.baseline, time=0.004)
+
+        # Act
+        comparison = compare_result(current, baseline, tolerances=Tolerances(minimum_time=0.01))
+
+        # Assert
+        self.assertNotIn("time", [metric.metric for metric in comparison.metrics])
+        self.assertFalse(comparison.is_regression)
+
+    def test_calibrate(self) -> None:
+        """Test that the calibration benchmark returns a positive time."""
+        # Act
+        calibration_time = calibrate(repeats=1)
+
+        # Assert
+        self.assertGreater(calibration_time, 0.0)
+
+    def test_run_regression_gate(self) -> None:
+        """Test that the cases of a baseline are run again and compared with it."""
+        # Arrange
+        baseline = run_benchmark_case(SOLVE_CASE, NetworkGeneratorSettings(number_of_consumers=3))
+        baseline.solver_iterations = 1
+
+        # Act
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "baseline.json"
+            write_results([baseline], path)
+            comparisons = run_regression_gate(path, isolate=False, repeats=1)
+
+        # Assert
+        self.assertEqual(len(comparisons), 1)
+        self.assertEqual(comparisons[0].name, "solve[radial-3-1-0]")
+        self.assertTrue(comparisons[0].is_regression)
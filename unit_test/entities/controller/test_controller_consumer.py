@@ -90,3 +90,14 @@ class ConsumerControllerTest(unittest.TestCase):
         demand = self.consumer.get_heat_demand(datetime(2021, 3, 2, 0, 0))
         # Assert
         self.assertEqual(demand, 0)
+
+    def test_get_heat_demand_array(self):
+        """Test to get the heat demand of the consumer for the time steps of a simulation."""
+        # Arrange
+        self.consumer.max_power = 150.0
+
+        # Act
+        demand = self.consumer.get_heat_demand_array(datetime(2021, 1, 1, 0, 0), 3600.0, 3)
+
+        # Assert
+        self.assertEqual(demand.tolist(), [100.0, 150.0, 0.0])
@@ -0,0 +1,83 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Test controller heat transfer class."""
+import unittest
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PRIMARY,
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_TEMPERATURE_IN,
+    PROPERTY_TEMPERATURE_OUT,
+)
+from omotes_simulator_core.entities.assets.controller.controller_heat_transfer import (
+    SECONDARY_SET_BYPASS_TEMPERATURES,
+    ControllerHeatTransferAsset,
+    HeatTransferAssetType,
+)
+from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
+
+
+class ControllerHeatTransferAssetTest(unittest.TestCase):
+    """Testcase for ControllerHeatTransferAsset class."""
+
+    def setUp(self) -> None:
+        """Set up a heat pump."""
+        self.heat_pump = ControllerHeatTransferAsset(
+            name="heat_pump",
+            identifier="heat_pump_id",
+            factor=4.0,
+            heat_transfer_type=HeatTransferAssetType.HEAT_PUMP,
+            temperatures_primary=Temperatures(in_flow=283.15, out_flow=278.15),
+            temperatures_secondary=Temperatures(in_flow=313.15, out_flow=353.15),
+        )
+
+    def test_set_asset_sec_bypass(self) -> None:
+        """Test that both sides get the bypass temperatures when the heat pump is bypassed."""
+        # Act
+        setpoints = self.heat_pump.set_asset_sec(1000.0, bypass=True)["heat_pump_id"]
+
+        # Assert
+        self.assertEqual(setpoints[PRIMARY + PROPERTY_HEAT_DEMAND], 1000.0)
+        self.assertEqual(
+            setpoints[PRIMARY + PROPERTY_TEMPERATURE_OUT],
+            SECONDARY_SET_BYPASS_TEMPERATURES.out_flow,
+        )
+        self.assertEqual(
+            setpoints[PRIMARY + PROPERTY_TEMPERATURE_IN], SECONDARY_SET_BYPASS_TEMPERATURES.in_flow
+        )
+
+    def test_array_setpoints_equal_scalar_setpoints(self) -> None:
+        """Test that the setpoints per time step equal those of the scalar methods."""
+        # Arrange
+        heat_demand = np.array([1000.0, 2000.0])
+        bypass = np.array([False, True])
+
+        for scalar_method, array_method in [
+            (self.heat_pump.set_asset_prim, self.heat_pump.set_asset_prim_array),
+            (self.heat_pump.set_asset_sec, self.heat_pump.set_asset_sec_array),
+        ]:
+            with self.subTest(method=scalar_method.__name__):
+                # Act
+                setpoints = array_method(heat_demand, bypass)["heat_pump_id"]
+
+                # Assert
+                for index in range(len(heat_demand)):
+                    expected = scalar_method(float(heat_demand[index]), bool(bypass[index]))
+                    for key, value in expected["heat_pump_id"].items():
+                        self.assertEqual(
+                            np.broadcast_to(setpoints[key], heat_demand.shape)[index], value
+                        )
@@ -17,6 +17,8 @@ import datetime
 import unittest
 from unittest.mock import Mock
 
+import numpy as np
+
 from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_HEAT_DEMAND,
     PROPERTY_SET_PRESSURE,
@@ -62,15 +64,32 @@ class TestControllerNetwork(unittest.TestCase):
         self.assertEqual(self.controller_network.producers, self.producers)
         self.assertEqual(self.controller_network.storages, self.storages)
         self.assertEqual(self.controller_network.factor_to_first_network, [self.factor])
+        self.assertEqual(self.controller_network.conversion_factor, self.factor)
         self.assertEqual(self.controller_network.path, [])
 
+    def test_set_factor_to_first_network(self):
+        # arrange
+
+        # act
+        self.controller_network.factor_to_first_network = [1.0, 2.0, 0.25]
+
+        # assert
+        self.assertEqual(self.controller_network.factor_to_first_network, [1.0, 2.0, 0.25])
+        self.assertEqual(self.controller_network.conversion_factor, 0.5)
+
     def test_exists(self):
         # arrange
         consumer = Mock()
         consumer.id = "test_consumer"
-        self.controller_network.consumers.append(consumer)
+        controller_network = ControllerNetwork(
+            heat_transfer_assets_prim_in=[],
+            heat_transfer_assets_sec_in=[],
+            consumers_in=[consumer],
+            producers_in=[],
+            storages_in=[],
+        )
         # act
-        res = self.controller_network.exists("test_consumer")
+        res = controller_network.exists("test_consumer")
 
         # assert
         self.assertTrue(res)
@@ -320,3 +339,30 @@ class TestControllerNetwork(unittest.TestCase):
 
         # assert
         pass
+
+    def test_set_time_grid(self):
+        # arrange
+        start = datetime.datetime(2021, 1, 1)
+        consumer = Mock()
+        consumer.get_heat_demand_array = Mock(return_value=np.array([10.0, 20.0]))
+        consumer.get_heat_demand = Mock(return_value=5.0)
+        producer = Mock()
+        producer.get_max_power_array = Mock(return_value=np.array([30.0, 40.0]))
+        producer.get_max_power = Mock(return_value=50.0)
+        self.controller_network.consumers = [consumer, consumer]
+        self.controller_network.producers = [producer]
+        self.controller_network.factor_to_first_network = [1.0, 2.0]
+
+        # act
+        self.controller_network.set_time_grid(start, 3600.0, 2)
+        demand = self.controller_network.get_total_heat_demand(start + datetime.timedelta(hours=1))
+        supply = self.controller_network.get_total_supply(start)
+        demand_off_grid = self.controller_network.get_total_heat_demand(
+            start + datetime.timedelta(hours=2)
+        )
+
+        # assert
+        consumer.get_heat_demand_array.assert_called_with(start, 3600.0, 2)
+        self.assertEqual(demand, 80.0)
+        self.assertEqual(supply, 60.0)
+        self.assertEqual(demand_off_grid, 20.0)
@@ -13,6 +13,7 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """Test controller class."""
+import copy
 import datetime
 import unittest
 from unittest.mock import Mock
@@ -35,6 +36,7 @@ from omotes_simulator_core.entities.assets.controller.controller_storage import
     ControllerStorageAbstract,
 )
 from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 from omotes_simulator_core.entities.network_controller import NetworkController
 
 
@@ -107,6 +109,29 @@ class ControllerTest(unittest.TestCase):
         self.assertEqual(self.network2.factor_to_first_network, [1, 0.5])
         self.assertEqual(self.network3.factor_to_first_network, [1, 0.3333333333333333, 0.5])
 
+    def test_update_networks_factor_changed_factor(self):
+        # arrange
+        mock_heat_trans_asset1 = Mock()
+        mock_heat_trans_asset1.factor = 1
+        mock_heat_trans_asset2 = Mock()
+        mock_heat_trans_asset2.factor = 2
+        mock_heat_trans_asset3 = Mock()
+        mock_heat_trans_asset3.factor = 3
+        self.network1.heat_transfer_assets_prim = [mock_heat_trans_asset1]
+        self.network2.heat_transfer_assets_prim = [mock_heat_trans_asset2]
+        self.network3.heat_transfer_assets_prim = [mock_heat_trans_asset3]
+        self.controller.update_networks_factor()
+        factors_network2 = self.network2.factor_to_first_network
+        # act
+        self.controller.update_networks_factor()
+        factors_unchanged = self.network3.factor_to_first_network
+        mock_heat_trans_asset3.factor = 4
+        self.controller.update_networks_factor()
+        # assert
+        self.assertIs(self.network2.factor_to_first_network, factors_network2)
+        self.assertEqual(factors_unchanged, [1, 3, 2])
+        self.assertEqual(self.network3.factor_to_first_network, [1, 4, 2])
+
     def setup_update_set_points(self):
         """Helper method to set up the networks with assets.
 
@@ -583,3 +608,117 @@ class ControllerTest(unittest.TestCase):
         result = self.controller._get_total_supply_priority(2)
         # assert
         self.assertEqual(result, 50)
+
+    def test_precompute_setpoints(self):
+        # arrange
+        start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+        consumer = ControllerConsumer(
+            name="consumer",
+            identifier="consumer",
+            temperatures=Temperatures(in_flow=50, out_flow=40),
+            max_power=1000,
+            profile=pd.DataFrame(
+                {
+                    "date": pd.date_range(start, periods=3, freq="h"),
+                    "values": [30.0, 70.0, 200.0],
+                }
+            ),
+        )
+        producers = [
+            ControllerProducer(
+                name=f"producer{priority}",
+                identifier=f"producer{priority}",
+                temperatures=Temperatures(in_flow=40, out_flow=50),
+                power=50,
+                marginal_costs=1,
+                priority=priority,
+                profile=pd.DataFrame(),
+            )
+            for priority in (2, 1)
+        ]
+        network = ControllerNetwork(
+            heat_transfer_assets_prim_in=[],
+            heat_transfer_assets_sec_in=[],
+            consumers_in=[consumer],
+            producers_in=producers,
+            storages_in=[],
+        )
+        controller = NetworkController([network])
+        reference = copy.deepcopy(controller)
+        times = [start + datetime.timedelta(hours=hour) for hour in range(4)]
+
+        # act
+        horizon = controller.precompute_setpoints(start, 3600, 4)
+        result = [controller.update_setpoints(time) for time in times]
+
+        # assert
+        self.assertIsNotNone(horizon)
+        self.assertEqual(horizon.capped.tolist(), [False, False, True, False])
+        self.assertEqual(result[0]["producer1"][PROPERTY_HEAT_DEMAND], -30)
+        self.assertEqual(result[0]["producer2"][PROPERTY_HEAT_DEMAND], 0)
+        self.assertEqual(result[1]["producer2"][PROPERTY_HEAT_DEMAND], -20)
+        self.assertEqual(result[2]["consumer"][PROPERTY_HEAT_DEMAND], 100)
+        for time, setpoints in zip(times, result):
+            self.assertEqual(setpoints, reference.update_setpoints(time))
+
+    def test_update_setpoint_array(self):
+        # arrange
+        start = datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+        consumer = ControllerConsumer(
+            name="consumer",
+            identifier="consumer",
+            temperatures=Temperatures(in_flow=50, out_flow=40),
+            max_power=1000,
+            profile=pd.DataFrame(
+                {"date": pd.date_range(start, periods=2, freq="h"), "values": [30.0, 70.0]}
+            ),
+        )
+        producer = ControllerProducer(
+            name="producer",
+            identifier="producer",
+            temperatures=Temperatures(in_flow=40, out_flow=50),
+            power=100,
+            marginal_costs=1,
+            priority=1,
+            profile=pd.DataFrame(),
+        )
+        network = ControllerNetwork(
+            heat_transfer_assets_prim_in=[],
+            heat_transfer_assets_sec_in=[],
+            consumers_in=[consumer],
+            producers_in=[producer],
+            storages_in=[],
+        )
+        controller = NetworkController([network])
+        reference = copy.deepcopy(controller)
+        horizon = controller.precompute_setpoints(start, 3600, 2)
+        asset_ids = ["pipe", "producer", "consumer"]
+        setpoint_array = horizon.get_setpoint_array(asset_ids)
+        times = [start, start + datetime.timedelta(minutes=30), start + datetime.timedelta(hours=1)]
+
+        # act
+        result = [controller.update_setpoint_array(time, setpoint_array) for time in times]
+
+        # assert
+        self.assertIsInstance(result[0], SetpointArray)
+        self.assertIs(result[0].asset_ids, asset_ids)
+        self.assertEqual(result[0].get_set_ordinals().tolist(), [1, 2])
+        self.assertTrue(result[2].records.base is not None)
+        self.assertIsInstance(result[1], dict)
+        self.assertEqual(result[0].to_dict(), reference.update_setpoints(times[0]))
+        self.assertEqual(result[1], reference.update_setpoints(times[1]))
+        self.assertEqual(result[2].to_dict(), reference.update_setpoints(times[2]))
+
+    def test_precompute_setpoints_with_storage(self):
+        # arrange
+        for network in self.networks:
+            network.producers = []
+        self.network1.storages = [Mock(spec=ControllerStorageAbstract)]
+        start = datetime.datetime(2021, 1, 1)
+
+        # act
+        horizon = self.controller.precompute_setpoints(start, 3600, 2)
+
+        # assert
+        self.assertIsNone(horizon)
+        self.assertIsNone(self.controller.setpoint_horizon)
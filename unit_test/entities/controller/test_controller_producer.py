@@ -91,3 +91,17 @@ class ControllerProducerTest(unittest.TestCase):
         # Assert
         self.assertEqual(max_power_1, self.producer.power)
         self.assertEqual(max_power_2, self.values[0])
+
+    def test_get_max_power_array(self) -> None:
+        """Test to get the maximum power of the producer for the time steps of a simulation."""
+        # Arrange
+        start = datetime(2021, 1, 1, 0, 0, 0)
+
+        # Act
+        max_power = self.producer.get_max_power_array(start, 3600.0, 3)
+        self.producer.profile = pd.DataFrame()
+        max_power_no_profile = self.producer.get_max_power_array(start, 3600.0, 2)
+
+        # Assert
+        self.assertEqual(max_power.tolist(), [*self.values, self.producer.power])
+        self.assertEqual(max_power_no_profile.tolist(), [self.producer.power] * 2)
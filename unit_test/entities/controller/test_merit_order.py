@@ -0,0 +1,90 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test merit order class."""
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.entities.assets.controller.controller_producer import ControllerProducer
+from omotes_simulator_core.entities.assets.controller.merit_order import MeritOrder
+from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
+
+
+class MeritOrderTest(unittest.TestCase):
+    """Testcase for MeritOrder class."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.producers = [
+            ControllerProducer(
+                name=f"producer{index}",
+                identifier=f"producer{index}",
+                temperatures=Temperatures(in_flow=40, out_flow=50),
+                power=power,
+                marginal_costs=1,
+                priority=priority,
+                profile=pd.DataFrame(),
+            )
+            for index, (power, priority) in enumerate(
+                [(50, 2), (40, 3), (40, 1), (20, 3), (30, None)]
+            )
+        ]
+        self.merit_order = MeritOrder(self.producers)
+
+    def test_init(self):
+        """Test the priorities and capacities of the merit order."""
+        # Assert
+        self.assertEqual(self.merit_order.priorities.tolist(), [1, 2, 3])
+        self.assertEqual(self.merit_order.capacities.tolist(), [40.0, 50.0, 60.0])
+        self.assertEqual(self.merit_order.cumulative_capacities.tolist(), [40.0, 90.0, 150.0])
+        self.assertEqual(self.merit_order.producer_levels.tolist(), [1, 2, 0, 2, -1])
+
+    def test_get_factors(self):
+        """Test to allocate the required supply to the producers."""
+        # Act
+        factors = self.merit_order.get_factors(120.0)
+
+        # Assert
+        np.testing.assert_allclose(factors, [[1.0, 0.5, 1.0, 0.5, 0.0]])
+
+    def test_get_factors_time_steps(self):
+        """Test to allocate the required supply of multiple time steps at once."""
+        # Act
+        factors = self.merit_order.get_factors(np.array([0.0, 20.0, 40.0, 65.0, 200.0]))
+
+        # Assert
+        np.testing.assert_allclose(
+            factors,
+            [
+                [0.0, 0.0, 0.0, 0.0, 0.0],
+                [0.0, 0.0, 0.5, 0.0, 0.0],
+                [0.0, 0.0, 1.0, 0.0, 0.0],
+                [0.5, 0.0, 1.0, 0.0, 0.0],
+                [1.0, 1.0, 1.0, 1.0, 0.0],
+            ],
+        )
+
+    def test_get_factors_without_priorities(self):
+        """Test to allocate the required supply when no producer has a priority."""
+        # Arrange
+        merit_order = MeritOrder(self.producers[4:])
+
+        # Act
+        factors = merit_order.get_factors(np.array([0.0, 10.0]))
+
+        # Assert
+        np.testing.assert_array_equal(factors, [[0.0], [0.0]])
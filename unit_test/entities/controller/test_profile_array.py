@@ -0,0 +1,119 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test profile array class."""
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.entities.assets.controller.profile_array import ProfileArray
+
+
+class ProfileArrayTest(unittest.TestCase):
+    """Testcase for ProfileArray class."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.profile = pd.DataFrame(
+            {
+                "date": pd.date_range("2021-01-01", periods=4, freq="h", tz="UTC"),
+                "values": [10.0, 20.0, 30.0, 40.0],
+            }
+        ).set_index("date")
+
+    def test_get_value(self):
+        """Test to get the values at times on and off the grid of the profile."""
+        # Arrange
+        profile_array = ProfileArray.from_profile(self.profile)
+
+        # Act
+        on_grid = profile_array.get_value(datetime(2021, 1, 1, 2, tzinfo=timezone.utc), -1.0)
+        naive = profile_array.get_value(datetime(2021, 1, 1, 3), -1.0)
+        between = profile_array.get_value(datetime(2021, 1, 1, 2, 30), -1.0)
+        after = profile_array.get_value(datetime(2021, 1, 1, 4), -1.0)
+        before = profile_array.get_value(datetime(2020, 12, 31, 23), -1.0)
+
+        # Assert
+        self.assertEqual(profile_array.step, 3600 * 1_000_000)
+        self.assertEqual(on_grid, 30.0)
+        self.assertEqual(naive, 40.0)
+        self.assertEqual(between, -1.0)
+        self.assertEqual(after, -1.0)
+        self.assertEqual(before, -1.0)
+
+    def test_get_value_not_equidistant(self):
+        """Test to get the values of a profile that is not equidistant."""
+        # Arrange
+        profile = self.profile.drop(self.profile.index[1])
+        profile_array = ProfileArray.from_profile(profile)
+
+        # Act
+        values = [profile_array.get_value(datetime(2021, 1, 1, hour), -1.0) for hour in range(5)]
+
+        # Assert
+        self.assertEqual(profile_array.step, 0)
+        self.assertEqual(values, [10.0, -1.0, 30.0, 40.0, -1.0])
+
+    def test_get_value_empty_and_single(self):
+        """Test to get the values of an empty profile and a profile with a single value."""
+        # Arrange
+        empty = ProfileArray.from_profile(pd.DataFrame())
+        single = ProfileArray.from_profile(self.profile.iloc[:1])
+
+        # Act
+        empty_value = empty.get_value(datetime(2021, 1, 1), -1.0)
+        single_value = single.get_value(datetime(2021, 1, 1), -1.0)
+        single_missing = single.get_value(datetime(2021, 1, 1, 1), -1.0)
+
+        # Assert
+        self.assertEqual(len(empty), 0)
+        self.assertEqual(empty_value, -1.0)
+        self.assertEqual(single_value, 10.0)
+        self.assertEqual(single_missing, -1.0)
+
+    def test_sample(self):
+        """Test to sample the profile on a time grid with another start and timestep."""
+        # Arrange
+        profile_array = ProfileArray.from_profile(self.profile)
+        not_equidistant = ProfileArray.from_profile(self.profile.drop(self.profile.index[1]))
+
+        # Act
+        result = profile_array.sample(datetime(2020, 12, 31, 23), 1800.0, 8, default=0.0)
+        result_not_equidistant = not_equidistant.sample(
+            datetime(2020, 12, 31, 23), 1800.0, 8, default=0.0
+        )
+
+        # Assert
+        expected = [0.0, 0.0, 10.0, 0.0, 20.0, 0.0, 30.0, 0.0]
+        np.testing.assert_array_equal(result, expected)
+        expected[4] = 0.0
+        np.testing.assert_array_equal(result_not_equidistant, expected)
+
+    def test_from_grid(self):
+        """Test to look up values in a profile array created on a time grid."""
+        # Arrange
+        profile_array = ProfileArray.from_grid(
+            datetime(2021, 1, 1, tzinfo=timezone.utc), 900.0, np.arange(4.0)
+        )
+
+        # Act
+        index = profile_array.get_index(datetime(2021, 1, 1, 0, 45))
+        missing = profile_array.get_index(datetime(2021, 1, 1, 1))
+
+        # Assert
+        self.assertEqual(index, 3)
+        self.assertEqual(missing, -1)
@@ -217,9 +217,9 @@ class AirToWaterHeatPumpTest(unittest.TestCase):
         self.assertEqual(
             len(self.air_to_water_hp.outputs), len(self.air_to_water_hp.connected_ports)
         )
-        self.assertEqual(len(self.air_to_water_hp.outputs[0]), 1)
+        self.assertEqual(self.air_to_water_hp.outputs.number_of_time_steps, 1)
         self.assertEqual(
-            self.air_to_water_hp.outputs[0][0],
+            self.air_to_water_hp.outputs.get_values(0, 0),
             {
                 PROPERTY_TEMPERATURE: 333.15,
                 PROPERTY_MASSFLOW: -1e6,
@@ -24,8 +24,12 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
     DEFAULT_PRESSURE,
     DEFAULT_TEMPERATURE,
     DEFAULT_TEMPERATURE_DIFFERENCE,
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_TEMPERATURE_IN,
+    PROPERTY_TEMPERATURE_OUT,
 )
 from omotes_simulator_core.entities.assets.demand_cluster import DemandCluster
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 
 
 class TestDemandCluster(unittest.TestCase):
@@ -70,6 +74,48 @@ class TestDemandCluster(unittest.TestCase):
         self.assertEqual(demand_cluster.solver_asset.name, "demand_cluster")
         self.assertEqual(demand_cluster.output, [])
 
+    def test_set_setpoints_array(self):
+        """Evaluate setting the setpoints from a setpoint array."""
+        # Arrange
+        setpoints = {
+            PROPERTY_HEAT_DEMAND: 1e6,
+            PROPERTY_TEMPERATURE_IN: 353.15,
+            PROPERTY_TEMPERATURE_OUT: 313.15,
+        }
+        setpoint_array = SetpointArray.from_dict(
+            {"production_cluster_id": setpoints}, ["production_cluster_id"]
+        )
+        expected = DemandCluster(
+            asset_name="expected", asset_id="expected_id", port_ids=["test1", "test2"]
+        )
+        expected.set_setpoints(setpoints)
+
+        # Act
+        self.heat_demand.set_setpoints_array(setpoint_array, 0)
+
+        # Assert
+        self.assertEqual(self.heat_demand.thermal_power_allocation, 1e6)
+        self.assertEqual(self.heat_demand.temperature_in, 353.15)
+        self.assertEqual(self.heat_demand.temperature_out, 313.15)
+        self.assertEqual(
+            self.heat_demand.solver_asset.mass_flow_rate_set_point,  # type: ignore
+            expected.solver_asset.mass_flow_rate_set_point,  # type: ignore
+        )
+
+    def test_set_setpoints_array_missing_setpoint(self):
+        """Evaluate the error when a setpoint is missing in the setpoint array."""
+        # Arrange
+        setpoint_array = SetpointArray.from_dict(
+            {"production_cluster_id": {PROPERTY_HEAT_DEMAND: 1e6}}, ["production_cluster_id"]
+        )
+
+        # Act
+        with self.assertRaises(ValueError) as cm:
+            self.heat_demand.set_setpoints_array(setpoint_array, 0)
+
+        # Assert
+        self.assertIn("are missing", cm.exception.args[0])
+
     def test_get_actual_heat_supplied(self):
         """Evaluate the get_actual_heat_supplied method."""  # noqa: D202
 
@@ -15,11 +15,28 @@
 
 """Test Entitites."""
 import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pandas as pd
 
 from omotes_simulator_core.adapter.transforms.mappers import EsdlEnergySystemMapper
+from omotes_simulator_core.entities.assets.asset_abstract import AssetAbstract
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PROPERTY_PRESSURE,
+    PROPERTY_TEMPERATURE,
+)
+from omotes_simulator_core.entities.assets.pipe import Pipe
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 from omotes_simulator_core.entities.esdl_object import EsdlObject
 from omotes_simulator_core.entities.heat_network import HeatNetwork
+from omotes_simulator_core.entities.simulation_configuration import (
+    OutputSpecification,
+    SimulationConfiguration,
+)
 from omotes_simulator_core.infrastructure.utils import pyesdl_from_file
 
 
@@ -39,3 +56,162 @@ class HeatNetworkTest(unittest.TestCase):
         self.assertIsInstance(network, HeatNetwork)
         self.assertEqual(len(network.assets), 4)
         self.assertEqual(len(network.junctions), 4)
+
+    def test_gather_output(self) -> None:
+        """Test gathering the output of all assets with a time index."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=datetime(2019, 1, 1),
+            stop=datetime(2019, 1, 1, 2),
+        )
+        network.allocate_output(2)
+        network.store_output()
+        network.store_output()
+
+        # Act
+        result = network.gather_output(config)
+
+        # Assert
+        pipe = network.assets[0]
+        self.assertEqual(result.shape, (2, 46))
+        self.assertEqual(result.columns.names, ["asset", "port", "property"])
+        self.assertEqual(result.index[1], pd.Timestamp("2019-01-01 01:00", tz="UTC"))
+        np.testing.assert_array_equal(
+            result[pipe.asset_id, pipe.connected_ports[0], PROPERTY_PRESSURE],
+            pipe.outputs.get_array(0, PROPERTY_PRESSURE),
+        )
+
+    def test_gather_output_start_with_time_zone(self) -> None:
+        """Test that a start with a time zone is converted to UTC for the time index."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=datetime(2019, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+            stop=datetime(2019, 1, 1, 1, tzinfo=timezone(timedelta(hours=1))),
+        )
+        network.allocate_output(1)
+        network.store_output()
+
+        # Act
+        result = network.gather_output(config)
+
+        # Assert
+        self.assertEqual(result.index[0], pd.Timestamp("2018-12-31 23:00", tz="UTC"))
+        self.assertEqual(str(result.index.tz), "UTC")
+
+    def test_gather_output_with_output_specification(self) -> None:
+        """Test that only the specified assets, properties and time steps are recorded."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=datetime(2019, 1, 1),
+            stop=datetime(2019, 1, 1, 4),
+            output_specification=OutputSpecification(
+                asset_types=["Pipe"], properties=[PROPERTY_PRESSURE], time_step_interval=2
+            ),
+        )
+        network.set_output_specification(config.output_specification)
+        network.allocate_output(4)
+
+        # Act
+        with patch.object(AssetAbstract, "get_volume_flow_rate") as get_volume_flow_rate:
+            for _ in range(4):
+                network.store_output()
+            network.close_output()
+        result = network.gather_output(config)
+
+        # Assert
+        pipes = [asset for asset in network.assets if isinstance(asset, Pipe)]
+        get_volume_flow_rate.assert_not_called()
+        self.assertEqual(result.shape, (2, 2 * len(pipes)))
+        self.assertEqual(set(result.columns.get_level_values("property")), {PROPERTY_PRESSURE})
+        self.assertEqual(
+            set(result.columns.get_level_values("asset")), {pipe.asset_id for pipe in pipes}
+        )
+        self.assertEqual(result.index[1], pd.Timestamp("2019-01-01 02:00", tz="UTC"))
+
+    def test_store_output_mean_aggregation(self) -> None:
+        """Test that the time steps of an interval are aggregated to their mean."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+        pipe = network.assets[0]
+        network.set_output_specification(
+            OutputSpecification(
+                asset_ids=[pipe.asset_id],
+                properties=[PROPERTY_TEMPERATURE],
+                time_step_interval=2,
+                aggregation="mean",
+            )
+        )
+        network.allocate_output(3)
+
+        # Act
+        with patch.object(
+            pipe.solver_asset,
+            "get_temperature",
+            side_effect=[300.0, 300.0, 310.0, 310.0, 320.0, 320.0],
+        ):
+            for _ in range(3):
+                network.store_output()
+            network.close_output()
+
+        # Assert
+        np.testing.assert_array_equal(
+            pipe.outputs.get_array(0, PROPERTY_TEMPERATURE), np.array([305.0, 320.0])
+        )
+        self.assertEqual(network.assets[1].outputs.number_of_time_steps, 0)
+
+    def test_store_output_with_output_writer(self) -> None:
+        """Test that the output is passed to the output writer given to the constructor."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        output_writer = Mock()
+        output_writer.allocate.return_value = 1
+        network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity, output_writer)
+        network.allocate_output(1)
+        time = datetime(2019, 1, 1)
+
+        # Act
+        network.store_output(time)
+        network.close_output()
+
+        # Assert
+        self.assertIs(network.output_writer, output_writer)
+        output_writer.allocate.assert_called_once_with(1)
+        output_writer.store_time_step.assert_called_once_with(time, network.assets)
+        output_writer.close.assert_called_once_with(network.assets)
+
+    def test_run_time_step_setpoint_array_of_other_assets(self) -> None:
+        """Test that a setpoint array with asset ids of other assets is rejected."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+        asset_ids = network.get_asset_ids()
+        setpoint_array = SetpointArray(list(reversed(asset_ids)))
+
+        # Act
+        with self.assertRaises(ValueError):
+            network.run_time_step(datetime(2019, 1, 1), 3600, setpoint_array)
+
+        # Assert
+        self.assertIs(network.get_asset_ids(), asset_ids)
@@ -82,6 +82,25 @@ class EsdlObjectTest(unittest.TestCase):
         self.assertTrue(isinstance(asset_consumer, DemandCluster))
         self.assertTrue(isinstance(asset_pipe, Pipe))
 
+    def test_creation_of_esdl_asset_objects_in_bulk(self):
+        """Test for creation of objects from a list of esdl assets."""
+        # Arrange
+        esdl_assets = [
+            *self.esdl_object.get_all_assets_of_type("pipe"),
+            self.esdl_object.get_all_assets_of_type("producer")[0],
+        ]
+
+        # Act
+        assets = EsdlAssetMapper.to_entities(esdl_assets)
+
+        # Assert
+        self.assertEqual(
+            [asset.asset_id for asset in assets],
+            [esdl_asset.get_id() for esdl_asset in esdl_assets],
+        )
+        self.assertTrue(isinstance(assets[0], Pipe))
+        self.assertTrue(isinstance(assets[-1], ProductionCluster))
+
     def test_get_connected_assets(self):
         """Test for connection of two assets."""
         # Arrange
@@ -99,6 +118,34 @@ class EsdlObjectTest(unittest.TestCase):
         self.assertEqual(connected_assets1, test_list2)
         self.assertEqual(connected_assets2, test_list1)
 
+    def test_get_asset_by_id_shared_with_type_buckets(self):
+        """Test that the indexed asset is returned and shared with the type buckets."""
+        # Arrange
+        pipe = self.esdl_object.get_all_assets_of_type("pipe")[0]
+
+        # Act
+        asset = self.esdl_object.get_asset_by_id(pipe.get_id())
+
+        # Assert
+        self.assertIs(asset, pipe)
+        with self.assertRaises(KeyError):
+            self.esdl_object.get_asset_by_id("unknown_id")
+
+    def test_get_port_by_id(self):
+        """Test to get the asset and esdl port belonging to a port id."""
+        # Arrange
+        pipe = self.esdl_object.get_all_assets_of_type("pipe")[0]
+        port_id = pipe.get_port_ids()[1]
+
+        # Act
+        asset, esdl_port = self.esdl_object.get_port_by_id(port_id)
+
+        # Assert
+        self.assertIs(asset, pipe)
+        self.assertEqual(esdl_port.id, port_id)
+        with self.assertRaises(KeyError):
+            self.esdl_object.get_port_by_id("unknown_id")
+
     def test_get_name(self):
         """Test get_name method."""
         # Arrange
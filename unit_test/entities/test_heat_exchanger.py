@@ -15,6 +15,7 @@
 
 """Test HeatExchanger entities."""
 import unittest
+from unittest.mock import patch
 
 from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_HEAT_LOSS,
@@ -97,6 +98,29 @@ class HeatExchangerTest(unittest.TestCase):
         self.heat_exchanger.write_to_output()
 
         # Assert
-        self.assertEqual(self.heat_exchanger.outputs[1][-1][PROPERTY_HEAT_POWER_PRIMARY], 10.0)
-        self.assertEqual(self.heat_exchanger.outputs[1][-1][PROPERTY_HEAT_LOSS], 5.0)
-        self.assertEqual(self.heat_exchanger.outputs[0][-1][PROPERTY_HEAT_POWER_SECONDARY], 5.0)
+        self.assertEqual(
+            self.heat_exchanger.outputs.get_values(1)[PROPERTY_HEAT_POWER_PRIMARY], 10.0
+        )
+        self.assertEqual(self.heat_exchanger.outputs.get_values(1)[PROPERTY_HEAT_LOSS], 5.0)
+        self.assertEqual(
+            self.heat_exchanger.outputs.get_values(0)[PROPERTY_HEAT_POWER_SECONDARY], 5.0
+        )
+
+    def test_write_to_output_excluded_properties(self):
+        """Test that the heat powers are not computed when they are not recorded."""
+        # Arrange
+        self.heat_exchanger.outputs.recorded_properties = {PROPERTY_HEAT_POWER_SECONDARY}
+        self.heat_exchanger.write_standard_output()
+
+        # Act
+        with patch.object(
+            self.heat_exchanger.solver_asset, "get_heat_power_primary", create=True
+        ) as get_heat_power_primary:
+            self.heat_exchanger.write_to_output()
+
+        # Assert
+        get_heat_power_primary.assert_not_called()
+        self.assertEqual(self.heat_exchanger.outputs.get_values(1), {})
+        self.assertEqual(
+            self.heat_exchanger.outputs.get_values(0)[PROPERTY_HEAT_POWER_SECONDARY], 5.0
+        )
@@ -241,6 +241,8 @@ class HeatPumpTest(unittest.TestCase):
         self.heat_pump.write_to_output()
 
         # Assert
-        self.assertEqual(self.heat_pump.outputs[1][-1][PROPERTY_HEAT_POWER_PRIMARY], -10.0)
-        self.assertEqual(self.heat_pump.outputs[1][-1][PROPERTY_ELECTRICITY_CONSUMPTION], 5.0)
-        self.assertEqual(self.heat_pump.outputs[0][-1][PROPERTY_HEAT_POWER_SECONDARY], 5.0)
+        self.assertEqual(self.heat_pump.outputs.get_values(1)[PROPERTY_HEAT_POWER_PRIMARY], -10.0)
+        self.assertEqual(
+            self.heat_pump.outputs.get_values(1)[PROPERTY_ELECTRICITY_CONSUMPTION], 5.0
+        )
+        self.assertEqual(self.heat_pump.outputs.get_values(0)[PROPERTY_HEAT_POWER_SECONDARY], 5.0)
@@ -15,13 +15,18 @@
 
 """Test influxdb reader."""
 import unittest
+from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock
 
 import esdl
 from esdl.esdl_handler import EnergySystemHandler
 
-from omotes_simulator_core.entities.utility.influxdb_reader import get_data_from_profile, get_unit
+from omotes_simulator_core.entities.utility.influxdb_reader import (
+    get_data_from_profile,
+    get_profile_references,
+    get_unit,
+)
 
 
 class InfluxdbTest(unittest.TestCase):
@@ -62,3 +67,43 @@ class InfluxdbTest(unittest.TestCase):
         # Assert
         self.assertEqual(len(data), 24 * 365)
         self.assertAlmostEqual(data["values"][0], 360800.0, 5)
+
+    def test_get_data_from_time_series_profile(self) -> None:
+        """Test get_data_from_profile for a profile with the values in the esdl."""
+        # Arrange
+        profile = esdl.TimeSeriesProfile(
+            startDateTime=datetime(2019, 1, 1),
+            timestep=900,
+            values=[1.0, 2.0, 3.0],
+            profileQuantityAndUnit=esdl.QuantityAndUnitType(
+                physicalQuantity=esdl.PhysicalQuantityEnum.POWER,
+                unit=esdl.UnitEnum.WATT,
+                multiplier=esdl.MultiplierEnum.KILO,
+            ),
+        )
+
+        # Act
+        data = get_data_from_profile(profile)
+
+        # Assert
+        self.assertEqual(list(data["values"]), [1000.0, 2000.0, 3000.0])
+        self.assertEqual(str(data["date"][1]), "2019-01-01 00:15:00+00:00")
+
+    def test_get_profile_references(self) -> None:
+        """Test get_profile_references returns the references without loading the data."""
+        # Arrange
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        es = EnergySystemHandler()
+        es.load_file(esdl_file_path)
+        profiles = es.get_all_instances_of_type(esdl.InfluxDBProfile)
+
+        # Act
+        references = get_profile_references(es)
+
+        # Assert
+        self.assertEqual(len(references), len(profiles))
+        self.assertEqual([reference[0] for reference in references], sorted(p.id for p in profiles))
+        reference = next(reference for reference in references if reference[0] == profiles[0].id)
+        self.assertEqual(reference[1], str(profiles[0].host))
+        self.assertEqual(reference[5], str(profiles[0].field))
+        self.assertEqual(reference[9], str(profiles[0].multiplier))
@@ -0,0 +1,136 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test output store."""
+import unittest
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.output_store import OutputStore
+
+
+class OutputStoreTest(unittest.TestCase):
+    """Testcase for OutputStore class."""
+
+    def setUp(self) -> None:
+        """Set up an output store for an asset with two ports."""
+        self.output_store = OutputStore(number_of_ports=2, number_of_time_steps=3)
+
+    def test_write_values(self) -> None:
+        """Test that values are written to the last time step."""
+        # Arrange
+        self.output_store.add_time_step()
+        self.output_store.write_values(0, {"pressure": 1.0, "temperature": 2.0})
+        self.output_store.add_time_step()
+
+        # Act
+        self.output_store.write_values(0, {"pressure": 3.0})
+        self.output_store.write(1, "heat_loss", 4.0)
+
+        # Assert
+        self.assertEqual(self.output_store.number_of_time_steps, 2)
+        self.assertEqual(self.output_store.get_values(0, 0), {"pressure": 1.0, "temperature": 2.0})
+        self.assertEqual(self.output_store.get_values(0)["pressure"], 3.0)
+        self.assertTrue(np.isnan(self.output_store.get_values(0)["temperature"]))
+        np.testing.assert_array_equal(
+            self.output_store.get_array(1, "heat_loss"), np.array([np.nan, 4.0])
+        )
+
+    def test_write_without_time_step(self) -> None:
+        """Test that an error is raised when no time step is added."""
+        # Act
+        with self.assertRaises(IndexError):
+            self.output_store.write(0, "pressure", 1.0)
+
+    def test_get_array_is_view(self) -> None:
+        """Test that the array returned is a view on the store."""
+        # Arrange
+        self.output_store.add_time_step()
+        self.output_store.write(0, "pressure", 1.0)
+
+        # Act
+        array = self.output_store.get_array(0, "pressure")
+        self.output_store.write(0, "pressure", 5.0)
+
+        # Assert
+        self.assertEqual(array[0], 5.0)
+
+    def test_add_time_step_grows_store(self) -> None:
+        """Test that the store grows when more time steps are written than allocated."""
+        # Arrange
+        for time_step in range(10):
+            self.output_store.add_time_step()
+            self.output_store.write(1, "pressure", float(time_step))
+
+        # Act
+        array = self.output_store.get_array(1, "pressure")
+
+        # Assert
+        np.testing.assert_array_equal(array, np.arange(10.0))
+
+    def test_allocate_float32(self) -> None:
+        """Test that the store is cleared and uses the data type when allocated."""
+        # Arrange
+        self.output_store.add_time_step()
+        self.output_store.write(0, "pressure", 1.0)
+
+        # Act
+        self.output_store.allocate(5, dtype=np.float32)
+        self.output_store.add_time_step()
+        self.output_store.write(0, "temperature", 2.0)
+
+        # Assert
+        self.assertEqual(self.output_store.number_of_time_steps, 1)
+        self.assertEqual(self.output_store.get_properties(0), ["temperature"])
+        self.assertEqual(self.output_store.get_array(0, "temperature").dtype, np.float32)
+
+    def test_write_ignores_properties_not_recorded(self) -> None:
+        """Test that only the recorded properties are stored."""
+        # Arrange
+        self.output_store.recorded_properties = {"pressure"}
+        self.output_store.add_time_step()
+
+        # Act
+        self.output_store.write_values(0, {"pressure": 1.0, "temperature": 2.0})
+
+        # Assert
+        self.assertTrue(self.output_store.is_recorded("pressure"))
+        self.assertFalse(self.output_store.is_recorded("temperature"))
+        self.assertEqual(self.output_store.get_values(0), {"pressure": 1.0})
+
+    def test_aggregate_last(self) -> None:
+        """Test that the last time steps are replaced by their mean."""
+        # Arrange
+        for time_step in range(5):
+            self.output_store.add_time_step()
+            self.output_store.write(0, "pressure", float(time_step))
+
+        # Act
+        self.output_store.aggregate_last(3)
+
+        # Assert
+        self.assertEqual(self.output_store.number_of_time_steps, 3)
+        np.testing.assert_array_equal(
+            self.output_store.get_array(0, "pressure"), np.array([0.0, 1.0, 3.0])
+        )
+
+    def test_aggregate_last_too_many_time_steps(self) -> None:
+        """Test that an error is raised when more time steps are aggregated than stored."""
+        # Arrange
+        self.output_store.add_time_step()
+
+        # Act
+        with self.assertRaises(IndexError):
+            self.output_store.aggregate_last(2)
@@ -18,8 +18,10 @@ import unittest
 from unittest.mock import patch
 
 from omotes_simulator_core.entities.assets.asset_defaults import (
+    PROPERTY_HEAT_LOSS,
     PROPERTY_PRESSURE_LOSS,
     PROPERTY_PRESSURE_LOSS_PER_LENGTH,
+    PROPERTY_VELOCITY,
 )
 from omotes_simulator_core.entities.assets.pipe import Pipe
 
@@ -113,8 +115,28 @@ class PipeTest(unittest.TestCase):
             self.pipe.write_to_output()
 
         # assert
-        self.assertEqual(self.pipe.outputs[1][-1][PROPERTY_PRESSURE_LOSS], 10.0)
-        self.assertEqual(self.pipe.outputs[1][-1][PROPERTY_PRESSURE_LOSS_PER_LENGTH], 2.0)
+        self.assertEqual(self.pipe.outputs.get_values(1)[PROPERTY_PRESSURE_LOSS], 10.0)
+        self.assertEqual(self.pipe.outputs.get_values(1)[PROPERTY_PRESSURE_LOSS_PER_LENGTH], 2.0)
+
+    def test_write_to_output_excluded_properties(self):
+        """Test that the properties not recorded are not computed."""
+        # arrange
+        self.pipe.outputs.recorded_properties = {PROPERTY_HEAT_LOSS}
+        self.pipe.write_standard_output()
+
+        with (
+            patch.object(self.pipe.solver_asset, "get_pressure") as get_pressure,
+            patch.object(self.pipe, "get_velocity") as get_velocity,
+            patch.object(self.pipe, "get_heat_loss", return_value=5.0),
+        ):
+            # act
+            self.pipe.write_to_output()
+
+        # assert
+        get_pressure.assert_not_called()
+        get_velocity.assert_not_called()
+        self.assertEqual(self.pipe.outputs.get_values(1), {PROPERTY_HEAT_LOSS: 5.0})
+        self.assertNotIn(PROPERTY_VELOCITY, self.pipe.outputs.get_values(0))
 
     def test_get_heat_loss(self):
         """Test the get_heat_loss method."""
@@ -28,6 +28,7 @@ from omotes_simulator_core.entities.assets.asset_defaults import (
     PROPERTY_VOLUMEFLOW,
 )
 from omotes_simulator_core.entities.assets.production_cluster import ProductionCluster
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray
 from omotes_simulator_core.entities.assets.utils import heat_demand_and_temperature_to_mass_flow
 from omotes_simulator_core.solver.utils.fluid_properties import fluid_props
 
@@ -110,6 +111,52 @@ class ProductionClusterTest(unittest.TestCase):
             f"The setpoints {necessary_setpoints.difference(set(setpoints))} are missing.",
         )
 
+    def test_production_cluster_set_setpoints_array(self) -> None:
+        """Test setting setpoints of a production cluster from a setpoint array."""
+        # Arrange
+        setpoints = {
+            PROPERTY_HEAT_DEMAND: -1e6,
+            PROPERTY_TEMPERATURE_OUT: 353.15,
+            PROPERTY_TEMPERATURE_IN: 333.15,
+            PROPERTY_SET_PRESSURE: True,
+        }
+        setpoint_array = SetpointArray.from_dict(
+            {"production_cluster_id": setpoints}, ["pipe", "production_cluster_id"]
+        )
+        expected = ProductionCluster(
+            asset_name="expected", asset_id="expected_id", port_ids=["test1", "test2"]
+        )
+        expected.set_setpoints(setpoints=setpoints)
+
+        # Act
+        self.production_cluster.set_setpoints_array(setpoint_array, 1)
+
+        # Assert
+        self.assertEqual(self.production_cluster.temperature_out, 353.15)
+        self.assertEqual(self.production_cluster.temperature_in, 333.15)
+        self.assertEqual(
+            self.production_cluster.controlled_mass_flow, expected.controlled_mass_flow
+        )
+        self.assertIsInstance(self.production_cluster.controlled_mass_flow, float)
+        self.assertEqual(
+            self.production_cluster.solver_asset.pre_scribe_mass_flow,  # type: ignore
+            expected.solver_asset.pre_scribe_mass_flow,  # type: ignore
+        )
+
+    def test_production_cluster_set_setpoints_array_missing_setpoint(self) -> None:
+        """Test raise ValueError with missing setpoint in a setpoint array."""
+        # Arrange
+        setpoint_array = SetpointArray.from_dict(
+            {"production_cluster_id": {PROPERTY_HEAT_DEMAND: -1e6}}, ["production_cluster_id"]
+        )
+
+        # Act
+        with self.assertRaises(ValueError) as cm:
+            self.production_cluster.set_setpoints_array(setpoint_array, 0)
+
+        # Assert
+        self.assertIn("are missing", cm.exception.args[0])
+
     def test_production_cluster_set_setpoints_negative_mass_flow(self) -> None:
         """Test raise ValueError with negative mass flow."""
         # Arrange
@@ -216,9 +263,9 @@ class ProductionClusterTest(unittest.TestCase):
         self.assertEqual(
             len(self.production_cluster.outputs), len(self.production_cluster.connected_ports)
         )
-        self.assertEqual(len(self.production_cluster.outputs[0]), 1)
+        self.assertEqual(self.production_cluster.outputs.number_of_time_steps, 1)
         self.assertEqual(
-            self.production_cluster.outputs[0][0],
+            self.production_cluster.outputs.get_values(0, 0),
             {
                 PROPERTY_TEMPERATURE: 333.15,
                 PROPERTY_MASSFLOW: -1e6,
@@ -0,0 +1,112 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test setpoint array."""
+import unittest
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PRIMARY,
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_SET_PRESSURE,
+    PROPERTY_TEMPERATURE_IN,
+    PROPERTY_TEMPERATURE_OUT,
+)
+from omotes_simulator_core.entities.assets.setpoint_array import SetpointArray, get_field_mask
+
+
+class SetpointArrayTest(unittest.TestCase):
+    """Testcase for SetpointArray class."""
+
+    def setUp(self) -> None:
+        """Set up the setpoints of a producer and a consumer."""
+        self.asset_ids = ["pipe", "producer", "consumer"]
+        self.setpoints = {
+            "producer": {
+                PROPERTY_HEAT_DEMAND: -10.0,
+                PROPERTY_TEMPERATURE_IN: 313.15,
+                PROPERTY_TEMPERATURE_OUT: 353.15,
+                PROPERTY_SET_PRESSURE: True,
+            },
+            "consumer": {PROPERTY_HEAT_DEMAND: 10.0, PRIMARY + PROPERTY_SET_PRESSURE: False},
+        }
+
+    def test_from_dict(self) -> None:
+        """Test that the setpoints are stored in the typed fields."""
+        # Act
+        setpoint_array = SetpointArray.from_dict(self.setpoints, self.asset_ids)
+
+        # Assert
+        self.assertEqual(setpoint_array.records.shape, (3,))
+        self.assertEqual(setpoint_array.get_set_ordinals().tolist(), [1, 2])
+        self.assertEqual(setpoint_array.records[1][PROPERTY_HEAT_DEMAND], -10.0)
+        self.assertTrue(setpoint_array.records[1][PROPERTY_SET_PRESSURE])
+        self.assertEqual(setpoint_array.to_dict(), self.setpoints)
+        self.assertIsInstance(setpoint_array.get_setpoints(1)[PROPERTY_SET_PRESSURE], bool)
+        self.assertIsInstance(setpoint_array.get_setpoints(1)[PROPERTY_HEAT_DEMAND], float)
+
+    def test_from_dict_unknown(self) -> None:
+        """Test that an error is raised for unknown setpoints and assets."""
+        # Act
+        with self.assertRaises(ValueError):
+            SetpointArray.from_dict({"producer": {"unknown": 1.0}}, self.asset_ids)
+        with self.assertRaises(KeyError):
+            SetpointArray.from_dict({"unknown": {PROPERTY_HEAT_DEMAND: 1.0}}, self.asset_ids)
+
+    def test_invalid_asset_ids(self) -> None:
+        """Test that an error is raised for duplicate asset ids or ids not matching the records."""
+        # Act
+        with self.assertRaises(ValueError):
+            SetpointArray(["producer", "producer"])
+        with self.assertRaises(ValueError):
+            SetpointArray(self.asset_ids, records=SetpointArray(["producer"]).records)
+
+    def test_has_setpoints(self) -> None:
+        """Test to check if the setpoints of a mask are given."""
+        # Arrange
+        setpoint_array = SetpointArray.from_dict(self.setpoints, self.asset_ids)
+        mask = get_field_mask((PROPERTY_HEAT_DEMAND, PROPERTY_TEMPERATURE_IN))
+
+        # Act
+        producer = setpoint_array.has_setpoints(1, mask)
+        consumer = setpoint_array.has_setpoints(2, mask)
+
+        # Assert
+        self.assertTrue(producer)
+        self.assertFalse(consumer)
+
+    def test_get_time_step(self) -> None:
+        """Test that a time step of a multi time step array is a view on the records."""
+        # Arrange
+        setpoint_array = SetpointArray(self.asset_ids, number_of_time_steps=2)
+        setpoint_array.set_setpoints("consumer", {PROPERTY_HEAT_DEMAND: 5.0}, 1)
+
+        # Act
+        time_step = setpoint_array.get_time_step(1)
+        time_step.set_setpoints("producer", {PROPERTY_HEAT_DEMAND: -5.0})
+
+        # Assert
+        self.assertEqual(len(setpoint_array), 2)
+        self.assertEqual(
+            time_step.to_dict(),
+            {"producer": {PROPERTY_HEAT_DEMAND: -5.0}, "consumer": {PROPERTY_HEAT_DEMAND: 5.0}},
+        )
+        np.testing.assert_array_equal(
+            setpoint_array.records[1][PROPERTY_HEAT_DEMAND], np.array([0.0, -5.0, 5.0])
+        )
+        self.assertEqual(setpoint_array.get_time_step(0).to_dict(), {})
+        with self.assertRaises(ValueError):
+            time_step.get_time_step(0)
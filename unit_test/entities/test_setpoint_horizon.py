@@ -0,0 +1,139 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test setpoint horizon class."""
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_SET_PRESSURE,
+    PROPERTY_TEMPERATURE_IN,
+)
+from omotes_simulator_core.entities.assets.controller.controller_heat_transfer import (
+    ControllerHeatTransferAsset,
+    HeatTransferAssetType,
+)
+from omotes_simulator_core.entities.assets.controller.temperature_data import Temperatures
+from omotes_simulator_core.entities.setpoint_horizon import SetpointHorizon
+
+
+class SetpointHorizonTest(unittest.TestCase):
+    """Testcase for SetpointHorizon class."""
+
+    def setUp(self):
+        """Set up the test case."""
+        self.start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+        self.horizon = SetpointHorizon(self.start, 3600, 3)
+        self.horizon.heat_demand["producer"] = np.array([-10.0, -20.0, -30.0])
+        self.horizon.properties["producer"] = {
+            PROPERTY_TEMPERATURE_IN: 313.15,
+            PROPERTY_SET_PRESSURE: False,
+        }
+        self.horizon.pressure = [("producer", PROPERTY_SET_PRESSURE)]
+
+    def test_get_index(self):
+        """Test to get the index of the time steps of the horizon."""
+        # Arrange
+        self.horizon.valid[2] = False
+
+        # Act
+        index = self.horizon.get_index(self.start + timedelta(hours=1))
+        off_grid = self.horizon.get_index(self.start + timedelta(minutes=30))
+        not_valid = self.horizon.get_index(self.start + timedelta(hours=2))
+        after = self.horizon.get_index(self.start + timedelta(hours=3))
+
+        # Assert
+        self.assertEqual(index, 1)
+        self.assertEqual(off_grid, -1)
+        self.assertEqual(not_valid, -1)
+        self.assertEqual(after, -1)
+
+    def test_get_setpoints(self):
+        """Test to get the setpoints of a time step, including a heat transfer asset."""
+        # Arrange
+        asset = Mock()
+        asset.set_asset_prim = Mock(return_value={"heat_pump": {PROPERTY_HEAT_DEMAND: 1.0}})
+        self.horizon.heat_transfer = [(asset, True, np.array([1.0, -2.0, 3.0]))]
+
+        # Act
+        setpoints = self.horizon.get_setpoints(1)
+
+        # Assert
+        asset.set_asset_prim.assert_called_once_with(-2.0, False)
+        self.assertEqual(
+            setpoints,
+            {
+                "producer": {
+                    PROPERTY_HEAT_DEMAND: -20.0,
+                    PROPERTY_TEMPERATURE_IN: 313.15,
+                    PROPERTY_SET_PRESSURE: True,
+                },
+                "heat_pump": {PROPERTY_HEAT_DEMAND: 1.0},
+            },
+        )
+        self.assertFalse(self.horizon.properties["producer"][PROPERTY_SET_PRESSURE])
+
+    def test_get_setpoint_array(self):
+        """Test to get the setpoints of all time steps as a setpoint array."""
+        # Arrange
+        heat_pump = ControllerHeatTransferAsset(
+            name="heat_pump",
+            identifier="heat_pump",
+            factor=4.0,
+            heat_transfer_type=HeatTransferAssetType.HEAT_PUMP,
+            temperatures_primary=Temperatures(in_flow=303.15, out_flow=313.15),
+            temperatures_secondary=Temperatures(in_flow=343.15, out_flow=353.15),
+        )
+        heat_exchanger = ControllerHeatTransferAsset(
+            name="heat_exchanger",
+            identifier="heat_exchanger",
+            factor=0.9,
+            heat_transfer_type=HeatTransferAssetType.HEAT_EXCHANGER,
+            temperatures_primary=Temperatures(in_flow=323.15, out_flow=353.15),
+            temperatures_secondary=Temperatures(in_flow=313.15, out_flow=343.15),
+        )
+        self.horizon.heat_transfer = [
+            (heat_pump, True, np.array([1.0, -2.0, 3.0])),
+            (heat_exchanger, False, np.array([-4.0, 5.0, 6.0])),
+        ]
+        self.horizon.valid[2] = False
+        asset_ids = ["heat_pump", "consumer", "producer", "heat_exchanger"]
+
+        # Act
+        setpoint_array = self.horizon.get_setpoint_array(asset_ids)
+        second_call = self.horizon.get_setpoint_array(asset_ids)
+
+        # Assert
+        self.assertIs(second_call, setpoint_array)
+        self.assertEqual(len(setpoint_array), 3)
+        self.assertEqual(setpoint_array.get_time_step(2).get_set_ordinals().tolist(), [2])
+        for index in range(2):
+            self.assertEqual(
+                setpoint_array.get_time_step(index).to_dict(), self.horizon.get_setpoints(index)
+            )
+
+    def test_to_dataframe(self):
+        """Test to get the heat demand setpoints of all time steps as a DataFrame."""
+        # Act
+        result = self.horizon.to_dataframe()
+
+        # Assert
+        self.assertEqual(result.index[0], self.start)
+        self.assertEqual(result.index[2], self.start + timedelta(hours=2))
+        self.assertEqual(result["producer"].tolist(), [-10.0, -20.0, -30.0])
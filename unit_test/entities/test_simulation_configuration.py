@@ -0,0 +1,68 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test simulation configuration."""
+import unittest
+
+from omotes_simulator_core.entities.simulation_configuration import OutputSpecification
+
+
+class OutputSpecificationTest(unittest.TestCase):
+    """Testcase for OutputSpecification class."""
+
+    def test_is_asset_recorded_by_default(self) -> None:
+        """Test that all assets are recorded when no asset types and ids are given."""
+        # Arrange
+        output_specification = OutputSpecification()
+
+        # Act
+        is_recorded = output_specification.is_asset_recorded("Pipe", "pipe_1")
+
+        # Assert
+        self.assertTrue(is_recorded)
+
+    def test_is_asset_recorded_by_type_or_id(self) -> None:
+        """Test that an asset is recorded when its type or its id is specified."""
+        # Arrange
+        output_specification = OutputSpecification(asset_types=["Pipe"], asset_ids=["producer_1"])
+
+        # Act
+        is_recorded = [
+            output_specification.is_asset_recorded("Pipe", "pipe_1"),
+            output_specification.is_asset_recorded("ProductionCluster", "producer_1"),
+            output_specification.is_asset_recorded("ProductionCluster", "producer_2"),
+        ]
+
+        # Assert
+        self.assertEqual(is_recorded, [True, True, False])
+
+    def test_get_number_of_output_time_steps(self) -> None:
+        """Test that a last partial interval is counted as an output time step."""
+        # Arrange
+        output_specification = OutputSpecification(time_step_interval=4)
+
+        # Act
+        number_of_output_time_steps = output_specification.get_number_of_output_time_steps(10)
+
+        # Assert
+        self.assertEqual(number_of_output_time_steps, 3)
+
+    def test_invalid_specification(self) -> None:
+        """Test that an error is raised for an invalid interval or aggregation."""
+        # Act
+        with self.assertRaises(ValueError):
+            OutputSpecification(time_step_interval=0)
+        with self.assertRaises(ValueError):
+            OutputSpecification(aggregation="median")
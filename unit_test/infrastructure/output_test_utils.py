@@ -0,0 +1,125 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Helpers shared by the tests of the output writers."""
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import Mock
+
+from omotes_simulator_core.adapter.transforms.mappers import EsdlEnergySystemMapper
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_SET_PRESSURE,
+    PROPERTY_TEMPERATURE_IN,
+    PROPERTY_TEMPERATURE_OUT,
+)
+from omotes_simulator_core.entities.assets.demand_cluster import DemandCluster
+from omotes_simulator_core.entities.assets.output_store import OutputStore
+from omotes_simulator_core.entities.assets.production_cluster import ProductionCluster
+from omotes_simulator_core.entities.esdl_object import EsdlObject
+from omotes_simulator_core.entities.heat_network import HeatNetwork
+from omotes_simulator_core.infrastructure.output_writer_abstract import OutputWriterAbstract
+from omotes_simulator_core.infrastructure.utils import pyesdl_from_file
+
+ESDL_FILE_PATH = Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl"
+"""Esdl with a consumer, a producer and two pipes, used to run a network."""
+
+
+def create_asset(name: str, port_ids: list[str]) -> Mock:
+    """Create an asset with an output store, writing output like AssetAbstract.
+
+    :param str name: Name of the asset.
+    :param list[str] port_ids: Ids of the ports of the asset.
+    :return: Mock of the asset.
+    """
+    asset = Mock()
+    asset.name = name
+    asset.asset_id = f"{name}_id"
+    asset.outputs = OutputStore(number_of_ports=len(port_ids))
+    asset.allocate_output.side_effect = asset.outputs.allocate
+    asset.get_output_columns.side_effect = lambda: {
+        (port_id, property_name): values
+        for i, port_id in enumerate(port_ids)
+        for property_name, values in asset.outputs.get_port_arrays(i).items()
+    }
+    return asset
+
+
+def write_time_steps(
+    writer: OutputWriterAbstract,
+    assets: list[Mock],
+    start: datetime,
+    number_of_time_steps: int,
+    property_name: str = "pressure",
+) -> None:
+    """Write hourly output of the assets for a number of time steps to the writer.
+
+    The first port gets the time step as value of the property, the second port twice the time
+    step and a heat loss of 1.
+
+    :param OutputWriterAbstract writer: Writer to write the output to.
+    :param list[Mock] assets: Assets created with create_asset.
+    :param datetime start: Time of the first time step.
+    :param int number_of_time_steps: Number of time steps to write.
+    :param str property_name: Name of the property written to both ports.
+    """
+    for time_step in range(number_of_time_steps):
+        for asset in assets:
+            asset.outputs.add_time_step()
+            asset.outputs.write_values(0, {property_name: float(time_step)})
+            asset.outputs.write_values(1, {property_name: 2.0 * time_step, "heat_loss": 1.0})
+        writer.store_time_step(start + timedelta(hours=time_step), assets)
+
+
+def create_network(output_writer: OutputWriterAbstract | None = None) -> HeatNetwork:
+    """Create the heat network of the esdl with a consumer, a producer and two pipes.
+
+    :param OutputWriterAbstract output_writer: Writer passed to the network.
+    :return: The heat network.
+    """
+    esdl_object = EsdlObject(pyesdl_from_file(ESDL_FILE_PATH))
+    return HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity, output_writer=output_writer)
+
+
+def simulate_network(network: HeatNetwork, start: datetime, number_of_time_steps: int) -> None:
+    """Simulate hourly time steps of a network created with create_network.
+
+    The heat demand of the consumer increases every time step and is supplied by the producer.
+
+    :param HeatNetwork network: Network to simulate.
+    :param datetime start: Time of the first time step.
+    :param int number_of_time_steps: Number of time steps to simulate.
+    """
+    network.allocate_output(number_of_time_steps)
+    for time_step in range(number_of_time_steps):
+        time = start + timedelta(hours=time_step)
+        heat_demand = 1.0e5 * (time_step + 1)
+        setpoints: dict[str, dict] = {}
+        for asset in network.assets:
+            if isinstance(asset, DemandCluster):
+                setpoints[asset.asset_id] = {
+                    PROPERTY_HEAT_DEMAND: heat_demand,
+                    PROPERTY_TEMPERATURE_IN: 353.15,
+                    PROPERTY_TEMPERATURE_OUT: 313.15,
+                }
+            elif isinstance(asset, ProductionCluster):
+                setpoints[asset.asset_id] = {
+                    PROPERTY_HEAT_DEMAND: -heat_demand,
+                    PROPERTY_TEMPERATURE_IN: 313.15,
+                    PROPERTY_TEMPERATURE_OUT: 353.15,
+                    PROPERTY_SET_PRESSURE: True,
+                }
+        network.run_time_step(time, 3600.0, setpoints)
+        network.store_output(time)
+    network.close_output()
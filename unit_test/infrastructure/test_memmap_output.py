@@ -0,0 +1,135 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test memory mapped output writer and reader."""
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from omotes_simulator_core.entities.simulation_configuration import (
+    OutputSpecification,
+    SimulationConfiguration,
+)
+from omotes_simulator_core.infrastructure.memmap_output import (
+    MemmapOutputReader,
+    MemmapOutputWriter,
+)
+from unit_test.infrastructure.output_test_utils import (
+    create_asset,
+    create_network,
+    simulate_network,
+    write_time_steps,
+)
+
+
+class MemmapOutputTest(unittest.TestCase):
+    """Testcase for MemmapOutputWriter and MemmapOutputReader classes."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory and two assets."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.directory = Path(self.temp_dir.name) / "output"
+        self.assets = [create_asset("pipe", ["p1", "p2"]), create_asset("consumer", ["c1", "c2"])]
+        self.start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+    def create_writer(self, number_of_time_steps: int, chunk_size: int) -> MemmapOutputWriter:
+        """Create a writer allocated for a number of time steps.
+
+        :param int number_of_time_steps: Number of time steps the files are allocated for.
+        :param int chunk_size: Number of time steps written at once.
+        :return: The memory mapped output writer.
+        """
+        writer = MemmapOutputWriter(self.directory, chunk_size=chunk_size)
+        writer.allocate(number_of_time_steps)
+        return writer
+
+    def test_write_and_read(self) -> None:
+        """Test that the output is written in chunks and read back in the result format."""
+        # Arrange
+        writer = self.create_writer(10, chunk_size=4)
+        write_time_steps(writer, self.assets, self.start, 10)
+        writer.close(self.assets)
+
+        # Act
+        result = MemmapOutputReader(self.directory).read()
+
+        # Assert
+        self.assertEqual(result.shape, (10, 6))
+        self.assertEqual(result.columns.names, ["asset", "port", "property"])
+        self.assertEqual(result.index[1], self.start + timedelta(hours=1))
+        np.testing.assert_array_equal(result["pipe_id", "p2", "pressure"], 2.0 * np.arange(10))
+        np.testing.assert_array_equal(result["consumer_id", "c2", "heat_loss"], np.ones(10))
+
+    def test_get_block_while_writing(self) -> None:
+        """Test that the chunks written can be read as a read only block during the simulation."""
+        # Arrange
+        writer = self.create_writer(10, chunk_size=4)
+        self.addCleanup(writer.close)
+        write_time_steps(writer, self.assets, self.start, 6)
+        reader = MemmapOutputReader(self.directory)
+
+        # Act
+        block = reader.get_block("pressure")
+
+        # Assert
+        self.assertEqual(reader.properties, ["pressure", "heat_loss"])
+        self.assertEqual(block.shape, (4, 4))
+        self.assertEqual(block.columns.names, ["asset", "port"])
+        self.assertFalse(block.to_numpy().flags.writeable)
+        np.testing.assert_array_equal(block["consumer_id", "c1"], np.arange(4.0))
+
+    def test_write_more_time_steps_than_allocated(self) -> None:
+        """Test that an error is raised when more time steps are written than allocated."""
+        # Arrange
+        writer = self.create_writer(3, chunk_size=2)
+
+        # Act
+        with self.assertRaises(ValueError):
+            write_time_steps(writer, self.assets, self.start, 4)
+
+    def test_write_network_output(self) -> None:
+        """Test that the files are sized by the network and hold the output gathered in memory."""
+        # Arrange
+        output_specification = OutputSpecification(time_step_interval=2, aggregation="mean")
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=self.start,
+            stop=self.start + timedelta(hours=5),
+            output_specification=output_specification,
+        )
+        writer = MemmapOutputWriter(self.directory, chunk_size=2)
+        network = create_network(output_writer=writer)
+        network.set_output_specification(output_specification)
+        expected_network = create_network()
+        expected_network.set_output_specification(output_specification)
+        simulate_network(expected_network, self.start, 5)
+
+        # Act
+        simulate_network(network, self.start, 5)
+        result = MemmapOutputReader(self.directory).read()
+
+        # Assert
+        expected = expected_network.gather_output(config)
+        self.assertEqual(writer.number_of_time_steps, 3)
+        self.assertEqual(set(result.columns), set(expected.columns))
+        pd.testing.assert_frame_equal(result[expected.columns], expected, check_freq=False)
@@ -0,0 +1,227 @@
+#  Copyright (c) 2024. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test network build cache."""
+import tempfile
+import threading
+import unittest
+import uuid
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from omotes_simulator_core.adapter.transforms.mappers import EsdlEnergySystemMapper
+from omotes_simulator_core.entities.esdl_object import EsdlObject
+from omotes_simulator_core.entities.heat_network import HeatNetwork
+from omotes_simulator_core.entities.network_controller import NetworkController
+from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+from omotes_simulator_core.infrastructure.network_build_cache import NetworkBuildCache
+from omotes_simulator_core.infrastructure.simulation_manager import SimulationManager
+from omotes_simulator_core.infrastructure.utils import pyesdl_from_file
+
+
+class NetworkBuildCacheTest(unittest.TestCase):
+    """Test class for the NetworkBuildCache."""
+
+    def setUp(self) -> None:
+        """Set up the esdl object, configuration and cache directory."""
+        esdl_file_path = (
+            Path(__file__).parent / ".." / ".." / "testdata" / "heat_transfers_test.esdl"
+        )
+        self.esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        self.config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=datetime.strptime("2019-01-01T00:00:00", "%Y-%m-%dT%H:%M:%S"),
+            stop=datetime.strptime("2019-01-01T01:00:00", "%Y-%m-%dT%H:%M:%S"),
+        )
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = NetworkBuildCache(self.temp_dir.name)
+        self.esdl_string = self.esdl_object.energy_system_handler.to_string()
+
+    def tearDown(self) -> None:
+        """Remove the cache directory."""
+        self.temp_dir.cleanup()
+
+    def test_get_key(self) -> None:
+        """Test that the key only depends on the esdl and the build related configuration."""
+        # Arrange
+        other_window = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="other run",
+            timestep=3600,
+            start=datetime.strptime("2020-01-01T00:00:00", "%Y-%m-%dT%H:%M:%S"),
+            stop=datetime.strptime("2020-02-01T00:00:00", "%Y-%m-%dT%H:%M:%S"),
+        )
+        other_timestep = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=900,
+            start=self.config.start,
+            stop=self.config.stop,
+        )
+
+        # Act
+        key = self.cache.get_key(self.esdl_string, self.config)
+
+        # Assert
+        self.assertEqual(key, self.cache.get_key(self.esdl_string, other_window))
+        self.assertNotEqual(key, self.cache.get_key(self.esdl_string, other_timestep))
+        self.assertNotEqual(key, self.cache.get_key(self.esdl_string + " ", self.config))
+
+    def test_store_and_load(self) -> None:
+        """Test that a stored network and controller are loaded again."""
+        # Arrange
+        network = HeatNetwork(EsdlEnergySystemMapper(self.esdl_object).to_entity)
+        controller = NetworkController(networks=[])
+        key = self.cache.get_key(self.esdl_string, self.config)
+
+        # Act
+        self.cache.store(key, network, controller)
+        loaded = self.cache.load(key)
+
+        # Assert
+        if loaded is None:
+            self.fail("Network and controller are not loaded from the cache.")
+        loaded_network, loaded_controller = loaded
+        self.assertTrue(self.cache.get_path(key).is_file())
+        self.assertIsInstance(loaded_network, HeatNetwork)
+        self.assertIsInstance(loaded_controller, NetworkController)
+        self.assertEqual(
+            [asset.asset_id for asset in loaded_network.assets],
+            [asset.asset_id for asset in network.assets],
+        )
+        self.assertEqual(list(loaded_network.network.nodes), list(network.network.nodes))
+        self.assertEqual(
+            [asset.matrix_index for asset in loaded_network.network.assets.values()],
+            [asset.matrix_index for asset in network.network.assets.values()],
+        )
+
+    def test_store_without_output_writer(self) -> None:
+        """Test that the output writer of a network is not stored in the cache."""
+        # Arrange
+        network = HeatNetwork(
+            EsdlEnergySystemMapper(self.esdl_object).to_entity, output_writer=Mock()
+        )
+        key = self.cache.get_key(self.esdl_string, self.config)
+
+        # Act
+        self.cache.store(key, network, NetworkController(networks=[]))
+        loaded = self.cache.load(key)
+
+        # Assert
+        if loaded is None:
+            self.fail("Network and controller are not loaded from the cache.")
+        self.assertIsNone(loaded[0].output_writer)
+        self.assertIsNotNone(network.output_writer)
+
+    def test_load_missing(self) -> None:
+        """Test that None is returned when the key is not in the cache."""
+        # Act
+        result = self.cache.load("missing")
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_load_corrupt_file(self) -> None:
+        """Test that None is returned when the cache file cannot be read."""
+        # Arrange
+        self.cache.get_path("corrupt").write_bytes(b"not a cache file")
+
+        # Act
+        result = self.cache.load("corrupt")
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test_store_not_picklable(self) -> None:
+        """Test that nothing is stored when the network cannot be pickled."""
+        # Arrange
+        network = Mock()
+        network.lock = threading.Lock()
+
+        # Act
+        self.cache.store("key", network, NetworkController(networks=[]))
+
+        # Assert
+        self.assertFalse(self.cache.get_path("key").exists())
+        self.assertEqual(list(Path(self.temp_dir.name).iterdir()), [])
+
+    def test_get_key_profiles(self) -> None:
+        """Test that the key changes when the reference to the data of a profile changes."""
+        # Arrange
+        reference = ("profile", "host", "8086", "db", "measurement", "field", "", "2019", "2020")
+        changed_reference = reference[:-1] + ("2021",)
+
+        # Act
+        key = self.cache.get_key(self.esdl_string, self.config, [reference])
+
+        # Assert
+        self.assertNotEqual(key, self.cache.get_key(self.esdl_string, self.config))
+        self.assertEqual(key, self.cache.get_key(self.esdl_string, self.config, [reference]))
+        self.assertNotEqual(
+            key, self.cache.get_key(self.esdl_string, self.config, [changed_reference])
+        )
+
+    def test_get_key_pipe_catalog(self) -> None:
+        """Test that the key changes when the content of the pipe catalog file changes."""
+        # Arrange
+        catalog_file = Path(self.temp_dir.name) / "pipe_catalog.json"
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=self.config.start,
+            stop=self.config.stop,
+            pipe_catalog_file=str(catalog_file),
+        )
+
+        # Act
+        key_without_file = self.cache.get_key(self.esdl_string, config)
+        catalog_file.write_text('{"S1": {"100": 0.1071}}')
+        key = self.cache.get_key(self.esdl_string, config)
+        catalog_file.write_text('{"S1": {"100": 0.1071, "150": 0.1603}}')
+        changed_key = self.cache.get_key(self.esdl_string, config)
+
+        # Assert
+        self.assertEqual(key_without_file, self.cache.get_key(self.esdl_string, self.config))
+        self.assertNotEqual(key, key_without_file)
+        self.assertNotEqual(key, changed_key)
+
+    def test_simulation_manager_uses_cache(self) -> None:
+        """Test that the simulation manager only builds the network when it is not cached."""
+        # Arrange
+        network = HeatNetwork(EsdlEnergySystemMapper(self.esdl_object).to_entity)
+        controller = NetworkController(networks=[])
+        app = SimulationManager(self.esdl_object, self.config, build_cache=self.cache)
+
+        # Act
+        with patch.object(
+            SimulationManager,
+            "_build_network_and_controller",
+            return_value=(network, controller),
+        ) as mock_build, patch(
+            "omotes_simulator_core.entities.utility.influxdb_reader.InfluxDBProfileManager"
+        ) as mock_profile_manager:
+            first_network, _ = app._get_network_and_controller()
+            second_network, _ = app._get_network_and_controller()
+
+        # Assert
+        mock_build.assert_called_once()
+        mock_profile_manager.assert_not_called()
+        self.assertIs(first_network, network)
+        self.assertIsNot(second_network, network)
+        self.assertIsInstance(second_network, HeatNetwork)
@@ -0,0 +1,166 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test output aggregator."""
+import unittest
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.asset_defaults import (
+    PROPERTY_HEAT_DEMAND,
+    PROPERTY_HEAT_DEMAND_SET_POINT,
+)
+from omotes_simulator_core.infrastructure.output_aggregator import OutputAggregator
+from unit_test.infrastructure.output_test_utils import (
+    create_asset,
+    create_network,
+    simulate_network,
+    write_time_steps,
+)
+
+
+class OutputAggregatorTest(unittest.TestCase):
+    """Testcase for OutputAggregator class."""
+
+    def setUp(self) -> None:
+        """Set up two assets."""
+        self.assets = [create_asset("pipe", ["p1", "p2"]), create_asset("consumer", ["c1", "c2"])]
+        self.start = datetime(2019, 1, 31, 20, tzinfo=timezone.utc)
+
+    def simulate(self, aggregator: OutputAggregator, number_of_time_steps: int) -> None:
+        """Write output of the assets for a number of time steps to the aggregator and close it.
+
+        :param OutputAggregator aggregator: Aggregator to write the output to.
+        :param int number_of_time_steps: Number of time steps to write.
+        """
+        write_time_steps(
+            aggregator, self.assets, self.start, number_of_time_steps, property_name="temperature"
+        )
+        aggregator.close(self.assets)
+
+    def test_get_summary(self) -> None:
+        """Test that the statistics of the whole simulation are accumulated over the chunks."""
+        # Arrange
+        aggregator = OutputAggregator(3600.0, thresholds={"temperature": 6.0}, chunk_size=3)
+        self.simulate(aggregator, 10)
+
+        # Act
+        summary = aggregator.get_summary()
+
+        # Assert
+        self.assertEqual(summary.shape, (6, 8))
+        self.assertEqual(summary.index.names, ["asset", "port", "property"])
+        row = summary.loc[("pipe_id", "p2", "temperature")]
+        self.assertEqual(row["count"], 10)
+        self.assertEqual(row["sum"], 90.0)
+        self.assertEqual(row["mean"], 9.0)
+        self.assertEqual(row["min"], 0.0)
+        self.assertEqual(row["max"], 18.0)
+        self.assertEqual(row["integral"], 90.0 * 3600.0)
+        self.assertEqual(row["time_above_threshold"], 6 * 3600.0)
+        self.assertTrue(
+            np.isnan(summary.loc[("pipe_id", "p2", "heat_loss"), "time_above_threshold"])
+        )
+        self.assertEqual(self.assets[0].outputs.number_of_time_steps, 0)
+
+    def test_get_summary_per_period(self) -> None:
+        """Test that the statistics are accumulated per calendar period."""
+        # Arrange
+        aggregator = OutputAggregator(3600.0, period="M", chunk_size=3)
+        self.simulate(aggregator, 10)
+
+        # Act
+        summary = aggregator.get_summary()
+
+        # Assert
+        self.assertEqual(summary.index.names, ["period", "asset", "port", "property"])
+        self.assertEqual(list(summary.index.unique("period")), ["2019-01", "2019-02"])
+        self.assertEqual(summary.loc[("2019-01", "consumer_id", "c1", "temperature"), "max"], 3.0)
+        self.assertEqual(summary.loc[("2019-02", "consumer_id", "c1", "temperature"), "min"], 4.0)
+
+    def test_get_histograms(self) -> None:
+        """Test that the values are counted per bin, including the right edge of the last bin."""
+        # Arrange
+        aggregator = OutputAggregator(
+            3600.0, histogram_bins={"temperature": [0.0, 5.0, 10.0]}, chunk_size=4
+        )
+        self.simulate(aggregator, 10)
+
+        # Act
+        histograms = aggregator.get_histograms()
+
+        # Assert
+        histogram = histograms["temperature"]
+        self.assertEqual(histogram.shape, (4, 2))
+        np.testing.assert_array_equal(histogram.loc[("pipe_id", "p1", "temperature")], [5, 5])
+        np.testing.assert_array_equal(histogram.loc[("pipe_id", "p2", "temperature")], [3, 3])
+
+    def test_invalid_histogram_bins(self) -> None:
+        """Test that an error is raised when the bin edges are not increasing."""
+        # Act
+        with self.assertRaises(ValueError):
+            OutputAggregator(3600.0, histogram_bins={"temperature": [10.0, 0.0]})
+
+    def test_unmet_demand_hours(self) -> None:
+        """Test that the hours are counted in which the heat delivered is below the set point."""
+        # Arrange
+        consumer = create_asset("consumer", ["c1", "c2"])
+        aggregator = OutputAggregator(1800.0, chunk_size=3)
+        heat_delivered = [1.0e5, 0.9e5, 1.0e5, 0.5e5, 0.9995e5]
+
+        # Act
+        for time_step, heat in enumerate(heat_delivered):
+            consumer.outputs.add_time_step()
+            consumer.outputs.write_values(
+                1, {PROPERTY_HEAT_DEMAND: heat, PROPERTY_HEAT_DEMAND_SET_POINT: -1.0e5}
+            )
+            aggregator.store_time_step(self.start + timedelta(minutes=30 * time_step), [consumer])
+        aggregator.close([consumer])
+        summary = aggregator.get_summary()
+
+        # Assert
+        self.assertEqual(
+            summary.loc[("consumer_id", "c2", PROPERTY_HEAT_DEMAND), "unmet_demand_hours"], 1.0
+        )
+        self.assertTrue(
+            np.isnan(
+                summary.loc[
+                    ("consumer_id", "c2", PROPERTY_HEAT_DEMAND_SET_POINT), "unmet_demand_hours"
+                ]
+            )
+        )
+
+    def test_aggregate_network_output(self) -> None:
+        """Test that the statistics of a network equal those of the output gathered in memory."""
+        # Arrange
+        aggregator = OutputAggregator(3600.0, chunk_size=2)
+        network = create_network(output_writer=aggregator)
+        expected_network = create_network()
+        simulate_network(expected_network, self.start, 5)
+
+        # Act
+        simulate_network(network, self.start, 5)
+        summary = aggregator.get_summary()
+
+        # Assert
+        expected = expected_network.gather_output()
+        self.assertEqual(list(summary.index), list(expected.columns))
+        np.testing.assert_array_equal(summary["count"], expected.count())
+        np.testing.assert_allclose(summary["sum"], expected.sum(), rtol=1e-12)
+        np.testing.assert_array_equal(summary["min"], expected.min())
+        np.testing.assert_array_equal(summary["max"], expected.max())
+        demand = summary.xs(PROPERTY_HEAT_DEMAND, level="property")["unmet_demand_hours"]
+        self.assertEqual(list(demand), [0.0])
@@ -0,0 +1,196 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test streaming output writer and reader."""
+import importlib.util
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+
+from omotes_simulator_core.infrastructure.output_writer import (
+    ARROW_FORMAT,
+    LONG_LAYOUT,
+    PARQUET_FORMAT,
+    WIDE_LAYOUT,
+    StreamingOutputReader,
+    StreamingOutputWriter,
+)
+from unit_test.infrastructure.output_test_utils import (
+    create_asset,
+    create_network,
+    simulate_network,
+    write_time_steps,
+)
+
+
+@unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+class StreamingOutputWriterTest(unittest.TestCase):
+    """Testcase for StreamingOutputWriter and StreamingOutputReader classes."""
+
+    def setUp(self) -> None:
+        """Set up a temporary directory and two assets."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.assets = [create_asset("pipe", ["p1", "p2"]), create_asset("consumer", ["c1", "c2"])]
+        self.start = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+    def simulate(self, writer: StreamingOutputWriter, number_of_time_steps: int) -> None:
+        """Write output of the assets for a number of time steps to the writer and close it.
+
+        :param StreamingOutputWriter writer: Writer to write the output to.
+        :param int number_of_time_steps: Number of time steps to write.
+        """
+        write_time_steps(writer, self.assets, self.start, number_of_time_steps)
+        writer.close(self.assets)
+
+    def test_write_and_read(self) -> None:
+        """Test that the output is written in chunks and read back for each format and layout."""
+        for file_format in [PARQUET_FORMAT, ARROW_FORMAT]:
+            for layout in [WIDE_LAYOUT, LONG_LAYOUT]:
+                with self.subTest(file_format=file_format, layout=layout):
+                    # Arrange
+                    path = Path(self.temp_dir.name) / f"output_{layout}.{file_format}"
+                    writer = StreamingOutputWriter(
+                        path, file_format=file_format, layout=layout, chunk_size=4
+                    )
+                    self.simulate(writer, 10)
+
+                    # Act
+                    result = StreamingOutputReader(path).read()
+
+                    # Assert
+                    self.assertEqual(writer.number_of_time_steps_written, 10)
+                    self.assertEqual(result.shape, (10, 6))
+                    self.assertEqual(result.columns.names, ["asset", "port", "property"])
+                    self.assertEqual(result.index[1], self.start + timedelta(hours=1))
+                    np.testing.assert_array_equal(
+                        result["pipe_id", "p2", "pressure"], 2.0 * np.arange(10)
+                    )
+                    np.testing.assert_array_equal(
+                        result["consumer_id", "c2", "heat_loss"], np.ones(10)
+                    )
+
+    def test_output_store_cleared_after_chunk(self) -> None:
+        """Test that the output stores of the assets are cleared when a chunk is written."""
+        # Arrange
+        path = Path(self.temp_dir.name) / "output.parquet"
+        writer = StreamingOutputWriter(path, chunk_size=4)
+
+        # Act
+        for time_step in range(5):
+            for asset in self.assets:
+                asset.outputs.add_time_step()
+                asset.outputs.write(0, "pressure", float(time_step))
+            writer.store_time_step(self.start + timedelta(hours=time_step), self.assets)
+
+        # Assert
+        self.assertEqual(writer.number_of_time_steps_written, 4)
+        self.assertEqual(self.assets[0].outputs.number_of_time_steps, 1)
+        writer.close()
+
+    def test_read_selected_columns(self) -> None:
+        """Test that only the selected outputs are read."""
+        # Arrange
+        path = Path(self.temp_dir.name) / "output.arrow"
+        writer = StreamingOutputWriter(path, file_format=ARROW_FORMAT, chunk_size=3)
+        self.simulate(writer, 7)
+        reader = StreamingOutputReader(path)
+
+        # Act
+        chunks = list(reader.iter_chunks(columns=[("consumer_id", "c1", "pressure")]))
+
+        # Assert
+        self.assertEqual(len(reader.columns), 6)
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 3, 1])
+        self.assertEqual(list(chunks[0].columns), [("consumer_id", "c1", "pressure")])
+
+    def test_read_selected_columns_long_layout(self) -> None:
+        """Test that only the rows of the selected outputs are read in the long layout."""
+        for file_format in [PARQUET_FORMAT, ARROW_FORMAT]:
+            with self.subTest(file_format=file_format):
+                # Arrange
+                path = Path(self.temp_dir.name) / f"output_long.{file_format}"
+                writer = StreamingOutputWriter(
+                    path, file_format=file_format, layout=LONG_LAYOUT, chunk_size=3
+                )
+                self.simulate(writer, 7)
+                reader = StreamingOutputReader(path)
+                columns: list[tuple[str, ...]] = [
+                    ("consumer_id", "c1", "pressure"),
+                    ("pipe_id", "p2", "heat_loss"),
+                ]
+
+                # Act
+                with patch.object(
+                    reader, "_long_to_frame", wraps=reader._long_to_frame
+                ) as long_to_frame:
+                    result = reader.read(columns=columns)
+
+                # Assert
+                self.assertEqual(list(result.columns), columns)
+                np.testing.assert_array_equal(result["consumer_id", "c1", "pressure"], np.arange(7))
+                np.testing.assert_array_equal(result["pipe_id", "p2", "heat_loss"], np.ones(7))
+                frames = [call.args[0] for call in long_to_frame.call_args_list]
+                self.assertEqual([len(frame) for frame in frames], [6, 6, 2])
+
+    def test_invalid_layout(self) -> None:
+        """Test that an error is raised for an unknown layout."""
+        # Act
+        with self.assertRaises(ValueError):
+            StreamingOutputWriter(Path(self.temp_dir.name) / "output.parquet", layout="diagonal")
+
+    def test_long_layout_columns_in_metadata(self) -> None:
+        """Test that the outputs of the long layout are read from the metadata of the file."""
+        # Arrange
+        path = Path(self.temp_dir.name) / "output_long.parquet"
+        writer = StreamingOutputWriter(path, layout=LONG_LAYOUT, chunk_size=3)
+        self.simulate(writer, 7)
+
+        # Act
+        with patch.object(StreamingOutputReader, "_iter_batches") as iter_batches:
+            reader = StreamingOutputReader(path)
+
+        # Assert
+        iter_batches.assert_not_called()
+        self.assertEqual(len(reader.columns), 6)
+        self.assertEqual(reader.columns[0], ("pipe_id", "p1", "pressure"))
+
+    def test_write_network_output(self) -> None:
+        """Test that the output streamed by a network equals the output gathered in memory."""
+        for file_format in [PARQUET_FORMAT, ARROW_FORMAT]:
+            for layout in [WIDE_LAYOUT, LONG_LAYOUT]:
+                with self.subTest(file_format=file_format, layout=layout):
+                    # Arrange
+                    path = Path(self.temp_dir.name) / f"network_{layout}.{file_format}"
+                    writer = StreamingOutputWriter(
+                        path, file_format=file_format, layout=layout, chunk_size=2
+                    )
+                    network = create_network(output_writer=writer)
+                    expected_network = create_network()
+                    simulate_network(expected_network, self.start, 5)
+
+                    # Act
+                    simulate_network(network, self.start, 5)
+                    result = StreamingOutputReader(path).read()
+
+                    # Assert
+                    expected = expected_network.gather_output()
+                    self.assertEqual(list(result.columns), list(expected.columns))
+                    self.assertEqual(result.index[-1], self.start + timedelta(hours=4))
+                    np.testing.assert_array_equal(result.to_numpy(), expected.to_numpy())
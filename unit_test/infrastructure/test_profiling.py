@@ -0,0 +1,123 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test memory profiling."""
+import tracemalloc
+import unittest
+
+import numpy as np
+
+from omotes_simulator_core.entities.assets.output_store import OutputStore
+from omotes_simulator_core.infrastructure import tracing
+from omotes_simulator_core.infrastructure.profiling import (
+    UNKNOWN_MODULE,
+    MemoryProfiler,
+    get_module_name,
+    get_peak_rss,
+)
+from omotes_simulator_core.infrastructure.tracing import set_span_exporter, start_span
+
+
+class MemoryProfilerTest(unittest.TestCase):
+    """Testcase for the memory profiler."""
+
+    def setUp(self) -> None:
+        """Set up a started memory profiler receiving the spans."""
+        self.profiler = MemoryProfiler(snapshot_interval=2, number_of_frames=5)
+        self.profiler.start()
+        set_span_exporter(self.profiler)
+        self.addCleanup(set_span_exporter, None)
+
+    def test_snapshots_at_phase_ends(self) -> None:
+        """Test that snapshots are taken after the phases and every interval time steps."""
+        # Arrange
+        output_store = OutputStore(1, 200000)
+        output_store.add_time_step()
+
+        # Act
+        with start_span("esdl_mapping"):
+            pass
+        for _ in range(5):
+            with start_span("time_step"):
+                output_store.write(0, "mass_flow", 1.0)
+        with start_span("gather_output"):
+            pass
+
+        # Assert
+        self.assertEqual(
+            [snapshot.phase for snapshot in self.profiler.snapshots],
+            ["start", "esdl_mapping", "time_step 2", "time_step 4", "gather_output"],
+        )
+        allocations = self.profiler.snapshots[-1].allocations
+        size, count = allocations[("omotes_simulator_core.entities.assets.output_store", "numpy")]
+        self.assertGreaterEqual(size, 200000 * 8)
+        self.assertGreater(self.profiler.snapshots[-1].traced_memory, 0)
+
+    def test_get_report(self) -> None:
+        """Test that the report holds the trajectory and the memory per module."""
+        # Arrange
+        output_store = OutputStore(1, 200000)
+        output_store.add_time_step()
+        output_store.write(0, "mass_flow", 1.0)
+        self.profiler.take_snapshot("esdl_load")
+
+        # Act
+        report = self.profiler.get_report(top=5)
+
+        # Assert
+        self.assertIn("peak rss [MB]", report)
+        self.assertIn("Allocated memory per module after esdl_load:", report)
+        self.assertIn("omotes_simulator_core.entities.assets.output_store (numpy", report)
+
+    def test_stop(self) -> None:
+        """Test that tracing is stopped when the exporter is shut down."""
+        # Act
+        set_span_exporter(None)
+
+        # Assert
+        self.assertFalse(tracemalloc.is_tracing())
+        with self.assertRaises(RuntimeError):
+            self.profiler.take_snapshot("after_stop")
+
+    def test_invalid_snapshot_interval(self) -> None:
+        """Test that a snapshot interval below one time step raises an error."""
+        # Act
+        with self.assertRaises(ValueError):
+            MemoryProfiler(snapshot_interval=0)
+
+
+class ProfilingTest(unittest.TestCase):
+    """Testcase for the profiling functions."""
+
+    def test_get_module_name(self) -> None:
+        """Test that source files are converted to the name of their module."""
+        # Act
+        package_module = get_module_name(tracing.__file__)
+        numpy_module = get_module_name(np.__file__)
+        frozen_module = get_module_name("<frozen importlib._bootstrap>")
+
+        # Assert
+        self.assertEqual(package_module, "omotes_simulator_core.infrastructure.tracing")
+        self.assertEqual(numpy_module, "numpy")
+        self.assertEqual(frozen_module, UNKNOWN_MODULE)
+
+    def test_get_peak_rss(self) -> None:
+        """Test that the peak resident set size is positive when available."""
+        # Act
+        peak_rss = get_peak_rss()
+
+        # Assert
+        if peak_rss is not None:
+            self.assertGreater(peak_rss, 0)
@@ -13,21 +13,36 @@
 #  You should have received a copy of the GNU General Public License
 #  along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import importlib.util
+import tempfile
 import unittest
 import uuid
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
+
+import numpy as np
 
 from omotes_simulator_core.entities.esdl_object import EsdlObject
 from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
+from omotes_simulator_core.infrastructure.memmap_output import MemmapOutputWriter
+from omotes_simulator_core.infrastructure.output_aggregator import OutputAggregator
+from omotes_simulator_core.infrastructure.output_writer import LONG_LAYOUT, StreamingOutputWriter
 from omotes_simulator_core.infrastructure.simulation_manager import SimulationManager
 from omotes_simulator_core.infrastructure.utils import pyesdl_from_file
+from unit_test.infrastructure.output_test_utils import create_network, simulate_network
 
 
 class SimulationManagerTest(unittest.TestCase):
     """Test clas for the SimulationManager."""
 
+    def setUp(self) -> None:
+        """Set up the esdl object of the test network."""
+        esdl_file_path = str(Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl")
+        self.esdl_object = EsdlObject(pyesdl_from_file(esdl_file_path))
+        self.start = datetime.strptime("2019-01-01T00:00:00", "%Y-%m-%dT%H:%M:%S")
+        self.stop = datetime.strptime("2019-01-01T01:00:00", "%Y-%m-%dT%H:%M:%S")
+
     def test_network_simulation_run(self) -> None:
         """Test for simulation."""
         # Arrange
@@ -49,3 +64,130 @@ class SimulationManagerTest(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertTrue(callback.called)
         self.assertEqual(result.shape, (1, 46))
+
+    @unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow is not installed")
+    def test_create_output_writer(self) -> None:
+        """Test that the output writer is created from the output settings of the configuration."""
+        # Arrange
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=self.start,
+            stop=self.stop,
+            output_mode="stream",
+            output_directory=temp_dir.name,
+            output_layout=LONG_LAYOUT,
+        )
+        app = SimulationManager(self.esdl_object, config)
+
+        # Act
+        with patch("omotes_simulator_core.infrastructure.simulation_manager.EsdlControllerMapper"):
+            network, _ = app._get_network_and_controller()
+
+        # Assert
+        writer = network.output_writer
+        if not isinstance(writer, StreamingOutputWriter):
+            self.fail("The output is not streamed to a file.")
+        self.assertEqual(writer.path, Path(temp_dir.name) / f"{config.simulation_id}.parquet")
+        self.assertEqual(writer.layout, LONG_LAYOUT)
+
+    def test_create_memmap_output_writer(self) -> None:
+        """Test that the memory mapped output is written to a directory named after the run."""
+        # Arrange
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=self.start,
+            stop=self.stop,
+            output_dtype="float32",
+            output_mode="memmap",
+            output_directory="output",
+        )
+
+        # Act
+        writer = SimulationManager(self.esdl_object, config)._create_output_writer()
+
+        # Assert
+        if not isinstance(writer, MemmapOutputWriter):
+            self.fail("The output is not written to memory mapped files.")
+        self.assertEqual(writer.directory, Path("output") / str(config.simulation_id))
+        self.assertEqual(writer.dtype, np.float32)
+
+    def test_output_kept_in_memory(self) -> None:
+        """Test that no output writer is created when the output is kept in memory."""
+        # Arrange
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=self.start,
+            stop=self.stop,
+        )
+
+        # Act
+        writer = SimulationManager(self.esdl_object, config)._create_output_writer()
+
+        # Assert
+        self.assertIsNone(writer)
+
+    def test_execute_aggregated_output(self) -> None:
+        """Test that the summary of the aggregator is returned when the output is aggregated."""
+        # Arrange
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=self.start,
+            stop=self.stop,
+            output_mode="aggregate",
+            output_aggregation_period="D",
+        )
+        app = SimulationManager(self.esdl_object, config)
+        writer = app._create_output_writer()
+        if not isinstance(writer, OutputAggregator):
+            self.fail("The output is not aggregated.")
+        network = create_network(output_writer=writer)
+
+        # Act
+        with patch.object(
+            SimulationManager, "_get_network_and_controller", return_value=(network, Mock())
+        ), patch(
+            "omotes_simulator_core.infrastructure.simulation_manager.NetworkSimulation"
+        ) as network_simulation:
+            network_simulation.return_value.run.side_effect = lambda *_: simulate_network(
+                network, self.start, 3
+            )
+            result = app.execute(Mock())
+
+        # Assert
+        network_simulation.return_value.gather_output.assert_not_called()
+        self.assertEqual(writer.time_step, 3600)
+        self.assertEqual(writer.period, "D")
+        self.assertEqual(result.index.names, ["period", "asset", "port", "property"])
+        self.assertEqual(set(result["count"]), {3})
+
+    def test_invalid_output_mode(self) -> None:
+        """Test that an error is raised for an unknown output mode or a missing directory."""
+        # Act
+        with self.assertRaises(ValueError):
+            SimulationConfiguration(
+                simulation_id=uuid.uuid1(),
+                name="test run",
+                timestep=3600,
+                start=self.start,
+                stop=self.stop,
+                output_mode="printer",
+            )
+        with self.assertRaises(ValueError):
+            SimulationConfiguration(
+                simulation_id=uuid.uuid1(),
+                name="test run",
+                timestep=3600,
+                start=self.start,
+                stop=self.stop,
+                output_mode="stream",
+            )
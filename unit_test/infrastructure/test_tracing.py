@@ -0,0 +1,137 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test tracing of spans."""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from omotes_simulator_core.infrastructure.tracing import (
+    STATUS_ERROR,
+    JsonLinesSpanExporter,
+    NoOpSpanExporter,
+    Span,
+    SpanExporterAbstract,
+    get_span_exporter,
+    is_tracing_enabled,
+    set_span_exporter,
+    start_span,
+)
+
+
+class ListSpanExporter(SpanExporterAbstract):
+    """Exporter keeping the spans in a list."""
+
+    def __init__(self) -> None:
+        """Constructor of the list span exporter."""
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        """Method to add the span to the list.
+
+        :param Span span: The span that ended.
+        """
+        self.spans.append(span)
+
+    def shutdown(self) -> None:
+        """Method to shut down the exporter."""
+
+
+class TracingTest(unittest.TestCase):
+    """Testcase for the tracing of spans."""
+
+    def setUp(self) -> None:
+        """Set up a list exporter, which is removed after the test."""
+        self.exporter = ListSpanExporter()
+        set_span_exporter(self.exporter)
+        self.addCleanup(set_span_exporter, None)
+
+    def test_tracing_disabled_by_default(self) -> None:
+        """Test that no spans are recorded when the no-op exporter is set."""
+        # Arrange
+        set_span_exporter(None)
+
+        # Act
+        with start_span("phase", time_step=1) as span:
+            span.set_attribute("iterations", 3)
+
+        # Assert
+        self.assertIsInstance(get_span_exporter(), NoOpSpanExporter)
+        self.assertEqual(self.exporter.spans, [])
+
+    def test_nested_spans(self) -> None:
+        """Test that spans started within a span get it as parent."""
+        # Act
+        with start_span("simulation", timestep=3600):
+            with start_span("solver") as span:
+                span.set_attribute("converged", True)
+
+        # Assert
+        solver, simulation = self.exporter.spans
+        self.assertEqual(solver.name, "solver")
+        self.assertEqual(solver.parent_id, simulation.span_id)
+        self.assertEqual(solver.trace_id, simulation.trace_id)
+        self.assertIsNone(simulation.parent_id)
+        self.assertEqual(solver.attributes, {"converged": True})
+        self.assertEqual(simulation.attributes, {"timestep": 3600})
+        self.assertGreaterEqual(solver.duration, 0.0)
+
+    def test_span_with_error(self) -> None:
+        """Test that a span ending with an exception gets the error status."""
+        # Act
+        with self.assertRaises(ValueError):
+            with start_span("esdl_mapping"):
+                raise ValueError("invalid esdl")
+
+        # Assert
+        self.assertEqual(self.exporter.spans[0].status, STATUS_ERROR)
+        self.assertEqual(self.exporter.spans[0].attributes["error"], "ValueError('invalid esdl')")
+
+    def test_is_tracing_enabled(self) -> None:
+        """Test that tracing is enabled by a recording exporter and disabled by None."""
+        # Act
+        enabled_with_exporter = is_tracing_enabled()
+        set_span_exporter(None)
+        enabled_without_exporter = is_tracing_enabled()
+
+        # Assert
+        self.assertTrue(enabled_with_exporter)
+        self.assertFalse(enabled_without_exporter)
+
+
+class JsonLinesSpanExporterTest(unittest.TestCase):
+    """Testcase for JsonLinesSpanExporter class."""
+
+    def test_export(self) -> None:
+        """Test that each span is written as a line of json."""
+        # Arrange
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        path = Path(temp_dir.name) / "spans.jsonl"
+        set_span_exporter(JsonLinesSpanExporter(path))
+        self.addCleanup(set_span_exporter, None)
+
+        # Act
+        with start_span("simulation"):
+            with start_span("time_step", iterations=2):
+                pass
+        set_span_exporter(None)
+
+        # Assert
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        self.assertEqual([line["name"] for line in lines], ["time_step", "simulation"])
+        self.assertEqual(lines[0]["attributes"], {"iterations": 2})
+        self.assertEqual(lines[0]["parent_id"], lines[1]["span_id"])
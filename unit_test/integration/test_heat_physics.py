@@ -91,8 +91,10 @@ class HeatDemandTest(unittest.TestCase):
             in_port_id = in_out_ports[demand.id]["InPort"]
             out_port_id = in_out_ports[demand.id]["OutPort"]
 
-            temp_in_dict[demand.id] = np.array(self.result[(in_port_id, "temperature")])
-            temp_out_dict[demand.id] = np.array(self.result[(out_port_id, "temperature")])
+            temp_in_dict[demand.id] = np.array(self.result[(demand.id, in_port_id, "temperature")])
+            temp_out_dict[demand.id] = np.array(
+                self.result[(demand.id, out_port_id, "temperature")]
+            )
 
         return temp_in_dict, temp_out_dict
 
@@ -111,8 +113,8 @@ class HeatDemandTest(unittest.TestCase):
         for demand in self.demands:
             in_port_id = self.in_out_demand_dict[demand.id]["InPort"]
             out_port_id = self.in_out_demand_dict[demand.id]["OutPort"]
-            m_dot_in_array = np.array(self.result[(in_port_id, "mass_flow")])
-            m_dot_out_array = np.array(self.result[(out_port_id, "mass_flow")])
+            m_dot_in_array = np.array(self.result[(demand.id, in_port_id, "mass_flow")])
+            m_dot_out_array = np.array(self.result[(demand.id, out_port_id, "mass_flow")])
             m_dot = (m_dot_in_array + m_dot_out_array) / 2
             cp = np.array([])
             temp_in_array = temp_in_dict[demand.id]
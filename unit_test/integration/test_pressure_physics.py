@@ -92,8 +92,8 @@ class PressureDropTest(unittest.TestCase):
             # Check which port is in and which out.
             [in_port_id, out_port_id] = self._get_in_out_port_id(pipe)
             # Compute pressure drop.
-            p_out = self.result[out_port_id, "pressure"]
-            p_in = self.result[in_port_id, "pressure"]
+            p_out = self.result[pipe.id, out_port_id, "pressure"]
+            p_in = self.result[pipe.id, in_port_id, "pressure"]
             delta_p_list = p_out - p_in
             for delta_p in delta_p_list:
                 np.testing.assert_(delta_p < 0)
@@ -102,8 +102,8 @@ class PressureDropTest(unittest.TestCase):
             # Check which port is in and which out.
             [in_port_id, out_port_id] = self._get_in_out_port_id(producer)
             # Compute pressure drop.
-            p_out = self.result[out_port_id, "pressure"]
-            p_in = self.result[in_port_id, "pressure"]
+            p_out = self.result[producer.id, out_port_id, "pressure"]
+            p_in = self.result[producer.id, in_port_id, "pressure"]
             delta_p_list = p_out - p_in
             for delta_p in delta_p_list:
                 np.testing.assert_(delta_p > 0)
@@ -112,8 +112,8 @@ class PressureDropTest(unittest.TestCase):
             # Check which port is in and which out.
             [in_port_id, out_port_id] = self._get_in_out_port_id(demand)
             # Compute pressure drop.
-            p_out = self.result[out_port_id, "pressure"]
-            p_in = self.result[in_port_id, "pressure"]
+            p_out = self.result[demand.id, out_port_id, "pressure"]
+            p_in = self.result[demand.id, in_port_id, "pressure"]
             delta_p_list = p_out - p_in
             for delta_p in delta_p_list:
                 np.testing.assert_(delta_p < 0)
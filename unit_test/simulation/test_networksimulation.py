@@ -15,12 +15,18 @@
 
 import unittest
 import uuid
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from unittest.mock import Mock
 
+import pandas as pd
+
 from omotes_simulator_core.adapter.transforms.controller_mapper import EsdlControllerMapper
 from omotes_simulator_core.adapter.transforms.mappers import EsdlEnergySystemMapper
+from omotes_simulator_core.benchmark.network_generator import (
+    NetworkGenerator,
+    NetworkGeneratorSettings,
+)
 from omotes_simulator_core.entities.esdl_object import EsdlObject
 from omotes_simulator_core.entities.heat_network import HeatNetwork
 from omotes_simulator_core.entities.simulation_configuration import SimulationConfiguration
@@ -67,3 +73,98 @@ class NetworkSimulationTest(unittest.TestCase):
         # Assert
         self.assertTrue(callback.called)
         self.assertEqual(len(network_simulation.gather_output()), 1)
+
+    def test_network_simulation_run_precomputed_setpoints(self):
+        """Test that the simulation with precomputed setpoints gives the same output."""
+        # Arrange
+        settings = NetworkGeneratorSettings(
+            number_of_consumers=4, number_of_producers=2, number_of_profile_values=4
+        )
+        esdl_object = NetworkGenerator(settings).to_esdl_object()
+        start = settings.start.astimezone(timezone.utc).replace(tzinfo=None)
+        outputs = []
+        horizons = []
+
+        # Act
+        for precompute_setpoints in (False, True):
+            network = HeatNetwork(EsdlEnergySystemMapper(esdl_object).to_entity)
+            controller = EsdlControllerMapper().to_entity(esdl_object, timestep=3600)
+            network_simulation = NetworkSimulation(network, controller)
+            config = SimulationConfiguration(
+                simulation_id=uuid.uuid1(),
+                name="test run",
+                timestep=3600,
+                start=start,
+                stop=start + timedelta(hours=3),
+                precompute_setpoints=precompute_setpoints,
+            )
+            network_simulation.run(config, Mock())
+            outputs.append(network_simulation.gather_output())
+            horizons.append(controller.setpoint_horizon)
+
+        # Assert
+        self.assertIsNone(horizons[0])
+        self.assertIsNotNone(horizons[1])
+        pd.testing.assert_frame_equal(outputs[0], outputs[1])
+
+    def test_network_simulation_run_diagnostics(self):
+        """Test that the condition estimate of the solver diagnostics follows the config."""
+        for solver_condition_estimate in (False, True):
+            with self.subTest(solver_condition_estimate=solver_condition_estimate):
+                # Arrange
+                network = Mock()
+                network.assets = []
+                network.solver.get_statistics.return_value = {}
+                network.solver.number_of_iterations = 1
+                network_simulation = NetworkSimulation(network, Mock())
+                config = SimulationConfiguration(
+                    simulation_id=uuid.uuid1(),
+                    name="test run",
+                    timestep=3600,
+                    start=datetime(2019, 1, 1),
+                    stop=datetime(2019, 1, 1, 1),
+                    solver_diagnostics=True,
+                    solver_condition_estimate=solver_condition_estimate,
+                )
+
+                # Act
+                network_simulation.run(config, Mock())
+
+                # Assert
+                network.solver.enable_diagnostics.assert_called_once_with(
+                    estimate_condition=solver_condition_estimate
+                )
+
+    def test_network_simulation_run_records_timing(self):
+        """Test that the time spent per phase and the iterations are recorded per time step."""
+        # Arrange
+        network = Mock()
+        network.assets = []
+        network.check_convergence.side_effect = [False, True, True]
+        network.solver.number_of_iterations = 3
+        network.solver.get_statistics.return_value = {"factorization": 0.5}
+        network_simulation = NetworkSimulation(network, Mock())
+        config = SimulationConfiguration(
+            simulation_id=uuid.uuid1(),
+            name="test run",
+            timestep=3600,
+            start=datetime(2019, 1, 1),
+            stop=datetime(2019, 1, 1, 2),
+        )
+        callback = Mock()
+
+        # Act
+        with self.assertLogs(
+            "omotes_simulator_core.simulation.networksimulation", level="DEBUG"
+        ) as logs:
+            network_simulation.run(config, callback)
+
+        # Assert
+        report = network_simulation.timing_report.to_dataframe()
+        self.assertEqual(len(report), 2)
+        self.assertEqual(list(report["controller_iterations"]), [2, 1])
+        self.assertEqual(list(report["solver_iterations"]), [3, 3])
+        self.assertEqual(list(report["solver_factorization"]), [0.5, 0.5])
+        self.assertEqual(network.solver.reset_statistics.call_count, 2)
+        self.assertEqual(callback.call_args.args[1], "calculating")
+        self.assertTrue(any("Timing of time steps: time step" in line for line in logs.output))
@@ -0,0 +1,90 @@
+#  Copyright (c) 2023. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test timing report."""
+import unittest
+from datetime import datetime
+
+from omotes_simulator_core.simulation.timing_report import TimingReport
+
+
+class TimingReportTest(unittest.TestCase):
+    """Testcase for TimingReport class."""
+
+    def setUp(self) -> None:
+        """Set up a timing report with two recorded time steps."""
+        self.timing_report = TimingReport(3)
+        self.timing_report.add_time_step(
+            datetime(2019, 1, 1, 0),
+            {"run_time_step": 1.0, "store_output": 0.5, "solver_factorization": 0.25},
+            controller_iterations=2,
+            solver_iterations=10,
+        )
+        self.timing_report.add_time_step(
+            datetime(2019, 1, 1, 1),
+            {"run_time_step": 3.0},
+            controller_iterations=1,
+            solver_iterations=4,
+        )
+
+    def test_to_dataframe(self) -> None:
+        """Test that the report has a row per recorded time step with the total time."""
+        # Act
+        report = self.timing_report.to_dataframe()
+
+        # Assert
+        self.assertEqual(len(self.timing_report), 2)
+        self.assertEqual(list(report["total"]), [1.5, 3.0])
+        self.assertEqual(list(report["solver_factorization"]), [0.25, 0.0])
+        self.assertEqual(list(report["solver_iterations"]), [10, 4])
+
+    def test_get_summary(self) -> None:
+        """Test that the total, mean and maximum time are given per phase."""
+        # Act
+        summary = self.timing_report.get_summary()
+
+        # Assert
+        self.assertEqual(summary.loc["run_time_step", "total"], 4.0)
+        self.assertEqual(summary.loc["run_time_step", "mean"], 2.0)
+        self.assertEqual(summary.loc["total", "max"], 3.0)
+
+    def test_get_slowest_time_steps(self) -> None:
+        """Test that the slowest time steps are returned first."""
+        # Act
+        slowest = self.timing_report.get_slowest_time_steps(1)
+
+        # Assert
+        self.assertEqual(list(slowest.index), [datetime(2019, 1, 1, 1)])
+
+    def test_get_progress_message(self) -> None:
+        """Test that the message describes the time steps from the given index."""
+        # Act
+        message = self.timing_report.get_progress_message(1)
+
+        # Assert
+        self.assertEqual(
+            message,
+            "time step 3.000 s mean, 3.000 s max at 2019-01-01 01:00:00, 4.0 solver iterations "
+            "mean",
+        )
+
+    def test_add_time_step_when_full(self) -> None:
+        """Test that an error is raised when more time steps are added than allocated."""
+        # Arrange
+        self.timing_report.add_time_step(datetime(2019, 1, 1, 2), {}, 1, 1)
+
+        # Act
+        with self.assertRaises(IndexError):
+            self.timing_report.add_time_step(datetime(2019, 1, 1, 3), {}, 1, 1)
@@ -15,13 +15,15 @@
 
 """Test matrix object."""
 
+import tempfile
 import unittest
+from pathlib import Path
 
 import numpy as np
 import numpy.testing as npt
 
 from omotes_simulator_core.solver.matrix.equation_object import EquationObject
-from omotes_simulator_core.solver.matrix.matrix import Matrix
+from omotes_simulator_core.solver.matrix.matrix import Matrix, load_matrix_dump
 
 
 class MatrixTest(unittest.TestCase):
@@ -152,7 +154,34 @@ class MatrixTest(unittest.TestCase):
 
         # assert
         self.assertIsInstance(cm.exception, RuntimeError)
-        self.assertEqual(str(cm.exception), "Matrix is singular, matrix is dumped to file.")
+        self.assertEqual(str(cm.exception), "Matrix is singular.")
+
+    def test_dump_matrix(self) -> None:
+        """Test that the dumped system of equations is read back in its sparse format."""
+        # arrange
+        matrix = Matrix()
+        index = matrix.add_unknowns(2)
+        equation1 = EquationObject()
+        equation1.indices = np.array([index, index + 1])
+        equation1.coefficients = np.array([1.0, 1.0])
+        equation1.rhs = 0.0
+        equation2 = EquationObject()
+        equation2.indices = np.array([index + 1])
+        equation2.coefficients = np.array([2.0])
+        equation2.rhs = 10.0
+        matrix.solve([equation1, equation2])
+
+        # act
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = Path(directory) / "dump.npz"
+            matrix.dump_matrix(matrix.system_matrix, matrix.system_rhs, file_name)
+            system_matrix, rhs, solution = load_matrix_dump(file_name)
+
+        # assert
+        self.assertEqual(system_matrix.nnz, 3)
+        npt.assert_array_equal(system_matrix.toarray(), [[1.0, 1.0], [0.0, 2.0]])
+        npt.assert_array_equal(rhs, [0.0, 10.0])
+        npt.assert_array_equal(solution, matrix.sol_old)
 
     def test_is_converged_false(self) -> None:
         """Test the is converged of the matrix object."""
@@ -0,0 +1,66 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+"""Test item registry class."""
+import unittest
+
+from omotes_simulator_core.solver.network.assets.node import Node
+from omotes_simulator_core.solver.network.item_registry import ItemRegistry
+
+
+class ItemRegistryTest(unittest.TestCase):
+    """Class to test the item registry class."""
+
+    def setUp(self) -> None:
+        """Set up a registry with three nodes."""
+        self.registry: ItemRegistry[Node] = ItemRegistry()
+        self.nodes = [Node(name=f"node_{index}", _id=f"node_{index}") for index in range(3)]
+        for node in self.nodes:
+            self.registry.add(node.name, node)
+
+    def test_add(self) -> None:
+        """Test that the integer id is the order of registration."""
+        # arrange
+        node = Node(name="node_3", _id="node_3")
+
+        # act
+        item_id = self.registry.add(node.name, node)
+
+        # assert
+        self.assertEqual(item_id, 3)
+        self.assertIs(self.registry.get_by_id(item_id), node)
+        self.assertIs(self.registry["node_3"], node)
+        self.assertEqual(self.registry.get_id("node_1"), 1)
+
+    def test_add_existing(self) -> None:
+        """Test that an item cannot be added twice."""
+        # act
+        with self.assertRaises(ValueError) as cm:
+            self.registry.add("node_0", self.nodes[0])
+
+        # assert
+        self.assertEqual(str(cm.exception), "node_0 already exists in network.")
+
+    def test_delete(self) -> None:
+        """Test that removing an item keeps the ids of the other items."""
+        # act
+        del self.registry["node_1"]
+
+        # assert
+        self.assertEqual(len(self.registry), 2)
+        self.assertEqual(list(self.registry), ["node_0", "node_2"])
+        self.assertEqual(self.registry.values(), [self.nodes[0], self.nodes[2]])
+        self.assertEqual(self.registry.get_id("node_2"), 2)
+        with self.assertRaises(KeyError):
+            self.registry.get_by_id(1)
@@ -71,6 +71,20 @@ class NetworkTest(unittest.TestCase):
         # assert
         self.assertIsInstance(self.network.assets[name], SolverPipe)
 
+    def test_add_asset_no_name_deterministic(self) -> None:
+        """Test that assets without a name get the same name in every network."""
+        # arrange
+        network = Network()
+
+        # act
+        names = [self.network.add_asset(asset_type="Pipe") for _ in range(2)]
+        names_other = [network.add_asset(asset_type="Pipe") for _ in range(2)]  # act
+
+        # assert
+        self.assertEqual(names, ["asset_0", "asset_1"])
+        self.assertEqual(names, names_other)
+        self.assertEqual(self.network.assets[names[0]].id, names[0])
+
     def test_add_asset_unknown_asset(self) -> None:
         """Test adding an unknown asset."""
         # arrange
@@ -105,14 +119,16 @@ class NetworkTest(unittest.TestCase):
         self.network.assets[self.asset.name].connect_node(node=self.node, connection_point=0)
 
         # act
-        node_name = self.network._connect_single_asset_at_node(
-            asset_id_connected=self.asset.name,
+        node_id = self.network._connect_single_asset_at_node(
+            asset_id_connected=self.network.assets.get_id(self.asset.name),
             connection_point_connected=0,
-            asset_id_unconnected=self.asset2.name,
+            asset_id_unconnected=self.network.assets.get_id(self.asset2.name),
             connection_point_unconnected=1,
         )
+        node_name = self.network.nodes.get_by_id(node_id).name
 
         # assert
+        self.assertEqual(node_id, 0)
         self.assertEqual(node_name, self.node.name)
 
     def test_connect_both_assets_at_node(self) -> None:
@@ -122,15 +138,16 @@ class NetworkTest(unittest.TestCase):
         self.network.add_existing_asset(asset=self.asset2)
 
         # act
-        node_name = self.network._connect_both_assets_at_node(
-            asset1_id=self.asset.name,
+        node_id = self.network._connect_both_assets_at_node(
+            asset1_id=self.network.assets.get_id(self.asset.name),
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=self.network.assets.get_id(self.asset2.name),
             connection_point_2=1,
         )  # act
+        node_name = self.network.nodes.get_by_id(node_id).name
 
         # assert
-        self.assertIsInstance(node_name, str)
+        self.assertIsInstance(node_id, int)
         self.assertEqual(
             self.network.assets[self.asset.name].get_connected_node(connection_point=0).name,
             node_name,
@@ -145,6 +162,25 @@ class NetworkTest(unittest.TestCase):
             [(self.asset, 0), (self.asset2, 1)],
         )
 
+    def test_connect_both_assets_at_node_deterministic_name(self) -> None:
+        """Test that the name of the created node only depends on the network build order."""
+        # arrange
+        self.network.add_existing_asset(asset=self.asset)
+        self.network.add_existing_asset(asset=self.asset2)
+
+        # act
+        node_id = self.network._connect_both_assets_at_node(
+            asset1_id=self.network.assets.get_id(self.asset.name),
+            connection_point_1=0,
+            asset2_id=self.network.assets.get_id(self.asset2.name),
+            connection_point_2=1,
+        )  # act
+        node_name = self.network.nodes.get_by_id(node_id).name
+
+        # assert
+        self.assertEqual(node_name, "node_2")
+        self.assertEqual(self.network.nodes[node_name].id, node_name)
+
     def test_connect_both_assets_and_replace_node(self) -> None:
         """Test connecting both assets and replacing the node."""
         # arrange
@@ -164,15 +200,16 @@ class NetworkTest(unittest.TestCase):
         node2.connect_asset(asset=self.asset2, connection_point=1)
 
         # act
-        node_name = self.network._connect_both_assets_and_replace_node(
-            asset1_id=self.asset.name,
+        node_id = self.network._connect_both_assets_and_replace_node(
+            asset1_id=self.network.assets.get_id(self.asset.name),
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=self.network.assets.get_id(self.asset2.name),
             connection_point_2=1,
         )  # act
+        node_name = self.network.nodes.get_by_id(node_id).name
 
         # assert
-        self.assertIsInstance(node_name, str)
+        self.assertIsInstance(node_id, int)
         self.assertEqual(node_name, node.name)
         self.assertEqual(len(self.network.nodes), 1)
         self.assertEqual(self.asset.get_connected_node(connection_point=0).name, node.name)
@@ -202,15 +239,16 @@ class NetworkTest(unittest.TestCase):
         node2.connect_asset(asset=self.asset2, connection_point=1)
 
         # act
-        node_name = self.network._connect_both_assets_and_replace_node(
-            asset1_id=self.asset.name,
+        node_id = self.network._connect_both_assets_and_replace_node(
+            asset1_id=self.network.assets.get_id(self.asset.name),
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=self.network.assets.get_id(self.asset2.name),
             connection_point_2=1,
         )  # act
+        node_name = self.network.nodes.get_by_id(node_id).name
 
         # assert
-        self.assertIsInstance(node_name, str)
+        self.assertIsInstance(node_id, int)
         self.assertEqual(node_name, node.name)
         self.assertEqual(len(self.network.nodes), 1)
         self.assertEqual(self.asset.get_connected_node(connection_point=0).name, node.name)
@@ -234,15 +272,16 @@ class NetworkTest(unittest.TestCase):
         node.connect_asset(asset=self.asset2, connection_point=1)
 
         # act
-        node_name = self.network._connect_both_assets_and_replace_node(
-            asset1_id=self.asset.name,
+        node_id = self.network._connect_both_assets_and_replace_node(
+            asset1_id=self.network.assets.get_id(self.asset.name),
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=self.network.assets.get_id(self.asset2.name),
             connection_point_2=1,
         )  # act
+        node_name = self.network.nodes.get_by_id(node_id).name
 
         # assert
-        self.assertIsInstance(node_name, str)
+        self.assertIsInstance(node_id, int)
         self.assertEqual(node_name, node.name)
         self.assertEqual(len(self.network.nodes), 1)
         self.assertEqual(self.asset.get_connected_node(connection_point=0).name, node.name)
@@ -268,9 +307,9 @@ class NetworkTest(unittest.TestCase):
         self.network.connect_assets_decision_tree(
             connected_1=False,
             connected_2=False,
-            asset1_id=self.asset.name,
+            asset1_id=0,
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=1,
             connection_point_2=1,
         )
 
@@ -280,7 +319,7 @@ class NetworkTest(unittest.TestCase):
         self.assertEqual(mock_connect_both_assets_and_replace_node.call_count, 0)
         self.assertEqual(
             list(mock_connect_both_assets_at_node.call_args[1].values()),
-            [self.asset.name, 0, self.asset2.name, 1],
+            [0, 0, 1, 1],
         )
 
     @patch.object(Network, "_connect_both_assets_and_replace_node")
@@ -299,9 +338,9 @@ class NetworkTest(unittest.TestCase):
         self.network.connect_assets_decision_tree(
             connected_1=True,
             connected_2=True,
-            asset1_id=self.asset.name,
+            asset1_id=0,
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=1,
             connection_point_2=1,
         )
 
@@ -311,7 +350,7 @@ class NetworkTest(unittest.TestCase):
         self.assertEqual(mock_connect_both_assets_and_replace_node.call_count, 1)
         self.assertEqual(
             list(mock_connect_both_assets_and_replace_node.call_args[1].values()),
-            [self.asset.name, 0, self.asset2.name, 1],
+            [0, 0, 1, 1],
         )
 
     @patch.object(Network, "_connect_both_assets_and_replace_node")
@@ -330,9 +369,9 @@ class NetworkTest(unittest.TestCase):
         self.network.connect_assets_decision_tree(
             connected_1=True,
             connected_2=False,
-            asset1_id=self.asset.name,
+            asset1_id=0,
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=1,
             connection_point_2=1,
         )
 
@@ -342,7 +381,7 @@ class NetworkTest(unittest.TestCase):
         self.assertEqual(mock_connect_both_assets_and_replace_node.call_count, 0)
         self.assertEqual(
             list(mock_connect_single_asset_at_node.call_args[1].values()),
-            [self.asset.name, 0, self.asset2.name, 1],
+            [0, 0, 1, 1],
         )
 
     @patch.object(Network, "_connect_both_assets_and_replace_node")
@@ -361,9 +400,9 @@ class NetworkTest(unittest.TestCase):
         self.network.connect_assets_decision_tree(
             connected_1=False,
             connected_2=True,
-            asset1_id=self.asset.name,
+            asset1_id=0,
             connection_point_1=0,
-            asset2_id=self.asset2.name,
+            asset2_id=1,
             connection_point_2=1,
         )
 
@@ -373,7 +412,7 @@ class NetworkTest(unittest.TestCase):
         self.assertEqual(mock_connect_both_assets_and_replace_node.call_count, 0)
         self.assertEqual(
             list(mock_connect_single_asset_at_node.call_args[1].values()),
-            [self.asset2.name, 1, self.asset.name, 0],
+            [1, 1, 0, 0],
         )
 
     def test_exists_asset(self) -> None:
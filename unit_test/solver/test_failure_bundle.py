@@ -0,0 +1,129 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test failure bundles of the solver."""
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+from omotes_simulator_core.solver.failure_bundle import (
+    FailureBundle,
+    replay_failure_bundle,
+    write_failure_bundle,
+)
+from omotes_simulator_core.solver.network.assets.production_asset import HeatBoundary
+from omotes_simulator_core.solver.network.assets.solver_pipe import SolverPipe
+from omotes_simulator_core.solver.network.network import Network
+from omotes_simulator_core.solver.solver import Solver
+
+
+class FailureBundleTest(unittest.TestCase):
+    """Testcase for writing, reading and replaying failure bundles."""
+
+    def setUp(self) -> None:
+        """Set up a solved network with a producer and consumer connected by two pipes."""
+        production_asset = HeatBoundary(name="Production", _id=str(uuid4()))
+        demand_asset = HeatBoundary(name="Demand", _id=str(uuid4()))
+        supply_pipe = SolverPipe(
+            name="Supply pipe", _id=str(uuid4()), length=100.0, diameter=0.1, roughness=0.001
+        )
+        return_pipe = SolverPipe(
+            name="Return pipe", _id=str(uuid4()), length=100.0, diameter=0.1, roughness=0.001
+        )
+        network = Network()
+        for asset in (production_asset, demand_asset, supply_pipe, return_pipe):
+            network.add_existing_asset(asset)
+        nodes_cold = [network.connect_assets("Production", 0, "Return pipe", 1)]
+        nodes_hot = [network.connect_assets("Production", 1, "Supply pipe", 0)]
+        nodes_hot.append(network.connect_assets("Demand", 0, "Supply pipe", 1))
+        nodes_cold.append(network.connect_assets("Demand", 1, "Return pipe", 0))
+        for node in nodes_hot:
+            network.get_node(node).initial_temperature = 60 + 273.15
+        for node in nodes_cold:
+            network.get_node(node).initial_temperature = 40 + 273.15
+        demand_asset.supply_temperature = 40 + 273.15
+        demand_asset.mass_flow_rate_set_point = 1.0
+        demand_asset.pre_scribe_mass_flow = True
+        production_asset.supply_temperature = 60 + 273.15
+        production_asset.pre_scribe_mass_flow = False
+        self.solver = Solver(network=network)
+        self.solver.solve()
+        self.time = datetime(2019, 1, 1, tzinfo=timezone.utc)
+        self.setpoints = {"Demand": {"heat_demand": 1e5}}
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_write_failure_bundle(self) -> None:
+        """Test that the bundle holds the state of the solve."""
+        # Act
+        path = write_failure_bundle(
+            self.directory,
+            self.solver,
+            self.time,
+            3600,
+            self.setpoints,
+            RuntimeError("Matrix is singular."),
+        )
+        bundle = FailureBundle(path)
+
+        # Assert
+        self.assertEqual(path.parent, self.directory)
+        self.assertEqual(bundle.time, self.time)
+        self.assertEqual(bundle.metadata["timestep"], 3600)
+        self.assertEqual(bundle.metadata["setpoints"], self.setpoints)
+        self.assertIn("Matrix is singular.", bundle.metadata["error"])
+        self.assertEqual(
+            set(bundle.previous_solutions),
+            {*self.solver.network.assets, *self.solver.network.nodes},
+        )
+        np.testing.assert_array_equal(
+            bundle.previous_solutions["Demand"], self.solver.network.assets["Demand"].prev_sol
+        )
+        self.assertIsNone(bundle.diagnostics)
+        np.testing.assert_allclose(bundle.solve_matrix(), self.solver.matrix.sol_new)
+
+    def test_write_failure_bundle_unique(self) -> None:
+        """Test that every bundle is written to a new directory."""
+        # Act
+        first = write_failure_bundle(
+            self.directory, self.solver, self.time, 3600, {}, RuntimeError()
+        )
+        second = write_failure_bundle(
+            self.directory, self.solver, self.time, 3600, {}, RuntimeError()
+        )
+
+        # Assert
+        self.assertNotEqual(first, second)
+
+    def test_replay_failure_bundle(self) -> None:
+        """Test that replaying the bundle solves the stored network again."""
+        # Arrange
+        self.solver.enable_diagnostics(estimate_condition=False)
+        path = write_failure_bundle(
+            self.directory, self.solver, self.time, 3600, self.setpoints, RuntimeError()
+        )
+
+        # Act
+        solver = replay_failure_bundle(path)
+
+        # Assert
+        self.assertIsNotNone(FailureBundle(path).diagnostics)
+        self.assertTrue(solver.converged)
+        np.testing.assert_allclose(solver.matrix.sol_new, self.solver.matrix.sol_new)
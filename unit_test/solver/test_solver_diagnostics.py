@@ -0,0 +1,147 @@
+#  Copyright (c) 2025. Deltares & TNO
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""Test solver diagnostics."""
+import math
+import unittest
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import numpy as np
+import scipy as sp
+
+from omotes_simulator_core.solver.network.assets.production_asset import HeatBoundary
+from omotes_simulator_core.solver.network.assets.solver_pipe import SolverPipe
+from omotes_simulator_core.solver.network.network import Network
+from omotes_simulator_core.solver.solver import Solver
+from omotes_simulator_core.solver.solver_diagnostics import estimate_condition_number
+
+
+class EstimateConditionNumberTest(unittest.TestCase):
+    """Testcase for the estimate of the condition number."""
+
+    def test_estimate_condition_number(self) -> None:
+        """Test that the estimate is exact for a diagonal matrix."""
+        # Arrange
+        matrix = sp.sparse.csc_matrix(np.diag([1.0, 2.0, 100.0]))
+
+        # Act
+        condition_number = estimate_condition_number(matrix)
+
+        # Assert
+        self.assertAlmostEqual(condition_number, 100.0)
+
+    def test_estimate_condition_number_singular(self) -> None:
+        """Test that the condition number of a singular matrix is infinite."""
+        # Arrange
+        matrix = sp.sparse.csc_matrix(np.array([[1.0, 2.0], [2.0, 4.0]]))
+
+        # Act
+        condition_number = estimate_condition_number(matrix)
+
+        # Assert
+        self.assertEqual(condition_number, math.inf)
+
+
+class SolverDiagnosticsTest(unittest.TestCase):
+    """Testcase for the diagnostics of the solver."""
+
+    def setUp(self) -> None:
+        """Set up a network with a producer and consumer connected by two pipes."""
+        self.production_asset = HeatBoundary(name="Production", _id=str(uuid4()))
+        self.demand_asset = HeatBoundary(name="Demand", _id=str(uuid4()))
+        supply_pipe = SolverPipe(
+            name="Supply pipe", _id=str(uuid4()), length=100.0, diameter=0.1, roughness=0.001
+        )
+        return_pipe = SolverPipe(
+            name="Return pipe", _id=str(uuid4()), length=100.0, diameter=0.1, roughness=0.001
+        )
+        network = Network()
+        for asset in (self.production_asset, self.demand_asset, supply_pipe, return_pipe):
+            network.add_existing_asset(asset)
+        nodes_cold = [network.connect_assets("Production", 0, "Return pipe", 1)]
+        nodes_hot = [network.connect_assets("Production", 1, "Supply pipe", 0)]
+        nodes_hot.append(network.connect_assets("Demand", 0, "Supply pipe", 1))
+        nodes_cold.append(network.connect_assets("Demand", 1, "Return pipe", 0))
+        for node in nodes_hot:
+            network.get_node(node).initial_temperature = 60 + 273.15
+        for node in nodes_cold:
+            network.get_node(node).initial_temperature = 40 + 273.15
+        self.demand_asset.supply_temperature = 40 + 273.15
+        self.demand_asset.mass_flow_rate_set_point = 1.0
+        self.demand_asset.pre_scribe_mass_flow = True
+        self.production_asset.supply_temperature = 60 + 273.15
+        self.production_asset.pre_scribe_mass_flow = False
+        self.solver = Solver(network=network)
+
+    def test_solve_with_diagnostics(self) -> None:
+        """Test that every iteration of the solver is recorded."""
+        # Arrange
+        diagnostics = self.solver.enable_diagnostics(estimate_condition=True)
+        time = datetime(2019, 1, 1, tzinfo=timezone.utc)
+
+        # Act
+        diagnostics.start_time_step(time)
+        self.solver.solve()
+
+        # Assert
+        records = diagnostics.records
+        self.assertEqual(len(diagnostics), self.solver.number_of_iterations)
+        np.testing.assert_array_equal(records["iteration"], np.arange(1, len(records) + 1))
+        self.assertTrue((records["time_step"] == 0).all())
+        self.assertTrue((records["solve"] == 1).all())
+        self.assertTrue((records["size"] == self.solver.matrix.num_unknowns).all())
+        self.assertTrue((records["nnz"] > 0).all())
+        self.assertTrue(np.isfinite(records["condition_estimate"]).all())
+        self.assertLessEqual(records[-1]["residual_mass_flow_rate"], 1.0)
+        self.assertLessEqual(records[-1]["residual_pressure"], 1.0)
+        self.assertLessEqual(records[-1]["residual_internal_energy"], 1.0)
+        self.assertGreater(records[0]["residual_pressure"], 1.0)
+
+    def test_to_dataframe(self) -> None:
+        """Test that the records are described by the owner of the unknown that changed most."""
+        # Arrange
+        diagnostics = self.solver.enable_diagnostics()
+        time = datetime(2019, 1, 1, tzinfo=timezone.utc)
+        diagnostics.start_time_step(time)
+        self.solver.solve()
+        self.solver.solve()
+
+        # Act
+        report = diagnostics.to_dataframe()
+        hot_spots = diagnostics.get_hot_spots()
+
+        # Assert
+        self.assertEqual(len(report), self.solver.number_of_iterations)
+        self.assertEqual(report["time"].iloc[0], time)
+        self.assertEqual(report["solve"].iloc[-1], 2)
+        self.assertTrue(report["condition_estimate"].isna().all())
+        owner = report["max_change_owner"].iloc[0]
+        owners = [*self.solver.network.assets, *self.solver.network.nodes]
+        self.assertIn(owner, owners)
+        self.assertEqual(hot_spots.sum(), len(report))
+
+    def test_get_unknown_description(self) -> None:
+        """Test that an unknown is described by its owner, quantity and connection point."""
+        # Arrange
+        diagnostics = self.solver.enable_diagnostics()
+
+        # Act
+        first = diagnostics.get_unknown_description(self.production_asset.matrix_index)
+        fifth = diagnostics.get_unknown_description(self.demand_asset.matrix_index + 4)
+
+        # Assert
+        self.assertEqual(first, "Production mass_flow_rate at connection point 0")
+        self.assertEqual(fifth, "Demand pressure at connection point 1")
@@ -15,7 +15,11 @@
 """Test energy system mapper class."""
 import unittest
 from pathlib import Path
+from unittest.mock import Mock, patch
 
+from omotes_simulator_core.adapter.transforms.esdl_asset_mappers.pipe_mapper import (
+    EsdlAssetPipeMapper,
+)
 from omotes_simulator_core.adapter.transforms.mappers import (
     EsdlEnergySystemMapper,
     replace_joint_in_connected_assets,
@@ -50,6 +54,23 @@ class EsdlEnergySystemMapperTest(unittest.TestCase):
         self.assertEqual(len(result[0]), 4)
         self.assertEqual(len(result[1]), 4)
 
+    def test_to_entity_passes_pipe_catalog(self):
+        """Method to test that the pipe catalog is passed to the pipe mapper."""
+        # arrange
+        esdl_file_path = Path(__file__).parent / ".." / ".." / "testdata" / "test1.esdl"
+        esdl_object = EsdlObject(pyesdl_from_file(str(esdl_file_path)))
+        pipe_catalog = Mock()
+
+        # act
+        with patch(
+            "omotes_simulator_core.adapter.transforms.mappers.EsdlAssetPipeMapper",
+            wraps=EsdlAssetPipeMapper,
+        ) as pipe_mapper:
+            EsdlEnergySystemMapper(esdl_object, pipe_catalog).to_entity(Network())
+
+        # assert
+        pipe_mapper.assert_called_once_with(pipe_catalog)
+
     def test_replace_joint_in_connected_assets(self):
         """Method to test the replace joint in connected assets method."""
         # act